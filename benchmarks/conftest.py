@@ -0,0 +1,100 @@
+"""
+Shared fixtures for the end-to-end benchmarks.
+
+The benchmarks run the SDK against the in-process stand-ins from
+intentlayer_sdk.testing (HTTP pinner, JSON-RPC chain, gRPC gateway):
+
+    python -m pytest benchmarks --no-cov
+    python -m pytest benchmarks --no-cov --latency-ms 5 --benchmark-json bench.json
+
+--latency-ms (or BENCH_LATENCY_MS) injects latency into every stand-in
+request. Besides pytest-benchmark's table, a summary with throughput and
+p50/p99 per benchmark is printed and added to the JSON report.
+"""
+import os
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+from intentlayer_sdk.envelope import create_envelope
+from intentlayer_sdk.testing import local_stack, summarize_latencies
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--latency-ms", type=float, default=float(os.environ.get("BENCH_LATENCY_MS", "0")),
+        help="Latency injected into every stand-in request, in milliseconds",
+    )
+
+
+@pytest.fixture(scope="session")
+def latency(pytestconfig):
+    """Injected stand-in latency in seconds"""
+    return pytestconfig.getoption("latency_ms") / 1000
+
+
+@pytest.fixture(scope="session")
+def stack(latency):
+    """Running pinner, chain and gateway stand-ins"""
+    with local_stack(latency=latency) as running:
+        yield running
+
+
+@pytest.fixture(scope="session")
+def signing_key():
+    return Ed25519PrivateKey.generate()
+
+
+@pytest.fixture
+def make_payload(signing_key):
+    """Build a fresh (envelope hash, payload) pair per call"""
+    counter = iter(range(10**9))
+
+    def make():
+        n = next(counter)
+        envelope = create_envelope(
+            prompt=f"benchmark prompt {n}",
+            model_id="gpt-4o@2025-03-12",
+            tool_id="https://api.example.com/tool",
+            did="did:key:z6MkBenchmark",
+            private_key=signing_key,
+            stake_wei=10**15,
+        )
+        payload = {"envelope": envelope.model_dump(), "prompt": f"benchmark prompt {n}"}
+        return envelope.hex_hash(), payload
+
+    return make
+
+
+def _summaries(config):
+    session = getattr(config, "_benchmarksession", None)
+    for bench in getattr(session, "benchmarks", None) or []:
+        if bench.stats and bench.stats.data:
+            yield bench, summarize_latencies(bench.stats.data)
+
+
+def pytest_benchmark_update_json(config, benchmarks, output_json):
+    summaries = {bench.fullname: summary for bench, summary in _summaries(config)}
+    for entry in output_json["benchmarks"]:
+        summary = summaries.get(entry["fullname"])
+        if summary is not None:
+            entry["extra_info"].update(
+                p50=summary["p50"], p99=summary["p99"], throughput=1 / summary["mean"]
+            )
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    rows = list(_summaries(config))
+    if not rows:
+        return
+    latency_ms = config.getoption("latency_ms")
+    terminalreporter.section(f"throughput and latency (injected latency {latency_ms:g} ms)")
+    width = max(len(bench.name) for bench, _ in rows)
+    terminalreporter.write_line(
+        f"{'benchmark':<{width}}  {'rounds':>7}  {'ops/s':>10}  {'p50 ms':>9}  {'p99 ms':>9}"
+    )
+    for bench, summary in rows:
+        terminalreporter.write_line(
+            f"{bench.name:<{width}}  {summary['count']:>7}  {1 / summary['mean']:>10.1f}"
+            f"  {summary['p50'] * 1000:>9.3f}  {summary['p99'] * 1000:>9.3f}"
+        )
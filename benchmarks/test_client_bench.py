@@ -0,0 +1,37 @@
+"""
+IntentClient benchmarks against the local stand-ins.
+"""
+import pytest
+
+ROUNDS = 50
+
+
+@pytest.fixture
+def client(stack):
+    return stack.client(pin_cache=False)
+
+
+def test_send_intent(benchmark, client, make_payload):
+    """Pin, sign, send and wait for the receipt of one intent"""
+    def setup():
+        return make_payload(), {}
+
+    receipt = benchmark.pedantic(client.send_intent, setup=setup, rounds=ROUNDS, warmup_rounds=2)
+    assert receipt["status"] == 1
+
+
+def test_send_intent_no_wait(benchmark, client, make_payload):
+    """send_intent up to the broadcast, without waiting for the receipt"""
+    def setup():
+        return make_payload(), {"wait_for_receipt": False}
+
+    benchmark.pedantic(client.send_intent, setup=setup, rounds=ROUNDS, warmup_rounds=2)
+
+
+def test_pin_to_ipfs(benchmark, client, make_payload):
+    """Upload one payload to the pinner"""
+    def setup():
+        return (make_payload()[1],), {}
+
+    cid = benchmark.pedantic(client.pin_to_ipfs, setup=setup, rounds=ROUNDS * 2, warmup_rounds=2)
+    assert cid.startswith("Qm")
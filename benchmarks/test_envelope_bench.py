@@ -0,0 +1,104 @@
+"""
+Envelope construction and hashing benchmarks.
+"""
+from intentlayer_sdk.envelope import CallEnvelope, create_envelope
+
+
+def test_create_envelope(benchmark, signing_key):
+    """Hash the prompt, sign and validate one envelope"""
+    envelope = benchmark(
+        create_envelope,
+        prompt="Summarize the quarterly report",
+        model_id="gpt-4o@2025-03-12",
+        tool_id="https://api.example.com/tool",
+        did="did:key:z6MkBenchmark",
+        private_key=signing_key,
+        stake_wei=10**15,
+    )
+    assert envelope.sig_ed25519
+
+
+def test_envelope_hash(benchmark, signing_key):
+    """Hash an existing envelope (memoized after the first call)"""
+    envelope = create_envelope(
+        prompt="Summarize the quarterly report",
+        model_id="gpt-4o@2025-03-12",
+        tool_id="https://api.example.com/tool",
+        did="did:key:z6MkBenchmark",
+        private_key=signing_key,
+        stake_wei=10**15,
+    )
+
+    digest = benchmark(envelope.hash)
+    assert len(digest) == 32
+
+
+def test_envelope_hash_cold(benchmark, signing_key):
+    """Encode and hash an envelope that has not been hashed yet"""
+    fields = create_envelope(
+        prompt="Summarize the quarterly report",
+        model_id="gpt-4o@2025-03-12",
+        tool_id="https://api.example.com/tool",
+        did="did:key:z6MkBenchmark",
+        private_key=signing_key,
+        stake_wei=10**15,
+    ).model_dump()
+
+    def setup():
+        return (CallEnvelope(**fields),), {}
+
+    digest = benchmark.pedantic(CallEnvelope.hash, setup=setup, rounds=2000)
+    assert len(digest) == 32
+
+
+def test_create_envelopes_1000(benchmark, signing_key):
+    """Build a batch of 1000 envelopes"""
+    from intentlayer_sdk.envelope import create_envelopes
+
+    prompts = [f"Summarize quarterly report {n}" for n in range(1000)]
+    batch = benchmark(
+        create_envelopes,
+        prompts,
+        model_id="gpt-4o@2025-03-12",
+        tool_id="https://api.example.com/tool",
+        did="did:key:z6MkBenchmark",
+        private_key=signing_key,
+        stake_wei=10**15,
+    )
+    assert len(batch) == 1000
+
+
+def test_verify_envelope(benchmark, signing_key):
+    """Verify the signature of one envelope against its did:key DID"""
+    from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+    from intentlayer_sdk.envelope import verify_envelope
+    from intentlayer_sdk.identity.crypto import derive_did_from_pubkey
+
+    envelope = create_envelope(
+        prompt="Summarize the quarterly report",
+        model_id="gpt-4o@2025-03-12",
+        tool_id="https://api.example.com/tool",
+        did=derive_did_from_pubkey(signing_key.public_key().public_bytes(Encoding.Raw, PublicFormat.Raw)),
+        private_key=signing_key,
+        stake_wei=10**15,
+    )
+
+    assert benchmark(verify_envelope, envelope)
+
+
+def test_verify_envelopes_1000(benchmark, signing_key):
+    """Verify a batch of 1000 envelopes"""
+    from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+    from intentlayer_sdk.envelope import create_envelopes, verify_envelopes
+    from intentlayer_sdk.identity.crypto import derive_did_from_pubkey
+
+    batch = create_envelopes(
+        [f"Summarize quarterly report {n}" for n in range(1000)],
+        model_id="gpt-4o@2025-03-12",
+        tool_id="https://api.example.com/tool",
+        did=derive_did_from_pubkey(signing_key.public_key().public_bytes(Encoding.Raw, PublicFormat.Raw)),
+        private_key=signing_key,
+        stake_wei=10**15,
+    )
+
+    assert all(benchmark(verify_envelopes, batch))
@@ -0,0 +1,32 @@
+"""
+GatewayClient benchmarks against the in-process gRPC gateway.
+"""
+import itertools
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def gateway_client(stack):
+    client = stack.gateway_client()
+    yield client
+    client.close()
+
+
+def test_register_did(benchmark, gateway_client):
+    """Register a new DID over gRPC"""
+    dids = (f"did:key:z6MkBench{n}" for n in itertools.count())
+
+    def setup():
+        return (next(dids),), {"pub_key": b"\x01" * 32}
+
+    receipt = benchmark.pedantic(gateway_client.register_did, setup=setup, rounds=100, warmup_rounds=2)
+    assert receipt.success
+
+
+def test_register_known_did(benchmark, gateway_client):
+    """Register a DID the gateway already knows"""
+    gateway_client.register_did("did:key:z6MkKnown", pub_key=b"\x01" * 32)
+
+    receipt = benchmark(gateway_client.register_did, "did:key:z6MkKnown", pub_key=b"\x01" * 32)
+    assert receipt.error_code == "ALREADY_REGISTERED"
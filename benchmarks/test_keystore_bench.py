@@ -0,0 +1,31 @@
+"""
+KeyStore benchmarks (file-locked JSON store).
+"""
+import pytest
+
+from intentlayer_sdk.identity.key_store import KeyStore
+
+IDENTITIES = 50
+
+
+@pytest.fixture
+def key_store(tmp_path):
+    store = KeyStore(str(tmp_path / "keys.json"))
+    for n in range(IDENTITIES):
+        store.add_identity(f"did:key:z6Mk{n}", {"encrypted_key": "00" * 64}, {"label": f"key {n}"})
+    return store
+
+
+def test_add_identity(benchmark, key_store):
+    """Add (or replace) one identity"""
+    benchmark(key_store.add_identity, "did:key:z6MkNew", {"encrypted_key": "00" * 64})
+
+
+def test_get_identity(benchmark, key_store):
+    """Look up one identity"""
+    assert benchmark(key_store.get_identity, "did:key:z6Mk7") is not None
+
+
+def test_list_identities(benchmark, key_store):
+    """List every identity"""
+    assert len(benchmark(key_store.list_identities)) == IDENTITIES
@@ -0,0 +1,45 @@
+"""
+intent-cli verify benchmark: receipt lookup, log decoding, IPFS fetch and hash check.
+"""
+import pytest
+import typer
+from web3 import Web3
+
+from intent_cli.verify import canonicalize_envelope, verify_tx
+from intentlayer_sdk.cid import compute_payload_cid
+from intentlayer_sdk.config import NetworkConfig
+from intentlayer_sdk.testing import ChainStandIn
+
+NETWORK = "local"
+
+
+@pytest.fixture(scope="module")
+def chain(latency):
+    """Chain stand-in posing as the "local" network"""
+    network = NetworkConfig.get_network(NETWORK)
+    with ChainStandIn(
+        latency, chain_id=network["chainId"], recorder_address=network["intentRecorder"]
+    ) as running:
+        yield running
+
+
+@pytest.fixture
+def recorded_tx(stack, chain, make_payload, monkeypatch):
+    """Hash of a mined intent whose payload is served by the pinner stand-in"""
+    monkeypatch.setenv(f"{NETWORK.upper()}_RPC_URL", chain.url)
+    _, payload = make_payload()
+    cid = compute_payload_cid(payload)
+    stack.pinner.pinned[cid] = payload
+    envelope_hash = Web3.keccak(canonicalize_envelope(payload["envelope"]).encode("utf-8"))
+    return chain.record_intent(bytes(envelope_hash), cid, "0x" + "ab" * 20, 10**15)
+
+
+def test_verify_tx(benchmark, stack, recorded_tx, capsys):
+    """Verify a recorded intent end to end"""
+    def verify():
+        try:
+            verify_tx(recorded_tx, gateway=stack.pinner.url, network=NETWORK, no_color=True)
+        except typer.Exit as e:
+            return e.exit_code
+
+    assert benchmark(verify) == 0
@@ -7,7 +7,7 @@ import typer
 from typing import Optional
 import importlib.metadata
 
-from . import verify
+from . import bench, verify
 
 try:
     __version__ = importlib.metadata.version("intentlayer-sdk")
@@ -21,6 +21,7 @@ app = typer.Typer(
 
 # Register commands
 app.add_typer(verify.app, name="verify", help="Verify an intent transaction")
+app.add_typer(bench.app, name="bench", help="Measure intent throughput and latency")
 
 @app.callback()
 def main(
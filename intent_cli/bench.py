@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Bench command for IntentLayer CLI.
+
+This module implements the 'bench' command, a load generator that pushes
+synthetic signed envelopes through IntentClient.send_intent (or DID
+registrations through GatewayClient.register_did) at a target rate or
+concurrency and reports throughput, per-stage latency percentiles and errors.
+"""
+import json
+import logging
+import secrets
+import threading
+import time
+from collections import Counter
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, List, Optional
+
+import typer
+
+from intentlayer_sdk.instrumentation import Instrumentation, InstrumentationListener, StageEvent
+
+# Create the app
+app = typer.Typer(
+    help="Measure intent throughput and latency",
+    epilog="""
+    Exit codes:
+      0: Run completed
+      1: Every operation failed
+      2: Could not set up the clients
+      4: Invalid command arguments
+    """
+)
+
+TARGETS = ("intent", "gateway")
+
+# Setup logger
+logger = logging.getLogger("intent_cli.bench")
+
+# An operation performs request number i and returns an error label, or None on success
+Operation = Callable[[int], Optional[str]]
+
+
+class StageRecorder(InstrumentationListener):
+    """Collects per-stage durations and failures from instrumentation events."""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = {}
+        self.errors: Dict[str, Counter] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, duration: float, error: Optional[str] = None) -> None:
+        """Record one stage run."""
+        with self._lock:
+            self.samples.setdefault(stage, []).append(duration)
+            if error is not None:
+                self.errors.setdefault(stage, Counter())[error] += 1
+
+    def on_stage_end(self, event: StageEvent) -> None:
+        # Whole-operation events are timed by the runner itself
+        if event.stage is not None:
+            self.record(event.stage, event.duration, event.error)
+
+
+def run_load(
+    operation: Operation,
+    duration: float,
+    concurrency: int = 1,
+    rate: float = 0.0,
+    count: Optional[int] = None,
+    recorder: Optional[StageRecorder] = None,
+) -> Dict[str, Any]:
+    """
+    Run an operation repeatedly from several worker threads.
+
+    Args:
+        operation: Callable performing request number i, returning an error label or None
+        duration: Seconds after which no new operation is started
+        concurrency: Number of worker threads
+        rate: Target operations started per second across all workers (0 for as fast as possible)
+        count: Stop after this many operations, even if time is left
+        recorder: Recorder receiving the per-operation "total" latency
+
+    Returns:
+        Report dictionary (see format_report)
+    """
+    recorder = recorder or StageRecorder()
+    errors: Counter = Counter()
+    lock = threading.Lock()
+    state = {"next": 0, "ok": 0, "failed": 0, "last_end": 0.0}
+    start = time.perf_counter()
+    deadline = start + duration
+
+    def worker() -> None:
+        while True:
+            with lock:
+                index = state["next"]
+                if count is not None and index >= count:
+                    return
+                state["next"] += 1
+            if rate > 0:
+                due = start + index / rate
+                if due >= deadline:
+                    return
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            elif time.perf_counter() >= deadline:
+                return
+
+            began = time.perf_counter()
+            try:
+                error = operation(index)
+            except Exception as e:
+                logger.debug(f"Operation {index} failed: {e}")
+                error = type(e).__name__
+            ended = time.perf_counter()
+
+            with lock:
+                state["last_end"] = max(state["last_end"], ended)
+                if error is None:
+                    state["ok"] += 1
+                else:
+                    state["failed"] += 1
+                    errors[error] += 1
+            recorder.record("total", ended - began, error)
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(max(1, concurrency))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    from intentlayer_sdk.testing import summarize_latencies
+
+    elapsed = max(state["last_end"] - start, 1e-9) if state["ok"] + state["failed"] else 0.0
+    stages = {}
+    for stage in ["total"] + [name for name in recorder.samples if name != "total"]:
+        if stage not in recorder.samples:
+            continue
+        summary = summarize_latencies(recorder.samples[stage])
+        stages[stage] = {
+            "count": summary["count"],
+            **{key: round(summary[key] * 1000, 3) for key in ("mean", "p50", "p90", "p99", "max")},
+            "errors": dict(recorder.errors.get(stage, {})),
+        }
+    return {
+        "duration_s": duration,
+        "concurrency": max(1, concurrency),
+        "target_rate": rate or None,
+        "operations": state["ok"] + state["failed"],
+        "succeeded": state["ok"],
+        "failed": state["failed"],
+        "elapsed_s": round(elapsed, 3),
+        "throughput": round(state["ok"] / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": stages,
+        "errors": dict(errors.most_common()),
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Render a run_load report as a text table."""
+    rate = f"{report['target_rate']:g}/s" if report.get("target_rate") else "unthrottled"
+    lines = []
+    if report.get("target"):
+        lines.append(f"Target:      {report['target']} ({report.get('endpoints', 'custom endpoints')})")
+    lines += [
+        f"Load:        {report['duration_s']:g} s, concurrency {report['concurrency']}, rate {rate}",
+        f"Operations:  {report['succeeded']} succeeded, {report['failed']} failed in {report['elapsed_s']:.2f} s",
+        f"Throughput:  {report['throughput']:.2f} ops/s",
+        "",
+        f"{'stage':<12} {'count':>7} {'mean ms':>9} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9} {'errors':>7}",
+    ]
+    for stage, row in report["latency_ms"].items():
+        lines.append(
+            f"{stage:<12} {row['count']:>7} {row['mean']:>9.2f} {row['p50']:>9.2f} {row['p90']:>9.2f} "
+            f"{row['p99']:>9.2f} {row['max']:>9.2f} {sum(row['errors'].values()):>7}"
+        )
+    if report["errors"]:
+        lines += ["", "Errors:"]
+        lines += [f"  {label:<32} {n:>7}" for label, n in report["errors"].items()]
+    return "\n".join(lines)
+
+
+def intent_operation(client: Any, wait_for_receipt: bool = True, recorder: Optional[StageRecorder] = None) -> Operation:
+    """
+    Build an operation that signs a synthetic envelope and sends it with client.send_intent.
+
+    Envelopes are signed by a throwaway Ed25519 key; their creation is
+    recorded as the "envelope" stage.
+    """
+    from intentlayer_sdk.envelope import create_envelope
+    from intentlayer_sdk.identity.crypto import derive_did_from_pubkey, generate_ed25519_keypair
+
+    private_key, public_key = generate_ed25519_keypair()
+    did = derive_did_from_pubkey(public_key)
+    stake_wei = client.min_stake_wei
+    run_id = secrets.token_hex(4)
+
+    def operation(index: int) -> Optional[str]:
+        prompt = f"intent-cli bench {run_id} #{index}"
+        began = time.perf_counter()
+        envelope = create_envelope(
+            prompt=prompt,
+            model_id="intent-cli-bench",
+            tool_id="intent-cli://bench",
+            did=did,
+            private_key=private_key,
+            stake_wei=stake_wei,
+        )
+        if recorder is not None:
+            recorder.record("envelope", time.perf_counter() - began)
+        payload = {"envelope": envelope.model_dump(), "prompt": prompt}
+        receipt = client.send_intent(envelope.hex_hash(), payload, wait_for_receipt=wait_for_receipt)
+        if wait_for_receipt and receipt.get("status") != 1:
+            return "TransactionReverted"
+        return None
+
+    return operation
+
+
+def gateway_operation(gateway_client: Any) -> Operation:
+    """Build an operation that registers a fresh random DID with the Gateway."""
+    from intentlayer_sdk.identity.crypto import derive_did_from_pubkey
+
+    def operation(index: int) -> Optional[str]:
+        public_key = secrets.token_bytes(32)
+        receipt = gateway_client.register_did(derive_did_from_pubkey(public_key), pub_key=public_key)
+        if not receipt.success:
+            return receipt.error_code or "RegisterFailed"
+        return None
+
+    return operation
+
+
+@app.callback(invoke_without_command=True)
+def main(
+    target: str = typer.Option(
+        "intent",
+        "--target",
+        help="What to drive: 'intent' (IntentClient.send_intent) or 'gateway' (GatewayClient.register_did)"
+    ),
+    duration: float = typer.Option(10.0, "--duration", help="Seconds to generate load for"),
+    concurrency: int = typer.Option(4, "--concurrency", help="Number of concurrent workers"),
+    rate: float = typer.Option(
+        0.0,
+        "--rate",
+        help="Target operations per second across all workers (0: as fast as the workers go)"
+    ),
+    count: Optional[int] = typer.Option(None, "--count", help="Stop after this many operations"),
+    local: bool = typer.Option(
+        False,
+        "--local",
+        help="Run against in-process pinner, chain and Gateway stand-ins (offline)"
+    ),
+    latency_ms: float = typer.Option(
+        0.0,
+        "--latency-ms",
+        help="Latency injected into every stand-in request with --local"
+    ),
+    network: str = typer.Option(None, "--network", help="Network from networks.json (intent target)"),
+    rpc_url: str = typer.Option(None, "--rpc-url", help="RPC URL override (intent target)"),
+    pinner_url: str = typer.Option(
+        None,
+        "--pinner-url",
+        envvar="PINNER_URL",
+        help="IPFS pinning service URL (intent target)"
+    ),
+    private_key: str = typer.Option(
+        None,
+        "--private-key",
+        envvar="PRIVATE_KEY",
+        help="Private key of the funded account sending the intents (intent target)"
+    ),
+    gateway_url: str = typer.Option(
+        None,
+        "--gateway-url",
+        envvar="INTENT_GATEWAY_URL",
+        help="Gateway service URL (gateway target)"
+    ),
+    no_wait: bool = typer.Option(False, "--no-wait", help="Don't wait for transaction receipts"),
+    json_output: bool = typer.Option(False, "--json", help="Print the report as JSON"),
+    output: str = typer.Option(None, "--output", help="Also write the JSON report to this file"),
+    debug: bool = typer.Option(False, "--debug", help="Enable debug output"),
+):
+    """
+    Generate load against a pinner, RPC node and Gateway and report throughput and latency.
+
+    Without --local, the intent target needs --network, --pinner-url and
+    --private-key, and the gateway target needs --gateway-url. Every intent
+    stakes the minimum stake.
+
+    Returns exit code:
+    - 0: Run completed
+    - 1: Every operation failed
+    - 2: Could not set up the clients
+    - 4: Invalid command arguments
+    """
+    if debug:
+        logging.basicConfig(level=logging.DEBUG)
+
+    if target not in TARGETS:
+        typer.echo(f"Error: --target must be one of: {', '.join(TARGETS)}", err=True)
+        raise typer.Exit(4)
+    if duration <= 0 or concurrency < 1 or rate < 0 or (count is not None and count < 1):
+        typer.echo("Error: --duration, --concurrency and --count must be positive and --rate non-negative", err=True)
+        raise typer.Exit(4)
+    if not local:
+        missing = (
+            [flag for flag, value in (("--network", network), ("--pinner-url", pinner_url), ("--private-key", private_key)) if not value]
+            if target == "intent" else
+            ([] if gateway_url else ["--gateway-url"])
+        )
+        if missing:
+            typer.echo(f"Error: {', '.join(missing)} required without --local", err=True)
+            raise typer.Exit(4)
+
+    recorder = StageRecorder()
+    hub = Instrumentation([recorder])
+
+    with ExitStack() as stack:
+        try:
+            if local:
+                from intentlayer_sdk.testing import local_stack
+                stand_ins = stack.enter_context(local_stack(latency=latency_ms / 1000, gateway=target == "gateway"))
+                endpoints = f"local stand-ins, {latency_ms:g} ms injected latency"
+            else:
+                endpoints = network if target == "intent" else gateway_url
+
+            if target == "intent":
+                if local:
+                    client = stand_ins.client(instrumentation=hub, pin_cache=False)
+                else:
+                    client = _remote_intent_client(network, rpc_url, pinner_url, private_key, hub)
+                operation = intent_operation(client, wait_for_receipt=not no_wait, recorder=recorder)
+            else:
+                if local:
+                    gateway_client = stand_ins.gateway_client(instrumentation=hub)
+                else:
+                    from intentlayer_sdk.gateway.client import GatewayClient
+                    gateway_client = GatewayClient(gateway_url, instrumentation=hub)
+                stack.callback(gateway_client.close)
+                operation = gateway_operation(gateway_client)
+        except Exception as e:
+            if debug:
+                logger.exception("Setup failed")
+            typer.echo(f"Error: Could not set up the {target} benchmark: {e}", err=True)
+            raise typer.Exit(2)
+
+        report = {
+            "target": target,
+            "endpoints": endpoints,
+            **run_load(operation, duration, concurrency=concurrency, rate=rate, count=count, recorder=recorder),
+        }
+
+    if output:
+        with open(output, "w") as f:
+            json.dump(report, f, indent=2)
+    typer.echo(json.dumps(report, indent=2) if json_output else format_report(report))
+
+    if report["operations"] and not report["succeeded"]:
+        raise typer.Exit(1)
+
+
+def _remote_intent_client(
+    network: str, rpc_url: Optional[str], pinner_url: str, private_key: str, hub: Instrumentation
+) -> Any:
+    """Create an IntentClient for a configured network with pin caching disabled."""
+    from intentlayer_sdk.client import IntentClient
+    from intentlayer_sdk.config import NetworkConfig
+    from intentlayer_sdk.signer.local import LocalSigner
+
+    net_config = NetworkConfig.get_network(network)
+    return IntentClient(
+        rpc_url=NetworkConfig.get_rpc_url(network, rpc_url),
+        pinner_url=pinner_url,
+        signer=LocalSigner(private_key),
+        recorder_address=net_config["intentRecorder"],
+        did_registry_address=net_config.get("didRegistry"),
+        expected_chain_id=int(net_config["chainId"]),
+        pin_cache=False,
+        instrumentation=hub,
+    )
+
+
+if __name__ == "__main__":
+    app()
@@ -11,13 +11,15 @@ import json
 import difflib
 import logging
 import urllib.parse
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Optional, Tuple, List, TYPE_CHECKING
 
 import typer
-import requests
-from web3 import Web3
-from web3.types import TxReceipt
 
+# web3 and requests are imported where needed to keep CLI startup fast
+if TYPE_CHECKING:
+    from web3 import Web3
+
+from intentlayer_sdk.canonical import canonical_json, keccak256
 from intentlayer_sdk.config import NetworkConfig
 
 # Create the app
@@ -56,6 +58,7 @@ def get_intent_recorded_event_signature():
     """Get the IntentRecorded event signature hex, cached for performance."""
     global _EVENT_SIGNATURE
     if _EVENT_SIGNATURE is None:
+        from web3 import Web3
         _EVENT_SIGNATURE = Web3.keccak(text="IntentRecorded(bytes32,string,address,uint256)").hex()
     return _EVENT_SIGNATURE
 
@@ -63,7 +66,7 @@ def setup_web3_for_network(
     network_name: Optional[str] = None, 
     chain_id: Optional[int] = None, 
     tx_hash: Optional[str] = None
-) -> Tuple[Web3, str, Optional[Dict[str, Any]]]:
+) -> Tuple["Web3", str, Optional[Dict[str, Any]]]:
     """
     Setup Web3 for a specific network based on network name, chain ID, or transaction hash.
     
@@ -78,8 +81,10 @@ def setup_web3_for_network(
     Raises:
         ValueError: If no matching network configuration is found
     """
+    from web3 import Web3
+    
     # Get all available networks
-    networks = NetworkConfig.get_all_networks()
+    networks = NetworkConfig.load_networks()
     
     # Case 1: Network name provided
     if network_name:
@@ -156,6 +161,8 @@ def fetch_ipfs_json(cid: str, gateway_url: str, token: Optional[str] = None) ->
         ValueError: If CID is invalid or payload is not valid JSON
         ConnectionError: If gateway is unreachable
     """
+    import requests
+    
     # Parse the gateway URL properly
     parsed = urllib.parse.urlparse(gateway_url)
     path = parsed.path.rstrip('/')
@@ -195,7 +202,7 @@ def canonicalize_envelope(envelope: Dict[str, Any]) -> str:
         del env_copy["metadata"]
     
     # Sort keys and remove whitespace
-    return json.dumps(env_copy, sort_keys=True, separators=(',', ':'))
+    return canonical_json(env_copy).decode("utf-8")
 
 # UNUSED until v2 contracts emit full envelope
 # This function will be used in a future version when the contract is upgraded 
@@ -270,13 +277,13 @@ def verify_hash_match(envelope_hash_hex: str, ipfs_envelope: Dict[str, Any]) ->
     """
     # Generate hash from IPFS envelope
     ipfs_canonical = canonicalize_envelope(ipfs_envelope).encode('utf-8')
-    calculated_hash = Web3.keccak(ipfs_canonical).hex()
+    calculated_hash = keccak256(ipfs_canonical).hex()
     
-    # Normalize hex strings
-    if not envelope_hash_hex.startswith('0x'):
-        envelope_hash_hex = '0x' + envelope_hash_hex
+    # Normalize hex strings (HexBytes.hex() drops the 0x prefix as of hexbytes 1.0)
+    calculated_hash = calculated_hash.lower().removeprefix('0x')
+    envelope_hash_hex = envelope_hash_hex.lower().removeprefix('0x')
     
-    return calculated_hash.lower() == envelope_hash_hex.lower()
+    return calculated_hash == envelope_hash_hex
 
 def should_use_color() -> bool:
     """
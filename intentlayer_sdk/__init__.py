@@ -1,33 +1,110 @@
 """
 IntentLayer SDK - Python client for the IntentLayer protocol.
+
+Public classes are imported on first access so that `import intentlayer_sdk`
+does not load web3, pydantic or eth_account until they are needed.
 """
+import importlib
 import warnings
-from .client import IntentClient
-from .models import TxReceipt
-from .envelope import CallEnvelope, create_envelope
+from typing import Any, List, TYPE_CHECKING
+
 from .exceptions import (
     IntentLayerError, PinningError, TransactionError, 
     EnvelopeError, NetworkError, AlreadyRegisteredError, InactiveDIDError
 )
-from .config import NetworkConfig, NETWORKS
-from .signer import Signer
-from .signer.local import LocalSigner
 
 # Import version
 from .version import __version__
 
+# Public name -> submodule defining it
+_LAZY_IMPORTS = {
+    "IntentClient": ".client",
+    "AsyncIntentClient": ".async_client",
+    "IntentOutbox": ".outbox",
+    "Instrumentation": ".instrumentation",
+    "InstrumentationListener": ".instrumentation",
+    "StageEvent": ".instrumentation",
+    "OpenTelemetryListener": ".instrumentation",
+    "MetricsRegistry": ".metrics",
+    "get_metrics_registry": ".metrics",
+    "TxReceipt": ".models",
+    "CallEnvelope": ".envelope",
+    "IntentResult": ".pipeline",
+    "create_envelope": ".envelope",
+    "create_envelopes": ".envelope",
+    "prompt_sha256": ".envelope",
+    "EnvelopeBatch": ".envelope",
+    "verify_envelope": ".envelope",
+    "verify_envelopes": ".envelope",
+    "NetworkConfig": ".config",
+    "NETWORKS": ".config",
+    "Signer": ".signer",
+    "LocalSigner": ".signer.local",
+}
+
+if TYPE_CHECKING:
+    from .client import IntentClient
+    from .async_client import AsyncIntentClient
+    from .models import TxReceipt
+    from .pipeline import IntentResult
+    from .outbox import IntentOutbox
+    from .instrumentation import (
+        Instrumentation, InstrumentationListener, StageEvent, OpenTelemetryListener
+    )
+    from .metrics import MetricsRegistry, get_metrics_registry
+    from .envelope import (
+        CallEnvelope, EnvelopeBatch, create_envelope, create_envelopes, prompt_sha256,
+        verify_envelope, verify_envelopes,
+    )
+    from .config import NetworkConfig, NETWORKS
+    from .signer import Signer
+    from .signer.local import LocalSigner
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # NETWORKS stays lazy in config; everything else is cached here
+    if name != "NETWORKS":
+        globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
 # No backward compatibility layer - using clean API from the start
 
 __all__ = [
     # Main client
     "IntentClient",
+    "AsyncIntentClient",
+    "IntentOutbox",
+    
+    # Instrumentation
+    "Instrumentation",
+    "InstrumentationListener",
+    "StageEvent",
+    "OpenTelemetryListener",
+    
+    # Metrics
+    "MetricsRegistry",
+    "get_metrics_registry",
     
     # Models
     "TxReceipt", 
     "CallEnvelope",
+    "IntentResult",
     
     # Envelope utilities
     "create_envelope",
+    "create_envelopes",
+    "EnvelopeBatch",
+    "prompt_sha256",
+    "verify_envelope",
+    "verify_envelopes",
     
     # Network configuration
     "NetworkConfig",
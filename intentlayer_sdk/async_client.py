@@ -0,0 +1,631 @@
+"""
+AsyncIntentClient - asyncio client for the IntentLayer protocol.
+"""
+import asyncio
+import logging
+import time
+import urllib.parse
+from typing import Dict, Any, Optional, Union, Tuple
+
+import aiohttp
+from web3 import AsyncWeb3, Web3
+from web3.exceptions import Web3Exception
+
+from .client import IntentClient
+from .config import NetworkConfig
+from .exceptions import (
+    PinningError, TransactionError, EnvelopeError, NetworkError,
+    AlreadyRegisteredError, InactiveDIDError
+)
+from .nonce import NonceManager, get_nonce_manager, is_already_known, is_ambiguous_send_error, is_nonce_error
+from .signer import Signer
+from .signer.local import LocalSigner
+from .utils import ipfs_cid_to_bytes
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+class AsyncIntentClient:
+    """
+    Asyncio client for interacting with the IntentLayer protocol.
+
+    Mirrors IntentClient (send_intent, pin_to_ipfs, resolve_did, register_did,
+    and get_min_stake_wei() for min_stake_wei) without blocking the event loop: chain access goes through
+    web3's AsyncHTTPProvider, pinning through a pooled aiohttp session, and
+    retries back off with asyncio.sleep. Nonces are allocated from the same
+    process-wide NonceManager as IntentClient, so sync and async clients can
+    share a signer.
+
+    The HTTP session is created on first use; call close() (or use the client
+    as an async context manager) to release pooled connections.
+    """
+
+    INTENT_RECORDER_ABI = IntentClient.INTENT_RECORDER_ABI
+    DID_REGISTRY_ABI = IntentClient.DID_REGISTRY_ABI
+    NONCE_RETRIES = IntentClient.NONCE_RETRIES
+
+    # Minimum stake cache expiration: 15 minutes
+    MIN_STAKE_CACHE_SECONDS = 900
+
+    # Base delay in seconds for pinner retry backoff
+    PIN_BACKOFF = 0.5
+
+    # Payload helpers are shared with the synchronous client
+    _validate_payload = IntentClient._validate_payload
+    _sanitize_payload = IntentClient._sanitize_payload
+    _map_send_error = IntentClient._map_send_error
+
+    @classmethod
+    def from_network(
+        cls,
+        network: str,
+        pinner_url: str,
+        signer: Union[Signer, str],
+        rpc_url: Optional[str] = None,
+        retry_count: int = 3,
+        timeout: int = 30,
+        logger: Optional[logging.Logger] = None,
+        pool_size: int = 100,
+    ) -> "AsyncIntentClient":
+        """
+        Create an AsyncIntentClient from a network configuration.
+
+        Args:
+            network: Network name from networks.json (e.g., "zksync-era-sepolia")
+            pinner_url: URL of the IPFS pinning service
+            signer: Either a Signer instance or a private key string
+            rpc_url: Optional RPC URL override
+            retry_count: Number of retries for pinner requests
+            timeout: Timeout in seconds for HTTP requests
+            logger: Optional logger instance
+            pool_size: Maximum pooled connections to the pinner
+
+        Returns:
+            Configured AsyncIntentClient instance
+
+        Raises:
+            NetworkError: If the network configuration cannot be loaded
+        """
+        try:
+            net_config = NetworkConfig.get_network(network)
+            if isinstance(signer, str):
+                signer = LocalSigner(signer)
+
+            client = cls(
+                rpc_url=NetworkConfig.get_rpc_url(network, rpc_url),
+                pinner_url=pinner_url,
+                signer=signer,
+                recorder_address=net_config["intentRecorder"],
+                did_registry_address=net_config["didRegistry"],
+                expected_chain_id=int(net_config["chainId"]),
+                retry_count=retry_count,
+                timeout=timeout,
+                logger=logger,
+                pool_size=pool_size,
+            )
+            client._network_name = network
+            return client
+        except Exception as e:
+            raise NetworkError(f"Failed to initialize client from network '{network}': {str(e)}")
+
+    def __init__(
+        self,
+        rpc_url: str,
+        pinner_url: str,
+        signer: Signer,
+        recorder_address: str = "",
+        did_registry_address: Optional[str] = None,
+        min_stake_wei: Optional[int] = None,
+        *,
+        expected_chain_id: Optional[int] = None,
+        retry_count: int = 3,
+        timeout: int = 30,
+        logger: Optional[logging.Logger] = None,
+        pool_size: int = 100,
+    ):
+        """
+        Initialize the AsyncIntentClient.
+
+        No network I/O happens here, so the client can be created outside a
+        running event loop.
+
+        Args:
+            rpc_url: Ethereum RPC URL
+            pinner_url: IPFS pinning service URL
+            signer: Signer instance for signing transactions
+            recorder_address: IntentRecorder contract address
+            did_registry_address: DIDRegistry contract address (optional)
+            min_stake_wei: Manual override for minimum stake (auto-queried if None)
+            expected_chain_id: Expected chain ID for safety checks (recommended)
+            retry_count: Number of retries for pinner requests
+            timeout: Timeout in seconds for HTTP requests
+            logger: Optional logger instance
+            pool_size: Maximum pooled connections to the pinner
+        """
+        # Validate URLs
+        for name, url in [("rpc_url", rpc_url), ("pinner_url", pinner_url)]:
+            parsed = urllib.parse.urlparse(url)
+            host = parsed.hostname or ""
+            is_local = host in ("localhost", "127.0.0.1")
+            if parsed.scheme != "https" and not is_local:
+                raise ValueError(
+                    f"{name} must use https:// for security (got: {parsed.scheme}://)"
+                )
+
+        if signer is None:
+            raise ValueError("signer must be provided")
+
+        self.rpc_url = rpc_url
+        self.pinner_url = pinner_url.rstrip("/")
+        self.recorder_address = Web3.to_checksum_address(recorder_address) if recorder_address else ""
+        self.did_registry_address = Web3.to_checksum_address(did_registry_address) if did_registry_address else None
+        self.signer = signer
+        self.logger = logger or logging.getLogger(__name__)
+        self.retry_count = retry_count
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self._network_name = None
+        self._expected_chain_id = expected_chain_id
+        self._min_stake_wei = min_stake_wei
+        # Use timestamp of 0 to mark manually set values
+        self._min_stake_wei_timestamp = None if min_stake_wei is None else 0
+
+        # Web3 setup (AsyncHTTPProvider manages its own pooled aiohttp session)
+        self.w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc_url))
+
+        self.recorder_contract = None
+        if self.recorder_address:
+            self.recorder_contract = self.w3.eth.contract(
+                address=self.recorder_address, abi=self.INTENT_RECORDER_ABI
+            )
+
+        self.did_registry_contract = None
+        if self.did_registry_address:
+            self.did_registry_contract = self.w3.eth.contract(
+                address=self.did_registry_address, abi=self.DID_REGISTRY_ABI
+            )
+
+        # Pinner session is created lazily inside the running event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncIntentClient":
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit async context manager, closing pooled connections."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the pinner session and the RPC provider's session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        disconnect = getattr(self.w3.provider, "disconnect", None)
+        if callable(disconnect):
+            try:
+                await disconnect()
+            except Exception as e:
+                self.logger.debug(f"Error closing RPC provider session: {e}")
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the pooled pinner session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size, limit_per_host=self.pool_size)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    @property
+    def address(self) -> str:
+        """Get the address associated with the signer."""
+        return self.signer.address
+
+    @property
+    def nonce_manager(self) -> NonceManager:
+        """Get the nonce manager shared by all clients using this signer on this chain."""
+        chain_key = self._expected_chain_id if self._expected_chain_id is not None else self.rpc_url
+        return get_nonce_manager(self.address, chain_key)
+
+    async def get_min_stake_wei(self) -> int:
+        """
+        Get the minimum stake required by the IntentRecorder contract.
+
+        Returns:
+            Minimum stake in wei
+
+        Raises:
+            TransactionError: If the contract call fails
+
+        Note:
+            The value is cached for 15 minutes, and never refreshed if it was
+            provided in the constructor. Use refresh_min_stake() to force a refresh.
+        """
+        manually_set = self._min_stake_wei is not None and self._min_stake_wei_timestamp == 0
+        if manually_set:
+            return self._min_stake_wei
+
+        current_time = time.time()
+        cache_expired = (self._min_stake_wei_timestamp is None or
+                         current_time - self._min_stake_wei_timestamp > self.MIN_STAKE_CACHE_SECONDS)
+        if self._min_stake_wei is None or cache_expired:
+            try:
+                self._min_stake_wei = await self.recorder_contract.functions.MIN_STAKE_WEI().call()
+                self._min_stake_wei_timestamp = current_time
+                self.logger.debug(f"Updated min_stake_wei to {self._min_stake_wei}")
+            except Exception as e:
+                raise TransactionError(f"Failed to get minimum stake: {e}")
+        return self._min_stake_wei
+
+    async def refresh_min_stake(self) -> int:
+        """
+        Force refresh the minimum stake value from the contract.
+
+        Raises:
+            TransactionError: If the contract call fails
+        """
+        try:
+            self._min_stake_wei = await self.recorder_contract.functions.MIN_STAKE_WEI().call()
+            self._min_stake_wei_timestamp = time.time()
+            self.logger.debug(f"Refreshed min_stake_wei to {self._min_stake_wei}")
+            return self._min_stake_wei
+        except Exception as e:
+            raise TransactionError(f"Failed to refresh minimum stake: {e}")
+
+    async def assert_chain_id(self) -> None:
+        """
+        Assert that the connected chain matches the expected chain ID.
+
+        Raises:
+            NetworkError: If the chain ID doesn't match or cannot be read
+        """
+        if self._expected_chain_id is None:
+            self.logger.warning("No expected chain ID set, skipping chain ID validation")
+            return
+
+        try:
+            actual_chain_id = await self.w3.eth.chain_id
+        except Exception as e:
+            raise NetworkError(f"Failed to validate chain ID: {e}")
+        if actual_chain_id != self._expected_chain_id:
+            network_name = self._network_name or "unknown"
+            raise NetworkError(
+                f"Chain ID mismatch: expected {self._expected_chain_id} ({network_name}), "
+                f"got {actual_chain_id}"
+            )
+
+    async def resolve_did(self, did: str) -> Tuple[str, bool]:
+        """
+        Resolve a DID to its associated Ethereum address and active status.
+
+        Returns:
+            Tuple of (owner_address, active_flag); (ZERO_ADDRESS, False) if the
+            DID is not registered
+
+        Raises:
+            ValueError: If DIDRegistry contract address is not set
+            TransactionError: If there's an RPC or contract error
+        """
+        if not self.did_registry_contract:
+            raise ValueError("DIDRegistry contract address not set")
+
+        try:
+            owner, active = await self.did_registry_contract.functions.resolve(did).call()
+            return Web3.to_checksum_address(owner), active
+        except ValueError as e:
+            if "revert" in str(e).lower():
+                self.logger.debug(f"DID '{did}' not found (contract reverted)")
+                return ZERO_ADDRESS, False
+            raise TransactionError(f"Failed to resolve DID: {e}")
+        except Exception as e:
+            raise TransactionError(f"Failed to resolve DID: {e}")
+
+    async def pin_to_ipfs(self, payload: Dict[str, Any]) -> str:
+        """
+        Pin data to IPFS via the pinning service.
+
+        Server errors (5xx) and connection failures are retried with
+        exponential backoff on the event loop.
+
+        Returns:
+            IPFS CID for the pinned content
+
+        Raises:
+            PinningError: If pinning fails
+        """
+        safe = self._sanitize_payload(payload)
+        self.logger.debug(f"Pinning payload to IPFS: {safe}")
+
+        session = self._get_session()
+        attempt = 0
+        while True:
+            try:
+                async with session.post(f"{self.pinner_url}/pin", json=payload) as resp:
+                    if resp.status < 500:
+                        if resp.status >= 400:
+                            text = await resp.text()
+                            raise PinningError(f"IPFS pinning failed: {resp.status} {text[:200]}")
+                        ct = resp.headers.get("Content-Type", "")
+                        if "application/json" not in ct:
+                            self.logger.warning(f"Unexpected Content-Type: {ct}")
+                        try:
+                            result = await resp.json(content_type=None)
+                        except ValueError as e:
+                            self.logger.error(f"Invalid JSON from pinner: {e}")
+                            raise PinningError(f"Invalid JSON from pinner: {e}")
+                        if not isinstance(result, dict) or "cid" not in result:
+                            raise PinningError(f"Missing CID in pinner response: {result}")
+                        return result["cid"]
+                    error = f"server {resp.status}"
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = str(e) or type(e).__name__
+
+            if attempt >= self.retry_count - 1:
+                self.logger.error(f"IPFS pinning failed: {error}")
+                raise PinningError(f"IPFS pinning failed: {error}")
+            attempt += 1
+            wait = self.PIN_BACKOFF * (2 ** (attempt - 1))
+            self.logger.warning(f"Retrying in {wait}s ({error})")
+            await asyncio.sleep(wait)
+
+    async def _gas_price(self, gas_price_override: Optional[int]) -> int:
+        """Get the gas price to use for a transaction."""
+        if gas_price_override is not None:
+            return gas_price_override
+        return await self.w3.eth.gas_price
+
+    async def _fetch_pending_nonce(self) -> int:
+        """Read the signer's pending transaction count from the chain."""
+        return await self.w3.eth.get_transaction_count(self.signer.address, "pending")
+
+    async def _sign_and_send(self, build_tx, description: str) -> Tuple[Any, int]:
+        """
+        Allocate a nonce, build, sign and broadcast a transaction.
+
+        Nonce rejections resync the shared nonce manager and rebuild the
+        transaction, up to NONCE_RETRIES times.
+
+        Args:
+            build_tx: Coroutine function building the unsigned transaction for a nonce
+            description: Short label used in log messages
+
+        Returns:
+            Tuple of (transaction hash, nonce used)
+        """
+        manager = self.nonce_manager
+        attempt = 0
+        while True:
+            if manager.next_nonce is None:
+                pending = await self._fetch_pending_nonce()
+                nonce = manager.allocate(lambda: pending)
+            else:
+                nonce = manager.allocate(self._nonce_not_seeded)
+            try:
+                tx = await build_tx(nonce)
+            except Exception:
+                manager.release(nonce)
+                raise
+
+            try:
+                signed = self.signer.sign_transaction(tx)
+            except Exception as e:
+                manager.release(nonce)
+                self.logger.error(f"Signing failed: {e}")
+                raise TransactionError(f"Failed to sign transaction: {e}")
+
+            try:
+                raw_bytes = getattr(signed, "raw_transaction", None) or getattr(signed, "rawTransaction", None)
+                if raw_bytes is None:
+                    raise TransactionError("Signed transaction missing raw bytes")
+                tx_hash = await self.w3.eth.send_raw_transaction(raw_bytes)
+            except Exception as e:
+                if is_already_known(e):
+                    # An earlier attempt already delivered this exact transaction
+                    tx_hash = Web3.keccak(raw_bytes)
+                    self.logger.info(f"Node already has {description} tx {tx_hash.hex()}")
+                    manager.mark_sent(nonce)
+                    return tx_hash, nonce
+                if is_ambiguous_send_error(e) or isinstance(e, aiohttp.ClientConnectionError):
+                    # The transaction may be in flight: keep its nonce out of reuse
+                    manager.mark_sent(nonce)
+                    self.logger.error(f"Send of {description} tx with nonce {nonce} failed with unknown outcome: {e}")
+                    try:
+                        pending = await self._fetch_pending_nonce()
+                        manager.resync(lambda: pending)
+                    except Exception as resync_error:
+                        self.logger.warning(f"Nonce resync failed: {resync_error}")
+                    raise TransactionError(f"Failed to send transaction: {e}") from e
+                manager.release(nonce)
+                if is_nonce_error(e) and attempt < self.NONCE_RETRIES:
+                    attempt += 1
+                    self.logger.warning(f"Nonce {nonce} rejected ({e}), resyncing with chain")
+                    pending = await self._fetch_pending_nonce()
+                    manager.resync(lambda: pending)
+                    continue
+                self.logger.error(f"Send failed: {e}")
+                if isinstance(e, Web3Exception):
+                    raise
+                raise TransactionError(f"Failed to send transaction: {e}")
+
+            manager.mark_sent(nonce)
+            self.logger.info(f"Sent {description} tx: {tx_hash.hex()}")
+            return tx_hash, nonce
+
+    @staticmethod
+    def _nonce_not_seeded() -> int:
+        # Only reached if another task reset the manager between check and allocate
+        raise TransactionError("Nonce manager was reset during allocation, retry the send")
+
+    async def _finish(self, tx_hash: Any, nonce: int, wait_for_receipt: bool,
+                      poll_interval: Optional[float]) -> Dict[str, Any]:
+        """Wait for a transaction's receipt, or return a minimal receipt."""
+        if wait_for_receipt:
+            receipt = await self.w3.eth.wait_for_transaction_receipt(
+                tx_hash, timeout=120, poll_latency=poll_interval or 0.1
+            )
+            self.nonce_manager.mark_confirmed(nonce)
+            return dict(receipt)
+        return {"transactionHash": "0x" + tx_hash.hex() if isinstance(tx_hash, bytes) else tx_hash}
+
+    async def register_did(
+        self,
+        did: str,
+        gas: Optional[int] = None,
+        gas_price_override: Optional[int] = None,
+        wait_for_receipt: bool = True,
+        force: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Register a DID on the DIDRegistry contract.
+
+        Args:
+            did: Decentralized Identifier to register
+            gas: Gas limit for the transaction (optional)
+            gas_price_override: Gas price in wei (optional)
+            wait_for_receipt: Whether to wait for the transaction receipt
+            force: Re-register the DID if it exists but is inactive
+
+        Returns:
+            Transaction receipt as dictionary
+
+        Raises:
+            ValueError: If DIDRegistry contract address is not set
+            AlreadyRegisteredError: If the DID is already registered and active
+            InactiveDIDError: If the DID exists but is inactive and force=False
+            TransactionError: If the transaction fails
+        """
+        if not self.did_registry_contract:
+            raise ValueError("DIDRegistry contract address not set")
+
+        await self.assert_chain_id()
+
+        try:
+            owner, active = await self.resolve_did(did)
+            if active:
+                raise AlreadyRegisteredError(did, owner)
+            elif not force:
+                raise InactiveDIDError(did, owner)
+            self.logger.warning(f"Re-registering inactive DID '{did}' (previously owned by {owner})")
+        except TransactionError:
+            # If resolve_did fails the DID likely doesn't exist, so proceed
+            pass
+
+        try:
+            register = self.did_registry_contract.functions.register(did)
+            if gas is None:
+                try:
+                    est = await register.estimate_gas({"from": self.signer.address})
+                    gas = int(est * 1.1)
+                    self.logger.debug(f"Estimated gas for DID registration: {gas}")
+                except Exception as e:
+                    gas = 250_000
+                    self.logger.warning(f"Gas estimate failed, fallback to {gas}: {e}")
+
+            async def build_tx(nonce: int) -> Dict[str, Any]:
+                return await register.build_transaction({
+                    "from": self.signer.address,
+                    "nonce": nonce,
+                    "gas": gas,
+                    "gasPrice": await self._gas_price(gas_price_override),
+                })
+
+            tx_hash, nonce = await self._sign_and_send(build_tx, "DID registration")
+            return await self._finish(tx_hash, nonce, wait_for_receipt, None)
+
+        except (TransactionError, AlreadyRegisteredError, InactiveDIDError, Web3Exception):
+            raise
+        except Exception as e:
+            self.logger.error(f"Unexpected error in DID registration: {e}")
+            raise TransactionError(f"DID registration failed: {e}")
+
+    async def send_intent(
+        self,
+        envelope_hash: Union[str, bytes],
+        payload_dict: Dict[str, Any],
+        stake_wei: Optional[int] = None,
+        gas: Optional[int] = None,
+        gas_price_override: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        wait_for_receipt: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Send an intent to be recorded on-chain.
+
+        Same steps and errors as IntentClient.send_intent, except Gateway
+        auto-registration, which is only available on the synchronous client.
+
+        Returns:
+            Transaction receipt as dictionary
+
+        Raises:
+            EnvelopeError: If the envelope is invalid
+            PinningError: If IPFS pinning fails
+            TransactionError: If the transaction fails
+            InactiveDIDError: If the envelope's DID exists but is inactive
+        """
+        await self.assert_chain_id()
+
+        try:
+            # 1. Validate payload
+            self._validate_payload(payload_dict)
+
+            # 1.5 Verify DID is active if we have a DID registry
+            did = payload_dict["envelope"].get("did")
+            if self.did_registry_contract and did:
+                try:
+                    owner, active = await self.resolve_did(did)
+                    if not active:
+                        raise InactiveDIDError(did, owner)
+                except TransactionError:
+                    pass
+
+            # 2. Normalize envelope hash
+            if isinstance(envelope_hash, str):
+                h = envelope_hash[2:] if envelope_hash.startswith("0x") else envelope_hash
+                try:
+                    envelope_hash = bytes.fromhex(h)
+                except ValueError as e:
+                    raise EnvelopeError(f"Invalid envelope hash format: {e}")
+
+            if stake_wei is None:
+                stake_wei = await self.get_min_stake_wei()
+
+            # 3. Pin to IPFS
+            cid = await self.pin_to_ipfs(payload_dict)
+            try:
+                cid_bytes = ipfs_cid_to_bytes(cid)
+            except Exception as e:
+                raise EnvelopeError(f"Failed to convert CID: {e}")
+
+            # 4. Gas estimate
+            record = self.recorder_contract.functions.recordIntent(envelope_hash, cid_bytes)
+            if gas is None:
+                try:
+                    est = await record.estimate_gas({"from": self.signer.address, "value": stake_wei})
+                    gas = int(est * 1.1)
+                    self.logger.debug(f"Estimated gas: {gas}")
+                except Exception as e:
+                    gas = 300_000
+                    self.logger.warning(f"Gas estimate failed, fallback to {gas}: {e}")
+                    if "insufficient funds" in str(e).lower():
+                        stake_wei = await self.refresh_min_stake()
+
+            # 5-8. Nonce, build, sign and send
+            async def build_tx(nonce: int) -> Dict[str, Any]:
+                return await record.build_transaction({
+                    "from": self.signer.address,
+                    "nonce": nonce,
+                    "gas": gas,
+                    "value": stake_wei,
+                    "gasPrice": await self._gas_price(gas_price_override),
+                })
+
+            tx_hash, nonce = await self._sign_and_send(build_tx, "intent")
+
+            # 9. Receipt
+            return await self._finish(tx_hash, nonce, wait_for_receipt, poll_interval)
+
+        except Exception as e:
+            raise self._map_send_error(e)
@@ -0,0 +1,219 @@
+"""
+JSON-RPC request batching for the IntentLayer SDK.
+
+BatchingProvider wraps a JSON-RPC provider and coalesces requests issued
+concurrently from several threads into a single JSON-RPC batch array. Each
+caller still receives its own response object, so web3's per-request result
+formatting and error mapping are unchanged. Independent reads made before a
+send, and eth_sendRawTransaction calls from concurrent senders, share one HTTP
+round trip instead of paying one each.
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional, Tuple, Union
+
+from web3.providers import JSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+logger = logging.getLogger(__name__)
+
+
+class _PendingRequest:
+    """A request waiting to be sent in a batch."""
+
+    __slots__ = ("method", "params", "response", "error", "done")
+
+    def __init__(self, method: RPCEndpoint, params: Any):
+        self.method = method
+        self.params = params
+        self.response: Optional[RPCResponse] = None
+        self.error: Optional[BaseException] = None
+        self.done = False
+
+
+class BatchingProvider(JSONBaseProvider):
+    """
+    Provider wrapper that sends concurrent requests as JSON-RPC batches.
+
+    A caller that finds a free sending slot waits up to window seconds for
+    other requests to join, then sends everything queued (up to
+    max_batch_size) in one batch. A lone request (nothing queued or in
+    flight) is sent at once, unless a burst announced with coalesce() is
+    under way. Requests arriving while max_in_flight
+    batches are already on the wire queue up for the next batch. Endpoints
+    that reject batch arrays are detected and served one request at a time.
+
+    The endpoint's eth_chainId answer is remembered, since web3's validation
+    middleware otherwise asks for it before every eth_call and estimate.
+    """
+
+    def __init__(
+        self,
+        provider: JSONBaseProvider,
+        window: float = 0.001,
+        max_batch_size: int = 100,
+        max_in_flight: int = 4,
+        cache_chain_id: bool = True,
+    ):
+        """
+        Initialize the batching provider.
+
+        Args:
+            provider: Underlying JSON-RPC provider (e.g. HTTPProvider)
+            window: Seconds a sender waits for more requests before sending
+            max_batch_size: Maximum requests per batch
+            max_in_flight: Maximum batches sent at the same time
+            cache_chain_id: Answer repeated eth_chainId requests from memory
+        """
+        super().__init__()
+        if max_batch_size < 1 or max_in_flight < 1:
+            raise ValueError("max_batch_size and max_in_flight must be at least 1")
+        self.provider = provider
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.max_in_flight = max_in_flight
+        self.supports_batching = True
+        self.cache_chain_id = cache_chain_id
+        self._chain_id_response: Optional[RPCResponse] = None
+
+        self._cond = threading.Condition()
+        self._queue: List[_PendingRequest] = []
+        self._in_flight = 0
+        self._collecting = False
+        self._bursts = 0
+
+        # Round trip counters, useful for verifying batching works
+        self.round_trips = 0
+        self.requests = 0
+
+    @property
+    def endpoint_uri(self) -> Any:
+        """Endpoint of the wrapped provider."""
+        return getattr(self.provider, "endpoint_uri", None)
+
+    @contextmanager
+    def coalesce(self) -> Iterator[None]:
+        """
+        Announce concurrent requests about to be issued from several threads.
+
+        While the block runs, even a request that finds nothing else queued
+        waits for the window so the others can join its batch.
+        """
+        with self._cond:
+            self._bursts += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._bursts -= 1
+
+    def clear_chain_id(self) -> None:
+        """Forget the remembered eth_chainId answer."""
+        self._chain_id_response = None
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        """Check the connection of the wrapped provider."""
+        return self.provider.is_connected(show_traceback)
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """
+        Send a request, batched with any concurrent requests.
+
+        Args:
+            method: JSON-RPC method
+            params: JSON-RPC params
+
+        Returns:
+            The JSON-RPC response for this request
+        """
+        if method == "eth_chainId" and self._chain_id_response is not None:
+            return dict(self._chain_id_response)  # type: ignore[return-value]
+
+        request = _PendingRequest(method, params)
+        with self._cond:
+            self._queue.append(request)
+            self.requests += 1
+            self._cond.notify_all()
+            while not request.done:
+                if not self._queue or self._collecting or self._in_flight >= self.max_in_flight:
+                    self._cond.wait()
+                    continue
+                # A lone request has nothing to wait for
+                lone = self._in_flight == 0 and len(self._queue) == 1 and not self._bursts
+                self._in_flight += 1
+                self._collecting = True
+                # Let concurrent callers join this batch
+                deadline = time.monotonic() + (0 if lone else self.window)
+                while len(self._queue) < self.max_batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(timeout=remaining)
+                self._collecting = False
+                batch = self._queue[:self.max_batch_size]
+                del self._queue[:len(batch)]
+                self.round_trips += 1
+                self._cond.release()
+                try:
+                    self._send(batch)
+                finally:
+                    self._cond.acquire()
+                    self._in_flight -= 1
+                    self._cond.notify_all()
+
+        if request.error is not None:
+            raise request.error
+        response = request.response
+        if (
+            method == "eth_chainId" and self.cache_chain_id
+            and isinstance(response, dict) and "result" in response
+        ):
+            self._chain_id_response = response
+        return response  # type: ignore[return-value]
+
+    def make_batch_request(
+        self, requests: List[Tuple[RPCEndpoint, Any]]
+    ) -> Union[List[RPCResponse], RPCResponse]:
+        """Send an explicit batch through the wrapped provider."""
+        self.round_trips += 1
+        return self.provider.make_batch_request(requests)
+
+    def _send(self, batch: List[_PendingRequest]) -> None:
+        """Send a batch and hand each response to its request (called without the lock)."""
+        if len(batch) > 1 and self.supports_batching:
+            try:
+                responses = self.provider.make_batch_request(
+                    [(r.method, r.params) for r in batch]
+                )
+            except Exception as e:
+                self._complete(batch, error=e)
+                return
+            if isinstance(responses, list) and len(responses) == len(batch):
+                for request, response in zip(batch, responses):
+                    request.response = response
+                self._complete(batch)
+                return
+            # A single error object means the endpoint does not accept batches
+            logger.warning("RPC endpoint rejected a batch request, sending requests individually")
+            self.supports_batching = False
+            self.round_trips += 1
+
+        for i, request in enumerate(batch):
+            try:
+                if i:
+                    self.round_trips += 1
+                request.response = self.provider.make_request(request.method, request.params)
+            except Exception as e:
+                request.error = e
+        self._complete(batch)
+
+    def _complete(self, batch: List[_PendingRequest], error: Optional[BaseException] = None) -> None:
+        """Mark requests done and wake their callers."""
+        with self._cond:
+            for request in batch:
+                if error is not None:
+                    request.error = error
+                request.done = True
+            self._cond.notify_all()
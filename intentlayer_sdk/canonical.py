@@ -0,0 +1,99 @@
+"""
+Canonical JSON encoding and keccak hashing for envelopes.
+
+Every envelope hash and signature in the SDK is computed over the same
+canonical form: keys sorted, no whitespace, non-ASCII characters escaped as
+\\uXXXX. For ASCII strings and integers (our envelope field set) the output is
+identical to RFC 8785 (JCS); the escaping of non-ASCII characters follows
+json.dumps, which keeps hashes of existing envelopes stable.
+
+orjson is used when installed and the value is one it encodes byte-for-byte
+like json.dumps (ASCII strings without DEL, 64-bit integers, booleans, None,
+lists and dicts with string keys); everything else, e.g. floats, goes through
+the standard library. The keccak-256 backend is picked on first use, fastest
+first: safe-pysha3, pycryptodome, then eth-hash's default.
+
+Install the fast backends with: pip install intentlayer-sdk[speedups]
+"""
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+_INT_MIN = -(2**63)
+_INT_MAX = 2**64 - 1
+
+_keccak: Optional[Callable[[bytes], bytes]] = None
+keccak_backend: Optional[str] = None
+
+json_backend = "orjson" if orjson is not None else "json"
+
+
+def _orjson_compatible(value: Any) -> bool:
+    """Whether orjson encodes value exactly like json.dumps."""
+    kind = type(value)
+    if kind is str:
+        # json.dumps escapes DEL as \u007f, orjson writes it raw
+        return value.isascii() and "\x7f" not in value
+    if kind is int:
+        return _INT_MIN <= value <= _INT_MAX
+    if value is None or kind is bool:
+        return True
+    if kind is dict:
+        return all(type(k) is str and _orjson_compatible(k) and _orjson_compatible(v) for k, v in value.items())
+    if kind is list or kind is tuple:
+        return all(_orjson_compatible(item) for item in value)
+    return False
+
+
+def canonical_json(value: Any) -> bytes:
+    """
+    Encode a value as canonical JSON.
+
+    Args:
+        value: JSON-serializable value (usually an envelope dictionary)
+
+    Returns:
+        UTF-8 encoded canonical JSON
+
+    Raises:
+        TypeError: If the value is not JSON serializable
+        ValueError: If the value contains a circular reference
+    """
+    if orjson is not None and _orjson_compatible(value):
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(value, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+def _select_keccak() -> Callable[[bytes], bytes]:
+    global _keccak, keccak_backend
+
+    try:
+        import sha3  # safe-pysha3
+        keccak_256 = sha3.keccak_256
+        _keccak, keccak_backend = (lambda data: keccak_256(data).digest()), "pysha3"
+    except (ImportError, AttributeError):
+        try:
+            from Crypto.Hash import keccak as pycryptodome_keccak
+            new = pycryptodome_keccak.new
+            _keccak, keccak_backend = (lambda data: new(data=data, digest_bits=256).digest()), "pycryptodome"
+        except ImportError:
+            from eth_hash.auto import keccak as eth_hash_keccak
+            _keccak, keccak_backend = eth_hash_keccak, "eth-hash"
+    return _keccak
+
+
+def keccak256(data: bytes) -> bytes:
+    """
+    Compute the keccak-256 digest (as used by Ethereum) of data.
+
+    Args:
+        data: Bytes to hash
+
+    Returns:
+        32-byte digest
+    """
+    return (_keccak or _select_keccak())(data)
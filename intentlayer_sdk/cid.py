@@ -0,0 +1,137 @@
+"""
+Local IPFS CID computation for the IntentLayer SDK.
+
+IPFS content identifiers are deterministic. compute_cid reproduces the CIDv0
+that `ipfs add` (and pinning services built on it) assigns to a file: the
+bytes are split into fixed-size chunks, each chunk becomes a UnixFS file leaf
+encoded as dag-pb, and leaves are combined into a balanced DAG whose root is
+hashed with sha2-256. Knowing the CID up front lets the SDK submit a
+transaction while the payload is still uploading.
+"""
+import hashlib
+import json
+from typing import Any, Dict, List, Tuple
+
+import base58
+
+# Defaults used by `ipfs add`
+DEFAULT_CHUNK_SIZE = 256 * 1024
+DEFAULT_MAX_LINKS = 174
+
+_UNIXFS_FILE = 2
+
+
+def canonical_payload_bytes(payload: Dict[str, Any]) -> bytes:
+    """
+    Serialize a payload to the exact bytes sent to the pinner.
+
+    Args:
+        payload: Payload dictionary
+
+    Returns:
+        Compact, key-sorted UTF-8 JSON
+    """
+    return json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+def _varint(value: int) -> bytes:
+    """Protobuf base-128 varint."""
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _field_bytes(number: int, value: bytes) -> bytes:
+    """Length-delimited protobuf field."""
+    return _varint(number << 3 | 2) + _varint(len(value)) + value
+
+
+def _field_varint(number: int, value: int) -> bytes:
+    """Varint protobuf field."""
+    return _varint(number << 3) + _varint(value)
+
+
+def _unixfs_file(data: bytes, filesize: int, blocksizes: List[int]) -> bytes:
+    """Encode a UnixFS File message."""
+    out = _field_varint(1, _UNIXFS_FILE)
+    if data:
+        out += _field_bytes(2, data)
+    out += _field_varint(3, filesize)
+    for size in blocksizes:
+        out += _field_varint(4, size)
+    return out
+
+
+def _pb_node(links: List[Tuple[bytes, int]], data: bytes) -> bytes:
+    """Encode a dag-pb node (links are serialized before data)."""
+    out = b""
+    for multihash, tsize in links:
+        link = _field_bytes(1, multihash) + _field_bytes(2, b"") + _field_varint(3, tsize)
+        out += _field_bytes(2, link)
+    return out + _field_bytes(1, data)
+
+
+def _multihash(block: bytes) -> bytes:
+    """sha2-256 multihash of a block."""
+    return b"\x12\x20" + hashlib.sha256(block).digest()
+
+
+def compute_cid(
+    data: bytes,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_links: int = DEFAULT_MAX_LINKS,
+) -> str:
+    """
+    Compute the CIDv0 `ipfs add` assigns to a file's contents.
+
+    Args:
+        data: File contents
+        chunk_size: Fixed chunk size used by the pinner's importer
+        max_links: Maximum links per intermediate node (balanced layout)
+
+    Returns:
+        Base58-encoded CIDv0 string (Qm...)
+    """
+    if chunk_size < 1 or max_links < 2:
+        raise ValueError("chunk_size must be positive and max_links at least 2")
+
+    # Each entry: (multihash, cumulative dag size, file bytes covered)
+    chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)] or [b""]
+    level = []
+    for chunk in chunks:
+        block = _pb_node([], _unixfs_file(chunk, len(chunk), []))
+        level.append((_multihash(block), len(block), len(chunk)))
+
+    while len(level) > 1:
+        parents = []
+        for start in range(0, len(level), max_links):
+            children = level[start:start + max_links]
+            filesize = sum(c[2] for c in children)
+            block = _pb_node(
+                [(c[0], c[1]) for c in children],
+                _unixfs_file(b"", filesize, [c[2] for c in children]),
+            )
+            parents.append((_multihash(block), len(block) + sum(c[1] for c in children), filesize))
+        level = parents
+
+    return base58.b58encode(level[0][0]).decode("ascii")
+
+
+def compute_payload_cid(payload: Dict[str, Any], **kwargs: Any) -> str:
+    """
+    Compute the CID of a payload as pinned from its canonical bytes.
+
+    Args:
+        payload: Payload dictionary
+        **kwargs: Options passed to compute_cid
+
+    Returns:
+        Base58-encoded CIDv0 string
+    """
+    return compute_cid(canonical_payload_bytes(payload), **kwargs)
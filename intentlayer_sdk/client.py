@@ -1,14 +1,18 @@
 """
 IntentClient - Main client for the IntentLayer protocol.
 """
+import gzip
 import json
 import hashlib
 import logging
 import os
 import time
 import urllib.parse
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_for_futures
+from contextlib import nullcontext
 from inspect import signature
-from typing import Dict, Any, Optional, Union, List, Tuple, cast
+from typing import Dict, Any, Optional, Union, List, Tuple, Callable, Iterable, Iterator, Sequence, cast
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -23,10 +27,38 @@ from .exceptions import (
     AlreadyRegisteredError, InactiveDIDError
 )
 from .utils import ipfs_cid_to_bytes
+from .batching import BatchingProvider
+from .rpc_pool import EndpointPoolProvider
+from .cid import canonical_payload_bytes, compute_payload_cid
 from .config import NetworkConfig
+from .did_cache import DIDCache
+from .fees import FeeOracle, get_fee_oracle
+from .gas import GasModel, is_out_of_gas_error
+from .instrumentation import Instrumentation, instrumented, stage
+from .metrics import MetricsRegistry, get_metrics_registry
+from .multicall import MULTICALL3_ADDRESS, aggregate3, chunk_calls
+from .nonce import NonceManager, get_nonce_manager, is_already_known, is_ambiguous_send_error, is_nonce_error
+from .pin_cache import PinCache
+from .pipeline import IntentPipeline, IntentResult
+from .receipts import ReceiptTracker, get_receipt_tracker
 from .signer import Signer
 from .signer.local import LocalSigner
 
+# Marks a contract binding that has not been built yet
+_UNBOUND = object()
+
+# Node messages suggesting a transaction was signed for another chain
+CHAIN_ID_ERROR_MARKERS = (
+    "invalid chain id", "chain id mismatch", "incorrect chain id", "wrong chain id",
+    "invalid sender", "only replay-protected",
+)
+
+
+def is_chain_id_error(error: Exception) -> bool:
+    """Check whether a send error suggests the endpoint is on a different chain."""
+    message = str(error).lower()
+    return any(marker in message for marker in CHAIN_ID_ERROR_MARKERS)
+
 class IntentClient:
     """
     Client for interacting with the IntentLayer protocol.
@@ -79,6 +111,9 @@ class IntentClient:
         }
     ]
 
+    # Number of times a transaction is rebuilt after the node rejects its nonce
+    NONCE_RETRIES = 2
+
     @classmethod
     def from_network(
         cls,
@@ -123,8 +158,9 @@ class IntentClient:
             # Get network configuration
             net_config = NetworkConfig.get_network(network)
             
-            # Determine RPC URL
+            # Determine RPC URL and any fallback endpoints
             effective_rpc = NetworkConfig.get_rpc_url(network, rpc_url)
+            rpc_endpoints = NetworkConfig.get_rpc_endpoints(network, rpc_url) if net_config.get("rpcs") else []
             
             # Create a signer if given a private key
             if isinstance(signer, str):
@@ -137,6 +173,8 @@ class IntentClient:
                 signer=signer,
                 recorder_address=net_config["intentRecorder"],
                 did_registry_address=net_config["didRegistry"],
+                multicall_address=NetworkConfig.get_multicall_address(network),
+                rpc_endpoints=rpc_endpoints if len(rpc_endpoints) > 1 else None,
                 retry_count=retry_count,
                 timeout=timeout,
                 logger=logger,
@@ -187,7 +225,25 @@ class IntentClient:
         retry_count: int = 3,
         timeout: int = 30,
         logger: Optional[logging.Logger] = None,
-        auto_did: bool = False
+        auto_did: bool = False,
+        use_receipt_tracker: bool = False,
+        confirmations: int = 1,
+        gas_model: Union[bool, GasModel] = False,
+        fee_oracle: Optional[FeeOracle] = None,
+        eip1559: bool = False,
+        did_cache: Union[bool, DIDCache] = True,
+        multicall_address: Optional[str] = None,
+        batch_rpc: bool = False,
+        pin_pool_size: int = 32,
+        pin_concurrency: int = 8,
+        pin_gzip_threshold: Optional[int] = None,
+        local_cid: bool = False,
+        pin_cache: Union[bool, PinCache] = True,
+        rpc_endpoints: Optional[Sequence[Union[str, Tuple[str, float]]]] = None,
+        chain_id_ttl: float = 300.0,
+        instrumentation: Optional[Instrumentation] = None,
+        collect_timings: bool = False,
+        metrics: Optional[MetricsRegistry] = None,
     ):
         """
         Initialize the IntentClient.
@@ -204,13 +260,57 @@ class IntentClient:
             timeout: Timeout in seconds for HTTP requests
             logger: Optional logger instance
             auto_did: Whether to automatically create and use a DID
+            use_receipt_tracker: Wait for receipts through the tracker shared by all
+                clients on this RPC endpoint instead of polling per transaction
+            confirmations: Blocks (including the inclusion block) to wait for when
+                use_receipt_tracker is enabled
+            gas_model: Cache gas estimates by call shape; True uses a default
+                GasModel, or pass a configured GasModel instance
+            fee_oracle: Custom fee oracle (defaults to the TTL-cached oracle
+                shared by all clients on this RPC endpoint)
+            eip1559: Send type-2 transactions priced from eth_feeHistory when
+                using the default fee oracle
+            did_cache: Cache resolve_did results; True uses a default DIDCache,
+                False disables caching, or pass a configured DIDCache instance
+            multicall_address: Multicall3 contract used by resolve_dids
+                (defaults to the canonical Multicall3 deployment)
+            batch_rpc: Coalesce concurrent RPC calls into JSON-RPC batches and
+                issue the independent reads of send_intent together
+            pin_pool_size: Keep-alive connections kept per host for pinning and
+                other HTTP requests
+            pin_concurrency: Default number of pin requests pin_many keeps in flight
+            pin_gzip_threshold: Gzip pin request bodies of at least this many bytes
+                (disabled if None; the pinner must accept Content-Encoding: gzip)
+            local_cid: Compute the payload CID locally (as `ipfs add` would) so
+                send_intent broadcasts while the upload is in flight, then
+                verify the pinner's CID
+            pin_cache: Skip re-uploading payloads pinned before; True uses an
+                in-memory PinCache, False disables it, or pass a configured
+                PinCache (e.g. with disk persistence)
+            rpc_endpoints: Fallback RPC endpoints for the same chain, as URLs or
+                (url, weight) tuples; requests are then routed by latency and
+                health with failover, and rpc_url stays the primary for
+                transactions (its weight is taken from this list if present)
+            chain_id_ttl: Seconds a successful chain ID check is trusted before
+                the chain is queried again (0 checks before every transaction)
+            instrumentation: Hub whose listeners receive per-stage events for
+                send_intent and register_did
+            collect_timings: Attach per-stage durations in seconds to the
+                results of send_intent and register_did under "timings"
+            metrics: Registry to report metrics to (defaults to the
+                process-wide registry)
             
         Note:
             It's strongly recommended to provide expected_chain_id to prevent 
             accidental transactions on the wrong network.
         """
         # Validate URLs
-        for name, url in [("rpc_url", rpc_url), ("pinner_url", pinner_url)]:
+        endpoint_specs = [
+            spec if isinstance(spec, tuple) else (spec, 1.0) for spec in rpc_endpoints or ()
+        ]
+        urls = [("rpc_url", rpc_url), ("pinner_url", pinner_url)]
+        urls += [("rpc_endpoints", url) for url, _ in endpoint_specs]
+        for name, url in urls:
             parsed = urllib.parse.urlparse(url)
             host = parsed.hostname or ""
             is_local = host in ("localhost", "127.0.0.1")
@@ -223,19 +323,44 @@ class IntentClient:
         self.pinner_url = pinner_url.rstrip("/")
         self.recorder_address = Web3.to_checksum_address(recorder_address) if recorder_address else ""
         self.did_registry_address = Web3.to_checksum_address(did_registry_address) if did_registry_address else None
+        self.multicall_address = Web3.to_checksum_address(multicall_address or MULTICALL3_ADDRESS)
         self.logger = logger or logging.getLogger(__name__)
         self._network_name = None
         self._expected_chain_id = expected_chain_id
+        self.chain_id_ttl = chain_id_ttl
+        self.instrumentation = instrumentation
+        self.collect_timings = collect_timings
+        self._metrics = metrics
+        # (validated endpoint identity, monotonic time of the check)
+        self._chain_id_check: Optional[Tuple[Tuple[Any, ...], float]] = None
         self._min_stake_wei = min_stake_wei
         # Use timestamp of 0 to mark manually set values
         self._min_stake_wei_timestamp = None if min_stake_wei is None else 0
+        if confirmations < 1:
+            raise ValueError(f"confirmations must be at least 1 (got: {confirmations})")
+        self._use_receipt_tracker = use_receipt_tracker
+        self.confirmations = confirmations
+        self.gas_model: Optional[GasModel] = (
+            GasModel() if gas_model is True else (gas_model or None)
+        )
 
         # Web3 setup
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
-        try:
-            self._default_gas_price = self.w3.eth.gas_price
-        except Exception:
-            self._default_gas_price = None
+        if any(url != rpc_url for url, _ in endpoint_specs):
+            primary_weight = next((w for url, w in endpoint_specs if url == rpc_url), 1.0)
+            provider = EndpointPoolProvider(
+                [(rpc_url, primary_weight)] + [spec for spec in endpoint_specs if spec[0] != rpc_url],
+                request_timeout=timeout,
+            )
+        else:
+            provider = Web3.HTTPProvider(rpc_url)
+        self._batch_rpc = batch_rpc
+        self._prefetch_pool: Optional[ThreadPoolExecutor] = None
+        self.w3 = Web3(BatchingProvider(provider) if batch_rpc else provider)
+        self._fee_oracle = fee_oracle
+        self._eip1559 = eip1559
+        self.did_cache: Optional[DIDCache] = (
+            DIDCache() if did_cache is True else (did_cache or None)
+        )
 
         # Create auto-DID if needed
         if auto_did:
@@ -258,19 +383,9 @@ class IntentClient:
             
         self.signer = signer
 
-        # Contract binding (if address provided)
-        self.recorder_contract = None
-        if self.recorder_address:
-            self.recorder_contract = self.w3.eth.contract(
-                address=self.recorder_address, abi=self.INTENT_RECORDER_ABI
-            )
-        
-        # DID registry contract (if address provided)
-        self.did_registry_contract = None
-        if self.did_registry_address:
-            self.did_registry_contract = self.w3.eth.contract(
-                address=self.did_registry_address, abi=self.DID_REGISTRY_ABI
-            )
+        # Contract bindings (if addresses provided) are built on first use
+        self._recorder_contract: Any = _UNBOUND if self.recorder_address else None
+        self._did_registry_contract: Any = _UNBOUND if self.did_registry_address else None
 
         # HTTP session with retry logic
         self.session = requests.Session()
@@ -294,9 +409,48 @@ class IntentClient:
         # (else: neither present -> we're on some exotic fork, just skip)
             
         retries = Retry(**retry_kwargs)
-        self.session.mount("http://", HTTPAdapter(max_retries=retries))
-        self.session.mount("https://", HTTPAdapter(max_retries=retries))
+        # Size the pool so concurrent pins reuse connections instead of
+        # discarding them and paying for new TLS handshakes
+        if pin_pool_size < 1 or pin_concurrency < 1:
+            raise ValueError("pin_pool_size and pin_concurrency must be at least 1")
+        for prefix in ("http://", "https://"):
+            self.session.mount(prefix, HTTPAdapter(
+                max_retries=retries, pool_connections=pin_pool_size, pool_maxsize=pin_pool_size
+            ))
         self.timeout = timeout
+        self.pin_concurrency = pin_concurrency
+        self.pin_gzip_threshold = pin_gzip_threshold
+        self.local_cid = local_cid
+        self.pin_cache: Optional[PinCache] = (
+            PinCache() if pin_cache is True else (pin_cache or None)
+        )
+        self._pin_pool: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def recorder_contract(self) -> Any:
+        """IntentRecorder contract binding, or None if no address is set."""
+        if self._recorder_contract is _UNBOUND:
+            self._recorder_contract = self.w3.eth.contract(
+                address=self.recorder_address, abi=self.INTENT_RECORDER_ABI
+            )
+        return self._recorder_contract
+
+    @recorder_contract.setter
+    def recorder_contract(self, contract: Any) -> None:
+        self._recorder_contract = contract
+
+    @property
+    def did_registry_contract(self) -> Any:
+        """DIDRegistry contract binding, or None if no address is set."""
+        if self._did_registry_contract is _UNBOUND:
+            self._did_registry_contract = self.w3.eth.contract(
+                address=self.did_registry_address, abi=self.DID_REGISTRY_ABI
+            )
+        return self._did_registry_contract
+
+    @did_registry_contract.setter
+    def did_registry_contract(self, contract: Any) -> None:
+        self._did_registry_contract = contract
 
     @property
     def address(self) -> str:
@@ -360,16 +514,92 @@ class IntentClient:
         except Exception as e:
             raise TransactionError(f"Failed to refresh minimum stake: {e}")
 
-    def assert_chain_id(self) -> None:
+    def warmup(self, timeout: float = 10.0) -> Dict[str, Optional[Exception]]:
+        """
+        Prefetch chain reads and open connections ahead of the first request.
+        
+        The constructor does no network I/O: the chain ID, minimum stake, fee
+        quote and nonce are otherwise read on first use. warmup() runs those
+        reads concurrently and opens the RPC, pinner and Gateway connections
+        so the first send does not pay for them. Failures are logged and
+        reported rather than raised; the send path retries them.
+        
+        Args:
+            timeout: Seconds to wait for all warmup tasks
+            
+        Returns:
+            Dictionary mapping each task name to None on success or the
+            exception it raised (TimeoutError if it did not finish in time)
+        """
+        tasks: Dict[str, Callable[[], Any]] = {
+            "chain_id": (
+                self.assert_chain_id if self._expected_chain_id is not None
+                else lambda: self.w3.eth.chain_id
+            ),
+            # Any HTTP response leaves a pooled keep-alive connection behind
+            "pinner": lambda: self.session.head(self.pinner_url, timeout=timeout),
+        }
+        if self.recorder_contract is not None:
+            tasks["min_stake"] = lambda: self.min_stake_wei
+        if self.signer is not None:
+            tasks["fees"] = lambda: self.fee_oracle.fees(self.w3)
+            if self.recorder_contract is not None and self.nonce_manager.next_nonce is None:
+                tasks["nonce"] = lambda: self.nonce_manager.resync(self._fetch_pending_nonce)
+        gateway_client = getattr(self, "_gateway_client", None)
+        if getattr(gateway_client, "channel", None) is not None:
+            tasks["gateway"] = lambda: self._wait_for_channel(gateway_client.channel, timeout)
+        
+        pool = ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="intentlayer-warmup")
+        futures = {name: pool.submit(task) for name, task in tasks.items()}
+        pool.shutdown(wait=False)
+        wait_for_futures(futures.values(), timeout=timeout)
+        
+        results: Dict[str, Optional[Exception]] = {}
+        for name, future in futures.items():
+            if not future.done():
+                results[name] = TimeoutError(f"{name} warmup did not finish within {timeout}s")
+            else:
+                results[name] = cast(Optional[Exception], future.exception())
+            if results[name] is not None:
+                self.logger.warning(f"Warmup of {name} failed: {results[name]}")
+        return results
+
+    @staticmethod
+    def _wait_for_channel(channel: Any, timeout: float) -> None:
+        """Connect a gRPC channel and wait until it is ready."""
+        import grpc
+        grpc.channel_ready_future(channel).result(timeout=timeout)
+
+    def assert_chain_id(self, force: bool = False) -> None:
         """
         Assert that the connected chain matches the expected chain ID.
         
+        A passing check is remembered for chain_id_ttl seconds. The chain is
+        queried again sooner if the provider changes or a pooled provider fails
+        over to another endpoint, after a send error that suggests a chain
+        mismatch, or when force is True. With an endpoint pool the chain ID is
+        read from the endpoint transactions are sent to.
+        
+        Args:
+            force: Query the chain even if a recent check passed
+        
         Raises:
             NetworkError: If the chain ID doesn't match or _expected_chain_id is not set
         """
         if self._expected_chain_id is None:
             self.logger.warning("No expected chain ID set, skipping chain ID validation")
             return
+        
+        key = (self._expected_chain_id,) + self._endpoint_identity()
+        check = self._chain_id_check
+        if not force and check is not None and check[0] == key:
+            if time.monotonic() - check[1] < self.chain_id_ttl:
+                return
+        
+        # Make the batching provider ask the endpoint instead of its memo
+        provider = self.w3.provider
+        if isinstance(provider, BatchingProvider):
+            provider.clear_chain_id()
             
         try:
             actual_chain_id = self.w3.eth.chain_id
@@ -380,10 +610,27 @@ class IntentClient:
                     f"got {actual_chain_id}"
                 )
         except Exception as e:
+            self._chain_id_check = None
             if isinstance(e, NetworkError):
                 raise
             raise NetworkError(f"Failed to validate chain ID: {e}")
+        self._chain_id_check = (key, time.monotonic())
+
+    def invalidate_chain_id(self) -> None:
+        """Forget the last chain ID check so the next transaction repeats it."""
+        self._chain_id_check = None
+        provider = self.w3.provider
+        if isinstance(provider, BatchingProvider):
+            provider.clear_chain_id()
 
+    def _endpoint_identity(self) -> Tuple[Any, int]:
+        """Identify the provider and, for an endpoint pool, how often it failed over."""
+        provider = self.w3.provider
+        inner = provider.provider if isinstance(provider, BatchingProvider) else provider
+        switches = inner.switches if isinstance(inner, EndpointPoolProvider) else 0
+        return provider, switches
+
+    @instrumented("register_did")
     def register_did(
         self, 
         did: str,
@@ -416,11 +663,13 @@ class IntentClient:
             raise ValueError("DIDRegistry contract address not set")
             
         # Verify chain ID
-        self.assert_chain_id()
+        with stage("chain_id"):
+            self.assert_chain_id()
         
         # Check if DID already exists
         try:
-            owner, active = self.resolve_did(did)
+            with stage("did_lookup"):
+                owner, active = self.resolve_did(did, use_cache=False)
             if active:
                 raise AlreadyRegisteredError(did, owner)
             elif not force:
@@ -433,70 +682,51 @@ class IntentClient:
             pass
         
         try:
-            # Get nonce
-            nonce = self.w3.eth.get_transaction_count(self.signer.address)
-            
             # Estimate gas if not provided
+            gas_key = None
             if gas is None:
                 try:
-                    est = self.did_registry_contract.functions.register(did).estimate_gas(
+                    estimate = lambda: self.did_registry_contract.functions.register(did).estimate_gas(
                         {"from": self.signer.address}
                     )
-                    gas = int(est * 1.1)
+                    with stage("gas"):
+                        if self.gas_model is not None:
+                            gas_key = GasModel.key_for(self.did_registry_address, "register", did)
+                            gas = self.gas_model.estimate(gas_key, estimate)
+                        else:
+                            gas = int(estimate() * 1.1)
                     self.logger.debug(f"Estimated gas for DID registration: {gas}")
                 except Exception as e:
                     gas = 250_000
                     self.logger.warning(f"Gas estimate failed, fallback to {gas}: {e}")
             
-            # Build transaction parameters
-            tx_params = {
-                "from": self.signer.address,
-                "nonce": nonce,
-                "gas": gas,
-            }
-            
-            # Set gas price if provided
-            if gas_price_override is not None:
-                tx_params["gasPrice"] = gas_price_override
-            else:
-                tx_params["gasPrice"] = (
-                    self._default_gas_price
-                    if self._default_gas_price is not None
-                    else self.w3.eth.gas_price
-                )
-            
-            # Build transaction
-            tx = self.did_registry_contract.functions.register(did).build_transaction(tx_params)
+            # Price the transaction before a nonce is allocated
+            fee_params = self._fee_params(gas_price_override)
             
-            # Sign transaction
-            try:
-                signed = self.signer.sign_transaction(tx)
-            except Exception as e:
-                self.logger.error(f"Signing failed: {e}")
-                raise TransactionError(f"Failed to sign transaction: {e}")
+            def build_tx(nonce: int) -> Dict[str, Any]:
+                # Build transaction parameters
+                tx_params = {
+                    "from": self.signer.address,
+                    "nonce": nonce,
+                    "gas": gas,
+                    **fee_params,
+                }
+                # Skip web3's eth_chainId lookup when the chain is already verified
+                if self._expected_chain_id is not None:
+                    tx_params["chainId"] = self._expected_chain_id
+                
+                return self.did_registry_contract.functions.register(did).build_transaction(tx_params)
             
-            # Send transaction
-            try:
-                if hasattr(signed, "rawTransaction"):
-                    raw_bytes = signed.rawTransaction
-                elif hasattr(signed, "raw_transaction"):
-                    raw_bytes = signed.raw_transaction
-                else:
-                    raise TransactionError("Signed transaction missing raw bytes")
-                    
-                tx_hash = self.w3.eth.send_raw_transaction(raw_bytes)
-                self.logger.info(f"Sent DID registration tx: {tx_hash.hex()}")
-            except Exception as e:
-                self.logger.error(f"Send failed: {e}")
-                if isinstance(e, Web3Exception):
-                    raise
-                raise TransactionError(f"Failed to send transaction: {e}")
+            # Allocate nonce, sign and send
+            tx_hash, nonce = self._send_with_gas_model(build_tx, "DID registration", gas_key, gas)
+            self.invalidate_did(did)
             
             # Wait for receipt
             if wait_for_receipt:
-                receipt = self.w3.eth.wait_for_transaction_receipt(
-                    tx_hash, timeout=120, poll_latency=0.1
-                )
+                receipt = self._wait_for_receipt(tx_hash)
+                self.nonce_manager.mark_confirmed(nonce)
+                if self.gas_model is not None:
+                    self.gas_model.observe_receipt(tx_hash, receipt)
                 return dict(receipt)
             else:
                 return {"transactionHash": "0x" + tx_hash.hex() if isinstance(tx_hash, bytes) else tx_hash}
@@ -508,12 +738,16 @@ class IntentClient:
             self.logger.error(f"Unexpected error in DID registration: {e}")
             raise TransactionError(f"DID registration failed: {e}")
 
-    def resolve_did(self, did: str) -> Tuple[str, bool]:
+    def resolve_did(self, did: str, use_cache: bool = True) -> Tuple[str, bool]:
         """
         Resolve a DID to its associated Ethereum address and active status.
         
+        Results are served from the DID cache when enabled; inactive and
+        unregistered DIDs are cached for a shorter time than active ones.
+        
         Args:
             did: Decentralized Identifier to resolve
+            use_cache: Whether to use the DID cache (a fresh result is still stored)
             
         Returns:
             Tuple of (owner_address, active_flag) where:
@@ -530,14 +764,25 @@ class IntentClient:
             raise ValueError("DIDRegistry contract address not set")
         
         ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+        
+        if use_cache and self.did_cache is not None:
+            cached = self.did_cache.get(did)
+            self.metrics.cache_requests.inc(cache="did", result="miss" if cached is None else "hit")
+            if cached is not None:
+                return cached
             
         try:
             owner, active = self.did_registry_contract.functions.resolve(did).call()
-            return Web3.to_checksum_address(owner), active
+            owner = Web3.to_checksum_address(owner)
+            if self.did_cache is not None:
+                self.did_cache.put(did, owner, active)
+            return owner, active
         except ValueError as e:
             # Check if this is a "revert" error which usually indicates the DID doesn't exist
             if "revert" in str(e).lower():
                 self.logger.debug(f"DID '{did}' not found (contract reverted)")
+                if self.did_cache is not None:
+                    self.did_cache.put(did, ZERO_ADDRESS, False)
                 return ZERO_ADDRESS, False
             # Re-raise other ValueErrors as TransactionError
             raise TransactionError(f"Failed to resolve DID: {e}")
@@ -545,10 +790,105 @@ class IntentClient:
             # Re-raise other exceptions as TransactionError
             raise TransactionError(f"Failed to resolve DID: {e}")
 
+    def resolve_dids(
+        self,
+        dids: Iterable[str],
+        use_cache: bool = True,
+        max_calldata_bytes: int = 64_000,
+        concurrency: int = 4,
+    ) -> Dict[str, Tuple[str, bool]]:
+        """
+        Resolve many DIDs with batched Multicall3 aggregate3 calls.
+        
+        DIDs are split into chunks by encoded calldata size and the chunks are
+        queried concurrently. A DID whose resolve call reverts or returns
+        malformed data resolves to (ZERO_ADDRESS, False), as in resolve_did.
+        
+        Args:
+            dids: Decentralized Identifiers to resolve (duplicates are resolved once)
+            use_cache: Whether to serve DIDs from the DID cache (fresh results are still stored)
+            max_calldata_bytes: Approximate maximum calldata size of one aggregate3 call
+            concurrency: Maximum number of chunks queried at the same time
+            
+        Returns:
+            Dictionary mapping each DID to (owner_address, active_flag), in input order
+            
+        Raises:
+            ValueError: If DIDRegistry contract address is not set
+            TransactionError: If a multicall request fails
+        """
+        if not self.did_registry_contract:
+            raise ValueError("DIDRegistry contract address not set")
+        
+        ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+        
+        results: Dict[str, Tuple[str, bool]] = {did: None for did in dids}  # type: ignore[misc]
+        pending = []
+        for did in results:
+            cached = self.did_cache.get(did) if use_cache and self.did_cache is not None else None
+            if cached is not None:
+                results[did] = cached
+            else:
+                pending.append(did)
+        if use_cache and self.did_cache is not None:
+            self.metrics.cache_requests.inc(len(results) - len(pending), cache="did", result="hit")
+            self.metrics.cache_requests.inc(len(pending), cache="did", result="miss")
+        if not pending:
+            return results
+        
+        calls = [
+            (self.did_registry_address, True, bytes.fromhex(
+                self.did_registry_contract.encode_abi("resolve", args=[did])[2:]
+            ))
+            for did in pending
+        ]
+        chunks = chunk_calls(calls, max_calldata_bytes)
+        
+        def run_chunk(chunk: List[Tuple[str, bool, bytes]]) -> List[Tuple[bool, bytes]]:
+            return aggregate3(self.w3, self.multicall_address, chunk)
+        
+        try:
+            if len(chunks) == 1:
+                chunk_results = [run_chunk(chunks[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(chunks)))) as pool:
+                    chunk_results = list(pool.map(run_chunk, chunks))
+        except Exception as e:
+            raise TransactionError(f"Failed to resolve DIDs: {e}")
+        
+        returned = [r for chunk in chunk_results for r in chunk]
+        for did, (success, data) in zip(pending, returned):
+            owner, active = ZERO_ADDRESS, False
+            if success:
+                try:
+                    decoded_owner, decoded_active = self.w3.codec.decode(["address", "bool"], data)
+                    owner, active = Web3.to_checksum_address(decoded_owner), bool(decoded_active)
+                except Exception as e:
+                    self.logger.debug(f"Malformed resolve result for DID '{did}': {e}")
+            results[did] = (owner, active)
+            if self.did_cache is not None:
+                self.did_cache.put(did, owner, active)
+        
+        self.logger.debug(f"Resolved {len(pending)} DIDs in {len(chunks)} multicall request(s)")
+        return results
+
+    def invalidate_did(self, did: Optional[str] = None) -> None:
+        """
+        Drop cached DID resolutions, e.g. after a DID is registered or revoked.
+        
+        Args:
+            did: DID to drop (all cached DIDs if None)
+        """
+        if self.did_cache is not None:
+            self.did_cache.invalidate(did)
+
     def pin_to_ipfs(self, payload: Dict[str, Any]) -> str:
         """
         Pin data to IPFS via the pinning service.
         
+        Payloads pinned before are answered from the pin cache (if enabled)
+        without contacting the pinner.
+        
         Args:
             payload: Data to pin to IPFS
             
@@ -558,6 +898,15 @@ class IntentClient:
         Raises:
             PinningError: If pinning fails
         """
+        cache_key = None
+        if self.pin_cache is not None:
+            cache_key = self.pin_cache.key_for(payload)
+            cached = self.pin_cache.get(cache_key)
+            self.metrics.cache_requests.inc(cache="pin", result="miss" if cached is None else "hit")
+            if cached is not None:
+                self.logger.debug(f"Payload already pinned as {cached}")
+                return cached
+
         safe = self._sanitize_payload(payload)
         self.logger.debug(f"Pinning payload to IPFS: {safe}")
 
@@ -565,10 +914,12 @@ class IntentClient:
         attempt = 0
         backoff = 0.5
 
+        request_kwargs = self._pin_request_kwargs(payload)
+
         while True:
             try:
                 resp = self.session.post(
-                    f"{self.pinner_url}/pin", json=payload, timeout=self.timeout
+                    f"{self.pinner_url}/pin", timeout=self.timeout, **request_kwargs
                 )
                 if resp.status_code < 500:
                     resp.raise_for_status()
@@ -581,6 +932,9 @@ class IntentClient:
                             raise PinningError(
                                 f"Missing CID in pinner response: {result}"
                             )
+                        if cache_key is not None:
+                            self.pin_cache.put(cache_key, result["cid"])
+                        self.metrics.pins.inc(result="success")
                         return result["cid"]
                     except ValueError as e:
                         self.logger.error(f"Invalid JSON from pinner: {e}")
@@ -588,6 +942,7 @@ class IntentClient:
                 if attempt < max_retries - 1:
                     attempt += 1
                     wait = backoff * (2 ** (attempt - 1))
+                    self.metrics.pin_retries.inc()
                     self.logger.warning(f"Retrying in {wait}s (server {resp.status_code})")
                     time.sleep(wait)
                     continue
@@ -600,15 +955,88 @@ class IntentClient:
                 ):
                     attempt += 1
                     wait = backoff * (2 ** (attempt - 1))
+                    self.metrics.pin_retries.inc()
                     self.logger.warning(f"Retrying in {wait}s due to HTTPError: {e}")
                     time.sleep(wait)
                     continue
+                self.metrics.pins.inc(result="error")
                 self.logger.error(f"IPFS pinning failed: {e}")
                 raise PinningError(f"IPFS pinning failed: {e}")
             except ValueError as e:
+                self.metrics.pins.inc(result="error")
                 self.logger.error(f"Invalid JSON from pinner: {e}")
                 raise PinningError(f"Invalid JSON from pinner: {e}")
 
+    def _pin_request_kwargs(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the body arguments for a pin request.
+        
+        Payloads at or above pin_gzip_threshold are sent as a gzip-compressed
+        JSON body; smaller payloads are sent as plain JSON. With local_cid the
+        body is the payload's canonical bytes, from which the CID was computed.
+        """
+        if self.local_cid:
+            # The pinner must store exactly the bytes the local CID was computed from
+            body = canonical_payload_bytes(payload)
+            plain = {"data": body, "headers": {"Content-Type": "application/json"}}
+        elif self.pin_gzip_threshold is None:
+            return {"json": payload}
+        else:
+            body = json.dumps(payload).encode("utf-8")
+            plain = {"json": payload}
+        if self.pin_gzip_threshold is None or len(body) < self.pin_gzip_threshold:
+            return plain
+        return {
+            "data": gzip.compress(body, compresslevel=5),
+            "headers": {"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        }
+
+    def pin_many(
+        self,
+        payloads: Iterable[Dict[str, Any]],
+        max_in_flight: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[str, Exception]]:
+        """
+        Pin many payloads with a bounded number of requests in flight.
+        
+        Requests share the client's keep-alive connection pool, so throughput
+        scales with concurrency rather than with connection setup.
+        
+        Args:
+            payloads: Payloads to pin
+            max_in_flight: Maximum concurrent pin requests (defaults to pin_concurrency)
+            return_exceptions: Return errors in place of CIDs instead of raising
+            
+        Returns:
+            List of CIDs (or exceptions, if return_exceptions is set) in input order
+            
+        Raises:
+            PinningError: If a pin fails and return_exceptions is False
+        """
+        payloads = list(payloads)
+        if not payloads:
+            return []
+        workers = max(1, min(max_in_flight or self.pin_concurrency, len(payloads)))
+        
+        results: List[Union[str, Exception]] = []
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="intentlayer-pin") as pool:
+            futures = [pool.submit(self.pin_to_ipfs, payload) for payload in payloads]
+            try:
+                for future in futures:
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        if not return_exceptions:
+                            raise
+                        results.append(e)
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        return results
+
+    @instrumented("send_intent")
     def send_intent(
         self,
         envelope_hash: Union[str, bytes],
@@ -643,189 +1071,669 @@ class IntentClient:
             
         Raises:
             EnvelopeError: If the envelope is invalid
-            PinningError: If IPFS pinning fails
+            PinningError: If IPFS pinning fails. With local_cid the pin is checked
+                after the broadcast: the error then carries tx_hash and receipt
+                (waited for if wait_for_receipt) of the sent transaction
             TransactionError: If the transaction fails
             InactiveDIDError: If the envelope's DID exists but is inactive
         """
-        # Verify chain ID
-        self.assert_chain_id()
+        # Verify chain ID (together with the other independent reads when batching)
+        with stage("chain_id"):
+            if self._batch_rpc:
+                self._prefetch_reads(payload_dict)
+            else:
+                self.assert_chain_id()
         
         try:
             # 0. Ensure DID is registered with Gateway service if we have an identity manager
-            if hasattr(self, "_identity_manager"):
+            with stage("gateway"):
+                self._ensure_gateway_registration()
+            
+            # 1-2. Validate payload, check DID and normalize envelope hash
+            with stage("validate"):
+                envelope_hash, stake_wei = self._prepare_intent(envelope_hash, payload_dict, stake_wei)
+
+            # 3. Pin to IPFS (in the background when the CID is computed locally)
+            with stage("pin"):
+                if self.local_cid:
+                    cid, cid_bytes, pinned = self._pin_intent_in_background(payload_dict)
+                else:
+                    cid_bytes = self._pin_intent(payload_dict)
+
+            # 4-8. Gas, nonce, sign and send
+            tx_hash, nonce = self._submit_intent(
+                envelope_hash, cid_bytes, stake_wei, gas, gas_price_override
+            )
+            if self.local_cid:
+                with stage("pin_verify"):
+                    try:
+                        self._verify_pin(pinned, cid, tx_hash)
+                    except PinningError as pin_error:
+                        # The transaction is already broadcast: settle it and its nonce before reporting
+                        pin_error.receipt = self._finish_intent(tx_hash, nonce, wait_for_receipt, poll_interval)
+                        raise
+
+            # 9. Receipt
+            return self._finish_intent(tx_hash, nonce, wait_for_receipt, poll_interval)
+
+        except Exception as e:
+            error = self._map_send_error(e)
+            self.metrics.intent_failures.inc(error=type(error).__name__)
+            raise error
+
+    def _prefetch_reads(self, payload_dict: Dict[str, Any]) -> None:
+        """
+        Issue the independent reads of a send concurrently.
+        
+        With a batching provider the chain ID check, DID lookup, minimum stake,
+        fee quote and nonce seed share one JSON-RPC batch. Their results land in
+        the client's caches, so the regular send path does not repeat them.
+        
+        Raises:
+            NetworkError: If the chain ID doesn't match
+        """
+        tasks: List[Callable[[], Any]] = [self.assert_chain_id, lambda: self.min_stake_wei]
+        if self.signer is not None:
+            tasks.append(lambda: self.fee_oracle.fees(self.w3))
+            if self.recorder_contract is not None and self.nonce_manager.next_nonce is None:
+                tasks.append(lambda: self.nonce_manager.resync(self._fetch_pending_nonce))
+        envelope = payload_dict.get("envelope") if isinstance(payload_dict, dict) else None
+        did = envelope.get("did") if isinstance(envelope, dict) else None
+        if did and self.did_registry_contract and self.did_cache is not None:
+            tasks.append(lambda: self.resolve_did(did))
+        
+        if self._prefetch_pool is None:
+            self._prefetch_pool = ThreadPoolExecutor(
+                max_workers=8, thread_name_prefix="intentlayer-prefetch"
+            )
+        provider = self.w3.provider
+        burst = provider.coalesce() if isinstance(provider, BatchingProvider) else nullcontext()
+        with burst:
+            futures = [self._prefetch_pool.submit(task) for task in tasks]
+            for future in futures[1:]:
                 try:
-                    # Configure schema version from environment if available, default to 2
-                    schema_version = os.environ.get("INTENT_SCHEMA_VERSION")
-                    if schema_version:
-                        try:
-                            schema_version = int(schema_version)
-                        except ValueError:
-                            self.logger.warning(f"Invalid INTENT_SCHEMA_VERSION: {schema_version}. Using default.")
-                            schema_version = 2
-                    else:
-                        schema_version = 2
-                    
-                    # Get lock strategy from environment
-                    lock_strategy = os.environ.get("INTENT_LOCK_STRATEGY")
-                    redis_url = os.environ.get("INTENT_REDIS_URL")
-                    
-                    # Register DID with Gateway
-                    did_registered = self._identity_manager.ensure_registered(
-                        schema_version=schema_version,
-                        lock_strategy=lock_strategy,
-                        redis_url=redis_url
-                    )
-                    
-                    if did_registered:
-                        self.logger.info(f"Auto-registered DID with Gateway service")
+                    future.result()
                 except Exception as e:
-                    # Import at the top of the method to avoid circular imports
-                    from typing import TYPE_CHECKING
-                    if TYPE_CHECKING:
-                        from .gateway.exceptions import QuotaExceededError
-                    else:
-                        from .gateway.exceptions import QuotaExceededError
-                    
-                    # Specifically handle quota exceeded errors
-                    if isinstance(e, QuotaExceededError):
-                        self.logger.error(f"DID registration quota exceeded: {e}")
-                        raise
-                    else:
-                        # Log but don't fail for other errors - Gateway registration is an enhancement
-                        self.logger.warning(f"Failed to auto-register DID with Gateway: {e}")
+                    # The regular send path repeats the read and reports the error
+                    self.logger.debug(f"Prefetch read failed: {e}")
+            futures[0].result()
+
+    def send_many(
+        self,
+        items: Iterable[Tuple[Union[str, bytes], Dict[str, Any]]],
+        stake_wei: Optional[int] = None,
+        gas: Optional[int] = None,
+        gas_price_override: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        wait_for_receipt: bool = True,
+        *,
+        ordered: bool = True,
+        pin_concurrency: int = 8,
+        send_concurrency: int = 4,
+        receipt_concurrency: int = 16,
+        max_pending: Optional[int] = None,
+    ) -> Iterator[IntentResult]:
+        """
+        Send many intents as a pipeline with bounded concurrency per stage.
+        
+        Validation and pinning, gas estimation/signing/sending, and receipt
+        waiting run on separate worker pools, so later items are pinned while
+        earlier ones are signed, sent and confirmed. Nonces come from the shared
+        nonce manager, so concurrent sends from one signer do not collide.
+        
+        Args:
+            items: Iterable of (envelope_hash, payload_dict) pairs
+            stake_wei: Amount to stake per intent (defaults to min_stake_wei)
+            gas: Gas limit per transaction (optional)
+            gas_price_override: Gas price in wei (optional)
+            poll_interval: Polling interval for receipts (optional)
+            wait_for_receipt: Whether to wait for each transaction receipt
+            ordered: Yield results in input order (True) or as they complete (False)
+            pin_concurrency: Maximum pins in flight
+            send_concurrency: Maximum transactions being signed and sent at once
+            receipt_concurrency: Maximum receipts being waited on at once
+            max_pending: Maximum items in flight across all stages (or held
+                back for ordered output)
             
-            # 1. Validate payload
-            self._validate_payload(payload_dict)
+        Yields:
+            IntentResult per item, with either a receipt or the error raised
+            for that item (errors are mapped exactly as in send_intent)
             
-            # 1.5 Verify DID is active if we have a DID registry
-            if self.did_registry_contract and "envelope" in payload_dict and isinstance(payload_dict["envelope"], dict):
-                did = payload_dict["envelope"].get("did")
-                if did:
-                    try:
-                        owner, active = self.resolve_did(did)
-                        if not active:
-                            raise InactiveDIDError(did, owner)
-                    except TransactionError:
-                        # If DID doesn't exist, that's fine - it will get caught during contract execution
-                        pass
-
-            # 2. Normalize envelope hash BEFORE any network calls
-            if isinstance(envelope_hash, str):
-                h = (
-                    envelope_hash[2:]
-                    if envelope_hash.startswith("0x")
-                    else envelope_hash
-                )
+        Raises:
+            NetworkError: If the chain ID check fails
+            QuotaExceededError: If Gateway DID registration quota is exceeded
+        """
+        # Checks shared by every item run once up front
+        self.assert_chain_id()
+        self._ensure_gateway_registration()
+
+        pipeline = IntentPipeline(
+            self,
+            pin_concurrency=pin_concurrency,
+            send_concurrency=send_concurrency,
+            receipt_concurrency=receipt_concurrency,
+            max_pending=max_pending,
+        )
+        yield from pipeline.run(
+            items,
+            stake_wei=stake_wei,
+            gas=gas,
+            gas_price_override=gas_price_override,
+            poll_interval=poll_interval,
+            wait_for_receipt=wait_for_receipt,
+            ordered=ordered,
+        )
+
+    def _ensure_gateway_registration(self) -> None:
+        """
+        Register the client's DID with the Gateway service if an identity manager is set.
+        
+        Raises:
+            QuotaExceededError: If the Gateway reports the DID quota is exhausted
+        """
+        if not hasattr(self, "_identity_manager"):
+            return
+        try:
+            # Configure schema version from environment if available, default to 2
+            schema_version = os.environ.get("INTENT_SCHEMA_VERSION")
+            if schema_version:
+                try:
+                    schema_version = int(schema_version)
+                except ValueError:
+                    self.logger.warning(f"Invalid INTENT_SCHEMA_VERSION: {schema_version}. Using default.")
+                    schema_version = 2
+            else:
+                schema_version = 2
+            
+            # Get lock strategy from environment
+            lock_strategy = os.environ.get("INTENT_LOCK_STRATEGY")
+            redis_url = os.environ.get("INTENT_REDIS_URL")
+            
+            # Register DID with Gateway
+            did_registered = self._identity_manager.ensure_registered(
+                schema_version=schema_version,
+                lock_strategy=lock_strategy,
+                redis_url=redis_url
+            )
+            
+            if did_registered:
+                self.logger.info(f"Auto-registered DID with Gateway service")
+                self.invalidate_did(self._identity.did)
+        except Exception as e:
+            # Import here to avoid circular imports
+            from .gateway.exceptions import QuotaExceededError
+            
+            # Specifically handle quota exceeded errors
+            if isinstance(e, QuotaExceededError):
+                self.logger.error(f"DID registration quota exceeded: {e}")
+                raise
+            else:
+                # Log but don't fail for other errors - Gateway registration is an enhancement
+                self.logger.warning(f"Failed to auto-register DID with Gateway: {e}")
+
+    def _prepare_intent(
+        self,
+        envelope_hash: Union[str, bytes],
+        payload_dict: Dict[str, Any],
+        stake_wei: Optional[int],
+    ) -> Tuple[bytes, int]:
+        """
+        Validate an intent before any pinning or transaction work.
+        
+        Args:
+            envelope_hash: Hash of the envelope (bytes32 or hex string)
+            payload_dict: Payload dictionary with envelope data
+            stake_wei: Amount to stake (defaults to min_stake_wei)
+            
+        Returns:
+            Tuple of (envelope hash bytes, stake in wei)
+            
+        Raises:
+            EnvelopeError: If the payload or envelope hash is invalid
+            InactiveDIDError: If the envelope's DID exists but is inactive
+        """
+        # 1. Validate payload
+        self._validate_payload(payload_dict)
+        
+        # 1.5 Verify DID is active if we have a DID registry
+        if self.did_registry_contract and "envelope" in payload_dict and isinstance(payload_dict["envelope"], dict):
+            did = payload_dict["envelope"].get("did")
+            if did:
                 try:
-                    envelope_hash = bytes.fromhex(h)
-                except ValueError as e:
-                    raise EnvelopeError(f"Invalid envelope hash format: {e}")
+                    owner, active = self.resolve_did(did)
+                    if not active:
+                        raise InactiveDIDError(did, owner)
+                except TransactionError:
+                    # If DID doesn't exist, that's fine - it will get caught during contract execution
+                    pass
+
+        # 2. Normalize envelope hash BEFORE any network calls
+        if isinstance(envelope_hash, str):
+            h = (
+                envelope_hash[2:]
+                if envelope_hash.startswith("0x")
+                else envelope_hash
+            )
+            try:
+                envelope_hash = bytes.fromhex(h)
+            except ValueError as e:
+                raise EnvelopeError(f"Invalid envelope hash format: {e}")
+
+        # Use default stake if not provided
+        if stake_wei is None:
+            stake_wei = self.min_stake_wei
+
+        return envelope_hash, stake_wei
+
+    def _pin_intent(self, payload_dict: Dict[str, Any]) -> bytes:
+        """
+        Pin an intent payload and convert its CID for the contract call.
+        
+        Raises:
+            PinningError: If IPFS pinning fails
+            EnvelopeError: If the CID cannot be converted
+        """
+        cid = self.pin_to_ipfs(payload_dict)
+        try:
+            return ipfs_cid_to_bytes(cid)
+        except Exception as e:
+            raise EnvelopeError(f"Failed to convert CID: {e}")
+
+    def _pin_intent_in_background(self, payload_dict: Dict[str, Any]) -> Tuple[str, bytes, Future]:
+        """
+        Compute an intent payload's CID locally and start pinning it.
+        
+        Returns:
+            Tuple of (local CID, CID bytes for the contract call, future of the pinner's CID)
+            
+        Raises:
+            EnvelopeError: If the CID cannot be computed or converted
+        """
+        try:
+            cid = compute_payload_cid(payload_dict)
+            cid_bytes = ipfs_cid_to_bytes(cid)
+        except Exception as e:
+            raise EnvelopeError(f"Failed to compute CID: {e}")
+        if self._pin_pool is None:
+            self._pin_pool = ThreadPoolExecutor(
+                max_workers=self.pin_concurrency, thread_name_prefix="intentlayer-pin"
+            )
+        return cid, cid_bytes, self._pin_pool.submit(self.pin_to_ipfs, payload_dict)
+
+    def _verify_pin(self, pinned: Future, expected_cid: str, tx_hash: Any) -> None:
+        """
+        Wait for a background pin and check the pinner stored the expected content.
+        
+        Raises:
+            PinningError: If pinning failed or the pinner returned a different CID;
+                the transaction has already been broadcast at this point, and its
+                hash is the error's tx_hash attribute
+        """
+        tx_ref = "0x" + tx_hash.hex() if isinstance(tx_hash, bytes) else str(tx_hash)
+        try:
+            cid = pinned.result()
+        except Exception as e:
+            error = PinningError(f"IPFS pinning failed after sending transaction {tx_ref}: {e}")
+        else:
+            if cid == expected_cid:
+                return
+            error = PinningError(f"Pinner returned CID {cid} but transaction {tx_ref} records {expected_cid}")
+        error.tx_hash = tx_ref
+        raise error
+
+    def _submit_intent(
+        self,
+        envelope_hash: bytes,
+        cid_bytes: bytes,
+        stake_wei: int,
+        gas: Optional[int] = None,
+        gas_price_override: Optional[int] = None,
+    ) -> Tuple[Any, int]:
+        """
+        Estimate gas, then build, sign and broadcast a recordIntent transaction.
+        
+        Returns:
+            Tuple of (transaction hash, nonce used)
+            
+        Raises:
+            TransactionError: If signing or sending fails
+        """
+        build_tx, gas_key, gas = self._intent_tx_builder(
+            envelope_hash, cid_bytes, stake_wei, gas, gas_price_override
+        )
 
-            # Use default stake if not provided
-            if stake_wei is None:
-                stake_wei = self.min_stake_wei
+        # 6-8. Nonce, sign and send
+        sent = self._send_with_gas_model(build_tx, "intent", gas_key, gas)
+        self.metrics.intents_sent.inc()
+        return sent
 
-            # 3. Pin to IPFS
-            cid = self.pin_to_ipfs(payload_dict)
+    def _sign_intent(
+        self,
+        envelope_hash: bytes,
+        cid_bytes: bytes,
+        stake_wei: int,
+        gas: Optional[int] = None,
+        gas_price_override: Optional[int] = None,
+    ) -> Tuple[bytes, int]:
+        """
+        Build and sign a recordIntent transaction without broadcasting it.
+        
+        The nonce is allocated from the shared nonce manager; the caller must
+        broadcast the transaction or release the nonce.
+        
+        Returns:
+            Tuple of (raw signed transaction, nonce used)
+            
+        Raises:
+            TransactionError: If signing fails
+        """
+        build_tx, _, _ = self._intent_tx_builder(
+            envelope_hash, cid_bytes, stake_wei, gas, gas_price_override
+        )
+        manager = self.nonce_manager
+        nonce = manager.allocate(self._fetch_pending_nonce)
+        try:
+            tx = build_tx(nonce)
             try:
-                cid_bytes = ipfs_cid_to_bytes(cid)
+                signed = self.signer.sign_transaction(tx)
             except Exception as e:
-                raise EnvelopeError(f"Failed to convert CID: {e}")
-
-            # 4. Nonce
-            nonce = self.w3.eth.get_transaction_count(self.signer.address)
+                raise TransactionError(f"Failed to sign transaction: {e}")
+            return bytes(self._raw_transaction(signed)), nonce
+        except Exception:
+            manager.release(nonce)
+            raise
 
-            # 5. Gas estimate
-            if gas is None:
-                try:
-                    est = (
-                        self.recorder_contract.functions.recordIntent(
-                            envelope_hash, cid_bytes
-                        )
-                        .estimate_gas(
-                            {"from": self.signer.address, "value": stake_wei}
-                        )
+    def _intent_tx_builder(
+        self,
+        envelope_hash: bytes,
+        cid_bytes: bytes,
+        stake_wei: int,
+        gas: Optional[int] = None,
+        gas_price_override: Optional[int] = None,
+    ) -> Tuple[Callable[[int], Dict[str, Any]], Optional[Any], int]:
+        """
+        Estimate gas and price a recordIntent transaction.
+        
+        Returns:
+            Tuple of (callable building the transaction for a nonce, gas model key, gas limit)
+        """
+        # 4. Gas estimate
+        gas_key = None
+        if gas is None:
+            try:
+                estimate = lambda: (
+                    self.recorder_contract.functions.recordIntent(
+                        envelope_hash, cid_bytes
                     )
-                    gas = int(est * 1.1)
-                    self.logger.debug(f"Estimated gas: {gas}")
-                except Exception as e:
-                    gas = 300_000
-                    self.logger.warning(f"Gas estimate failed, fallback to {gas}: {e}")
-                    
-                    # If this was due to min_stake changing, re-query it
-                    if "insufficient funds" in str(e).lower():
-                        self.refresh_min_stake()
-                        stake_wei = self.min_stake_wei
+                    .estimate_gas(
+                        {"from": self.signer.address, "value": stake_wei}
+                    )
+                )
+                with stage("gas"):
+                    if self.gas_model is not None:
+                        gas_key = GasModel.key_for(
+                            self.recorder_address, "recordIntent", envelope_hash, cid_bytes
+                        )
+                        gas = self.gas_model.estimate(gas_key, estimate)
+                    else:
+                        gas = int(estimate() * 1.1)
+                self.logger.debug(f"Estimated gas: {gas}")
+            except Exception as e:
+                gas = 300_000
+                self.logger.warning(f"Gas estimate failed, fallback to {gas}: {e}")
+                
+                # If this was due to min_stake changing, re-query it
+                if "insufficient funds" in str(e).lower():
+                    self.refresh_min_stake()
+                    stake_wei = self.min_stake_wei
+
+        # 5. Build tx (the nonce is allocated by the shared nonce manager)
+        fee_params = self._fee_params(gas_price_override)
 
-            # 6. Build tx params
+        def build_tx(nonce: int) -> Dict[str, Any]:
             tx_params = {
                 "from": self.signer.address,
                 "nonce": nonce,
                 "gas": gas,
                 "value": stake_wei,
+                **fee_params,
             }
-            if gas_price_override is not None:
-                tx_params["gasPrice"] = gas_price_override
+            # Skip web3's eth_chainId lookup when the chain is already verified
+            if self._expected_chain_id is not None:
+                tx_params["chainId"] = self._expected_chain_id
+            return self.recorder_contract.functions.recordIntent(
+                envelope_hash, cid_bytes
+            ).build_transaction(tx_params)
+
+        return build_tx, gas_key, gas
+
+    def _finish_intent(
+        self,
+        tx_hash: Any,
+        nonce: int,
+        wait_for_receipt: bool = True,
+        poll_interval: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Wait for an intent transaction's receipt, or return a minimal receipt.
+        """
+        if wait_for_receipt:
+            receipt = self._wait_for_receipt(tx_hash, poll_interval)
+            self.nonce_manager.mark_confirmed(nonce)
+            if self.gas_model is not None:
+                self.gas_model.observe_receipt(tx_hash, receipt)
+            return dict(receipt)
+        # Return minimal receipt
+        return {"transactionHash": "0x" + tx_hash.hex() if isinstance(tx_hash, bytes) else tx_hash}
+
+    def _send_with_gas_model(
+        self,
+        build_tx: Callable[[int], Dict[str, Any]],
+        description: str,
+        gas_key: Optional[Any],
+        gas: int,
+    ) -> Tuple[Any, int]:
+        """
+        Sign and send a transaction, keeping the gas model informed.
+        
+        If the gas limit came from the gas model, the sent transaction is
+        watched for an out-of-gas receipt, and a send rejected for too little
+        gas invalidates the cached estimate.
+        """
+        try:
+            tx_hash, nonce = self._sign_and_send(build_tx, description)
+        except Exception as e:
+            if gas_key is not None and is_out_of_gas_error(e):
+                self.gas_model.invalidate(gas_key)
+            raise
+        if gas_key is not None:
+            self.gas_model.watch(tx_hash, gas_key, gas)
+        return tx_hash, nonce
+
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """Get the metrics registry this client reports to."""
+        if self._metrics is not None:
+            return self._metrics
+        return get_metrics_registry()
+
+    @property
+    def fee_oracle(self) -> FeeOracle:
+        """Get the fee oracle used to price transactions."""
+        if self._fee_oracle is not None:
+            return self._fee_oracle
+        return get_fee_oracle(self.rpc_url, eip1559=self._eip1559)
+
+    def _fee_params(self, gas_price_override: Optional[int] = None) -> Dict[str, int]:
+        """Get the fee fields for a new transaction."""
+        if gas_price_override is not None:
+            return {"gasPrice": gas_price_override}
+        with stage("fees"):
+            return self.fee_oracle.fees(self.w3)
+
+    @property
+    def receipt_tracker(self) -> ReceiptTracker:
+        """Get the receipt tracker shared by all clients on this RPC endpoint."""
+        return get_receipt_tracker(self.w3, self.rpc_url)
+
+    def _wait_for_receipt(self, tx_hash: Any, poll_interval: Optional[float] = None) -> Any:
+        """
+        Wait for a transaction receipt.
+        
+        Uses the shared block-driven receipt tracker when enabled, otherwise
+        polls the receipt for this transaction directly.
+        
+        Raises:
+            TimeExhausted: If no receipt arrives within 120 seconds
+        """
+        started = time.monotonic()
+        with stage("receipt"):
+            if self._use_receipt_tracker:
+                receipt = self.receipt_tracker.wait(tx_hash, timeout=120, confirmations=self.confirmations)
             else:
-                tx_params["gasPrice"] = (
-                    self._default_gas_price
-                    if self._default_gas_price is not None
-                    else self.w3.eth.gas_price
+                receipt = self.w3.eth.wait_for_transaction_receipt(
+                    tx_hash, timeout=120, poll_latency=poll_interval or 0.1
                 )
+        self.metrics.receipt_wait.observe(time.monotonic() - started)
+        gas_used = receipt.get("gasUsed") if isinstance(receipt, Mapping) else None
+        if isinstance(gas_used, int):
+            self.metrics.gas_used.observe(gas_used)
+        return receipt
 
-            tx = self.recorder_contract.functions.recordIntent(
-                envelope_hash, cid_bytes
-            ).build_transaction(tx_params)
+    def _map_send_error(self, error: Exception) -> Exception:
+        """
+        Map an exception raised while sending an intent to the SDK's error types.
+        
+        Known SDK, DID, quota and Web3 errors are returned unchanged; anything
+        else is wrapped in a TransactionError.
+        """
+        if isinstance(error, (PinningError, EnvelopeError, TransactionError, Web3Exception,
+                              AlreadyRegisteredError, InactiveDIDError)):
+            # known exceptions including DID-specific errors pass through
+            return error
+
+        # Import here to avoid circular imports at module level
+        from .gateway.exceptions import QuotaExceededError
+        
+        # Use proper instance check for QuotaExceededError
+        if isinstance(error, QuotaExceededError):
+            return error
+        # Handle all other unexpected errors
+        self.logger.error(f"Unexpected send error: {error}")
+        wrapped = TransactionError(f"Transaction failed: {error}")
+        wrapped.__cause__ = error
+        return wrapped
+
+    # No aliases - using clean API
 
-            # 7. Sign
+    @property
+    def nonce_manager(self) -> NonceManager:
+        """
+        Get the nonce manager shared by all clients using this signer on this chain.
+        
+        Raises:
+            ValueError: If no signer is available
+        """
+        chain_key = self._expected_chain_id if self._expected_chain_id is not None else self.rpc_url
+        return get_nonce_manager(self.address, chain_key)
+
+    def _fetch_pending_nonce(self) -> int:
+        """Read the signer's pending transaction count from the chain."""
+        return self.w3.eth.get_transaction_count(self.signer.address, "pending")
+
+    def _sign_and_send(
+        self,
+        build_tx: Callable[[int], Dict[str, Any]],
+        description: str,
+    ) -> Tuple[Any, int]:
+        """
+        Allocate a nonce, build, sign and broadcast a transaction.
+        
+        If the node rejects the nonce as too low or too high, the shared nonce
+        manager is resynced with the chain and the transaction is rebuilt with a
+        fresh nonce, up to NONCE_RETRIES times.
+        
+        Args:
+            build_tx: Callable building the unsigned transaction for a given nonce
+            description: Short label used in log messages
+            
+        Returns:
+            Tuple of (transaction hash, nonce used)
+            
+        Raises:
+            TransactionError: If signing or sending fails
+        """
+        manager = self.nonce_manager
+        attempt = 0
+        while True:
+            with stage("nonce"):
+                nonce = manager.allocate(self._fetch_pending_nonce)
             try:
-                signed = self.signer.sign_transaction(tx)
+                tx = build_tx(nonce)
+            except Exception:
+                manager.release(nonce)
+                raise
+
+            # Sign
+            try:
+                with stage("sign"):
+                    signed = self.signer.sign_transaction(tx)
             except Exception as e:
+                manager.release(nonce)
                 self.logger.error(f"Signing failed: {e}")
                 raise TransactionError(f"Failed to sign transaction: {e}")
 
-            # 8. Send
+            # Send
             try:
-                if hasattr(signed, "rawTransaction"):
-                    raw_bytes = signed.rawTransaction
-                elif hasattr(signed, "raw_transaction"):
-                    raw_bytes = signed.raw_transaction
-                else:
-                    raise TransactionError("Signed transaction missing raw bytes")
-                tx_hash = self.w3.eth.send_raw_transaction(raw_bytes)
-                self.logger.info(f"Sent intent tx: {tx_hash.hex()}")
+                with stage("send"):
+                    raw_bytes = self._raw_transaction(signed)
+                    tx_hash = self.w3.eth.send_raw_transaction(raw_bytes)
             except Exception as e:
+                if is_already_known(e):
+                    # An earlier attempt (e.g. before a failover) already delivered this exact transaction
+                    tx_hash = Web3.keccak(raw_bytes)
+                    self.logger.info(f"Node already has {description} tx {tx_hash.hex()}")
+                    manager.mark_sent(nonce)
+                    return tx_hash, nonce
+                if is_ambiguous_send_error(e):
+                    # The transaction may be in flight: keep its nonce out of reuse
+                    manager.mark_sent(nonce)
+                    self.logger.error(f"Send of {description} tx with nonce {nonce} failed with unknown outcome: {e}")
+                    try:
+                        manager.resync(self._fetch_pending_nonce)
+                    except Exception as resync_error:
+                        self.logger.warning(f"Nonce resync failed: {resync_error}")
+                    raise TransactionError(f"Failed to send transaction: {e}") from e
+                manager.release(nonce)
+                if is_chain_id_error(e):
+                    self.invalidate_chain_id()
+                if is_nonce_error(e) and attempt < self.NONCE_RETRIES:
+                    attempt += 1
+                    self.logger.warning(f"Nonce {nonce} rejected ({e}), resyncing with chain")
+                    manager.resync(self._fetch_pending_nonce)
+                    continue
                 self.logger.error(f"Send failed: {e}")
                 if isinstance(e, Web3Exception):
                     raise
                 raise TransactionError(f"Failed to send transaction: {e}")
 
-            # 9. Receipt
-            if wait_for_receipt:
-                receipt = self.w3.eth.wait_for_transaction_receipt(
-                    tx_hash, timeout=120, poll_latency=poll_interval or 0.1
-                )
-                return dict(receipt)
-            else:
-                # Return minimal receipt
-                return {"transactionHash": "0x" + tx_hash.hex() if isinstance(tx_hash, bytes) else tx_hash}
+            manager.mark_sent(nonce)
+            self.logger.info(f"Sent {description} tx: {tx_hash.hex()}")
+            return tx_hash, nonce
 
-        except (PinningError, EnvelopeError, TransactionError, Web3Exception, AlreadyRegisteredError, InactiveDIDError):
-            # re-raise known exceptions including DID-specific errors
-            raise
-        except Exception as e:
-            # Import here to avoid circular imports at module level
-            from .gateway.exceptions import QuotaExceededError
-            
-            # Use proper instance check for QuotaExceededError
-            if isinstance(e, QuotaExceededError):
-                raise
-            # Handle all other unexpected errors
-            else:
-                self.logger.error(f"Unexpected send error: {e}")
-                raise TransactionError(f"Transaction failed: {e}")
-    
-    # No aliases - using clean API
+    @staticmethod
+    def _raw_transaction(signed: Any) -> Any:
+        """
+        Get the raw bytes of a signed transaction across eth-account versions.
+        
+        Raises:
+            TransactionError: If the signed transaction has no raw bytes
+        """
+        if hasattr(signed, "rawTransaction"):
+            return signed.rawTransaction
+        if hasattr(signed, "raw_transaction"):
+            return signed.raw_transaction
+        raise TransactionError("Signed transaction missing raw bytes")
 
     def tx_url(self, tx_hash: Union[str, bytes]) -> str:
         """
@@ -4,7 +4,7 @@ Network configuration utilities for the IntentLayer SDK.
 import json
 import os
 import importlib.resources
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 class NetworkConfig:
     """Network configuration manager for the IntentLayer SDK."""
@@ -74,7 +74,42 @@ class NetworkConfig:
             return os.environ[env_var]
             
         # Fall back to configuration
-        return cls.get_network(network_name)["rpc"]
+        return cls.get_rpc_endpoints(network_name)[0][0]
+    
+    @classmethod
+    def get_rpc_endpoints(cls, network_name: str, override: Optional[str] = None) -> List[Tuple[str, float]]:
+        """
+        Get all RPC endpoints for a network with their weights, primary first.
+        
+        Networks may list endpoints under "rpcs", each either a URL or an
+        object with "url" and optional "weight" (default 1.0). An override or
+        the <NETWORK>_RPC_URL environment variable replaces the whole list.
+        
+        Args:
+            network_name: Name of the network
+            override: Optional RPC URL to use instead of the configured ones
+            
+        Returns:
+            List of (url, weight) tuples
+        """
+        env_var = f"{network_name.upper().replace('-', '_')}_RPC_URL"
+        url = override or os.environ.get(env_var)
+        if url:
+            return [(url, 1.0)]
+        
+        network = cls.get_network(network_name)
+        endpoints = []
+        for entry in network.get("rpcs") or [network["rpc"]]:
+            if isinstance(entry, str):
+                endpoints.append((entry, 1.0))
+            else:
+                endpoints.append((entry["url"], float(entry.get("weight", 1.0))))
+        # A separately configured "rpc" stays the primary endpoint
+        primary = network.get("rpc")
+        if primary and primary != endpoints[0][0]:
+            weight = next((w for url, w in endpoints if url == primary), 1.0)
+            endpoints = [(primary, weight)] + [e for e in endpoints if e[0] != primary]
+        return endpoints
     
     @classmethod
     def get_chain_id(cls, network_name: str) -> int:
@@ -114,6 +149,23 @@ class NetworkConfig:
             DIDRegistry contract address
         """
         return cls.get_network(network_name)["didRegistry"]
+    
+    @classmethod
+    def get_multicall_address(cls, network_name: str) -> str:
+        """
+        Get Multicall3 contract address for a network.
+        
+        Args:
+            network_name: Name of the network
+            
+        Returns:
+            Multicall3 contract address (the canonical deployment unless configured)
+        """
+        from .multicall import MULTICALL3_ADDRESS
+        return cls.get_network(network_name).get("multicall3", MULTICALL3_ADDRESS)
 
-# Export NETWORKS map for direct access
-NETWORKS = NetworkConfig.load_networks()
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    # Export NETWORKS map for direct access, read from networks.json on first use
+    if name == "NETWORKS":
+        return NetworkConfig.load_networks()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
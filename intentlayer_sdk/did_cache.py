@@ -0,0 +1,107 @@
+"""
+DID resolution caching for the IntentLayer SDK.
+
+send_intent checks that an envelope's DID is active before every transaction.
+Agents reuse a small set of DIDs, so DIDCache keeps recent resolve() results in
+a bounded LRU with a TTL, using a shorter TTL for inactive or unregistered DIDs
+so a fresh registration becomes visible quickly.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class DIDCache:
+    """
+    Thread-safe LRU cache of DID resolution results with per-result TTLs.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0, negative_ttl: float = 15.0):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of DIDs kept (least recently used are evicted)
+            ttl: Seconds an active DID's resolution is reused
+            negative_ttl: Seconds an inactive or unregistered DID's resolution is reused
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1 (got: {maxsize})")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        # did -> (owner, active, expires_at)
+        self._entries: "OrderedDict[str, Tuple[str, bool, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, did: str) -> Optional[Tuple[str, bool]]:
+        """
+        Look up a cached resolution.
+
+        Args:
+            did: Decentralized Identifier
+
+        Returns:
+            Tuple of (owner_address, active_flag), or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(did)
+            if entry is None or entry[2] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[did]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(did)
+            self.hits += 1
+            return entry[0], entry[1]
+
+    def put(self, did: str, owner: str, active: bool) -> None:
+        """
+        Store a resolution result.
+
+        Args:
+            did: Decentralized Identifier
+            owner: Owner address returned by the registry
+            active: Whether the DID is active
+        """
+        expires_at = time.monotonic() + (self.ttl if active else self.negative_ttl)
+        with self._lock:
+            self._entries[did] = (owner, active, expires_at)
+            self._entries.move_to_end(did)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, did: Optional[str] = None) -> None:
+        """
+        Drop cached resolutions.
+
+        Args:
+            did: DID to drop (all entries if None)
+        """
+        with self._lock:
+            if did is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(did, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, evictions, hit_rate and size
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": len(self._entries),
+            }
@@ -1,15 +1,24 @@
 """
 Envelope models and utilities for the IntentLayer SDK.
 """
+import binascii
+import copy
+import functools
 import hashlib
-import json
+import mmap
+import os
+import secrets
 import time
-from typing import Dict, Any, Optional, Union
+from collections.abc import Iterable as IterableABC, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Callable, Dict, Any, Iterable, List, Mapping, Optional, Tuple, Union, overload
 
+import base58
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
-from pydantic import BaseModel, Field, field_validator
-from base64 import urlsafe_b64encode
-from web3 import Web3
+from pydantic import BaseModel, Field, PrivateAttr, ValidationError, field_validator
+from base64 import b64decode, urlsafe_b64encode
+
+from .canonical import canonical_json, keccak256
 
 class CallEnvelope(BaseModel):
     """
@@ -25,6 +34,54 @@ class CallEnvelope(BaseModel):
     stake_wei: str
     sig_ed25519: str
     metadata: Optional[Dict[str, Any]] = None
+
+    # Memoized encodings, reset when a field is assigned. Only envelopes without metadata
+    # memoize: metadata can be mutated in place, which no reset would catch.
+    # Read through __pydantic_private__: pydantic's attribute fallback costs microseconds per access.
+    _signing_bytes: Optional[bytes] = PrivateAttr(default=None)
+    _hash: Optional[bytes] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in CallEnvelope.model_fields:
+            self._reset_encodings()
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "CallEnvelope":
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._reset_encodings()
+        return copied
+
+    def _reset_encodings(self) -> None:
+        self.__pydantic_private__.update(_signing_bytes=None, _hash=None)
+
+    @classmethod
+    def _trusted(cls, fields: Dict[str, Any], signing_bytes: Optional[bytes] = None) -> "CallEnvelope":
+        """
+        Build an envelope from fields already known to be valid, skipping validation.
+
+        Args:
+            fields: Value for every model field, in declaration order
+            signing_bytes: Canonical bytes the signature was made over, if known
+                (ignored when metadata is set, as those envelopes don't memoize)
+        """
+        envelope = cls.__new__(cls)
+        object.__setattr__(envelope, "__dict__", fields)
+        object.__setattr__(
+            envelope, "__pydantic_fields_set__",
+            set(fields) if fields["metadata"] is not None else set(fields) - {"metadata"},
+        )
+        object.__setattr__(envelope, "__pydantic_extra__", None)
+        if fields["metadata"] is not None:
+            signing_bytes = None
+        object.__setattr__(envelope, "__pydantic_private__", {"_signing_bytes": signing_bytes, "_hash": None})
+        return envelope
+
+    def __eq__(self, other: Any) -> bool:
+        # Compare fields only; whether an encoding is memoized doesn't matter
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
     
     @field_validator('did')
     @classmethod
@@ -46,6 +103,30 @@ class CallEnvelope(BaseModel):
             raise ValueError("prompt_sha256 must be a hex string")
         return v
     
+    def _unsigned_fields(self) -> Dict[str, Any]:
+        return {
+            "did": self.did,
+            "model_id": self.model_id,
+            "prompt_sha256": self.prompt_sha256,
+            "tool_id": self.tool_id,
+            "timestamp_ms": self.timestamp_ms,
+            "stake_wei": self.stake_wei,
+        }
+
+    def signing_bytes(self) -> bytes:
+        """
+        Canonical JSON covered by sig_ed25519.
+
+        Returns:
+            Canonical encoding of every field except the signature (metadata only if set)
+        """
+        if self.metadata is not None:
+            return canonical_json({**self._unsigned_fields(), "metadata": self.metadata})
+        private = self.__pydantic_private__
+        if private["_signing_bytes"] is None:
+            private["_signing_bytes"] = canonical_json(self._unsigned_fields())
+        return private["_signing_bytes"]
+
     def hash(self) -> bytes:
         """
         Generate the envelope hash used for on-chain recording.
@@ -53,12 +134,13 @@ class CallEnvelope(BaseModel):
         Returns:
             bytes32 keccak hash of the canonical envelope representation
         """
-        # Create a copy without the signature
-        envelope_dict = self.model_dump(exclude={"sig_ed25519"})
-        
-        # Sort keys and remove whitespace for deterministic representation
-        canonical_json = json.dumps(envelope_dict, separators=(',', ':'), sort_keys=True).encode('utf-8')
-        return Web3.keccak(canonical_json)
+        if self.metadata is not None:
+            return keccak256(canonical_json({**self._unsigned_fields(), "metadata": self.metadata}))
+        private = self.__pydantic_private__
+        if private["_hash"] is None:
+            # Unlike the signed form, the hashed form carries "metadata": null when unset
+            private["_hash"] = keccak256(canonical_json({**self._unsigned_fields(), "metadata": None}))
+        return private["_hash"]
     
     def hex_hash(self) -> str:
         """
@@ -70,8 +152,89 @@ class CallEnvelope(BaseModel):
         return "0x" + self.hash().hex()
 
 
+def _check_envelope_params(model_id: str, tool_id: str, did: str) -> None:
+    """Validate the string parameters shared by create_envelope and create_envelopes."""
+    if not isinstance(model_id, str) or not model_id:
+        raise ValueError("model_id must be a non-empty string")
+        
+    if not isinstance(tool_id, str) or not tool_id:
+        raise ValueError("tool_id must be a non-empty string")
+        
+    if not isinstance(did, str) or not did:
+        raise ValueError("did must be a non-empty string")
+
+
+# Prompts are hashed this many characters/bytes at a time, so no full-size copy is made
+_HASH_CHUNK = 1 << 20
+
+# Anything create_envelope accepts as a prompt: text, a buffer, a path to a
+# file (hashed through mmap), a file object, or an iterable of str/bytes chunks
+PromptSource = Union[str, bytes, bytearray, memoryview, "os.PathLike[str]", IO[Any], Iterable[Union[str, bytes]]]
+
+
+def _prompt_digest(prompt: PromptSource) -> Tuple[bytes, int]:
+    """SHA-256 digest of a prompt's UTF-8 bytes and the number of bytes hashed."""
+    sha = hashlib.sha256()
+    size = 0
+
+    def update(piece: Any) -> None:
+        nonlocal size
+        if isinstance(piece, str):
+            # Slicing the whole string returns it as is; longer ones are encoded piece by piece
+            for start in range(0, len(piece), _HASH_CHUNK):
+                data = piece[start:start + _HASH_CHUNK].encode("utf-8")
+                sha.update(data)
+                size += len(data)
+            return
+        try:
+            view = memoryview(piece)
+        except TypeError:
+            raise TypeError(f"Prompt chunks must be str or bytes-like, got {type(piece).__name__}") from None
+        sha.update(view)
+        size += view.nbytes
+
+    if isinstance(prompt, (str, bytes, bytearray, memoryview, mmap.mmap)):
+        update(prompt)
+    elif isinstance(prompt, os.PathLike):
+        with open(prompt, "rb") as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    update(mapped)
+    elif hasattr(prompt, "read"):
+        while True:
+            chunk = prompt.read(_HASH_CHUNK)
+            if not chunk:
+                break
+            update(chunk)
+    elif isinstance(prompt, IterableABC):
+        for chunk in prompt:
+            update(chunk)
+    else:
+        raise TypeError(f"Unsupported prompt type: {type(prompt).__name__}")
+    return sha.digest(), size
+
+
+def prompt_sha256(prompt: PromptSource) -> str:
+    """
+    Hash a prompt the way create_envelope does, without holding a full copy in memory.
+
+    Args:
+        prompt: Text (hashed as UTF-8), a bytes-like object, a path (os.PathLike,
+            hashed through mmap), a binary or text file object, or an iterable
+            of str/bytes chunks
+
+    Returns:
+        Hex-encoded SHA-256 of the prompt
+
+    Raises:
+        TypeError: If the prompt (or one of its chunks) has an unsupported type
+        OSError: If a path cannot be read
+    """
+    return _prompt_digest(prompt)[0].hex()
+
+
 def create_envelope(
-    prompt: str,
+    prompt: PromptSource,
     model_id: str,
     tool_id: str,
     did: str,
@@ -84,7 +247,8 @@ def create_envelope(
     Create a signed call envelope.
     
     Args:
-        prompt: The raw user prompt
+        prompt: The raw user prompt; also bytes, a file path (os.PathLike), a
+            file object or an iterable of chunks, hashed incrementally (see prompt_sha256)
         model_id: AI model identifier
         tool_id: Tool/API identifier
         did: W3C Decentralized Identifier
@@ -100,19 +264,13 @@ def create_envelope(
     if not prompt:
         raise ValueError("Prompt cannot be empty")
     
-    if not isinstance(model_id, str) or not model_id:
-        raise ValueError("model_id must be a non-empty string")
-        
-    if not isinstance(tool_id, str) or not tool_id:
-        raise ValueError("tool_id must be a non-empty string")
-        
-    if not isinstance(did, str) or not did:
-        raise ValueError("did must be a non-empty string")
+    _check_envelope_params(model_id, tool_id, did)
     
-    # Generate prompt hash
-    prompt_sha256 = hashlib.sha256(
-        prompt.encode("utf-8") if isinstance(prompt, str) else prompt
-    ).hexdigest()
+    # Generate prompt hash; streamed prompts can only be checked for emptiness once read
+    digest, size = _prompt_digest(prompt)
+    if not size:
+        raise ValueError("Prompt cannot be empty")
+    prompt_sha256 = digest.hex()
     
     # Set timestamp if not provided
     if timestamp_ms is None:
@@ -138,7 +296,7 @@ def create_envelope(
         envelope_data["metadata"] = metadata
     
     # Create canonical representation
-    canonical = json.dumps(envelope_data, separators=(',', ':'), sort_keys=True).encode('utf-8')
+    canonical = canonical_json(envelope_data)
     
     # Sign the canonical representation
     signature = private_key.sign(canonical)
@@ -149,5 +307,393 @@ def create_envelope(
     # Add signature to the envelope
     envelope_data["sig_ed25519"] = sig_b64
     
-    # Create and return the envelope
-    return CallEnvelope(**envelope_data)
\ No newline at end of file
+    # Create and return the envelope, keeping the bytes we just signed (if they can't go stale)
+    envelope = CallEnvelope(**envelope_data)
+    if metadata is None:
+        envelope.__pydantic_private__["_signing_bytes"] = canonical
+    return envelope
+
+
+# Total prompt size from which create_envelopes hashes on worker threads;
+# hashlib releases the GIL for inputs over 2 KiB, but threads don't pay off for small batches
+_PARALLEL_HASH_BYTES = 1 << 20
+
+# Envelopes per signing task when create_envelopes signs on worker threads
+_SIGN_CHUNK = 256
+
+
+class EnvelopeBatch(Sequence):
+    """
+    Envelopes built by create_envelopes.
+
+    The fields all envelopes share are stored once and the per-envelope
+    prompt hashes and signatures in packed byte strings; indexing builds a
+    CallEnvelope on demand without re-validating it.
+    """
+
+    def __init__(
+        self,
+        did: str,
+        model_id: str,
+        tool_id: str,
+        stake_wei: str,
+        timestamp_ms: int,
+        metadata: Optional[Dict[str, Any]],
+        digests: bytes,
+        signatures: bytes,
+        signing_template: Tuple[bytes, bytes],
+    ):
+        self.did = did
+        self.model_id = model_id
+        self.tool_id = tool_id
+        self.stake_wei = stake_wei
+        self.timestamp_ms = timestamp_ms
+        self.metadata = metadata
+        self._digests = digests
+        self._signatures = signatures
+        self._prefix, self._suffix = signing_template
+
+    def __len__(self) -> int:
+        return len(self._digests) // 32
+
+    def _index(self, index: int) -> int:
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("envelope index out of range")
+        return index
+
+    def prompt_sha256(self, index: int) -> str:
+        """Hex SHA-256 of prompt number index."""
+        index = self._index(index)
+        return self._digests[index * 32:(index + 1) * 32].hex()
+
+    def sig_ed25519(self, index: int) -> str:
+        """Signature of envelope number index, URL-safe base64 without padding."""
+        index = self._index(index)
+        return urlsafe_b64encode(self._signatures[index * 64:(index + 1) * 64]).decode("ascii").rstrip("=")
+
+    def signing_bytes(self, index: int) -> bytes:
+        """Canonical JSON covered by the signature of envelope number index."""
+        index = self._index(index)
+        return self._prefix + self._digests[index * 32:(index + 1) * 32].hex().encode("ascii") + self._suffix
+
+    @overload
+    def __getitem__(self, index: int) -> CallEnvelope: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[CallEnvelope]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[CallEnvelope, List[CallEnvelope]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        prompt_sha256 = self.prompt_sha256(index)
+        fields = {
+            "did": self.did,
+            "model_id": self.model_id,
+            "prompt_sha256": prompt_sha256,
+            "tool_id": self.tool_id,
+            "timestamp_ms": self.timestamp_ms,
+            "stake_wei": self.stake_wei,
+            "sig_ed25519": self.sig_ed25519(index),
+            "metadata": copy.deepcopy(self.metadata),
+        }
+        return CallEnvelope._trusted(fields, self._prefix + prompt_sha256.encode("ascii") + self._suffix)
+
+    def __repr__(self) -> str:
+        return f"EnvelopeBatch({len(self)} envelopes, did={self.did!r}, model_id={self.model_id!r})"
+
+
+def _ed25519_signer(private_key: Ed25519PrivateKey) -> Callable[[bytes], bytes]:
+    """Return a signing function for private_key, going through libsodium when the raw key is available."""
+    try:
+        seed = private_key.private_bytes_raw()
+    except (AttributeError, TypeError, ValueError):
+        # Not exportable (e.g. held by a hardware token): sign through the key object
+        return private_key.sign
+
+    from nacl.bindings import crypto_sign, crypto_sign_seed_keypair
+
+    _, secret_key = crypto_sign_seed_keypair(seed)
+    # Ed25519 is deterministic: libsodium and OpenSSL produce the same signature
+    return lambda message: crypto_sign(message, secret_key)[:64]
+
+
+def _prompt_size(prompt: PromptSource) -> int:
+    """Approximate size of a prompt in bytes (0 if unknown without reading it)."""
+    if isinstance(prompt, (str, bytes, bytearray)):
+        return len(prompt)
+    if isinstance(prompt, memoryview):
+        return prompt.nbytes
+    if isinstance(prompt, os.PathLike):
+        try:
+            return os.path.getsize(prompt)
+        except OSError:
+            return 0
+    return 0
+
+
+def _signing_template(
+    did: str,
+    model_id: str,
+    tool_id: str,
+    timestamp_ms: int,
+    stake_wei: str,
+    metadata: Optional[Dict[str, Any]],
+) -> Tuple[bytes, bytes]:
+    """Canonical signed bytes before and after prompt_sha256 for envelopes sharing every other field."""
+    # Every signed message differs only in prompt_sha256: encode the rest once around a unique marker
+    envelope_data: Dict[str, Any] = {
+        "did": did,
+        "model_id": model_id,
+        "tool_id": tool_id,
+        "timestamp_ms": timestamp_ms,
+        "stake_wei": stake_wei,
+    }
+    if metadata is not None:
+        envelope_data["metadata"] = metadata
+    while True:
+        marker = secrets.token_hex(32).encode("ascii")
+        template = canonical_json({**envelope_data, "prompt_sha256": marker.decode("ascii")})
+        if template.count(marker) == 1:
+            break
+    prefix, suffix = template.split(marker)
+    return prefix, suffix
+
+
+def create_envelopes(
+    prompts: Iterable[PromptSource],
+    model_id: str,
+    tool_id: str,
+    did: str,
+    private_key: Ed25519PrivateKey,
+    stake_wei: Union[int, str],
+    timestamp_ms: Optional[int] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+    max_workers: Optional[int] = None,
+) -> EnvelopeBatch:
+    """
+    Create signed call envelopes for many prompts at once.
+
+    Produces the same envelopes as calling create_envelope for each prompt
+    with the same parameters, but validates the parameters once, hashes large
+    prompt sets on worker threads, signs with one prepared key and skips
+    per-envelope model validation.
+
+    Args:
+        prompts: Raw user prompts, each of any type create_envelope accepts
+        model_id: AI model identifier
+        tool_id: Tool/API identifier
+        did: W3C Decentralized Identifier
+        private_key: Ed25519 private key for signing
+        stake_wei: Amount staked (in wei)
+        timestamp_ms: Timestamp for every envelope (defaults to current time)
+        metadata: Optional metadata to include in every envelope
+        max_workers: Worker threads for hashing and signing (defaults to the CPU count, at most 8)
+
+    Returns:
+        EnvelopeBatch producing a CallEnvelope per prompt, in order
+
+    Raises:
+        ValueError: If a prompt is empty or a parameter is invalid
+        TypeError: If prompts is a single prompt, metadata is not a dictionary or
+            timestamp_ms not an integer
+    """
+    if isinstance(prompts, (str, bytes, bytearray, memoryview)):
+        raise TypeError("prompts must be a collection of prompts, not a single prompt")
+    _check_envelope_params(model_id, tool_id, did)
+    if not did.startswith("did:"):
+        raise ValueError("DID must start with 'did:'")
+    if metadata is not None:
+        if not isinstance(metadata, dict):
+            raise TypeError(f"metadata must be a dictionary, got {type(metadata).__name__}")
+        # The signing template is encoded once: later changes to the caller's dict must not leak in
+        metadata = copy.deepcopy(metadata)
+    if timestamp_ms is None:
+        timestamp_ms = int(time.time() * 1000)
+    elif not isinstance(timestamp_ms, int) or isinstance(timestamp_ms, bool):
+        raise TypeError(f"timestamp_ms must be an integer, got {type(timestamp_ms).__name__}")
+    stake_wei_str = str(stake_wei)
+
+    prompts = list(prompts)
+
+    prefix, suffix = _signing_template(did, model_id, tool_id, timestamp_ms, stake_wei_str, metadata)
+
+    sign = _ed25519_signer(private_key)
+    workers = max_workers if max_workers is not None else min(8, os.cpu_count() or 1)
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 and len(prompts) > 1 else None
+    try:
+        if executor is not None and sum(map(_prompt_size, prompts)) >= _PARALLEL_HASH_BYTES:
+            hashed = list(executor.map(_prompt_digest, prompts))
+        else:
+            hashed = list(map(_prompt_digest, prompts))
+        for index, (_, size) in enumerate(hashed):
+            if not size:
+                raise ValueError(f"Prompt {index} cannot be empty")
+        digests = b"".join(digest for digest, _ in hashed)
+
+        def sign_range(start: int, stop: int) -> bytes:
+            return b"".join(
+                sign(prefix + digests[i * 32:(i + 1) * 32].hex().encode("ascii") + suffix)
+                for i in range(start, stop)
+            )
+
+        if executor is not None and len(prompts) > _SIGN_CHUNK:
+            starts = range(0, len(prompts), _SIGN_CHUNK)
+            signatures = b"".join(executor.map(
+                lambda start: sign_range(start, min(start + _SIGN_CHUNK, len(prompts))), starts
+            ))
+        else:
+            signatures = sign_range(0, len(prompts))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return EnvelopeBatch(
+        did, model_id, tool_id, stake_wei_str, timestamp_ms,
+        metadata, digests, signatures, (prefix, suffix),
+    )
+
+
+# Multicodec prefix of an Ed25519 public key in a did:key identifier
+_ED25519_MULTICODEC = b"\xed\x01"
+
+# Envelopes per verification task when verify_envelopes verifies on worker threads
+_VERIFY_CHUNK = 256
+
+
+@functools.lru_cache(maxsize=4096)
+def _did_key_public_key(did: str) -> Optional[bytes]:
+    """Raw Ed25519 public key of a did:key DID, or None if the DID is not one."""
+    if not did.startswith("did:key:"):
+        return None
+    encoded = did[len("did:key:"):]
+    # Standard DIDs carry the multibase "z" (base58btc) prefix; derive_did_from_pubkey leaves it out
+    candidates = (encoded[1:], encoded) if encoded.startswith("z") else (encoded,)
+    for candidate in candidates:
+        try:
+            decoded = base58.b58decode(candidate)
+        except ValueError:
+            continue
+        if len(decoded) == 34 and decoded.startswith(_ED25519_MULTICODEC):
+            return decoded[2:]
+    return None
+
+
+def _decode_signature(sig_ed25519: Any) -> Optional[bytes]:
+    """Raw 64-byte signature from its unpadded URL-safe base64 form, or None if malformed."""
+    if not isinstance(sig_ed25519, str):
+        return None
+    try:
+        signature = b64decode(sig_ed25519 + "=" * (-len(sig_ed25519) % 4), altchars=b"-_", validate=True)
+    except (binascii.Error, ValueError):
+        return None
+    return signature if len(signature) == 64 else None
+
+
+def _signed_parts(envelope: Union[CallEnvelope, Mapping[str, Any]]) -> Optional[Tuple[bytes, bytes, bytes]]:
+    """(message, signature, public key) of an envelope, or None if it can't be verified."""
+    if not isinstance(envelope, CallEnvelope):
+        try:
+            envelope = CallEnvelope.model_validate(envelope)
+        except ValidationError:
+            return None
+    signature = _decode_signature(envelope.sig_ed25519)
+    public_key = _did_key_public_key(envelope.did)
+    if signature is None or public_key is None:
+        return None
+    # Encode the current fields rather than trusting memoized signing bytes
+    fields = envelope._unsigned_fields()
+    if envelope.metadata is not None:
+        fields["metadata"] = envelope.metadata
+    return canonical_json(fields), signature, public_key
+
+
+def _ed25519_verify(message: bytes, signature: bytes, public_key: bytes) -> bool:
+    from nacl.bindings import crypto_sign_open
+    from nacl.exceptions import BadSignatureError
+
+    try:
+        crypto_sign_open(signature + message, public_key)
+    except BadSignatureError:
+        return False
+    return True
+
+
+def verify_envelope(envelope: Union[CallEnvelope, Mapping[str, Any]]) -> bool:
+    """
+    Verify the Ed25519 signature of an envelope against its did:key DID.
+
+    The signed bytes are always re-encoded from the envelope's current
+    fields. The public key is decoded from the DID, so no key lookup is
+    needed; decoded keys are cached per DID.
+
+    Args:
+        envelope: CallEnvelope, or a dictionary of its fields (e.g. parsed from JSON)
+
+    Returns:
+        True if sig_ed25519 is a valid signature of the envelope by the DID's key;
+        False if it is not, or the envelope, signature or DID is malformed or the
+        DID is not an Ed25519 did:key
+    """
+    parts = _signed_parts(envelope)
+    return parts is not None and _ed25519_verify(*parts)
+
+
+def verify_envelopes(
+    envelopes: Iterable[Union[CallEnvelope, Mapping[str, Any]]],
+    max_workers: Optional[int] = None,
+) -> List[bool]:
+    """
+    Verify the signatures of many envelopes at once.
+
+    An EnvelopeBatch is verified from its packed signatures without building
+    envelope objects. Large inputs are verified on worker threads; libsodium
+    releases the GIL while verifying.
+
+    Args:
+        envelopes: EnvelopeBatch, or envelopes as accepted by verify_envelope
+        max_workers: Worker threads (defaults to the CPU count, at most 8)
+
+    Returns:
+        verify_envelope's result for each envelope, in order
+    """
+    if isinstance(envelopes, EnvelopeBatch):
+        batch = envelopes
+        public_key = _did_key_public_key(batch.did)
+        count = len(batch)
+        # Re-encode the shared fields as they are now rather than reusing the template they were signed with
+        prefix, suffix = _signing_template(
+            batch.did, batch.model_id, batch.tool_id, batch.timestamp_ms, batch.stake_wei, batch.metadata
+        )
+        digests, signatures = batch._digests, batch._signatures
+
+        def verify_range(start: int, stop: int) -> List[bool]:
+            if public_key is None:
+                return [False] * (stop - start)
+            return [
+                _ed25519_verify(
+                    prefix + digests[i * 32:(i + 1) * 32].hex().encode("ascii") + suffix,
+                    signatures[i * 64:(i + 1) * 64],
+                    public_key,
+                )
+                for i in range(start, stop)
+            ]
+    else:
+        items = list(envelopes)
+        count = len(items)
+
+        def verify_range(start: int, stop: int) -> List[bool]:
+            return [verify_envelope(items[i]) for i in range(start, stop)]
+
+    workers = max_workers if max_workers is not None else min(8, os.cpu_count() or 1)
+    if workers <= 1 or count <= _VERIFY_CHUNK:
+        return verify_range(0, count)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        chunks = executor.map(
+            lambda start: verify_range(start, min(start + _VERIFY_CHUNK, count)),
+            range(0, count, _VERIFY_CHUNK),
+        )
+        return [valid for chunk in chunks for valid in chunk]
@@ -0,0 +1,201 @@
+"""
+Transaction fee pricing for the IntentLayer SDK.
+
+A FeeOracle supplies the fee fields of a transaction. The default
+CachedFeeOracle refreshes its quote at most once per TTL and is shared by all
+clients on the same RPC endpoint, so long-running workers follow the market
+without an extra RPC call on every send. With eip1559 enabled it builds type-2
+fees from eth_feeHistory.
+"""
+import logging
+import statistics
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+from web3 import Web3
+from web3.exceptions import MethodUnavailable
+
+logger = logging.getLogger(__name__)
+
+# JSON-RPC error code for a method the node does not implement
+METHOD_NOT_FOUND = -32601
+
+# Node messages for an unsupported method, for providers that do not return the code
+METHOD_NOT_FOUND_MARKERS = ("method not found", "does not exist", "not supported")
+
+
+def _is_unsupported_method(error: Exception) -> bool:
+    """Whether an RPC error says the node does not implement the method, rather than failing transiently."""
+    if isinstance(error, MethodUnavailable):
+        return True
+    response = getattr(error, "rpc_response", None) or {}
+    if isinstance(response.get("error"), dict) and response["error"].get("code") == METHOD_NOT_FOUND:
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in METHOD_NOT_FOUND_MARKERS)
+
+
+class FeeOracle(ABC):
+    """
+    Abstract base class for fee oracles.
+
+    Subclasses implement fees() to return the fee fields for a transaction:
+    either {"gasPrice": ...} or {"maxFeePerGas": ..., "maxPriorityFeePerGas": ...}.
+    """
+
+    @abstractmethod
+    def fees(self, w3: Web3) -> Dict[str, int]:
+        """
+        Get the fee fields for a new transaction.
+
+        Args:
+            w3: Web3 instance of the client sending the transaction
+
+        Returns:
+            Dictionary of fee fields to merge into the transaction parameters
+        """
+        pass
+
+    def invalidate(self) -> None:
+        """Drop any cached quote so the next call fetches fresh fees."""
+
+
+class CachedFeeOracle(FeeOracle):
+    """
+    Fee oracle that caches the node's fee quote for a fixed TTL.
+
+    In legacy mode the quote is eth_gasPrice. In EIP-1559 mode the priority fee
+    is the median of the reward_percentile tips over the last history_blocks
+    blocks, and the max fee allows the base fee to grow by base_fee_multiplier
+    before the transaction is priced out. Chains without eth_feeHistory (or
+    without a base fee) switch to legacy pricing for good; other fee history
+    failures are priced legacy for that quote only.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 15.0,
+        eip1559: bool = False,
+        history_blocks: int = 10,
+        reward_percentile: float = 50.0,
+        base_fee_multiplier: float = 2.0,
+        min_priority_fee: int = 0,
+    ):
+        """
+        Initialize the fee oracle.
+
+        Args:
+            ttl: Seconds a fee quote is reused before refreshing
+            eip1559: Build type-2 fees from eth_feeHistory
+            history_blocks: Number of recent blocks sampled by eth_feeHistory
+            reward_percentile: Percentile of per-block tips used for the priority fee
+            base_fee_multiplier: Headroom applied to the next block's base fee
+            min_priority_fee: Lower bound for the priority fee in wei
+        """
+        if ttl < 0:
+            raise ValueError(f"ttl must not be negative (got: {ttl})")
+        self.ttl = ttl
+        self.eip1559 = eip1559
+        self.history_blocks = history_blocks
+        self.reward_percentile = reward_percentile
+        self.base_fee_multiplier = base_fee_multiplier
+        self.min_priority_fee = min_priority_fee
+        self._lock = threading.Lock()
+        self._quote: Optional[Dict[str, int]] = None
+        self._quote_time = 0.0
+        self._eip1559_supported = True
+        self.refreshes = 0
+
+    def fees(self, w3: Web3) -> Dict[str, int]:
+        """
+        Get the fee fields for a new transaction, refreshing the quote if stale.
+
+        Args:
+            w3: Web3 instance of the client sending the transaction
+
+        Returns:
+            Dictionary of fee fields to merge into the transaction parameters
+        """
+        with self._lock:
+            if self._quote is not None and time.monotonic() - self._quote_time < self.ttl:
+                return dict(self._quote)
+
+            if self.eip1559 and self._eip1559_supported:
+                try:
+                    quote = self._eip1559_fees(w3)
+                except Exception as e:
+                    if _is_unsupported_method(e):
+                        quote = None
+                    else:
+                        logger.warning(f"eth_feeHistory failed, using legacy gas price for this quote: {e}")
+                        quote = self._legacy_fees(w3)
+                if quote is None:
+                    logger.warning("Chain does not support EIP-1559 fees, using legacy gas price")
+                    self._eip1559_supported = False
+                    quote = self._legacy_fees(w3)
+            else:
+                quote = self._legacy_fees(w3)
+
+            self._quote = quote
+            self._quote_time = time.monotonic()
+            self.refreshes += 1
+            logger.debug(f"Refreshed fee quote: {quote}")
+            return dict(quote)
+
+    def invalidate(self) -> None:
+        """Drop the cached quote so the next call fetches fresh fees."""
+        with self._lock:
+            self._quote = None
+
+    def _legacy_fees(self, w3: Web3) -> Dict[str, int]:
+        """Quote a legacy gas price."""
+        return {"gasPrice": int(w3.eth.gas_price)}
+
+    def _eip1559_fees(self, w3: Web3) -> Optional[Dict[str, int]]:
+        """Quote type-2 fees from recent fee history, or None if the chain has no base fee."""
+        history = w3.eth.fee_history(self.history_blocks, "latest", [self.reward_percentile])
+        base_fees = history.get("baseFeePerGas")
+        if not base_fees:
+            return None
+        # The last entry is the base fee of the next (pending) block
+        next_base_fee = int(base_fees[-1])
+        tips = [int(r[0]) for r in history.get("reward") or [] if r]
+        priority_fee = max(int(statistics.median(tips)) if tips else 0, self.min_priority_fee)
+        return {
+            "maxPriorityFeePerGas": priority_fee,
+            "maxFeePerGas": int(next_base_fee * self.base_fee_multiplier) + priority_fee,
+        }
+
+
+# Module-level oracle cache with thread safety
+_oracles: Dict[Tuple[str, bool], CachedFeeOracle] = {}
+_oracles_lock = threading.RLock()
+
+
+def get_fee_oracle(endpoint: str, eip1559: bool = False, **kwargs: Any) -> CachedFeeOracle:
+    """
+    Get or create the shared fee oracle for an RPC endpoint.
+
+    Args:
+        endpoint: RPC endpoint identifier (typically the RPC URL)
+        eip1559: Whether the oracle builds type-2 fees
+        **kwargs: Options passed to CachedFeeOracle when it is created
+
+    Returns:
+        CachedFeeOracle shared by every client in the process using this endpoint
+    """
+    key = (endpoint, eip1559)
+    with _oracles_lock:
+        oracle = _oracles.get(key)
+        if oracle is None:
+            oracle = CachedFeeOracle(eip1559=eip1559, **kwargs)
+            _oracles[key] = oracle
+        return oracle
+
+
+def reset_fee_oracles() -> None:
+    """Drop all shared fee oracles (mainly useful in tests)."""
+    with _oracles_lock:
+        _oracles.clear()
@@ -0,0 +1,187 @@
+"""
+Gas estimate caching for the IntentLayer SDK.
+
+Gas for recordIntent(bytes32, bytes) and register(string) depends almost
+entirely on the size of the dynamic arguments, so GasModel caches estimates by
+(contract, function, argument length class) and only re-runs eth_estimateGas
+periodically or after an out-of-gas failure.
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Substrings used by common node implementations for gas limit failures
+OUT_OF_GAS_MARKERS = ("out of gas", "intrinsic gas too low", "gas required exceeds allowance")
+
+GasKey = Tuple[str, str, Tuple[int, ...]]
+
+
+def is_out_of_gas_error(error: Exception) -> bool:
+    """
+    Check whether an exception reports that a transaction ran out of gas.
+
+    Args:
+        error: Exception raised while sending a transaction
+
+    Returns:
+        True if the error message reports an insufficient gas limit
+    """
+    message = str(error).lower()
+    return any(marker in message for marker in OUT_OF_GAS_MARKERS)
+
+
+def _length_class(value: Any) -> int:
+    """ABI word count of a dynamic argument (0 for static arguments)."""
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    if isinstance(value, (bytes, bytearray)):
+        return (len(value) + 31) // 32
+    return 0
+
+
+class GasModel:
+    """
+    Thread-safe cache of gas estimates keyed by call shape.
+
+    Cached estimates are returned with the same safety margin the client applies
+    to fresh estimates. An entry is re-estimated after ttl seconds, after
+    max_uses hits, or when a transaction using it runs out of gas.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        max_uses: int = 1000,
+        margin: float = 1.1,
+        max_watched: int = 10_000,
+    ):
+        """
+        Initialize the gas model.
+
+        Args:
+            ttl: Seconds before a cached estimate is refreshed
+            max_uses: Cache hits before a cached estimate is refreshed
+            margin: Multiplier applied to raw estimates
+            max_watched: Maximum sent transactions remembered for out-of-gas detection
+        """
+        self.ttl = ttl
+        self.max_uses = max_uses
+        self.margin = margin
+        self.max_watched = max_watched
+        self._lock = threading.Lock()
+        # key -> [raw estimate, timestamp, uses]
+        self._entries: Dict[Hashable, list] = {}
+        # tx hash -> (key, gas limit), for out-of-gas detection on receipts
+        self._watched: "OrderedDict[Any, Tuple[Hashable, int]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def key_for(contract_address: str, function_name: str, *args: Any) -> GasKey:
+        """
+        Build the cache key for a contract call.
+
+        Args:
+            contract_address: Address of the called contract
+            function_name: Name of the called function
+            *args: Call arguments (only the length of dynamic arguments matters)
+
+        Returns:
+            Cache key for the call shape
+        """
+        return (contract_address.lower(), function_name, tuple(_length_class(a) for a in args))
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of estimates served from the cache."""
+        with self._lock:
+            total = self.hits + self.misses
+            return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, invalidations, hit_rate and size
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": len(self._entries),
+            }
+
+    def estimate(self, key: Hashable, estimate_fn: Callable[[], int]) -> int:
+        """
+        Get a gas limit for a call shape, estimating only on a cache miss.
+
+        Args:
+            key: Cache key from key_for()
+            estimate_fn: Callable running eth_estimateGas for the call
+
+        Returns:
+            Gas limit including the safety margin
+
+        Raises:
+            Exception: Whatever estimate_fn raises on a miss (nothing is cached)
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[1] <= self.ttl and entry[2] < self.max_uses:
+                entry[2] += 1
+                self.hits += 1
+                return int(entry[0] * self.margin)
+            self.misses += 1
+
+        raw = int(estimate_fn())
+        with self._lock:
+            self._entries[key] = [raw, now, 0]
+        logger.debug(f"Cached gas estimate {raw} for {key}")
+        return int(raw * self.margin)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Drop a cached estimate so the next call re-estimates.
+
+        Args:
+            key: Key to drop (all entries if None)
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            elif self._entries.pop(key, None) is None:
+                return
+            self.invalidations += 1
+
+    def watch(self, tx_hash: Any, key: Hashable, gas_limit: int) -> None:
+        """Remember which estimate a sent transaction used."""
+        with self._lock:
+            self._watched[tx_hash] = (key, gas_limit)
+            while len(self._watched) > self.max_watched:
+                self._watched.popitem(last=False)
+
+    def observe_receipt(self, tx_hash: Any, receipt: Dict[str, Any]) -> None:
+        """
+        Check a receipt for an out-of-gas failure.
+
+        A failed transaction that used its entire gas limit invalidates the
+        estimate it was built with.
+        """
+        with self._lock:
+            watched = self._watched.pop(tx_hash, None)
+        if watched is None:
+            return
+        key, gas_limit = watched
+        if receipt.get("status") == 0 and receipt.get("gasUsed", 0) >= gas_limit:
+            logger.warning(f"Transaction ran out of gas with cached limit {gas_limit}, re-estimating")
+            self.invalidate(key)
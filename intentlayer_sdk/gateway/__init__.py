@@ -6,17 +6,23 @@ which handles DID registration and intent submission.
 
 Note: This module requires additional dependencies that can be installed with:
     pip install intentlayer-sdk[grpc]
+
+GatewayClient (and with it grpc and the generated protos) is imported on
+first use, so importing this package stays cheap.
 """
 import os
 import sys
 import importlib.util
 import logging
 import threading
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, TYPE_CHECKING
 
 from .exceptions import QuotaExceededError, AlreadyRegisteredError
 from ._deps import ensure_grpc_installed
 
+if TYPE_CHECKING:
+    from .client import GatewayClient
+
 __all__ = ['GatewayClient', 'ensure_grpc_installed', 'QuotaExceededError', 
            'AlreadyRegisteredError', 'get_gateway_client']
 
@@ -43,4 +49,11 @@ def get_gateway_client(gateway_url: str, api_key: Optional[str] = None) -> 'Gate
         if cache_key not in _gateway_client_cache:
             from .client import GatewayClient
             _gateway_client_cache[cache_key] = GatewayClient(gateway_url, api_key=api_key)
-        return _gateway_client_cache[cache_key]
\ No newline at end of file
+        return _gateway_client_cache[cache_key]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "GatewayClient":
+        from .client import GatewayClient
+        return GatewayClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -82,6 +82,8 @@ except ImportError:
     PROTO_AVAILABLE = False
 
 from ._deps import ensure_grpc_installed
+from ..instrumentation import Instrumentation, instrumented, stage
+from ..metrics import MetricsRegistry, get_metrics_registry
 
 from .exceptions import (
     GatewayError, GatewayConnectionError, GatewayResponseError,
@@ -306,7 +308,9 @@ class GatewayClient:
         api_key: Optional[str] = None,
         bearer_token: Optional[str] = None,
         timeout: Optional[int] = None,
-        verify_ssl: bool = True
+        verify_ssl: bool = True,
+        instrumentation: Optional[Instrumentation] = None,
+        metrics: Optional[MetricsRegistry] = None
     ):
         """
         Initialize the Gateway client.
@@ -317,6 +321,9 @@ class GatewayClient:
             bearer_token: Optional JWT token for authentication (deprecated)
             timeout: Request timeout in seconds
             verify_ssl: Whether to verify SSL certificates
+            instrumentation: Hub whose listeners receive per-attempt events for register_did
+            metrics: Registry to report retries and quota rejections to
+                (defaults to the process-wide registry)
 
         Raises:
             ValueError: If gateway_url is invalid or both api_key and bearer_token are provided
@@ -328,6 +335,8 @@ class GatewayClient:
         # Validate URL
         self._validate_gateway_url(gateway_url)
         self.gateway_url = gateway_url
+        self.instrumentation = instrumentation
+        self._metrics = metrics
         
         # Get API key and bearer token from environment if not provided
         # Strip whitespace to handle copy-paste errors
@@ -659,6 +668,12 @@ class GatewayClient:
 
         return tuple(metadata) if metadata else None # Return None if empty
 
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """Get the metrics registry this client reports to."""
+        return getattr(self, "_metrics", None) or get_metrics_registry()
+
+    @instrumented("gateway.register_did")
     def register_did(
         self,
         did: str,
@@ -723,28 +738,31 @@ class GatewayClient:
                 jitter = delay * random.uniform(0, 0.1)
                 actual_delay = delay + jitter
                 logger.info(f"Retrying DID registration (attempt {retry_count+1}/{max_retries+1}) in {actual_delay:.2f}s") # Corrected log message
-                time.sleep(actual_delay)
+                with stage("backoff"):
+                    time.sleep(actual_delay)
 
             # Use per-retry timeout if specified, otherwise fall back to global timeout
             current_timeout = retry_timeout if retry_timeout is not None else self.timeout
 
             try:
-                # Prepare request based on proto availability
-                if PROTO_AVAILABLE:
-                    # Use the proper proto request format
-                    proto_doc = doc.to_proto()
-                    request = RegisterDidRequest(document=proto_doc)
-                    proto_response = self.stub.RegisterDid(request, timeout=current_timeout, metadata=metadata)
+                # Each attempt is one "rpc" stage
+                with stage("rpc"):
+                    # Prepare request based on proto availability
+                    if PROTO_AVAILABLE:
+                        # Use the proper proto request format
+                        proto_doc = doc.to_proto()
+                        request = RegisterDidRequest(document=proto_doc)
+                        proto_response = self.stub.RegisterDid(request, timeout=current_timeout, metadata=metadata)
                     
-                    # If our "stub" already returned a TxReceipt (as in tests), just use it:
-                    if isinstance(proto_response, TxReceipt):
-                        response = proto_response
+                        # If our "stub" already returned a TxReceipt (as in tests), just use it:
+                        if isinstance(proto_response, TxReceipt):
+                            response = proto_response
+                        else:
+                            # Otherwise parse the real gRPC response into a TxReceipt
+                            response = TxReceipt.from_proto_response(proto_response)
                     else:
-                        # Otherwise parse the real gRPC response into a TxReceipt
-                        response = TxReceipt.from_proto_response(proto_response)
-                else:
-                    # Use the legacy placeholder stub approach
-                    response = self.stub.RegisterDid(doc, timeout=current_timeout, metadata=metadata)
+                        # Use the legacy placeholder stub approach
+                        response = self.stub.RegisterDid(doc, timeout=current_timeout, metadata=metadata)
 
                 # Check for errors in the response
                 if not response.success:
@@ -767,6 +785,7 @@ class GatewayClient:
                             interval=60 # Log only once per minute
                         )
                         # Raise specific exception for quota exceeded
+                        self.metrics.quota_exceeded.inc()
                         raise QuotaExceededError(f"DID registration quota exceeded (Gateway error: {error})")
                     
                     elif error_code == RegisterError.INVALID_DID:
@@ -790,6 +809,7 @@ class GatewayClient:
                         # For now, treat unknown gateway errors as potentially retryable
                         logger.warning(f"Gateway returned failure for DID {did[:10]}...: {error} (code: {error_code}). Retrying (attempt {retry_count+1}/{max_retries+1})...")
                         last_error = GatewayResponseError(f"Failed to register DID: {error}", error_code)
+                        self.metrics.gateway_retries.inc(code=error_code)
                         retry_count += 1
                         continue # Go to next retry iteration
 
@@ -831,6 +851,7 @@ class GatewayClient:
                 error_details = str(e)
                 is_retryable = False
                 grpc_error   = False # Assume not a gRPC error initially
+                retry_code = type(e).__name__ # Status reported in the retry metric
 
                 # Check for other gRPC errors using duck typing (has .code() method)
                 if GRPC_AVAILABLE:
@@ -848,6 +869,7 @@ class GatewayClient:
                         details = error_details # Default details
                         try: code = e.code()
                         except Exception: logger.warning("Caught gRPC-like error without .code() method.")
+                        retry_code = getattr(code, "name", None) or str(code)
                         try:
                             # Use details() if available and callable
                             details_method = getattr(e, 'details', None)
@@ -896,6 +918,7 @@ class GatewayClient:
                 if is_retryable and retry_count < max_retries:
                     # Log the specific error determined above before retrying
                     logger.warning(f"Caught retryable error during DID registration (attempt {retry_count+1}/{max_retries+1}): {last_error or e}. Retrying...")
+                    self.metrics.gateway_retries.inc(code=retry_code)
                     retry_count += 1
                     continue # Continue to the next iteration of the while loop
                 else:
@@ -17,7 +17,8 @@ import appdirs
 if TYPE_CHECKING:
     from ..gateway.client import GatewayClient
 
-from ..gateway.exceptions import AlreadyRegisteredError
+from ..gateway.exceptions import AlreadyRegisteredError, QuotaExceededError
+from ..metrics import get_metrics_registry
 
 logger = logging.getLogger(__name__)
 
@@ -316,14 +317,20 @@ class IdentityManager:
                 with self._thread_lock:
                     self._is_registered = True
                 self.logger.info(f"Registered DID {self.identity.did[:6]}… with Gateway")
+                get_metrics_registry().identity_registrations.inc(result="registered")
                 return True
             except AlreadyRegisteredError:
                 # Already registered, mark as registered but return False
                 with self._thread_lock:
                     self._is_registered = True
+                get_metrics_registry().identity_registrations.inc(result="already_registered")
                 return False
+            except QuotaExceededError:
+                get_metrics_registry().identity_registrations.inc(result="quota_exceeded")
+                raise
             except Exception:
                 # Re-raise other exceptions
+                get_metrics_registry().identity_registrations.inc(result="error")
                 raise
         finally:
             # Always release the lock if we acquired it
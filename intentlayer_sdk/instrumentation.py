@@ -0,0 +1,272 @@
+"""
+Per-stage instrumentation for the IntentLayer SDK.
+
+Instrumented operations (IntentClient.send_intent, IntentClient.register_did
+and GatewayClient.register_did) report each stage they go through (pinning,
+gas estimation, nonce allocation, signing, sending, receipt wait, ...) to the
+listeners registered on an Instrumentation hub, with durations, attempt
+numbers and error classes. With no listener registered and timings disabled
+the stages are skipped entirely, so instrumentation costs a context variable
+lookup per stage.
+
+OpenTelemetryListener turns the events into spans and requires the optional
+opentelemetry-api package (pip install intentlayer-sdk[otel]).
+"""
+import contextvars
+import functools
+import itertools
+import logging
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Dict, Iterable, List, NamedTuple, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class StageEvent(NamedTuple):
+    """
+    A stage (or whole operation) starting or ending.
+
+    Attributes:
+        operation: Instrumented operation, e.g. "send_intent"
+        stage: Stage name, or None for the operation as a whole
+        call_id: Identifier shared by all events of one operation call
+        attempt: 1 for the first time a stage runs in a call, 2 for its first retry, ...
+        duration: Seconds spent, or None for start events
+        error: Class name of the exception that ended the stage, if any
+    """
+    operation: str
+    stage: Optional[str]
+    call_id: int
+    attempt: int
+    duration: Optional[float] = None
+    error: Optional[str] = None
+
+
+class InstrumentationListener:
+    """
+    Base class for instrumentation listeners; override the callbacks you need.
+
+    Callbacks run synchronously on the thread doing the work and should be
+    fast. Exceptions they raise are logged and otherwise ignored.
+    """
+
+    def on_stage_start(self, event: StageEvent) -> None:
+        """Called when a stage or operation starts."""
+
+    def on_stage_end(self, event: StageEvent) -> None:
+        """Called when a stage or operation ends, with its duration and error."""
+
+
+class _Call:
+    """State of one instrumented operation call."""
+
+    __slots__ = ("hub", "operation", "call_id", "collect", "timings", "attempts")
+
+    def __init__(self, hub: "Instrumentation", operation: str, call_id: int, collect: bool):
+        self.hub = hub
+        self.operation = operation
+        self.call_id = call_id
+        self.collect = collect
+        self.timings: Dict[str, float] = {}
+        self.attempts: Dict[str, int] = {}
+
+
+_current_call: "contextvars.ContextVar[Optional[_Call]]" = contextvars.ContextVar(
+    "intentlayer_current_call", default=None
+)
+_call_ids = itertools.count(1)
+_NOOP: ContextManager[None] = nullcontext()
+
+
+class _StageTimer:
+    """Context manager timing one stage (or the call itself when stage is None)."""
+
+    __slots__ = ("call", "stage", "attempt", "start", "token")
+
+    def __init__(self, call: _Call, stage: Optional[str]):
+        self.call = call
+        self.stage = stage
+        self.attempt = 1
+        self.start = 0.0
+        self.token: Optional[contextvars.Token] = None
+
+    def __enter__(self) -> _Call:
+        call = self.call
+        if self.stage is None:
+            self.token = _current_call.set(call)
+        else:
+            self.attempt = call.attempts.get(self.stage, 0) + 1
+            call.attempts[self.stage] = self.attempt
+        call.hub._emit("on_stage_start", StageEvent(call.operation, self.stage, call.call_id, self.attempt))
+        self.start = time.perf_counter()
+        return call
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        duration = time.perf_counter() - self.start
+        call = self.call
+        key = self.stage or "total"
+        if call.collect:
+            call.timings[key] = call.timings.get(key, 0.0) + duration
+        if self.token is not None:
+            _current_call.reset(self.token)
+        call.hub._emit("on_stage_end", StageEvent(
+            call.operation, self.stage, call.call_id, self.attempt, duration,
+            exc_type.__name__ if exc_type is not None else None,
+        ))
+
+
+class Instrumentation:
+    """
+    Hub distributing stage events to listeners.
+
+    One hub can be shared by several clients.
+    """
+
+    def __init__(self, listeners: Iterable[InstrumentationListener] = ()):
+        """
+        Initialize the hub.
+
+        Args:
+            listeners: Listeners to register
+        """
+        self._lock = threading.Lock()
+        self._listeners: List[InstrumentationListener] = list(listeners)
+
+    @property
+    def active(self) -> bool:
+        """True if any listener is registered."""
+        return bool(self._listeners)
+
+    def add_listener(self, listener: InstrumentationListener) -> None:
+        """Register a listener."""
+        with self._lock:
+            self._listeners = self._listeners + [listener]
+
+    def remove_listener(self, listener: InstrumentationListener) -> None:
+        """Unregister a listener (no-op if it is not registered)."""
+        with self._lock:
+            self._listeners = [l for l in self._listeners if l is not listener]
+
+    def call(self, operation: str, collect_timings: bool = False) -> ContextManager[Optional[_Call]]:
+        """
+        Instrument one operation call; stages entered inside it report to this hub.
+
+        Args:
+            operation: Operation name
+            collect_timings: Accumulate per-stage durations on the call
+
+        Returns:
+            Context manager yielding the call state, or None if nothing listens
+        """
+        if not self._listeners and not collect_timings:
+            return _NOOP
+        return _StageTimer(_Call(self, operation, next(_call_ids), collect_timings), None)
+
+    def _emit(self, callback: str, event: StageEvent) -> None:
+        for listener in self._listeners:
+            try:
+                getattr(listener, callback)(event)
+            except Exception as e:
+                logger.warning(f"Instrumentation listener {listener!r} failed in {callback}: {e}")
+
+
+# Hub used for timing collection by clients without their own
+_NO_LISTENERS = Instrumentation()
+
+
+def stage(name: str) -> ContextManager[Any]:
+    """
+    Time a stage of the instrumented call running in the current context.
+
+    Args:
+        name: Stage name
+
+    Returns:
+        Context manager (a shared no-op when no call is being instrumented)
+    """
+    call = _current_call.get()
+    if call is None:
+        return _NOOP
+    return _StageTimer(call, name)
+
+
+def instrumented(operation: str) -> Callable[[F], F]:
+    """
+    Decorate a client method as an instrumented operation.
+
+    The instance's `instrumentation` hub receives the events. If its
+    `collect_timings` attribute is true and the method returns a dict, the
+    per-stage durations (and "total") are attached under "timings".
+
+    Args:
+        operation: Operation name reported in events
+    """
+    def decorator(method: F) -> F:
+        @functools.wraps(method)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            hub = getattr(self, "instrumentation", None) or _NO_LISTENERS
+            collect = getattr(self, "collect_timings", False) is True
+            if not (collect or hub.active):
+                return method(self, *args, **kwargs)
+            with hub.call(operation, collect) as call:
+                result = method(self, *args, **kwargs)
+            if collect and isinstance(result, dict):
+                result["timings"] = dict(call.timings)
+            return result
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+class OpenTelemetryListener(InstrumentationListener):
+    """
+    Listener recording each operation as an OpenTelemetry span with a child
+    span per stage.
+    """
+
+    def __init__(self, tracer: Any = None):
+        """
+        Initialize the listener.
+
+        Args:
+            tracer: OpenTelemetry tracer (defaults to the global tracer provider's)
+
+        Raises:
+            ImportError: If opentelemetry-api is not installed
+        """
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise ImportError(
+                "OpenTelemetry support requires opentelemetry-api. "
+                "Install with: pip install intentlayer-sdk[otel]"
+            )
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer("intentlayer_sdk")
+        self._lock = threading.Lock()
+        self._spans: Dict[Any, Any] = {}
+
+    def on_stage_start(self, event: StageEvent) -> None:
+        if event.stage is None:
+            span = self.tracer.start_span(f"intentlayer.{event.operation}")
+        else:
+            with self._lock:
+                parent = self._spans.get((event.call_id, None, 1))
+            context = self._trace.set_span_in_context(parent) if parent is not None else None
+            span = self.tracer.start_span(f"intentlayer.{event.operation}.{event.stage}", context=context)
+            span.set_attribute("intentlayer.attempt", event.attempt)
+        with self._lock:
+            self._spans[(event.call_id, event.stage, event.attempt)] = span
+
+    def on_stage_end(self, event: StageEvent) -> None:
+        with self._lock:
+            span = self._spans.pop((event.call_id, event.stage, event.attempt), None)
+        if span is None:
+            return
+        if event.error is not None:
+            span.set_attribute("error.type", event.error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, event.error))
+        span.end()
@@ -0,0 +1,304 @@
+"""
+In-process metrics for the IntentLayer SDK.
+
+A MetricsRegistry holds counters and fixed-bucket histograms that the clients
+update as they work: intents sent and failed, pin retries, Gateway retries by
+status, quota rejections, receipt wait times, gas used and cache hit rates.
+Updates take a per-metric lock for a dictionary update only, and the registry
+renders the Prometheus text exposition format without prometheus_client.
+
+All clients report to the process-wide registry from get_metrics_registry()
+unless given their own.
+"""
+import bisect
+import math
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Default histogram buckets (seconds)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+RECEIPT_WAIT_BUCKETS = (0.5, 1.0, 2.0, 5.0, 10.0, 15.0, 30.0, 60.0, 120.0)
+GAS_USED_BUCKETS = (21_000, 50_000, 100_000, 150_000, 200_000, 300_000, 500_000, 1_000_000, 3_000_000)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric(ABC):
+    """Abstract base class for a labelled metric family."""
+
+    type_name = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], Any] = {}
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        try:
+            return tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError:
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+
+    def reset(self) -> None:
+        """Drop all recorded values."""
+        with self._lock:
+            self._values.clear()
+
+    @abstractmethod
+    def _samples(self) -> List[str]:
+        """Sample lines of this family in the Prometheus text format."""
+        pass
+
+    def render(self) -> str:
+        """Render this metric family in the Prometheus text format."""
+        lines = [f"# HELP {self.name} {_escape(self.help)}", f"# TYPE {self.name} {self.type_name}"]
+        return "\n".join(lines + self._samples())
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    type_name = "counter"
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        """
+        Increase the counter.
+
+        Args:
+            amount: Non-negative increment
+            **labels: Value for each of the metric's label names
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: Any) -> float:
+        """Get the current value for a label set (0 if never incremented)."""
+        key = self._key(labels)
+        with self._lock:
+            return self._values.get(key, 0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    """Histogram with fixed upper bucket bounds."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        labelnames: Sequence[str] = (),
+    ):
+        super().__init__(name, help, labelnames)
+        bounds = sorted(float(b) for b in buckets if b != math.inf)
+        if not bounds:
+            raise ValueError("Histogram needs at least one finite bucket")
+        self.buckets = tuple(bounds)
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """
+        Record an observation.
+
+        Args:
+            value: Observed value
+            **labels: Value for each of the metric's label names
+        """
+        key = self._key(labels)
+        # Bucket i counts observations <= buckets[i]; the last slot is +Inf
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def count(self, **labels: Any) -> int:
+        """Get the number of observations for a label set."""
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            return state[2] if state else 0
+
+    def sum(self, **labels: Any) -> float:
+        """Get the sum of observations for a label set."""
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            return state[1] if state else 0.0
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, (list(state[0]), state[1], state[2])) for key, state in self._values.items())
+        lines = []
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Collection of metrics rendered together.
+
+    The SDK's own metrics are created with the registry and exposed as
+    attributes; counter() and histogram() add (or return existing) custom
+    metrics.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+
+        self.intents_sent = self.counter(
+            "intentlayer_intents_sent_total", "Intent transactions broadcast"
+        )
+        self.intent_failures = self.counter(
+            "intentlayer_intent_failures_total", "send_intent calls that failed, by error class",
+            ("error",),
+        )
+        self.pins = self.counter(
+            "intentlayer_pins_total", "Payloads pinned to IPFS, by result", ("result",)
+        )
+        self.pin_retries = self.counter(
+            "intentlayer_pin_retries_total", "Pin requests retried after a server error"
+        )
+        self.gateway_retries = self.counter(
+            "intentlayer_gateway_retries_total", "Gateway DID registration retries, by status",
+            ("code",),
+        )
+        self.quota_exceeded = self.counter(
+            "intentlayer_quota_exceeded_total", "DID registrations rejected for exceeding the quota"
+        )
+        self.identity_registrations = self.counter(
+            "intentlayer_identity_registrations_total",
+            "IdentityManager.ensure_registered outcomes", ("result",),
+        )
+        self.cache_requests = self.counter(
+            "intentlayer_cache_requests_total", "Cache lookups, by cache and result",
+            ("cache", "result"),
+        )
+        self.receipt_wait = self.histogram(
+            "intentlayer_receipt_wait_seconds", "Time spent waiting for transaction receipts",
+            RECEIPT_WAIT_BUCKETS,
+        )
+        self.gas_used = self.histogram(
+            "intentlayer_gas_used", "Gas used by confirmed transactions", GAS_USED_BUCKETS
+        )
+
+    def _register(self, metric: _Metric) -> Any:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is None:
+                self._metrics[metric.name] = metric
+                return metric
+        if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+            raise ValueError(f"Metric {metric.name} is already registered with a different definition")
+        return existing
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        """
+        Get or create a counter.
+
+        Raises:
+            ValueError: If the name is registered with another type or labels
+        """
+        return self._register(Counter(name, help, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        labelnames: Sequence[str] = (),
+    ) -> Histogram:
+        """
+        Get or create a histogram.
+
+        Raises:
+            ValueError: If the name is registered with another type or labels
+        """
+        return self._register(Histogram(name, help, buckets, labelnames))
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """Get a registered metric by name."""
+        with self._lock:
+            return self._metrics.get(name)
+
+    def reset(self) -> None:
+        """Drop the recorded values of every metric."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+# Process-wide registry
+_registry: Optional[MetricsRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    global _registry
+    registry = _registry
+    if registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = MetricsRegistry()
+            registry = _registry
+    return registry
+
+
+def reset_metrics_registry() -> None:
+    """Replace the process-wide registry with an empty one (mainly useful in tests)."""
+    global _registry
+    with _registry_lock:
+        _registry = None
@@ -0,0 +1,96 @@
+"""
+Multicall3 helpers for the IntentLayer SDK.
+
+Multicall3 aggregates many read-only calls into a single eth_call, which makes
+bulk lookups such as resolving thousands of DIDs cost a handful of requests
+instead of one request per item.
+"""
+from typing import Any, Iterable, List, Sequence, Tuple
+
+from web3 import Web3
+
+# Deterministic deployment address of Multicall3 on most EVM chains
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    }
+]
+
+# ABI-encoded size of one Call3 entry excluding its calldata: offset word,
+# target, allowFailure, calldata offset and calldata length
+CALL3_OVERHEAD_BYTES = 5 * 32
+
+Call3 = Tuple[str, bool, bytes]
+
+
+def chunk_calls(calls: Sequence[Call3], max_calldata_bytes: int) -> List[List[Call3]]:
+    """
+    Split Call3 entries into chunks whose encoded calldata stays under a limit.
+
+    Args:
+        calls: Sequence of (target, allow_failure, calldata) tuples
+        max_calldata_bytes: Approximate maximum encoded size of one aggregate3 call
+
+    Returns:
+        List of chunks, each containing at least one call
+    """
+    chunks: List[List[Call3]] = []
+    current: List[Call3] = []
+    size = 0
+    for call in calls:
+        # Calldata is padded to a whole number of 32-byte words
+        call_size = CALL3_OVERHEAD_BYTES + (len(call[2]) + 31) // 32 * 32
+        if current and size + call_size > max_calldata_bytes:
+            chunks.append(current)
+            current, size = [], 0
+        current.append(call)
+        size += call_size
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def aggregate3(w3: Web3, multicall_address: str, calls: Iterable[Call3]) -> List[Tuple[bool, bytes]]:
+    """
+    Execute calls through Multicall3.aggregate3 in a single eth_call.
+
+    Args:
+        w3: Web3 instance
+        multicall_address: Address of the Multicall3 contract
+        calls: Iterable of (target, allow_failure, calldata) tuples
+
+    Returns:
+        List of (success, return_data) tuples in call order
+    """
+    contract = w3.eth.contract(
+        address=Web3.to_checksum_address(multicall_address), abi=MULTICALL3_ABI
+    )
+    results: Any = contract.functions.aggregate3(list(calls)).call()
+    return [(bool(success), bytes(data)) for success, data in results]
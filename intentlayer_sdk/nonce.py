@@ -0,0 +1,300 @@
+"""
+Process-wide nonce management for the IntentLayer SDK.
+
+This module allocates transaction nonces from a local counter so that
+IntentClient instances sharing a signer do not need an RPC round trip per
+transaction and do not collide when sending concurrently.
+"""
+import asyncio
+import heapq
+import logging
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Substrings used by common node implementations for nonce rejections
+NONCE_TOO_LOW_MARKERS = ("nonce too low", "nonce is too low")
+NONCE_TOO_HIGH_MARKERS = ("nonce too high", "nonce is too high", "nonce gap")
+
+# Node messages for a raw transaction it has already accepted (e.g. re-sent after a timeout)
+ALREADY_KNOWN_MARKERS = ("already known", "known transaction", "already imported")
+
+# Transport failures after which the node may or may not have received the transaction
+AMBIGUOUS_SEND_ERRORS = (
+    TimeoutError,
+    asyncio.TimeoutError,
+    ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ConnectionError,
+)
+
+
+def is_nonce_error(error: Exception) -> bool:
+    """
+    Check whether an exception looks like a node rejecting a nonce.
+
+    Args:
+        error: Exception raised while sending a transaction
+
+    Returns:
+        True if the error message reports a nonce that is too low or too high
+    """
+    message = str(error).lower()
+    return any(marker in message for marker in NONCE_TOO_LOW_MARKERS + NONCE_TOO_HIGH_MARKERS)
+
+
+def is_already_known(error: Exception) -> bool:
+    """
+    Check whether an exception reports that the node already has the transaction.
+
+    Args:
+        error: Exception raised while sending a raw transaction
+
+    Returns:
+        True if the exact signed transaction is already in the node's pool or chain
+    """
+    message = str(error).lower()
+    return any(marker in message for marker in ALREADY_KNOWN_MARKERS)
+
+
+def is_ambiguous_send_error(error: Exception) -> bool:
+    """
+    Check whether a send failed in a way that leaves its outcome unknown.
+
+    A timed out or reset request may have reached the node, so the nonce it
+    used must not be handed to another transaction.
+
+    Args:
+        error: Exception raised while sending a transaction
+
+    Returns:
+        True for timeouts and connection failures
+    """
+    return isinstance(error, AMBIGUOUS_SEND_ERRORS)
+
+
+class NonceManager:
+    """
+    Thread-safe nonce allocator for a single signer on a single chain.
+
+    Nonces are handed out from a local counter seeded with the chain's pending
+    transaction count. Nonces that were allocated but never broadcast, or whose
+    transactions were dropped from the mempool, are reused before the counter
+    advances so the account never stalls behind a gap.
+    """
+
+    def __init__(self, address: str, gap_timeout: float = 60.0):
+        """
+        Initialize the nonce manager.
+
+        Args:
+            address: Address of the signer this manager allocates nonces for
+            gap_timeout: Seconds a sent transaction may stay below the chain's
+                pending count before its nonce is treated as dropped
+        """
+        self.address = address
+        self.gap_timeout = gap_timeout
+        self._lock = threading.Lock()
+        self._next_nonce: Optional[int] = None
+        # Nonces available for reuse (min-heap so the lowest gap is filled first)
+        self._free: List[int] = []
+        # Nonces broadcast but not yet observed as mined, mapped to send time (oldest first)
+        self._in_flight: Dict[int, float] = {}
+        # Lowest counter value allowed when seeding (raised by reserve() before the first sync)
+        self._floor = 0
+
+    @property
+    def next_nonce(self) -> Optional[int]:
+        """Next nonce the local counter would hand out (None before first sync)."""
+        with self._lock:
+            return self._next_nonce
+
+    @property
+    def in_flight(self) -> Tuple[int, ...]:
+        """Sorted nonces that have been sent but not yet confirmed."""
+        with self._lock:
+            return tuple(sorted(self._in_flight))
+
+    def allocate(self, fetch_pending: Callable[[], int]) -> int:
+        """
+        Allocate the next nonce for this signer.
+
+        Args:
+            fetch_pending: Callable returning the chain's pending transaction count;
+                only invoked the first time or after reset()
+
+        Returns:
+            Nonce to use for the next transaction
+        """
+        with self._lock:
+            if self._next_nonce is None:
+                pending = int(fetch_pending())
+                # Nonces below the chain's count (e.g. reserved before a restart) are consumed
+                for n in [n for n in self._in_flight if n < pending]:
+                    del self._in_flight[n]
+                self._next_nonce = max(pending, self._floor)
+                logger.debug(f"Seeded nonce for {self.address[:10]}... at {self._next_nonce}")
+
+            if self._free:
+                nonce = heapq.heappop(self._free)
+            else:
+                nonce = self._next_nonce
+                self._next_nonce += 1
+            return nonce
+
+    def mark_sent(self, nonce: int) -> None:
+        """Record that a transaction using nonce was accepted by the node."""
+        now = time.monotonic()
+        with self._lock:
+            # Re-insert so the dict stays ordered by send time
+            self._in_flight.pop(nonce, None)
+            self._in_flight[nonce] = now
+            self._expire_in_flight(now)
+
+    def _expire_in_flight(self, now: float) -> None:
+        """
+        Forget sent nonces older than gap_timeout (caller holds the lock).
+
+        resync() treats such nonces exactly like ones that were never sent, so
+        dropping them changes nothing but keeps fire-and-forget senders, which
+        never confirm, from growing the map without bound.
+        """
+        expired = []
+        for nonce, sent_at in self._in_flight.items():
+            if now - sent_at <= self.gap_timeout:
+                break
+            expired.append(nonce)
+        for nonce in expired:
+            del self._in_flight[nonce]
+
+    def reserve(self, nonces: Iterable[int]) -> None:
+        """
+        Record nonces already used by transactions signed outside this manager.
+
+        Used for transactions signed before a restart (e.g. in a journal) that
+        may not have reached the chain yet: the nonces are treated as in flight
+        and the counter never hands them out again.
+
+        Args:
+            nonces: Nonces of signed transactions
+        """
+        nonces = [int(n) for n in nonces]
+        if not nonces:
+            return
+        now = time.monotonic()
+        with self._lock:
+            for n in nonces:
+                self._in_flight.setdefault(n, now)
+            reserved = set(nonces)
+            if any(n in reserved for n in self._free):
+                self._free = [n for n in self._free if n not in reserved]
+                heapq.heapify(self._free)
+            top = max(nonces) + 1
+            if self._next_nonce is None:
+                self._floor = max(self._floor, top)
+            else:
+                self._next_nonce = max(self._next_nonce, top)
+
+    def mark_confirmed(self, nonce: int) -> None:
+        """Record that the transaction using nonce (and so every lower nonce) was mined."""
+        with self._lock:
+            for n in [n for n in self._in_flight if n <= nonce]:
+                del self._in_flight[n]
+
+    def release(self, nonce: int) -> None:
+        """
+        Return a nonce that was allocated but never broadcast.
+
+        The nonce is reused by the next allocation so no gap is left behind.
+        """
+        with self._lock:
+            self._in_flight.pop(nonce, None)
+            if self._next_nonce is not None and nonce < self._next_nonce and nonce not in self._free:
+                heapq.heappush(self._free, nonce)
+
+    def resync(self, fetch_pending: Callable[[], int]) -> int:
+        """
+        Reconcile the local counter with the chain's pending transaction count.
+
+        Called after the node rejects a nonce as too low or too high. Nonces
+        below the chain count are discarded; nonces between the chain count and
+        the local counter that are not in flight (or whose transactions have been
+        pending longer than gap_timeout) are queued for reuse.
+
+        Args:
+            fetch_pending: Callable returning the chain's pending transaction count
+
+        Returns:
+            The chain's pending transaction count
+        """
+        pending = int(fetch_pending())
+        now = time.monotonic()
+
+        with self._lock:
+            if self._next_nonce is None or self._next_nonce < pending:
+                # Nonce too low: other senders (or a restart) advanced the account
+                self._next_nonce = max(pending, self._floor) if self._next_nonce is None else pending
+
+            # Everything below the chain's count has been consumed
+            self._free = [n for n in self._free if n >= pending]
+            for n in [n for n in self._in_flight if n < pending]:
+                del self._in_flight[n]
+
+            # Nonce too high: find gaps between the chain count and our counter
+            free = set(self._free)
+            for n in range(pending, self._next_nonce):
+                if n in free:
+                    continue
+                sent_at = self._in_flight.get(n)
+                if sent_at is None or now - sent_at > self.gap_timeout:
+                    if sent_at is not None:
+                        logger.warning(f"Nonce {n} for {self.address[:10]}... appears dropped, reusing it")
+                        del self._in_flight[n]
+                    heapq.heappush(self._free, n)
+
+            logger.debug(
+                f"Resynced nonce for {self.address[:10]}...: chain pending={pending}, "
+                f"next={self._next_nonce}, gaps={sorted(self._free)}"
+            )
+            return pending
+
+    def reset(self) -> None:
+        """Forget all local state; the next allocation re-reads the chain."""
+        with self._lock:
+            self._next_nonce = None
+            self._free = []
+            self._in_flight = {}
+            self._floor = 0
+
+
+# Module-level nonce manager cache with thread safety
+_nonce_managers: Dict[Tuple[str, str], NonceManager] = {}
+_nonce_managers_lock = threading.RLock()
+
+
+def get_nonce_manager(address: str, chain_key: Union[str, int]) -> NonceManager:
+    """
+    Get or create the shared nonce manager for a signer on a chain.
+
+    Args:
+        address: Signer address
+        chain_key: Identifier of the chain (chain ID, or RPC URL if unknown)
+
+    Returns:
+        NonceManager shared by every client in the process using this signer
+    """
+    key = (str(chain_key), address.lower())
+    with _nonce_managers_lock:
+        if key not in _nonce_managers:
+            _nonce_managers[key] = NonceManager(address)
+        return _nonce_managers[key]
+
+
+def reset_nonce_managers() -> None:
+    """Drop all shared nonce managers (mainly useful in tests)."""
+    with _nonce_managers_lock:
+        _nonce_managers.clear()
@@ -0,0 +1,564 @@
+"""
+Durable intent outbox for the IntentLayer SDK.
+
+IntentOutbox records every submitted intent in a SQLite write-ahead journal
+and drives it through its stages on background workers:
+
+    pending -> pinned (CID) -> signed (raw tx, nonce) -> sent (tx hash) -> confirmed
+
+Each stage is committed before the next one starts, so after a crash the
+outbox resumes from the last durable stage: a pinned intent is not pinned
+again and a signed transaction is re-broadcast as-is rather than re-signed.
+A sent transaction that stays unmined is re-broadcast every
+rebroadcast_interval, and re-signed if the node dropped it and its nonce was
+used by another transaction.
+Intents are keyed by envelope hash, so submitting the same intent twice is
+idempotent, and callers only pay for a local insert.
+"""
+import json
+import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Union, TYPE_CHECKING
+
+from web3 import Web3
+from web3.exceptions import TransactionNotFound
+
+from .client import is_chain_id_error
+from .exceptions import EnvelopeError, InactiveDIDError, TransactionError
+from .nonce import is_already_known, is_nonce_error, NONCE_TOO_LOW_MARKERS
+from .utils import ipfs_cid_to_bytes
+
+if TYPE_CHECKING:
+    from .client import IntentClient
+
+logger = logging.getLogger(__name__)
+
+STAGE_PENDING = "pending"
+STAGE_PINNED = "pinned"
+STAGE_SIGNED = "signed"
+STAGE_SENT = "sent"
+STAGE_CONFIRMED = "confirmed"
+STAGE_FAILED = "failed"
+
+FINAL_STAGES = (STAGE_CONFIRMED, STAGE_FAILED)
+
+# Errors that retrying cannot fix: the SDK's own validation errors. Plain ValueError is
+# not listed, as web3 raises its subclasses (e.g. Web3ValueError) for transient failures
+PERMANENT_ERRORS = (EnvelopeError, InactiveDIDError)
+
+# Node messages for a transaction whose nonce is held by another pending transaction
+REPLACEMENT_UNDERPRICED_MARKERS = ("replacement transaction underpriced", "replacement fee too low")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS intents (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    envelope_hash TEXT NOT NULL UNIQUE,
+    payload TEXT NOT NULL,
+    stake_wei TEXT,
+    stage TEXT NOT NULL,
+    cid TEXT,
+    raw_tx BLOB,
+    nonce INTEGER,
+    tx_hash TEXT,
+    sent_at REAL,
+    receipt TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+)
+"""
+
+
+class OutboxEntry(NamedTuple):
+    """
+    Durable state of one intent in the outbox.
+
+    Attributes:
+        id: Outbox entry ID
+        envelope_hash: Envelope hash (0x-prefixed hex)
+        stage: Current stage (pending, pinned, signed, sent, confirmed or failed)
+        cid: CID returned by the pinner, once pinned
+        nonce: Nonce of the signed transaction, once signed
+        tx_hash: Transaction hash, once signed
+        receipt: Receipt summary, once confirmed
+        error: Last error message
+        attempts: Failed attempts at the current stage (re-broadcasts, once sent)
+    """
+    id: int
+    envelope_hash: str
+    stage: str
+    cid: Optional[str]
+    nonce: Optional[int]
+    tx_hash: Optional[str]
+    receipt: Optional[Dict[str, Any]]
+    error: Optional[str]
+    attempts: int
+
+    @property
+    def done(self) -> bool:
+        """True once the entry is confirmed or has failed permanently."""
+        return self.stage in FINAL_STAGES
+
+
+def _normalize_envelope_hash(envelope_hash: Union[str, bytes]) -> str:
+    """Return a lowercase 0x-prefixed hex envelope hash."""
+    if isinstance(envelope_hash, (bytes, bytearray)):
+        return "0x" + bytes(envelope_hash).hex()
+    envelope_hash = envelope_hash.lower()
+    return envelope_hash if envelope_hash.startswith("0x") else "0x" + envelope_hash
+
+
+class IntentOutbox:
+    """
+    Persistent queue that records intents on-chain at least once.
+
+    Background workers advance entries one stage at a time. Transient failures
+    are retried with exponential backoff up to max_attempts; invalid envelopes
+    fail immediately. Use process_once() instead of start() to drive the
+    outbox from your own loop.
+    """
+
+    def __init__(
+        self,
+        client: "IntentClient",
+        path: str,
+        workers: int = 4,
+        poll_interval: float = 1.0,
+        max_attempts: int = 5,
+        retry_backoff: float = 1.0,
+        rebroadcast_interval: float = 60.0,
+        autostart: bool = True,
+    ):
+        """
+        Initialize the outbox.
+
+        Args:
+            client: Client used to pin, sign and send intents
+            path: SQLite journal file (created if missing)
+            workers: Background workers advancing entries
+            poll_interval: Seconds between receipt checks for sent transactions
+            max_attempts: Failed attempts at one stage (or re-broadcasts of an
+                unmined transaction) before the entry fails
+            retry_backoff: Initial retry delay in seconds (doubled per attempt, max 60)
+            rebroadcast_interval: Seconds a sent transaction may stay unmined
+                before it is re-broadcast
+            autostart: Start the background workers immediately
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1 (got: {workers})")
+        self.client = client
+        self.path = path
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.rebroadcast_interval = rebroadcast_interval
+
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(_SCHEMA)
+        self._db.execute("CREATE INDEX IF NOT EXISTS intents_stage ON intents (stage, next_attempt_at)")
+        self._db_lock = threading.Lock()
+
+        self._cond = threading.Condition()
+        self._claimed: Set[int] = set()
+        self._stopped = True
+        self._dispatcher: Optional[threading.Thread] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._nonces_reserved = False
+
+        if autostart:
+            self.start()
+
+    # -- public API --
+
+    def submit(
+        self,
+        envelope_hash: Union[str, bytes],
+        payload_dict: Dict[str, Any],
+        stake_wei: Optional[int] = None,
+    ) -> int:
+        """
+        Durably enqueue an intent.
+
+        Submitting an envelope hash that is already in the outbox returns the
+        existing entry instead of recording the intent twice.
+
+        Args:
+            envelope_hash: Envelope hash (hex string or bytes)
+            payload_dict: Payload dictionary with envelope data
+            stake_wei: Amount to stake (defaults to the client's min_stake_wei)
+
+        Returns:
+            Outbox entry ID
+        """
+        key = _normalize_envelope_hash(envelope_hash)
+        now = time.time()
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR IGNORE INTO intents (envelope_hash, payload, stake_wei, stage, created_at, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, json.dumps(payload_dict), None if stake_wei is None else str(stake_wei),
+                 STAGE_PENDING, now, now),
+            )
+            entry_id = self._db.execute(
+                "SELECT id FROM intents WHERE envelope_hash = ?", (key,)
+            ).fetchone()[0]
+        with self._cond:
+            self._cond.notify_all()
+        return entry_id
+
+    def get(self, entry: Union[int, str, bytes]) -> Optional[OutboxEntry]:
+        """
+        Get the current state of an entry.
+
+        Args:
+            entry: Entry ID or envelope hash
+
+        Returns:
+            OutboxEntry, or None if unknown
+        """
+        if isinstance(entry, int):
+            where, arg = "id = ?", entry
+        else:
+            where, arg = "envelope_hash = ?", _normalize_envelope_hash(entry)
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT id, envelope_hash, stage, cid, nonce, tx_hash, receipt, error, attempts"
+                f" FROM intents WHERE {where}", (arg,)
+            ).fetchone()
+        if row is None:
+            return None
+        return OutboxEntry(*row[:6], json.loads(row[6]) if row[6] else None, row[7], row[8])
+
+    def wait(self, entry: Union[int, str, bytes], timeout: Optional[float] = None) -> OutboxEntry:
+        """
+        Block until an entry is confirmed or has failed.
+
+        Args:
+            entry: Entry ID or envelope hash
+            timeout: Maximum seconds to wait (forever if None)
+
+        Returns:
+            Final OutboxEntry
+
+        Raises:
+            KeyError: If the entry is unknown
+            TimeoutError: If the entry is not final within timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            state = self.get(entry)
+            if state is None:
+                raise KeyError(f"Unknown outbox entry: {entry}")
+            if state.done:
+                return state
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise TimeoutError(f"Outbox entry {entry} still {state.stage} after {timeout}s")
+            with self._cond:
+                self._cond.wait(timeout=min(self.poll_interval, remaining) if remaining else self.poll_interval)
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Count entries by stage.
+
+        Returns:
+            Dictionary mapping stage name to number of entries
+        """
+        with self._db_lock:
+            rows = self._db.execute("SELECT stage, COUNT(*) FROM intents GROUP BY stage").fetchall()
+        return dict(rows)
+
+    def start(self) -> None:
+        """Start the background workers (resuming any unfinished entries)."""
+        self._reserve_journaled_nonces()
+        with self._cond:
+            if not self._stopped:
+                return
+            self._stopped = False
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="intentlayer-outbox")
+            self._dispatcher = threading.Thread(
+                target=self._run, name="intentlayer-outbox-dispatcher", daemon=True
+            )
+            self._dispatcher.start()
+
+    def stop(self, wait: bool = True) -> None:
+        """
+        Stop the background workers. Unfinished entries stay in the journal.
+
+        Args:
+            wait: Wait for steps already running to finish
+        """
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+            dispatcher, pool = self._dispatcher, self._pool
+            self._dispatcher = self._pool = None
+        if dispatcher is not None and dispatcher is not threading.current_thread():
+            dispatcher.join(timeout=5)
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def close(self) -> None:
+        """Stop the workers and close the journal."""
+        self.stop()
+        with self._db_lock:
+            self._db.close()
+
+    def process_once(self) -> int:
+        """
+        Advance every due entry by one stage on the calling thread.
+
+        Returns:
+            Number of entries processed
+        """
+        self._reserve_journaled_nonces()
+        due = self._due_entries()
+        for entry_id in due:
+            self._step(entry_id)
+        return len(due)
+
+    # -- internals --
+
+    def _reserve_journaled_nonces(self) -> None:
+        """Keep the nonces of journaled signed transactions away from new allocations."""
+        if self._nonces_reserved:
+            return
+        with self._db_lock:
+            rows = self._db.execute(
+                "SELECT nonce FROM intents WHERE stage IN (?, ?) AND nonce IS NOT NULL",
+                (STAGE_SIGNED, STAGE_SENT),
+            ).fetchall()
+        nonces = [row[0] for row in rows]
+        if nonces:
+            logger.info(f"Reserving {len(nonces)} journaled nonces up to {max(nonces)}")
+            self.client.nonce_manager.reserve(nonces)
+        self._nonces_reserved = True
+
+    def _due_entries(self) -> List[int]:
+        """IDs of unclaimed entries ready for their next step."""
+        now = time.time()
+        with self._db_lock:
+            rows = self._db.execute(
+                "SELECT id FROM intents WHERE stage NOT IN (?, ?) AND next_attempt_at <= ? ORDER BY id",
+                (*FINAL_STAGES, now),
+            ).fetchall()
+        with self._cond:
+            return [r[0] for r in rows if r[0] not in self._claimed]
+
+    def _run(self) -> None:
+        """Dispatcher loop handing due entries to the worker pool."""
+        while True:
+            with self._cond:
+                if self._stopped:
+                    return
+            try:
+                for entry_id in self._due_entries():
+                    with self._cond:
+                        if self._stopped:
+                            return
+                        self._claimed.add(entry_id)
+                        pool = self._pool
+                    pool.submit(self._step_claimed, entry_id)
+            except Exception as e:
+                logger.warning(f"Outbox dispatch failed: {e}")
+            with self._cond:
+                if not self._stopped:
+                    self._cond.wait(timeout=self.poll_interval)
+
+    def _step_claimed(self, entry_id: int) -> None:
+        """Run one step for a claimed entry, then release the claim."""
+        try:
+            self._step(entry_id)
+        finally:
+            with self._cond:
+                self._claimed.discard(entry_id)
+                self._cond.notify_all()
+
+    def _load(self, entry_id: int) -> Dict[str, Any]:
+        with self._db_lock:
+            cursor = self._db.execute("SELECT * FROM intents WHERE id = ?", (entry_id,))
+            columns = [c[0] for c in cursor.description]
+            row = cursor.fetchone()
+        return dict(zip(columns, row))
+
+    def _update(self, entry_id: int, **fields: Any) -> None:
+        """Durably update an entry and wake waiters."""
+        fields["updated_at"] = time.time()
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._db_lock:
+            self._db.execute(
+                f"UPDATE intents SET {assignments} WHERE id = ?", (*fields.values(), entry_id)
+            )
+        with self._cond:
+            self._cond.notify_all()
+
+    def _advance(self, entry_id: int, stage: str, **fields: Any) -> None:
+        """Move an entry to a new stage, resetting its retry state."""
+        self._update(entry_id, stage=stage, attempts=0, next_attempt_at=0, error=None, **fields)
+
+    def _step(self, entry_id: int) -> None:
+        """Advance one entry by one stage, recording failures."""
+        row = self._load(entry_id)
+        stage = row["stage"]
+        try:
+            if stage == STAGE_PENDING:
+                self._pin(row)
+            elif stage == STAGE_PINNED:
+                self._sign(row)
+            elif stage == STAGE_SIGNED:
+                self._send(row)
+            elif stage == STAGE_SENT:
+                self._check_receipt(row)
+        except Exception as e:
+            attempts = row["attempts"] + 1
+            if isinstance(e, PERMANENT_ERRORS) or attempts >= self.max_attempts:
+                logger.error(f"Outbox entry {entry_id} failed at stage {stage}: {e}")
+                if stage == STAGE_SIGNED and row["nonce"] is not None:
+                    self.client.nonce_manager.release(row["nonce"])
+                self._update(entry_id, stage=STAGE_FAILED, attempts=attempts, error=str(e))
+            else:
+                delay = min(self.retry_backoff * (2 ** (attempts - 1)), 60.0)
+                logger.warning(f"Outbox entry {entry_id} {stage} step failed, retrying in {delay}s: {e}")
+                self._update(
+                    entry_id, attempts=attempts, error=str(e), next_attempt_at=time.time() + delay
+                )
+
+    def _pin(self, row: Dict[str, Any]) -> None:
+        """pending -> pinned: validate the payload, resolve the stake and pin it."""
+        payload = json.loads(row["payload"])
+        stake = int(row["stake_wei"]) if row["stake_wei"] is not None else None
+        _, stake = self.client._prepare_intent(row["envelope_hash"], payload, stake)
+        cid = self.client.pin_to_ipfs(payload)
+        self._advance(row["id"], STAGE_PINNED, cid=cid, stake_wei=str(stake))
+
+    def _sign(self, row: Dict[str, Any]) -> None:
+        """pinned -> signed: build and sign the transaction, persisting it before broadcast."""
+        self.client.assert_chain_id()
+        cid_bytes = ipfs_cid_to_bytes(row["cid"])
+        raw_tx, nonce = self.client._sign_intent(
+            bytes.fromhex(row["envelope_hash"][2:]), cid_bytes, int(row["stake_wei"])
+        )
+        tx_hash = Web3.keccak(raw_tx).hex()
+        tx_hash = tx_hash if tx_hash.startswith("0x") else "0x" + tx_hash
+        try:
+            self._advance(row["id"], STAGE_SIGNED, raw_tx=raw_tx, nonce=nonce, tx_hash=tx_hash)
+        except Exception:
+            self.client.nonce_manager.release(nonce)
+            raise
+
+    def _send(self, row: Dict[str, Any]) -> None:
+        """signed -> sent: broadcast the stored raw transaction."""
+        if self._broadcast(row):
+            self.client.nonce_manager.mark_sent(row["nonce"])
+            self._advance(row["id"], STAGE_SENT, sent_at=time.time())
+
+    def _broadcast(self, row: Dict[str, Any]) -> bool:
+        """
+        Broadcast the stored raw transaction.
+
+        Returns:
+            True if the node has the transaction (or it is mined), False if the
+            entry was sent back to be re-signed
+        """
+        try:
+            self.client.w3.eth.send_raw_transaction(row["raw_tx"])
+        except Exception as e:
+            message = str(e).lower()
+            if is_already_known(e):
+                logger.debug(f"Outbox entry {row['id']} was already broadcast")
+            elif any(marker in message for marker in REPLACEMENT_UNDERPRICED_MARKERS):
+                # Another pending transaction holds the nonce. If it is this one
+                # (e.g. broadcast through another endpoint) the send succeeded;
+                # otherwise re-sign rather than outbid a transaction that may be another intent
+                if self._transaction_known(row["tx_hash"]):
+                    logger.debug(f"Outbox entry {row['id']} is already pending")
+                else:
+                    self._resign(row, "is held by another transaction")
+                    return False
+            elif is_nonce_error(e) and any(marker in message for marker in NONCE_TOO_LOW_MARKERS):
+                # Either this transaction was mined before a crash, or its nonce
+                # was used by another transaction and it must be signed again
+                if self._fetch_receipt(row["tx_hash"]) is None:
+                    self._resign(row, "was taken")
+                    return False
+            else:
+                if is_chain_id_error(e):
+                    self.client.invalidate_chain_id()
+                raise TransactionError(f"Failed to send transaction: {e}")
+        return True
+
+    def _resign(self, row: Dict[str, Any], reason: str) -> None:
+        """Send an entry whose nonce was lost back to pinned, to be signed with a fresh nonce."""
+        logger.warning(f"Nonce {row['nonce']} of outbox entry {row['id']} {reason}, re-signing")
+        self.client.nonce_manager.resync(self.client._fetch_pending_nonce)
+        self._advance(row["id"], STAGE_PINNED, raw_tx=None, nonce=None, tx_hash=None, sent_at=None)
+
+    def _transaction_known(self, tx_hash: str) -> bool:
+        """Whether the node has the transaction, pending or mined."""
+        try:
+            return self.client.w3.eth.get_transaction(tx_hash) is not None
+        except TransactionNotFound:
+            return False
+
+    def _check_receipt(self, row: Dict[str, Any]) -> None:
+        """sent -> confirmed: record the receipt once the transaction is mined."""
+        receipt = self._fetch_receipt(row["tx_hash"])
+        if receipt is None:
+            if time.time() - (row["sent_at"] or 0) >= self.rebroadcast_interval:
+                self._rebroadcast(row)
+            else:
+                # Not mined yet, check again after poll_interval
+                self._update(row["id"], next_attempt_at=time.time() + self.poll_interval)
+            return
+        self.client.nonce_manager.mark_confirmed(row["nonce"])
+        summary = {
+            "transactionHash": row["tx_hash"],
+            "blockNumber": receipt.get("blockNumber"),
+            "gasUsed": receipt.get("gasUsed"),
+            "status": receipt.get("status"),
+        }
+        if summary["status"] == 0:
+            self._update(row["id"], stage=STAGE_FAILED, receipt=json.dumps(summary),
+                         error="Transaction reverted")
+            return
+        self._advance(row["id"], STAGE_CONFIRMED, receipt=json.dumps(summary))
+
+    def _rebroadcast(self, row: Dict[str, Any]) -> None:
+        """Re-broadcast a sent transaction that is still unmined, in case the node dropped it."""
+        if row["attempts"] >= self.max_attempts:
+            logger.error(f"Outbox entry {row['id']} not mined after {row['attempts']} re-broadcasts")
+            self._update(
+                row["id"], stage=STAGE_FAILED,
+                error=f"Transaction not mined after {row['attempts']} re-broadcasts",
+            )
+            return
+        # A dropped transaction whose nonce has since been used can never be mined
+        if (
+            self.client._fetch_pending_nonce() > row["nonce"]
+            and not self._transaction_known(row["tx_hash"])
+        ):
+            self._resign(row, "was used while the transaction was dropped")
+            return
+        logger.info(f"Re-broadcasting unmined transaction {row['tx_hash']} of outbox entry {row['id']}")
+        if self._broadcast(row):
+            now = time.time()
+            self._update(
+                row["id"], attempts=row["attempts"] + 1, sent_at=now,
+                next_attempt_at=now + self.poll_interval,
+            )
+
+    def _fetch_receipt(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        """Get a receipt without waiting, or None if the transaction is not mined."""
+        try:
+            receipt = self.client.w3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            return None
+        return dict(receipt) if receipt else None
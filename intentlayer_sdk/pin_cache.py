@@ -0,0 +1,163 @@
+"""
+Content-addressed pin deduplication for the IntentLayer SDK.
+
+Retried sends, replays and agents emitting identical payloads would otherwise
+upload the same bytes again. PinCache maps a hash of a payload's canonical
+JSON to the CID the pinner returned, in a bounded in-memory LRU optionally
+backed by a SQLite file so the mapping survives restarts. Entries older than
+the TTL are re-pinned, which also re-confirms the content is still pinned.
+"""
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .cid import canonical_payload_bytes
+
+logger = logging.getLogger(__name__)
+
+
+class PinCache:
+    """
+    Thread-safe payload-hash to CID cache with optional disk persistence.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 3600.0, path: Optional[str] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum entries kept in memory (least recently used are evicted)
+            ttl: Seconds before a cached CID is revalidated by pinning again
+            path: SQLite file to persist entries in (memory only if None)
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1 (got: {maxsize})")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.path = path
+        self._lock = threading.Lock()
+        # key -> (cid, pinned_at as wall-clock time, comparable across restarts)
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS pins (key TEXT PRIMARY KEY, cid TEXT NOT NULL, pinned_at REAL NOT NULL)"
+            )
+            self._db.commit()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key_for(payload: Dict[str, Any]) -> str:
+        """
+        Build the cache key for a payload.
+
+        Args:
+            payload: Payload dictionary
+
+        Returns:
+            Hex sha256 of the payload's canonical JSON
+        """
+        return hashlib.sha256(canonical_payload_bytes(payload)).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up the CID for a payload key.
+
+        Args:
+            key: Key from key_for()
+
+        Returns:
+            Cached CID, or None if unknown or due for revalidation
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self._db is not None:
+                row = self._db.execute(
+                    "SELECT cid, pinned_at FROM pins WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    entry = (row[0], row[1])
+                    self._remember(key, entry)
+            if entry is None or now - entry[1] >= self.ttl:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, cid: str) -> None:
+        """
+        Store the CID the pinner returned for a payload key.
+
+        Args:
+            key: Key from key_for()
+            cid: CID returned by the pinner
+        """
+        entry = (cid, time.time())
+        with self._lock:
+            self._remember(key, entry)
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO pins (key, cid, pinned_at) VALUES (?, ?, ?)",
+                        (key, entry[0], entry[1]),
+                    )
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Failed to persist pin cache entry: {e}")
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Drop cached CIDs.
+
+        Args:
+            key: Key to drop (all entries if None)
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+            if self._db is not None:
+                if key is None:
+                    self._db.execute("DELETE FROM pins")
+                else:
+                    self._db.execute("DELETE FROM pins WHERE key = ?", (key,))
+                self._db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate and size (in memory)
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": len(self._entries),
+            }
+
+    def close(self) -> None:
+        """Close the backing database, if any."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, key: str, entry: Tuple[str, float]) -> None:
+        """Insert into the in-memory LRU (caller holds the lock)."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
@@ -0,0 +1,201 @@
+"""
+Pipelined batch sending for the IntentLayer SDK.
+
+IntentPipeline runs the stages of IntentClient.send_intent (prepare and pin,
+gas/nonce/sign/send, receipt wait) on separate bounded thread pools, so many
+intents are in flight at once and throughput is limited by the slowest stage
+rather than the sum of all stages.
+"""
+import logging
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import IntentClient
+
+logger = logging.getLogger(__name__)
+
+IntentItem = Tuple[Union[str, bytes], Dict[str, Any]]
+
+
+class IntentResult(NamedTuple):
+    """
+    Outcome of one intent sent through IntentClient.send_many.
+
+    Attributes:
+        index: Position of the item in the input iterable
+        envelope_hash: Envelope hash as given by the caller
+        receipt: Transaction receipt dictionary (None if the item failed)
+        error: Exception raised for this item (None if it succeeded)
+    """
+    index: int
+    envelope_hash: Union[str, bytes]
+    receipt: Optional[Dict[str, Any]]
+    error: Optional[Exception]
+
+    @property
+    def ok(self) -> bool:
+        """True if the intent was recorded without error."""
+        return self.error is None
+
+
+class IntentPipeline:
+    """
+    Bounded-concurrency pipeline driving intents through an IntentClient.
+
+    Each stage has its own thread pool. Items move to the next stage as soon as
+    they finish the previous one, and at most max_pending items are admitted
+    from the input iterable at a time so memory stays bounded for large or
+    unbounded inputs. In ordered mode an item counts until its result is
+    yielded, so results held back behind a slow item also stay bounded.
+    """
+
+    def __init__(
+        self,
+        client: "IntentClient",
+        pin_concurrency: int = 8,
+        send_concurrency: int = 4,
+        receipt_concurrency: int = 16,
+        max_pending: Optional[int] = None,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            client: Client whose stage methods are used
+            pin_concurrency: Workers validating and pinning payloads
+            send_concurrency: Workers estimating gas, signing and sending
+            receipt_concurrency: Workers waiting for receipts
+            max_pending: Maximum items admitted but not yet finished (not yet
+                yielded, in ordered mode); defaults to twice the total number of workers
+        """
+        for name, value in [
+            ("pin_concurrency", pin_concurrency),
+            ("send_concurrency", send_concurrency),
+            ("receipt_concurrency", receipt_concurrency),
+        ]:
+            if value < 1:
+                raise ValueError(f"{name} must be at least 1 (got: {value})")
+
+        self.client = client
+        self.pin_concurrency = pin_concurrency
+        self.send_concurrency = send_concurrency
+        self.receipt_concurrency = receipt_concurrency
+        self.max_pending = max_pending or 2 * (pin_concurrency + send_concurrency + receipt_concurrency)
+
+    def run(
+        self,
+        items: Iterable[IntentItem],
+        stake_wei: Optional[int] = None,
+        gas: Optional[int] = None,
+        gas_price_override: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        wait_for_receipt: bool = True,
+        ordered: bool = True,
+    ) -> Iterator[IntentResult]:
+        """
+        Send intents through the pipeline, yielding one result per item.
+
+        Args:
+            items: Iterable of (envelope_hash, payload_dict) pairs
+            stake_wei: Amount to stake per intent (defaults to min_stake_wei)
+            gas: Gas limit per transaction (optional)
+            gas_price_override: Gas price in wei (optional)
+            poll_interval: Polling interval for receipts (optional)
+            wait_for_receipt: Whether to wait for each transaction receipt
+            ordered: Yield results in input order (True) or as they complete (False)
+
+        Yields:
+            IntentResult for every input item; per-item failures are reported
+            in IntentResult.error rather than raised
+        """
+        client = self.client
+        done: "queue.Queue[IntentResult]" = queue.Queue()
+        pin_pool = ThreadPoolExecutor(self.pin_concurrency, thread_name_prefix="intent-pin")
+        send_pool = ThreadPoolExecutor(self.send_concurrency, thread_name_prefix="intent-send")
+        receipt_pool = ThreadPoolExecutor(self.receipt_concurrency, thread_name_prefix="intent-receipt")
+        closed = threading.Event()
+
+        def finish(index: int, envelope_hash: Any, receipt: Any = None, error: Optional[Exception] = None) -> None:
+            if error is not None:
+                error = client._map_send_error(error)
+            done.put(IntentResult(index, envelope_hash, receipt, error))
+
+        def then(future: Future, index: int, envelope_hash: Any, next_stage) -> None:
+            # Chain the next stage onto a completed future, routing errors to the result
+            def callback(f: Future) -> None:
+                if f.cancelled():
+                    return
+                error = f.exception()
+                if error is not None:
+                    finish(index, envelope_hash, error=error)
+                    return
+                try:
+                    next_stage(f.result())
+                except RuntimeError as e:
+                    # Pool already shut down because the consumer stopped iterating
+                    if not closed.is_set():
+                        finish(index, envelope_hash, error=e)
+            future.add_done_callback(callback)
+
+        def pin_stage(envelope_hash: Any, payload: Dict[str, Any]) -> Tuple[bytes, int, bytes]:
+            h, stake = client._prepare_intent(envelope_hash, payload, stake_wei)
+            return h, stake, client._pin_intent(payload)
+
+        def start(index: int, envelope_hash: Any, payload: Dict[str, Any]) -> None:
+            pinned = pin_pool.submit(pin_stage, envelope_hash, payload)
+
+            def to_send(result: Tuple[bytes, int, bytes]) -> None:
+                h, stake, cid_bytes = result
+                sent = send_pool.submit(client._submit_intent, h, cid_bytes, stake, gas, gas_price_override)
+
+                def to_receipt(sent_result: Tuple[Any, int]) -> None:
+                    tx_hash, nonce = sent_result
+                    waited = receipt_pool.submit(
+                        client._finish_intent, tx_hash, nonce, wait_for_receipt, poll_interval
+                    )
+                    then(waited, index, envelope_hash, lambda receipt: finish(index, envelope_hash, receipt))
+
+                then(sent, index, envelope_hash, to_receipt)
+
+            then(pinned, index, envelope_hash, to_send)
+
+        try:
+            iterator = iter(items)
+            exhausted = False
+            admitted = 0
+            completed = 0
+            buffered: Dict[int, IntentResult] = {}
+            next_index = 0
+
+            while True:
+                # Admit new items while under the in-flight bound; in ordered mode
+                # results buffered behind the next index still count
+                while not exhausted and admitted - (next_index if ordered else completed) < self.max_pending:
+                    try:
+                        envelope_hash, payload = next(iterator)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    start(admitted, envelope_hash, payload)
+                    admitted += 1
+
+                if exhausted and completed == admitted:
+                    return
+
+                result = done.get()
+                completed += 1
+                if not ordered:
+                    yield result
+                    continue
+
+                buffered[result.index] = result
+                while next_index in buffered:
+                    yield buffered.pop(next_index)
+                    next_index += 1
+        finally:
+            closed.set()
+            for pool in (pin_pool, send_pool, receipt_pool):
+                pool.shutdown(wait=False, cancel_futures=True)
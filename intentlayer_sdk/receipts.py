@@ -0,0 +1,377 @@
+"""
+Shared, block-driven transaction receipt tracking for the IntentLayer SDK.
+
+Instead of every waiter polling eth_getTransactionReceipt on its own, one
+ReceiptTracker per RPC endpoint watches for new blocks and fetches receipts
+for all pending transactions in batched JSON-RPC calls, so RPC load grows with
+the block rate rather than with the number of transactions in flight.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Optional, Union
+
+from web3 import Web3
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+try:
+    from web3._utils.method_formatters import receipt_formatter
+    RECEIPT_FORMATTER_AVAILABLE = True
+except ImportError:
+    RECEIPT_FORMATTER_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_hash(tx_hash: Union[str, bytes]) -> str:
+    """Return a lowercase 0x-prefixed hex transaction hash."""
+    if isinstance(tx_hash, (bytes, bytearray)):
+        return "0x" + bytes(tx_hash).hex()
+    tx_hash = tx_hash.lower()
+    return tx_hash if tx_hash.startswith("0x") else "0x" + tx_hash
+
+
+class _Pending:
+    """Bookkeeping for one tracked transaction."""
+
+    __slots__ = ("waiters", "receipt", "fresh")
+
+    def __init__(self):
+        # Each waiter's own future, mapped to the confirmations it asked for
+        self.waiters: Dict[Future, int] = {}
+        self.receipt: Optional[Dict[str, Any]] = None
+        # Fetch once immediately, the transaction may already be mined
+        self.fresh = True
+
+    @property
+    def confirmations(self) -> int:
+        """Fewest confirmations any waiter needs."""
+        return min(self.waiters.values())
+
+
+class ReceiptTracker:
+    """
+    Resolves receipt futures for many transactions from a single polling loop.
+
+    A background thread polls eth_blockNumber at an interval derived from the
+    observed block time and, whenever the head advances, fetches the receipts
+    of all pending transactions in batches. The thread starts on the first
+    tracked transaction and exits after idle_timeout seconds with nothing to
+    track.
+    """
+
+    def __init__(
+        self,
+        w3: Web3,
+        block_time: float = 1.0,
+        min_poll_interval: float = 0.1,
+        max_poll_interval: float = 12.0,
+        batch_size: int = 100,
+        idle_timeout: float = 30.0,
+        autostart: bool = True,
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            w3: Web3 instance for the RPC endpoint
+            block_time: Initial block time estimate in seconds (refined from observed blocks)
+            min_poll_interval: Lower bound for the head polling interval
+            max_poll_interval: Upper bound for the head polling interval
+            batch_size: Maximum receipts requested per JSON-RPC batch
+            idle_timeout: Seconds without pending transactions before the thread exits
+            autostart: Start the polling thread on demand; set False to drive
+                poll_once() from your own loop
+        """
+        self.w3 = w3
+        self.block_time = block_time
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.batch_size = batch_size
+        self.idle_timeout = idle_timeout
+        self.autostart = autostart
+
+        self._pending: Dict[str, _Pending] = {}
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self._head: Optional[int] = None
+        self._head_time: Optional[float] = None
+
+        # RPC call counters, useful for verifying load stays per-block
+        self.block_polls = 0
+        self.receipt_requests = 0
+
+    @property
+    def poll_interval(self) -> float:
+        """Current head polling interval (half the estimated block time, clamped)."""
+        return min(self.max_poll_interval, max(self.min_poll_interval, self.block_time / 2))
+
+    @property
+    def pending_count(self) -> int:
+        """Number of transactions still being tracked."""
+        with self._cond:
+            return len(self._pending)
+
+    def track(self, tx_hash: Union[str, bytes], confirmations: int = 1) -> Future:
+        """
+        Start tracking a transaction.
+
+        Args:
+            tx_hash: Transaction hash
+            confirmations: Blocks (including the inclusion block) required before resolving
+
+        Returns:
+            Future resolving to the receipt as a dictionary; each call gets its
+            own future, so other waiters on the same transaction are unaffected
+            when it is cancelled or untracked
+        """
+        if confirmations < 1:
+            raise ValueError(f"confirmations must be at least 1 (got: {confirmations})")
+        key = _normalize_hash(tx_hash)
+        future: Future = Future()
+        with self._cond:
+            entry = self._pending.get(key)
+            if entry is None:
+                entry = self._pending[key] = _Pending()
+            entry.waiters[future] = confirmations
+            self._stopped = False
+            if self.autostart:
+                self._ensure_thread()
+            self._cond.notify_all()
+        return future
+
+    def wait(
+        self,
+        tx_hash: Union[str, bytes],
+        timeout: float = 120,
+        confirmations: int = 1,
+    ) -> Dict[str, Any]:
+        """
+        Block until a transaction has a receipt with enough confirmations.
+
+        Args:
+            tx_hash: Transaction hash
+            timeout: Maximum seconds to wait
+            confirmations: Blocks (including the inclusion block) required
+
+        Returns:
+            Receipt as a dictionary
+
+        Raises:
+            TimeExhausted: If the receipt is not available within timeout
+        """
+        future = self.track(tx_hash, confirmations)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            self.untrack(tx_hash, future)
+            raise TimeExhausted(
+                f"Transaction {_normalize_hash(tx_hash)} is not in the chain after {timeout} seconds"
+            )
+
+    def untrack(self, tx_hash: Union[str, bytes], future: Optional[Future] = None) -> None:
+        """
+        Stop waiting for a transaction.
+
+        Args:
+            tx_hash: Transaction hash
+            future: Future returned by track() for the waiter that is leaving; the
+                transaction stays tracked while other waiters remain. If None,
+                every waiter's future is cancelled.
+        """
+        key = _normalize_hash(tx_hash)
+        with self._cond:
+            entry = self._pending.get(key)
+            if entry is None:
+                cancelled: List[Future] = [future] if future is not None else []
+            elif future is None:
+                cancelled = list(entry.waiters)
+                del self._pending[key]
+            else:
+                entry.waiters.pop(future, None)
+                cancelled = [future]
+                if not entry.waiters:
+                    del self._pending[key]
+        for waiter in cancelled:
+            waiter.cancel()
+
+    def stop(self) -> None:
+        """Stop the polling thread; pending futures are cancelled."""
+        with self._cond:
+            self._stopped = True
+            pending, self._pending = self._pending, {}
+            self._cond.notify_all()
+            thread = self._thread
+        for entry in pending.values():
+            for waiter in entry.waiters:
+                waiter.cancel()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+
+    def poll_once(self) -> None:
+        """
+        Run a single polling step.
+
+        Reads the chain head and, if it advanced (or new transactions were
+        added), fetches pending receipts in batches and resolves waiters.
+        """
+        head = int(self.w3.eth.block_number)
+        self.block_polls += 1
+        now = time.monotonic()
+
+        with self._cond:
+            advanced = self._head is None or head > self._head
+            if advanced:
+                if self._head is not None and self._head_time is not None:
+                    # Exponentially weighted block time from observed head changes
+                    observed = (now - self._head_time) / (head - self._head)
+                    self.block_time = 0.8 * self.block_time + 0.2 * observed
+                self._head, self._head_time = head, now
+
+            to_fetch = [
+                key for key, entry in self._pending.items()
+                if entry.fresh
+                or (advanced and entry.receipt is None)
+                or (advanced and entry.receipt is not None
+                    and head - entry.receipt["blockNumber"] + 1 >= entry.confirmations)
+            ]
+            for key in to_fetch:
+                self._pending[key].fresh = False
+
+        if not to_fetch:
+            return
+
+        receipts = self._fetch_receipts(to_fetch)
+
+        resolved = []
+        with self._cond:
+            for key in to_fetch:
+                entry = self._pending.get(key)
+                if entry is None:
+                    continue
+                receipt = receipts.get(key)
+                # A receipt that disappears has been reorged out
+                entry.receipt = receipt
+                if receipt is None:
+                    continue
+                depth = head - receipt["blockNumber"] + 1
+                for waiter, confirmations in list(entry.waiters.items()):
+                    if waiter.done():
+                        # Cancelled by its caller
+                        del entry.waiters[waiter]
+                    elif depth >= confirmations:
+                        resolved.append((waiter, receipt))
+                        del entry.waiters[waiter]
+                if not entry.waiters:
+                    del self._pending[key]
+
+        for waiter, receipt in resolved:
+            if not waiter.done():
+                waiter.set_result(receipt)
+
+    def _fetch_receipts(self, hashes: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Fetch receipts for hashes, batching requests where the provider allows it."""
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        provider = self.w3.provider
+        can_batch = RECEIPT_FORMATTER_AVAILABLE and callable(getattr(provider, "make_batch_request", None))
+
+        for start in range(0, len(hashes), self.batch_size):
+            chunk = hashes[start:start + self.batch_size]
+            if can_batch:
+                try:
+                    responses = provider.make_batch_request(
+                        [("eth_getTransactionReceipt", [h]) for h in chunk]
+                    )
+                    self.receipt_requests += 1
+                    if isinstance(responses, list) and len(responses) == len(chunk):
+                        for key, response in zip(chunk, responses):
+                            result = response.get("result") if isinstance(response, dict) else None
+                            results[key] = dict(receipt_formatter(result)) if result else None
+                        continue
+                    logger.debug("Unexpected batch response shape, falling back to single requests")
+                except Exception as e:
+                    logger.debug(f"Batch receipt request failed, falling back to single requests: {e}")
+
+            for key in chunk:
+                self.receipt_requests += 1
+                try:
+                    results[key] = dict(self.w3.eth.get_transaction_receipt(key))
+                except TransactionNotFound:
+                    results[key] = None
+                except Exception as e:
+                    logger.debug(f"Receipt lookup for {key[:10]}... failed: {e}")
+                    results[key] = None
+        return results
+
+    def _ensure_thread(self) -> None:
+        """Start the polling thread if it is not running (caller holds the lock)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="intentlayer-receipt-tracker", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Polling loop executed by the background thread."""
+        idle_since = None
+        while True:
+            with self._cond:
+                if self._stopped:
+                    return
+                if not self._pending:
+                    now = time.monotonic()
+                    idle_since = idle_since or now
+                    if now - idle_since >= self.idle_timeout:
+                        self._thread = None
+                        return
+                    self._cond.wait(timeout=self.idle_timeout - (now - idle_since))
+                    continue
+                idle_since = None
+
+            try:
+                self.poll_once()
+            except Exception as e:
+                logger.warning(f"Receipt tracker poll failed: {e}")
+
+            with self._cond:
+                if self._stopped:
+                    return
+                # New transactions wake the loop early so they are checked immediately
+                if not any(entry.fresh for entry in self._pending.values()):
+                    self._cond.wait(timeout=self.poll_interval)
+
+
+# Module-level tracker cache with thread safety
+_trackers: Dict[str, ReceiptTracker] = {}
+_trackers_lock = threading.RLock()
+
+
+def get_receipt_tracker(w3: Web3, endpoint: str, **kwargs: Any) -> ReceiptTracker:
+    """
+    Get or create the shared receipt tracker for an RPC endpoint.
+
+    Args:
+        w3: Web3 instance connected to the endpoint (used when creating the tracker)
+        endpoint: RPC endpoint identifier (typically the RPC URL)
+        **kwargs: Options passed to ReceiptTracker when it is created
+
+    Returns:
+        ReceiptTracker shared by every client in the process using this endpoint
+    """
+    with _trackers_lock:
+        tracker = _trackers.get(endpoint)
+        if tracker is None:
+            tracker = ReceiptTracker(w3, **kwargs)
+            _trackers[endpoint] = tracker
+        return tracker
+
+
+def reset_receipt_trackers() -> None:
+    """Stop and drop all shared receipt trackers (mainly useful in tests)."""
+    with _trackers_lock:
+        trackers = list(_trackers.values())
+        _trackers.clear()
+    for tracker in trackers:
+        tracker.stop()
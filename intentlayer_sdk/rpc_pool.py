@@ -0,0 +1,323 @@
+"""
+Multi-endpoint RPC failover for the IntentLayer SDK.
+
+EndpointPoolProvider spreads JSON-RPC traffic over several endpoints for the
+same chain. It keeps an exponentially weighted moving average (EWMA) of each
+endpoint's latency and error rate, sends reads to the best-scoring healthy
+endpoint, sends transactions to the primary endpoint first, and fails over on
+transport errors. Endpoints that fail repeatedly are ejected and re-probed in
+the background with a cheap eth_blockNumber call before taking traffic again.
+"""
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from web3 import Web3
+from web3.providers import BaseProvider, JSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+logger = logging.getLogger(__name__)
+
+# Methods that submit transactions and prefer the primary endpoint
+WRITE_METHODS = frozenset({"eth_sendRawTransaction", "eth_sendTransaction"})
+
+# Methods routed like writes: the chain ID validated before a send must be
+# the one of the endpoint the transaction goes to
+PRIMARY_METHODS = WRITE_METHODS | {"eth_chainId"}
+
+# JSON-RPC error codes meaning the endpoint, not the request, is the problem
+ENDPOINT_ERROR_CODES = frozenset({-32005})  # limit exceeded / rate limited
+
+# Extra weight given to an endpoint's error rate when scoring it
+ERROR_PENALTY = 4.0
+
+EndpointSpec = Union[str, BaseProvider, Tuple[Union[str, BaseProvider], float]]
+
+
+class AllEndpointsFailedError(ConnectionError):
+    """Raised when every endpoint in the pool failed a request."""
+
+
+class _Endpoint:
+    """Health state of one endpoint."""
+
+    __slots__ = (
+        "provider", "url", "weight", "latency", "error_rate", "failures",
+        "ejections", "ejected_until", "probing", "requests", "errors",
+    )
+
+    def __init__(self, provider: BaseProvider, url: str, weight: float):
+        self.provider = provider
+        self.url = url
+        self.weight = weight
+        self.latency: Optional[float] = None  # EWMA seconds, None until measured
+        self.error_rate = 0.0                 # EWMA of failures (0..1)
+        self.failures = 0                     # consecutive failures
+        self.ejections = 0                    # consecutive ejections (probe backoff)
+        self.ejected_until: Optional[float] = None
+        self.probing = False
+        self.requests = 0
+        self.errors = 0
+
+    @property
+    def ejected(self) -> bool:
+        """Ejected endpoints stay out of rotation until a request or probe succeeds."""
+        return self.ejected_until is not None
+
+    def score(self) -> float:
+        """Lower is better: latency penalized by error rate, divided by weight."""
+        return (self.latency or 0.0) * (1 + ERROR_PENALTY * self.error_rate) / self.weight
+
+
+def _is_endpoint_error(response: Any) -> bool:
+    """Whether a JSON-RPC response reports an endpoint rather than request failure."""
+    if not isinstance(response, dict):
+        return False
+    error = response.get("error")
+    return isinstance(error, dict) and error.get("code") in ENDPOINT_ERROR_CODES
+
+
+class EndpointPoolProvider(JSONBaseProvider):
+    """
+    Provider routing requests over a pool of RPC endpoints with failover.
+
+    The first endpoint is the primary: transactions (and eth_chainId, so the
+    chain checked before a send is the one receiving it) go there first and
+    only fall back to the others when it fails. Reads go to the healthy endpoint
+    with the lowest latency/error score (scaled by weight). JSON-RPC error
+    responses are returned to the caller unchanged; only transport failures
+    and rate-limit responses count against an endpoint.
+    """
+
+    def __init__(
+        self,
+        endpoints: Sequence[EndpointSpec],
+        alpha: float = 0.3,
+        eject_after: int = 3,
+        probe_interval: float = 15.0,
+        max_probe_interval: float = 300.0,
+        request_timeout: float = 10.0,
+    ):
+        """
+        Initialize the endpoint pool.
+
+        Args:
+            endpoints: Endpoint URLs or providers, optionally as (endpoint, weight)
+                tuples; the first one is the primary
+            alpha: EWMA smoothing factor for latency and error rate
+            eject_after: Consecutive failures before an endpoint is ejected
+            probe_interval: Seconds before an ejected endpoint is first re-probed
+            max_probe_interval: Upper bound for the doubling probe interval
+            request_timeout: HTTP timeout in seconds for endpoints given as URLs
+        """
+        super().__init__()
+        if not endpoints:
+            raise ValueError("At least one RPC endpoint is required")
+        if not 0 < alpha <= 1:
+            raise ValueError(f"alpha must be in (0, 1] (got: {alpha})")
+        self.alpha = alpha
+        self.eject_after = eject_after
+        self.probe_interval = probe_interval
+        self.max_probe_interval = max_probe_interval
+        self._lock = threading.Lock()
+        self._endpoints: List[_Endpoint] = []
+        # Failovers (an endpoint failed and another one answered) and reinstatements
+        # of ejected endpoints; routine read/write routing does not count
+        self.switches = 0
+        for spec in endpoints:
+            target, weight = spec if isinstance(spec, tuple) else (spec, 1.0)
+            if weight <= 0:
+                raise ValueError(f"Endpoint weight must be positive (got: {weight})")
+            if isinstance(target, str):
+                provider = Web3.HTTPProvider(target, request_kwargs={"timeout": request_timeout})
+                url = target
+            else:
+                provider = target
+                url = str(getattr(target, "endpoint_uri", None) or type(target).__name__)
+            self._endpoints.append(_Endpoint(provider, url, float(weight)))
+
+    @property
+    def endpoint_uri(self) -> str:
+        """URL of the primary endpoint."""
+        return self._endpoints[0].url
+
+    @property
+    def endpoints(self) -> List[str]:
+        """URLs of all endpoints, primary first."""
+        return [e.url for e in self._endpoints]
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        """Check whether any endpoint is reachable."""
+        return any(e.provider.is_connected(show_traceback) for e in self._endpoints)
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """
+        Send a request to the best endpoint, failing over on errors.
+
+        Args:
+            method: JSON-RPC method
+            params: JSON-RPC params
+
+        Returns:
+            The JSON-RPC response
+
+        Raises:
+            AllEndpointsFailedError: If every endpoint failed
+        """
+        return self._route(
+            method in PRIMARY_METHODS,
+            lambda provider: provider.make_request(method, params),
+            method,
+        )
+
+    def make_batch_request(
+        self, requests: List[Tuple[RPCEndpoint, Any]]
+    ) -> Union[List[RPCResponse], RPCResponse]:
+        """Send a JSON-RPC batch to the best endpoint, failing over on errors."""
+        write = any(method in PRIMARY_METHODS for method, _ in requests)
+        return self._route(write, lambda provider: provider.make_batch_request(requests), "batch")
+
+    def probe(self, force: bool = False) -> Dict[str, bool]:
+        """
+        Probe ejected endpoints now and reinstate the ones that answer.
+
+        Args:
+            force: Probe every endpoint, not just ejected ones that are due
+
+        Returns:
+            Dictionary mapping probed endpoint URL to whether it is healthy
+        """
+        now = time.monotonic()
+        with self._lock:
+            due = [e for e in self._endpoints if force or self._probe_due(e, now)]
+            for endpoint in due:
+                endpoint.probing = True
+        return {endpoint.url: self._probe(endpoint) for endpoint in due}
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        Get per-endpoint health statistics.
+
+        Returns:
+            List of dictionaries (primary first) with url, weight, latency,
+            error_rate, requests, errors and healthy
+        """
+        with self._lock:
+            return [
+                {
+                    "url": e.url,
+                    "weight": e.weight,
+                    "latency": e.latency,
+                    "error_rate": e.error_rate,
+                    "requests": e.requests,
+                    "errors": e.errors,
+                    "healthy": not e.ejected,
+                }
+                for e in self._endpoints
+            ]
+
+    def _route(self, write: bool, call: Any, description: str) -> Any:
+        """Try endpoints in preference order until one succeeds."""
+        self._start_background_probes()
+        errors = []
+        for endpoint in self._order(write):
+            start = time.monotonic()
+            try:
+                response = call(endpoint.provider)
+            except Exception as e:
+                self._record(endpoint, time.monotonic() - start, failed=True)
+                logger.warning(f"RPC endpoint {endpoint.url} failed {description}: {e}")
+                errors.append(f"{endpoint.url}: {e}")
+                continue
+            if _is_endpoint_error(response):
+                self._record(endpoint, time.monotonic() - start, failed=True)
+                errors.append(f"{endpoint.url}: {response['error'].get('message')}")
+                continue
+            self._record(endpoint, time.monotonic() - start, failed=False, failover=bool(errors))
+            return response
+        raise AllEndpointsFailedError(f"All RPC endpoints failed {description}: " + "; ".join(errors))
+
+    def _order(self, write: bool) -> List[_Endpoint]:
+        """Endpoints in the order they should be tried (ejected ones last)."""
+        with self._lock:
+            healthy = sorted((e for e in self._endpoints if not e.ejected), key=_Endpoint.score)
+            ejected = sorted((e for e in self._endpoints if e.ejected), key=lambda e: e.ejected_until)
+        primary = self._endpoints[0]
+        if write and primary in healthy:
+            healthy.remove(primary)
+            healthy.insert(0, primary)
+        return healthy + ejected
+
+    def _record(self, endpoint: _Endpoint, elapsed: float, failed: bool, failover: bool = False) -> None:
+        """Update an endpoint's EWMAs and ejection state after a request."""
+        with self._lock:
+            endpoint.requests += 1
+            endpoint.error_rate += self.alpha * ((1.0 if failed else 0.0) - endpoint.error_rate)
+            if failed:
+                endpoint.errors += 1
+                endpoint.failures += 1
+                if endpoint.failures >= self.eject_after and endpoint.ejected_until is None:
+                    self._eject(endpoint)
+                return
+            endpoint.latency = (
+                elapsed if endpoint.latency is None
+                else endpoint.latency + self.alpha * (elapsed - endpoint.latency)
+            )
+            if failover or endpoint.ejected_until is not None:
+                self.switches += 1
+            endpoint.failures = 0
+            endpoint.ejections = 0
+            endpoint.ejected_until = None
+
+    def _eject(self, endpoint: _Endpoint) -> None:
+        """Take an endpoint out of rotation until its next probe (caller holds the lock)."""
+        delay = min(self.probe_interval * 2 ** endpoint.ejections, self.max_probe_interval)
+        endpoint.ejections += 1
+        endpoint.ejected_until = time.monotonic() + delay
+        logger.warning(f"Ejecting RPC endpoint {endpoint.url} for {delay:.0f}s")
+
+    @staticmethod
+    def _probe_due(endpoint: _Endpoint, now: float) -> bool:
+        return (
+            endpoint.ejected_until is not None
+            and endpoint.ejected_until <= now
+            and not endpoint.probing
+        )
+
+    def _start_background_probes(self) -> None:
+        """Re-probe ejected endpoints whose backoff has elapsed, off the request path."""
+        now = time.monotonic()
+        with self._lock:
+            due = [e for e in self._endpoints if self._probe_due(e, now)]
+            for endpoint in due:
+                endpoint.probing = True
+        for endpoint in due:
+            threading.Thread(
+                target=self._probe, args=(endpoint,), name="intentlayer-rpc-probe", daemon=True
+            ).start()
+
+    def _probe(self, endpoint: _Endpoint) -> bool:
+        """Send a cheap request to an endpoint and update its state."""
+        start = time.monotonic()
+        try:
+            response = endpoint.provider.make_request(RPCEndpoint("eth_blockNumber"), [])
+            healthy = isinstance(response, dict) and "result" in response
+        except Exception as e:
+            logger.debug(f"Probe of RPC endpoint {endpoint.url} failed: {e}")
+            healthy = False
+        elapsed = time.monotonic() - start
+        with self._lock:
+            endpoint.probing = False
+            if healthy:
+                if endpoint.ejected_until is not None:
+                    logger.info(f"RPC endpoint {endpoint.url} is healthy again")
+                    self.switches += 1
+                endpoint.latency = elapsed
+                endpoint.failures = 0
+                endpoint.ejections = 0
+                endpoint.ejected_until = None
+            else:
+                endpoint.failures += 1
+                self._eject(endpoint)
+        return healthy
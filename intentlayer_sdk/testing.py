@@ -0,0 +1,484 @@
+"""
+Local stand-ins for the services the SDK talks to.
+
+PinnerStandIn (HTTP pinning service and IPFS gateway), ChainStandIn (JSON-RPC
+node that mines every transaction instantly) and GatewayStandIn (gRPC
+GatewayService) run in-process on 127.0.0.1 with an optional injected
+latency per request. They speak the real protocols, so the SDK's HTTP, web3
+and gRPC stacks are exercised end to end without network access; the
+benchmarks and `intent-cli bench --local` use them.
+
+Example:
+    with local_stack(latency=0.005) as stack:
+        client = stack.client()
+        client.send_intent(envelope.hex_hash(), {"envelope": envelope.model_dump(), ...})
+"""
+import gzip
+import json
+import math
+import socket
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import base58
+from eth_abi import decode, encode
+from eth_utils import keccak, to_checksum_address
+
+from .cid import compute_cid
+
+# Default stand-in chain settings
+STANDIN_CHAIN_ID = 31337
+STANDIN_RECORDER = "0x" + "12" * 20
+STANDIN_DID_REGISTRY = "0x" + "34" * 20
+STANDIN_MIN_STAKE_WEI = 10**15
+
+_RECORD_INTENT = keccak(text="recordIntent(bytes32,bytes)")[:4]
+_MIN_STAKE = keccak(text="MIN_STAKE_WEI()")[:4]
+_RESOLVE = keccak(text="resolve(string)")[:4]
+_INTENT_RECORDED = keccak(text="IntentRecorded(bytes32,string,address,uint256)")
+
+# Result of calls the chain stand-in does not model
+_ZERO_WORD = "0x" + "00" * 32
+
+
+class _StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _HTTPStandIn(ABC):
+    """Abstract base class for HTTP stand-ins served from a background thread."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server: Optional[_StandInServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running stand-in."""
+        if self._server is None:
+            raise RuntimeError("Stand-in is not running")
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self) -> "_HTTPStandIn":
+        """Start serving on an ephemeral port."""
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                super().setup()
+                # Headers and body go out in separate writes; don't let Nagle hold the body back
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                if self.headers.get("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+                with stand_in._lock:
+                    stand_in.requests += 1
+                if stand_in.latency:
+                    time.sleep(stand_in.latency)
+                status, response = stand_in.handle(self.command, self.path, body)
+                data = json.dumps(response).encode("utf-8") if response is not None else b""
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(data)
+
+            do_GET = do_POST = do_HEAD = _handle
+
+        self._server = _StandInServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> Any:
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    @abstractmethod
+    def handle(self, method: str, path: str, body: bytes) -> Tuple[int, Any]:
+        """Answer one request with (status, JSON body)."""
+        pass
+
+
+class PinnerStandIn(_HTTPStandIn):
+    """
+    Pinning service answering POST /pin with the CIDv0 of the request body,
+    and IPFS gateway serving pinned payloads from GET /ipfs/<cid>.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        super().__init__(latency)
+        self.pinned: Dict[str, Any] = {}
+
+    def handle(self, method: str, path: str, body: bytes) -> Tuple[int, Any]:
+        if method == "POST" and path.rstrip("/") == "/pin":
+            try:
+                payload = json.loads(body)
+            except ValueError:
+                return 400, {"error": "invalid JSON"}
+            cid = compute_cid(body)
+            with self._lock:
+                self.pinned[cid] = payload
+            return 200, {"cid": cid}
+        if method == "GET" and path.startswith("/ipfs/"):
+            payload = self.pinned.get(path[len("/ipfs/"):].strip("/"))
+            return (200, payload) if payload is not None else (404, {"error": "not found"})
+        if method == "HEAD":
+            return 200, None
+        return 404, {"error": "not found"}
+
+
+class ChainStandIn(_HTTPStandIn):
+    """
+    JSON-RPC node that accepts signed transactions, mines each one into its
+    own block as soon as its nonce is next (holding future nonces until the
+    gap is filled) and emits IntentRecorded logs for recordIntent calls.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        chain_id: int = STANDIN_CHAIN_ID,
+        recorder_address: str = STANDIN_RECORDER,
+        min_stake_wei: int = STANDIN_MIN_STAKE_WEI,
+        gas_price: int = 10**9,
+        gas_estimate: int = 60_000,
+    ):
+        super().__init__(latency)
+        self.chain_id = chain_id
+        self.recorder_address = to_checksum_address(recorder_address)
+        self.min_stake_wei = min_stake_wei
+        self.gas_price = gas_price
+        self.gas_estimate = gas_estimate
+        self.block_number = 1
+        self.nonces: Dict[str, int] = {}
+        self.queued: Dict[str, Dict[int, Tuple[str, Optional[str], List[Dict[str, Any]]]]] = {}
+        self.transactions: Dict[str, Dict[str, Any]] = {}
+        self.receipts: Dict[str, Dict[str, Any]] = {}
+
+    def handle(self, method: str, path: str, body: bytes) -> Tuple[int, Any]:
+        if method != "POST":
+            return 405, {"error": "JSON-RPC needs POST"}
+        try:
+            request = json.loads(body)
+        except ValueError:
+            return 200, {"jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": "Parse error"}}
+        if isinstance(request, list):
+            return 200, [self._dispatch(item) for item in request]
+        return 200, self._dispatch(request)
+
+    def _dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        response: Dict[str, Any] = {"jsonrpc": "2.0", "id": request.get("id")}
+        handler = getattr(self, f"rpc_{request.get('method')}", None)
+        if handler is None:
+            response["error"] = {"code": -32601, "message": f"Method {request.get('method')} not found"}
+            return response
+        try:
+            response["result"] = handler(*request.get("params", []))
+        except Exception as e:
+            response["error"] = {"code": -32000, "message": str(e)}
+        return response
+
+    def rpc_eth_chainId(self) -> str:
+        return hex(self.chain_id)
+
+    def rpc_net_version(self) -> str:
+        return str(self.chain_id)
+
+    def rpc_eth_blockNumber(self) -> str:
+        return hex(self.block_number)
+
+    def rpc_eth_gasPrice(self) -> str:
+        return hex(self.gas_price)
+
+    def rpc_eth_estimateGas(self, tx: Dict[str, Any], *_: Any) -> str:
+        return hex(self.gas_estimate)
+
+    def rpc_eth_getTransactionCount(self, address: str, *_: Any) -> str:
+        return hex(self.nonces.get(address.lower(), 0))
+
+    def rpc_eth_call(self, tx: Dict[str, Any], *_: Any) -> str:
+        data = bytes.fromhex((tx.get("data") or tx.get("input") or "0x")[2:])
+        if data[:4] == _MIN_STAKE:
+            return "0x" + encode(["uint128"], [self.min_stake_wei]).hex()
+        if data[:4] == _RESOLVE:
+            return "0x" + encode(["address", "bool"], ["0x" + "00" * 20, False]).hex()
+        return _ZERO_WORD
+
+    def rpc_eth_sendRawTransaction(self, raw_hex: str) -> str:
+        from eth_account import Account
+        import rlp
+
+        raw = bytes.fromhex(raw_hex[2:])
+        sender = Account.recover_transaction(raw)
+        if raw[0] >= 0xC0:  # legacy
+            fields = rlp.decode(raw)
+            nonce, to, value, data = fields[0], fields[3], fields[4], fields[5]
+        else:  # typed: 0x01 access list, 0x02 dynamic fee
+            fields = rlp.decode(raw[1:])
+            offset = 1 if raw[0] == 1 else 2
+            nonce = fields[1]
+            to, value, data = fields[3 + offset], fields[4 + offset], fields[5 + offset]
+        nonce = int.from_bytes(nonce, "big")
+        tx_hash = "0x" + keccak(raw).hex()
+        logs = []
+        if to and to_checksum_address(to) == self.recorder_address and data[:4] == _RECORD_INTENT:
+            envelope_hash, cid_bytes = decode(["bytes32", "bytes"], data[4:])
+            logs.append(self.intent_log(
+                envelope_hash, _cid_text(cid_bytes), sender, int.from_bytes(value, "big")
+            ))
+
+        key = sender.lower()
+        with self._lock:
+            expected = self.nonces.get(key, 0)
+            if nonce < expected:
+                raise ValueError("nonce too low")
+            # Like a node's mempool, hold future nonces until the gap is filled
+            queued = self.queued.setdefault(key, {})
+            queued[nonce] = (tx_hash, to_checksum_address(to) if to else None, logs)
+            while expected in queued:
+                queued_hash, queued_to, queued_logs = queued.pop(expected)
+                self._mine(queued_hash, sender, queued_to, expected, queued_logs)
+                expected += 1
+            self.nonces[key] = expected
+        return tx_hash
+
+    def intent_log(self, envelope_hash: bytes, cid: str, sender: str, stake_wei: int) -> Dict[str, Any]:
+        """Build an IntentRecorded log emitted by the recorder contract."""
+        return {
+            "address": self.recorder_address,
+            "topics": [
+                "0x" + _INTENT_RECORDED.hex(),
+                "0x" + bytes(envelope_hash).rjust(32, b"\0").hex(),
+                "0x" + bytes.fromhex(sender[2:]).rjust(32, b"\0").hex(),
+            ],
+            "data": "0x" + encode(["string", "uint256"], [cid, stake_wei]).hex(),
+        }
+
+    def record_intent(self, envelope_hash: bytes, cid: str, sender: str, stake_wei: int = 0) -> str:
+        """
+        Mine a recordIntent transaction without signing one.
+
+        Returns:
+            Transaction hash
+        """
+        with self._lock:
+            tx_hash = "0x" + keccak(envelope_hash + cid.encode() + str(self.block_number).encode()).hex()
+            log = self.intent_log(envelope_hash, cid, sender, stake_wei)
+            self._mine(tx_hash, sender, self.recorder_address, 0, [log])
+        return tx_hash
+
+    def _mine(self, tx_hash: str, sender: str, to: Optional[str], nonce: int, logs: List[Dict[str, Any]]) -> None:
+        self.block_number += 1
+        block_hash = "0x" + keccak(self.block_number.to_bytes(32, "big")).hex()
+        for index, log in enumerate(logs):
+            log.update({
+                "blockHash": block_hash, "blockNumber": hex(self.block_number),
+                "transactionHash": tx_hash, "transactionIndex": "0x0",
+                "logIndex": hex(index), "removed": False,
+            })
+        self.transactions[tx_hash] = {
+            "hash": tx_hash, "from": sender, "to": to, "nonce": hex(nonce),
+            "blockHash": block_hash, "blockNumber": hex(self.block_number),
+            "transactionIndex": "0x0", "gas": hex(self.gas_estimate),
+            "gasPrice": hex(self.gas_price), "value": "0x0", "input": "0x",
+            "v": "0x0", "r": "0x0", "s": "0x0", "type": "0x0",
+        }
+        self.receipts[tx_hash] = {
+            "transactionHash": tx_hash, "transactionIndex": "0x0",
+            "blockHash": block_hash, "blockNumber": hex(self.block_number),
+            "from": sender, "to": to, "contractAddress": None,
+            "cumulativeGasUsed": hex(self.gas_estimate), "gasUsed": hex(self.gas_estimate),
+            "effectiveGasPrice": hex(self.gas_price), "logs": logs,
+            "logsBloom": "0x" + "00" * 256, "status": "0x1", "type": "0x0",
+        }
+
+    def rpc_eth_getTransactionReceipt(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        return self.receipts.get(tx_hash.lower())
+
+    def rpc_eth_getTransactionByHash(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        return self.transactions.get(tx_hash.lower())
+
+
+def _cid_text(cid_bytes: bytes) -> str:
+    # Full multihashes map back to CIDv0; truncated ones are logged as hex
+    if len(cid_bytes) == 34 and cid_bytes[:2] == b"\x12\x20":
+        return base58.b58encode(cid_bytes).decode("ascii")
+    return "0x" + cid_bytes.hex()
+
+
+class GatewayStandIn:
+    """In-process gRPC GatewayService accepting every DID registration."""
+
+    def __init__(self, latency: float = 0.0, max_workers: int = 16):
+        self.latency = latency
+        self.max_workers = max_workers
+        self.registered: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self._server: Any = None
+        self.port: Optional[int] = None
+
+    @property
+    def url(self) -> str:
+        """Gateway URL accepted by GatewayClient."""
+        if self._server is None:
+            raise RuntimeError("Stand-in is not running")
+        return f"http://localhost:{self.port}"
+
+    def start(self) -> "GatewayStandIn":
+        """Start serving on an ephemeral port."""
+        import grpc
+        from .gateway.proto import gateway_pb2, gateway_pb2_grpc
+
+        stand_in = self
+
+        class Servicer(gateway_pb2_grpc.GatewayServiceServicer):
+            def RegisterDid(self, request: Any, context: Any) -> Any:
+                if stand_in.latency:
+                    time.sleep(stand_in.latency)
+                did = request.document.did
+                with stand_in._lock:
+                    known = did in stand_in.registered
+                    stand_in.registered.setdefault(did, bytes(request.document.pub_key))
+                receipt = gateway_pb2.TxReceipt(
+                    hash="0x" + keccak(text=did).hex(), gas_used=50_000, success=not known,
+                    error_code=(
+                        gateway_pb2.RegisterError.ALREADY_REGISTERED if known
+                        else gateway_pb2.RegisterError.UNKNOWN_UNSPECIFIED
+                    ),
+                )
+                return gateway_pb2.RegisterDidResponse(receipt=receipt)
+
+        self._server = grpc.server(ThreadPoolExecutor(max_workers=self.max_workers))
+        gateway_pb2_grpc.add_GatewayServiceServicer_to_server(Servicer(), self._server)
+        self.port = self._server.add_insecure_port("localhost:0")
+        self._server.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving."""
+        if self._server is not None:
+            self._server.stop(grace=None)
+            self._server = None
+
+    def __enter__(self) -> "GatewayStandIn":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+class LocalStack:
+    """Running pinner, chain and (optionally) gateway stand-ins."""
+
+    def __init__(self, pinner: PinnerStandIn, chain: ChainStandIn, gateway: Optional[GatewayStandIn]):
+        self.pinner = pinner
+        self.chain = chain
+        self.gateway = gateway
+
+    def client(self, signer: Any = None, **kwargs: Any) -> Any:
+        """
+        Create an IntentClient wired to the stand-ins.
+
+        Args:
+            signer: Signer to use (defaults to a fresh random LocalSigner)
+            **kwargs: Extra IntentClient options
+        """
+        from .client import IntentClient
+        from .signer.local import LocalSigner
+
+        if signer is None:
+            from eth_account import Account
+            signer = LocalSigner("0x" + Account.create().key.hex().removeprefix("0x"))
+        kwargs.setdefault("min_stake_wei", self.chain.min_stake_wei)
+        kwargs.setdefault("expected_chain_id", self.chain.chain_id)
+        return IntentClient(
+            rpc_url=self.chain.url,
+            pinner_url=self.pinner.url,
+            signer=signer,
+            recorder_address=self.chain.recorder_address,
+            **kwargs,
+        )
+
+    def gateway_client(self, **kwargs: Any) -> Any:
+        """Create a GatewayClient wired to the gateway stand-in."""
+        from .gateway.client import GatewayClient
+
+        if self.gateway is None:
+            raise RuntimeError("The local stack was started without a gateway")
+        return GatewayClient(self.gateway.url, verify_ssl=False, **kwargs)
+
+
+@contextmanager
+def local_stack(latency: float = 0.0, gateway: bool = True, **chain_options: Any) -> Iterator[LocalStack]:
+    """
+    Run pinner, chain and gateway stand-ins for the duration of a with block.
+
+    Args:
+        latency: Seconds of latency injected into every request
+        gateway: Also start the gRPC gateway stand-in
+        **chain_options: Options passed to ChainStandIn
+    """
+    pinner = PinnerStandIn(latency).start()
+    chain = ChainStandIn(latency, **chain_options).start()
+    gateway_stand_in = GatewayStandIn(latency).start() if gateway else None
+    try:
+        yield LocalStack(pinner, chain, gateway_stand_in)
+    finally:
+        if gateway_stand_in is not None:
+            gateway_stand_in.stop()
+        chain.stop()
+        pinner.stop()
+
+
+def summarize_latencies(samples: Iterable[float]) -> Dict[str, float]:
+    """
+    Summarize latency samples (seconds) as used in benchmark reports.
+
+    Percentiles use the nearest-rank method.
+
+    Returns:
+        Dict with count, mean, p50, p90, p99 and max (seconds)
+    """
+    ordered = sorted(samples)
+    if not ordered:
+        return {"count": 0, "mean": 0.0, "p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0}
+
+    def rank(q: float) -> float:
+        return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+    return {
+        "count": len(ordered),
+        "mean": sum(ordered) / len(ordered),
+        "p50": rank(0.50),
+        "p90": rank(0.90),
+        "p99": rank(0.99),
+        "max": ordered[-1],
+    }
@@ -2,15 +2,14 @@
 Utility functions for the IntentLayer SDK.
 """
 import hashlib
-import json
 import logging
 import os
 import warnings
 from typing import Dict, Any, Union, Optional
 
 import base58
-from web3 import Web3
 
+from .canonical import canonical_json, keccak256
 from .exceptions import EnvelopeError
 
 # Setup logger
@@ -34,9 +33,7 @@ def create_envelope_hash(payload: Dict[str, Any]) -> bytes:
         raise TypeError(f"Payload must be a dictionary, got {type(payload).__name__}")
         
     try:
-        # Sort keys and remove whitespace for deterministic representation
-        canonical_json = json.dumps(payload, separators=(',', ':'), sort_keys=True).encode('utf-8')
-        return Web3.keccak(canonical_json)
+        return keccak256(canonical_json(payload))
     except (TypeError, ValueError) as e:
         raise ValueError(f"Failed to serialize payload to JSON: {str(e)}")
 
@@ -0,0 +1,109 @@
+"""
+Tests for the bench CLI command.
+"""
+import json
+
+import pytest
+from typer.testing import CliRunner
+from web3 import HTTPProvider
+
+from intent_cli.__main__ import app
+from intent_cli.bench import StageRecorder, format_report, run_load
+from intentlayer_sdk.instrumentation import StageEvent
+
+# The suite stubs every web3 HTTP call; the --local intent run needs the real one
+_REAL_MAKE_REQUEST = HTTPProvider.make_request
+
+runner = CliRunner()
+
+
+def test_run_load_counts_successes_and_errors():
+    def operation(index):
+        if index % 5 == 0:
+            raise ConnectionError("down")
+        if index % 5 == 1:
+            return "ALREADY_REGISTERED"
+        return None
+
+    report = run_load(operation, duration=60, concurrency=3, count=20)
+
+    assert report["operations"] == 20
+    assert report["succeeded"] == 12
+    assert report["failed"] == 8
+    assert report["errors"] == {"ConnectionError": 4, "ALREADY_REGISTERED": 4}
+    assert report["latency_ms"]["total"]["count"] == 20
+    assert report["latency_ms"]["total"]["errors"] == {"ConnectionError": 4, "ALREADY_REGISTERED": 4}
+    assert report["throughput"] > 0
+
+
+def test_run_load_respects_rate_and_duration():
+    report = run_load(lambda index: None, duration=1.0, concurrency=2, rate=5)
+
+    # Slots are 0.2 s apart and none may start at or after the deadline
+    assert report["operations"] == 5
+    assert report["target_rate"] == 5
+
+
+def test_stage_recorder_keeps_stage_events_only():
+    recorder = StageRecorder()
+    recorder.on_stage_end(StageEvent("send_intent", "pin", 1, 1, duration=0.01))
+    recorder.on_stage_end(StageEvent("send_intent", "pin", 1, 2, duration=0.02, error="PinningError"))
+    recorder.on_stage_end(StageEvent("send_intent", None, 1, 1, duration=0.05))
+
+    assert recorder.samples == {"pin": [0.01, 0.02]}
+    assert recorder.errors == {"pin": {"PinningError": 1}}
+
+
+def test_format_report_lists_stages_and_errors():
+    recorder = StageRecorder()
+    recorder.record("pin", 0.004)
+    report = run_load(lambda index: "QUOTA_EXCEEDED" if index else None, duration=60, count=3, recorder=recorder)
+
+    text = format_report(report)
+
+    assert "1 succeeded, 2 failed" in text
+    assert "rate unthrottled" in text
+    assert text.index("total") < text.index("pin")
+    assert "QUOTA_EXCEEDED" in text
+
+
+def test_bench_local_gateway_json():
+    result = runner.invoke(app, ["bench", "--local", "--target", "gateway", "--count", "5", "--json"])
+
+    assert result.exit_code == 0, result.output
+    report = json.loads(result.stdout[result.stdout.index("{"):])
+    assert report["target"] == "gateway"
+    assert report["succeeded"] == 5
+    assert report["latency_ms"]["rpc"]["count"] == 5
+
+
+def test_bench_local_intent(monkeypatch, tmp_path):
+    monkeypatch.setattr(HTTPProvider, "make_request", _REAL_MAKE_REQUEST)
+    output = tmp_path / "report.json"
+
+    result = runner.invoke(
+        app, ["bench", "--local", "--count", "4", "--concurrency", "2", "--output", str(output)]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Throughput:" in result.stdout
+    report = json.loads(output.read_text())
+    assert report["succeeded"] == 4
+    for stage in ("total", "envelope", "pin", "sign", "send", "receipt"):
+        assert report["latency_ms"][stage]["count"] >= 4
+
+
+@pytest.mark.parametrize("args", [
+    ["bench", "--local", "--target", "ledger"],
+    ["bench", "--local", "--concurrency", "0"],
+    ["bench", "--network", "local"],
+    ["bench", "--target", "gateway"],
+])
+def test_bench_rejects_invalid_arguments(args, monkeypatch):
+    monkeypatch.delenv("INTENT_GATEWAY_URL", raising=False)
+    monkeypatch.delenv("PINNER_URL", raising=False)
+    monkeypatch.delenv("PRIVATE_KEY", raising=False)
+
+    result = runner.invoke(app, args)
+
+    assert result.exit_code == 4
@@ -19,6 +19,10 @@ import base58
 from intentlayer_sdk.utils import sha256_hex
 from intentlayer_sdk.envelope import create_envelope, CallEnvelope
 from intentlayer_sdk.client import IntentClient, PinningError
+from intentlayer_sdk.fees import reset_fee_oracles
+from intentlayer_sdk.metrics import reset_metrics_registry
+from intentlayer_sdk.nonce import reset_nonce_managers
+from intentlayer_sdk.receipts import reset_receipt_trackers
 
 # ─────────────────────────────────────────────────────────────────────────
 #  FAST PINNER-RETRY BEHAVIOUR FOR TESTS
@@ -30,7 +34,29 @@ def _fast_sleep(monkeypatch):
     monkeypatch.setattr(time, "sleep", lambda *_a, **_kw: None)
 
 
-# 2) Monkey-patch pin_to_ipfs with deterministic, test-friendly logic
+# 2) Give every test fresh process-wide nonce managers, fee oracles, receipt trackers and metrics
+@pytest.fixture(autouse=True)
+def _reset_shared_state():
+    reset_nonce_managers()
+    reset_fee_oracles()
+    reset_metrics_registry()
+    yield
+    reset_nonce_managers()
+    reset_fee_oracles()
+    reset_receipt_trackers()
+    reset_metrics_registry()
+
+
+# 3) Monkey-patch pin_to_ipfs with deterministic, test-friendly logic
+_REAL_PIN_TO_IPFS = IntentClient.pin_to_ipfs
+
+
+@pytest.fixture
+def real_pin_to_ipfs(monkeypatch):
+    """Restore the SDK's own pin_to_ipfs for tests that exercise it directly."""
+    monkeypatch.setattr(IntentClient, "pin_to_ipfs", _REAL_PIN_TO_IPFS, raising=True)
+
+
 @pytest.fixture(autouse=True)
 def _patch_pin_to_ipfs(monkeypatch):
     """Ensure retry behavior is fast and deterministic for tests."""
@@ -0,0 +1,222 @@
+"""
+Tests for the asyncio IntentClient.
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiohttp import web
+
+from intentlayer_sdk import AsyncIntentClient
+from intentlayer_sdk.exceptions import (
+    AlreadyRegisteredError, NetworkError, PinningError, TransactionError
+)
+from intentlayer_sdk.signer.local import LocalSigner
+from tests.test_helpers import TEST_CONTRACT, TEST_DID_CONTRACT, TEST_PRIV_KEY, TEST_STAKE_WEI
+
+
+async def _start_pinner(handler):
+    """Start an in-process pinner and return (runner, base_url)"""
+    app = web.Application()
+    app.router.add_post("/pin", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def _client(pinner_url="https://pin.example.com", **kwargs):
+    kwargs.setdefault("min_stake_wei", TEST_STAKE_WEI)
+    client = AsyncIntentClient(
+        rpc_url="https://rpc.example.com",
+        pinner_url=pinner_url,
+        signer=LocalSigner(TEST_PRIV_KEY),
+        recorder_address=TEST_CONTRACT,
+        did_registry_address=TEST_DID_CONTRACT,
+        **kwargs,
+    )
+    client.PIN_BACKOFF = 0
+    return client
+
+
+def _mock_chain(client, chain_id=1, pending=0):
+    """Replace the AsyncWeb3 instance and contracts with async mocks"""
+    eth = MagicMock()
+
+    async def _chain_id():
+        return chain_id
+
+    type(eth).chain_id = property(lambda self: _chain_id())
+    type(eth).gas_price = property(lambda self: asyncio.sleep(0, result=10**9))
+    eth.get_transaction_count = AsyncMock(return_value=pending)
+    eth.send_raw_transaction = AsyncMock(side_effect=lambda raw: b"\x01" * 32)
+    eth.wait_for_transaction_receipt = AsyncMock(
+        side_effect=lambda tx_hash, **kw: {"transactionHash": tx_hash, "status": 1}
+    )
+    client.w3 = MagicMock()
+    client.w3.eth = eth
+
+    record = MagicMock()
+    record.estimate_gas = AsyncMock(return_value=100000)
+    record.build_transaction = AsyncMock(
+        side_effect=lambda params: {**params, "to": TEST_CONTRACT, "data": "0x", "chainId": chain_id}
+    )
+    client.recorder_contract = MagicMock()
+    client.recorder_contract.functions.recordIntent.return_value = record
+
+    resolve = MagicMock()
+    resolve.call = AsyncMock(return_value=(TEST_CONTRACT, True))
+    client.did_registry_contract = MagicMock()
+    client.did_registry_contract.functions.resolve.return_value = resolve
+    return record
+
+
+def test_rejects_insecure_urls():
+    """Non-local URLs must use https"""
+    with pytest.raises(ValueError, match="pinner_url must use https"):
+        _client(pinner_url="http://pin.example.com")
+
+
+def test_pin_to_ipfs_success():
+    """Payloads are posted to the pinner and the CID returned"""
+    received = []
+
+    async def handler(request):
+        received.append(await request.json())
+        return web.json_response({"cid": "QmAsync123"})
+
+    async def run():
+        runner, url = await _start_pinner(handler)
+        try:
+            async with _client(pinner_url=url) as client:
+                cids = await asyncio.gather(*(client.pin_to_ipfs({"n": i}) for i in range(10)))
+                session = client._session
+                assert client._get_session() is session
+        finally:
+            await runner.cleanup()
+        return cids
+
+    assert asyncio.run(run()) == ["QmAsync123"] * 10
+    assert sorted(p["n"] for p in received) == list(range(10))
+
+
+def test_pin_to_ipfs_retries_server_errors():
+    """5xx responses are retried with backoff"""
+    calls = []
+
+    async def handler(request):
+        calls.append(1)
+        if len(calls) < 3:
+            return web.json_response({"error": "busy"}, status=503)
+        return web.json_response({"cid": "QmRetried"})
+
+    async def run():
+        runner, url = await _start_pinner(handler)
+        try:
+            async with _client(pinner_url=url) as client:
+                return await client.pin_to_ipfs({"a": 1})
+        finally:
+            await runner.cleanup()
+
+    assert asyncio.run(run()) == "QmRetried"
+    assert len(calls) == 3
+
+
+@pytest.mark.parametrize("status, body, match", [
+    (400, {"error": "bad"}, "IPFS pinning failed"),
+    (200, {"not_cid": "x"}, "Missing CID"),
+    (500, {"error": "down"}, "IPFS pinning failed"),
+])
+def test_pin_to_ipfs_errors(status, body, match):
+    """Client errors, bad responses and exhausted retries raise PinningError"""
+    async def handler(request):
+        return web.json_response(body, status=status)
+
+    async def run():
+        runner, url = await _start_pinner(handler)
+        try:
+            async with _client(pinner_url=url) as client:
+                await client.pin_to_ipfs({"a": 1})
+        finally:
+            await runner.cleanup()
+
+    with pytest.raises(PinningError, match=match):
+        asyncio.run(run())
+
+
+def test_send_intent_concurrently(test_payload):
+    """Concurrent sends from one signer get distinct nonces"""
+    client = _client(expected_chain_id=1)
+    record = _mock_chain(client, pending=5)
+    client.pin_to_ipfs = AsyncMock(return_value="0x" + "ab" * 32)
+
+    async def run():
+        return await asyncio.gather(*(
+            client.send_intent("0x" + f"{i:064x}", test_payload) for i in range(20)
+        ))
+
+    receipts = asyncio.run(run())
+
+    assert all(r["status"] == 1 for r in receipts)
+    nonces = sorted(c.args[0]["nonce"] for c in record.build_transaction.call_args_list)
+    assert nonces == list(range(5, 25))
+    assert client.w3.eth.get_transaction_count.await_count >= 1
+
+
+def test_send_intent_chain_mismatch(test_payload):
+    """Chain ID mismatches raise NetworkError before any work"""
+    client = _client(expected_chain_id=300)
+    _mock_chain(client, chain_id=1)
+
+    with pytest.raises(NetworkError, match="Chain ID mismatch"):
+        asyncio.run(client.send_intent("0x" + "11" * 32, test_payload))
+
+
+def test_send_intent_wraps_send_errors(test_payload):
+    """Send failures surface as TransactionError"""
+    client = _client()
+    _mock_chain(client)
+    client.pin_to_ipfs = AsyncMock(return_value="0x" + "ab" * 32)
+    client.w3.eth.send_raw_transaction.side_effect = ConnectionError("reset")
+
+    with pytest.raises(TransactionError, match="Failed to send transaction"):
+        asyncio.run(client.send_intent("0x" + "11" * 32, test_payload, wait_for_receipt=False))
+
+
+def test_resolve_did_not_found():
+    """A reverted resolve call means the DID is not registered"""
+    client = _client()
+    _mock_chain(client)
+    client.did_registry_contract.functions.resolve.return_value.call.side_effect = ValueError(
+        "execution reverted"
+    )
+
+    owner, active = asyncio.run(client.resolve_did("did:key:zmissing"))
+
+    assert owner == "0x0000000000000000000000000000000000000000"
+    assert active is False
+
+
+def test_register_did_already_registered():
+    """Active DIDs cannot be registered again"""
+    client = _client()
+    _mock_chain(client)
+
+    with pytest.raises(AlreadyRegisteredError):
+        asyncio.run(client.register_did("did:key:zactive"))
+
+
+def test_get_min_stake_wei_is_cached():
+    """get_min_stake_wei() reads the contract once and caches the value"""
+    client = _client(min_stake_wei=None)
+    _mock_chain(client)
+    stake_call = client.recorder_contract.functions.MIN_STAKE_WEI.return_value
+    stake_call.call = AsyncMock(return_value=42)
+
+    async def run():
+        return [await client.get_min_stake_wei(), await client.get_min_stake_wei()]
+
+    assert asyncio.run(run()) == [42, 42]
+    assert stake_call.call.await_count == 1
@@ -0,0 +1,210 @@
+"""
+Tests for JSON-RPC request batching.
+"""
+import threading
+
+import pytest
+from eth_abi import encode
+from web3 import Web3
+from web3.providers import JSONBaseProvider
+
+from intentlayer_sdk.batching import BatchingProvider
+from tests.test_helpers import TEST_CONTRACT, create_test_client
+
+
+class RecordingChain(JSONBaseProvider):
+    """Provider answering a few methods and recording each round trip"""
+
+    def __init__(self, batching=True):
+        super().__init__()
+        self.batching = batching
+        self.round_trips = []      # list of method lists, one per HTTP request
+        self.lock = threading.Lock()
+
+    def _answer(self, method, params):
+        if method == "eth_chainId":
+            return {"result": "0x1"}
+        if method == "eth_gasPrice":
+            return {"result": hex(10**9)}
+        if method == "eth_getTransactionCount":
+            return {"result": "0x7"}
+        if method == "eth_estimateGas":
+            return {"result": hex(100000)}
+        if method == "eth_call":
+            if params[0]["to"].lower() == TEST_CONTRACT.lower():
+                out = encode(["uint128"], [10**15])     # MIN_STAKE_WEI
+            else:
+                out = encode(["address", "bool"], [TEST_CONTRACT, True])
+            return {"result": "0x" + out.hex()}
+        if method == "eth_sendRawTransaction":
+            if params[0].endswith("00"):
+                return {"error": {"code": -32000, "message": "nonce too low"}}
+            return {"result": "0x" + "ab" * 32}
+        if method == "eth_blockNumber":
+            return {"result": "0x10"}
+        return {"error": {"code": -32601, "message": f"method {method} not found"}}
+
+    def make_request(self, method, params):
+        with self.lock:
+            self.round_trips.append([method])
+        return {"jsonrpc": "2.0", "id": 1, **self._answer(method, params)}
+
+    def make_batch_request(self, requests):
+        if not self.batching:
+            return {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "batch unsupported"}}
+        with self.lock:
+            self.round_trips.append([m for m, _ in requests])
+        return [
+            {"jsonrpc": "2.0", "id": i, **self._answer(m, p)}
+            for i, (m, p) in enumerate(requests)
+        ]
+
+
+def _concurrently(fns, provider=None):
+    """Run callables on separate threads (as one announced burst) and return their results or exceptions"""
+    if provider is not None:
+        with provider.coalesce():
+            return _concurrently(fns)
+    results = [None] * len(fns)
+    barrier = threading.Barrier(len(fns))
+
+    def run(i, fn):
+        barrier.wait()
+        try:
+            results[i] = fn()
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=run, args=(i, fn)) for i, fn in enumerate(fns)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def test_concurrent_requests_share_one_batch():
+    """Independent concurrent calls go out as a single batch"""
+    chain = RecordingChain()
+    w3 = Web3(BatchingProvider(chain, window=0.2))
+
+    results = _concurrently([
+        lambda: w3.eth.chain_id,
+        lambda: w3.eth.gas_price,
+        lambda: w3.eth.block_number,
+        lambda: w3.eth.get_transaction_count(TEST_CONTRACT, "pending"),
+    ], w3.provider)
+
+    assert results == [1, 10**9, 16, 7]
+    assert len(chain.round_trips) == 1
+    assert sorted(chain.round_trips[0]) == sorted([
+        "eth_chainId", "eth_gasPrice", "eth_blockNumber", "eth_getTransactionCount"
+    ])
+
+
+def test_raw_transactions_batched_with_per_request_errors():
+    """Concurrent eth_sendRawTransaction calls batch and keep their own errors"""
+    chain = RecordingChain()
+    w3 = Web3(BatchingProvider(chain, window=0.2))
+    plain = Web3(RecordingChain())
+
+    results = _concurrently([
+        lambda: w3.eth.send_raw_transaction("0x01"),
+        lambda: w3.eth.send_raw_transaction("0x00"),
+        lambda: w3.eth.send_raw_transaction("0x02"),
+    ], w3.provider)
+    with pytest.raises(Exception) as unbatched:
+        plain.eth.send_raw_transaction("0x00")
+
+    assert results[0] == results[2] == bytes.fromhex("ab" * 32)
+    assert type(results[1]) is unbatched.type
+    assert "nonce too low" in str(results[1])
+    assert len(chain.round_trips) == 1
+
+
+def test_single_request_skips_batch_array():
+    """A lone request is sent as a normal JSON-RPC request"""
+    chain = RecordingChain()
+    w3 = Web3(BatchingProvider(chain, window=0))
+
+    assert w3.eth.chain_id == 1
+    assert chain.round_trips == [["eth_chainId"]]
+
+
+def test_lone_request_skips_window():
+    """A request with nothing queued or in flight does not wait for company"""
+    import time
+
+    chain = RecordingChain()
+    w3 = Web3(BatchingProvider(chain, window=5.0))
+
+    start = time.monotonic()
+    assert w3.eth.gas_price == 10**9
+    assert time.monotonic() - start < 1.0
+
+
+def test_chain_id_checks_bypass_memo():
+    """Re-validating the chain asks the endpoint instead of the remembered answer"""
+    from intentlayer_sdk.exceptions import NetworkError
+
+    chain = RecordingChain()
+    client = create_test_client(expected_chain_id=1)
+    client.w3 = Web3(BatchingProvider(chain, window=0))
+    client.assert_chain_id()
+
+    chain._answer = lambda method, params: {"result": "0x5"}
+    client.invalidate_chain_id()
+    assert client.w3.eth.chain_id == 5
+    with pytest.raises(NetworkError, match="Chain ID mismatch"):
+        client.assert_chain_id(force=True)
+
+
+def test_falls_back_when_batches_rejected():
+    """Endpoints that reject batch arrays get individual requests"""
+    chain = RecordingChain(batching=False)
+    provider = BatchingProvider(chain, window=0.2)
+    w3 = Web3(provider)
+
+    results = _concurrently([lambda: w3.eth.chain_id, lambda: w3.eth.gas_price], provider)
+
+    assert results == [1, 10**9]
+    assert provider.supports_batching is False
+    assert len(chain.round_trips) == 2
+
+
+def test_transport_errors_reach_every_caller():
+    """A failed batch request raises for each request in it"""
+    chain = RecordingChain()
+    chain.make_batch_request = lambda requests: (_ for _ in ()).throw(ConnectionError("reset"))
+    w3 = Web3(BatchingProvider(chain, window=0.2))
+
+    results = _concurrently([lambda: w3.eth.chain_id, lambda: w3.eth.gas_price], w3.provider)
+
+    assert all(isinstance(r, ConnectionError) for r in results)
+
+
+def test_send_intent_reads_share_a_batch(test_payload):
+    """send_intent issues its independent reads in one round trip"""
+    client = create_test_client(batch_rpc=True, expected_chain_id=1, min_stake_wei=None)
+    chain = RecordingChain()
+    client.w3 = Web3(BatchingProvider(chain, window=0.2))
+    client.recorder_contract = client.w3.eth.contract(
+        address=client.recorder_address, abi=client.INTENT_RECORDER_ABI
+    )
+    client.did_registry_contract = client.w3.eth.contract(
+        address=client.did_registry_address, abi=client.DID_REGISTRY_ABI
+    )
+    client.pin_to_ipfs = lambda payload: "0x" + "cd" * 32
+    payload = {**test_payload, "envelope": {**test_payload["envelope"], "did": "did:key:zbatch"}}
+
+    client.send_intent("0x" + "11" * 32, payload, wait_for_receipt=False)
+
+    first = set(chain.round_trips[0])
+    assert {"eth_chainId", "eth_gasPrice", "eth_getTransactionCount"} <= first
+    assert chain.round_trips[-2:] == [["eth_estimateGas"], ["eth_sendRawTransaction"]]
+    assert len(chain.round_trips) == 4
+
+    # Once warm, a send costs the gas estimate and the broadcast only
+    del chain.round_trips[:]
+    client.send_intent("0x" + "22" * 32, payload, wait_for_receipt=False)
+    assert chain.round_trips == [["eth_estimateGas"], ["eth_sendRawTransaction"]]
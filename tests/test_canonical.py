@@ -0,0 +1,57 @@
+"""
+Tests for canonical JSON encoding and keccak hashing.
+"""
+import json
+
+import pytest
+from hypothesis import given, settings, strategies as st
+from web3 import Web3
+
+from intentlayer_sdk import canonical
+from intentlayer_sdk.canonical import canonical_json, keccak256
+
+
+def _stdlib(value):
+    return json.dumps(value, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+json_values = st.recursive(
+    st.none() | st.booleans() | st.integers() | st.floats(allow_nan=False) | st.text(),
+    lambda children: st.lists(children, max_size=4) | st.dictionaries(st.text(), children, max_size=4),
+    max_leaves=12,
+)
+
+
+@given(json_values)
+@settings(max_examples=300, deadline=None)
+def test_canonical_json_matches_stdlib(value):
+    """Encoding is byte-identical to json.dumps(sort_keys, compact) for any JSON value"""
+    assert canonical_json(value) == _stdlib(value)
+
+
+@pytest.mark.parametrize("value", [
+    {"b": 1, "a": [True, None, "x"], "c": {"z": "y", "k": -(2**63)}},
+    {"did": "did:key:zé", "model_id": "模型", "stake_wei": "10"},
+    {"n": 2**64, "f": 1e16, "t": (1, 2)},
+    {1: "int key"},
+    {"\x7f": "del\x7f"},
+])
+def test_canonical_json_examples(value):
+    assert canonical_json(value) == _stdlib(value)
+
+
+def test_canonical_json_falls_back_without_orjson(monkeypatch):
+    monkeypatch.setattr(canonical, "orjson", None)
+
+    assert canonical_json({"b": 1, "a": "é"}) == b'{"a":"\\u00e9","b":1}'
+
+
+def test_canonical_json_rejects_unserializable():
+    with pytest.raises(TypeError):
+        canonical_json({"a": object()})
+
+
+@pytest.mark.parametrize("data", [b"", b"abc", b"x" * 1000])
+def test_keccak256_matches_web3(data):
+    assert keccak256(data) == bytes(Web3.keccak(data))
+    assert canonical.keccak_backend in ("pysha3", "pycryptodome", "eth-hash")
@@ -72,4 +72,99 @@ def test_assert_chain_id_w3_error():
     
     # Test
     with pytest.raises(NetworkError, match="Failed to validate chain ID"):
-        client.assert_chain_id()
\ No newline at end of file
+        client.assert_chain_id()
+
+class CountingEth:
+    """web3.eth stand-in counting chain_id reads"""
+
+    def __init__(self, chain_id):
+        self.reads = 0
+        self.value = chain_id
+
+    @property
+    def chain_id(self):
+        self.reads += 1
+        return self.value
+
+
+def _cached_client(**kwargs):
+    client = IntentClient(
+        rpc_url=TEST_RPC_URL,
+        pinner_url=TEST_PINNER_URL,
+        signer=MagicMock(),
+        recorder_address=TEST_CONTRACT,
+        expected_chain_id=11155111,
+        **kwargs
+    )
+    client.w3 = MagicMock()
+    client.w3.eth = CountingEth(11155111)
+    return client
+
+
+def test_assert_chain_id_is_cached(monkeypatch):
+    """A passing check is reused until the TTL expires or force is set"""
+    now = [1000.0]
+    monkeypatch.setattr("intentlayer_sdk.client.time.monotonic", lambda: now[0])
+    client = _cached_client(chain_id_ttl=60)
+
+    for _ in range(5):
+        client.assert_chain_id()
+    assert client.w3.eth.reads == 1
+
+    client.assert_chain_id(force=True)
+    assert client.w3.eth.reads == 2
+
+    now[0] += 61
+    client.assert_chain_id()
+    assert client.w3.eth.reads == 3
+
+
+def test_assert_chain_id_rechecks_after_changes():
+    """A new provider, an endpoint switch or a chain error repeats the check"""
+    client = _cached_client()
+    client.assert_chain_id()
+
+    client.w3.provider = MagicMock()
+    client.assert_chain_id()
+    assert client.w3.eth.reads == 2
+
+    client.w3.eth.value = 1
+    client.invalidate_chain_id()
+    with pytest.raises(NetworkError, match="Chain ID mismatch"):
+        client.assert_chain_id()
+    # A failed check is never cached
+    with pytest.raises(NetworkError, match="Chain ID mismatch"):
+        client.assert_chain_id()
+
+
+def test_endpoint_switch_invalidates_chain_id_check():
+    """Failover to another pooled endpoint changes the validated identity"""
+    from intentlayer_sdk.rpc_pool import EndpointPoolProvider
+
+    client = _cached_client()
+    pool = EndpointPoolProvider([MagicMock(), MagicMock()])
+    client.w3.provider = pool
+    client.assert_chain_id()
+    client.assert_chain_id()
+    assert client.w3.eth.reads == 1
+
+    pool.switches += 1
+    client.assert_chain_id()
+    assert client.w3.eth.reads == 2
+
+
+def test_chain_id_send_error_invalidates_check():
+    """A send rejected for the wrong chain clears the cached check"""
+    from intentlayer_sdk.client import is_chain_id_error
+
+    client = _cached_client()
+    client.assert_chain_id()
+    client.nonce_manager.reset()
+    client._fetch_pending_nonce = MagicMock(return_value=0)
+    client.w3.eth.send_raw_transaction = MagicMock(side_effect=ValueError("invalid chain id for signer"))
+
+    with pytest.raises(Exception):
+        client._sign_and_send(lambda nonce: {"nonce": nonce}, "test")
+
+    assert is_chain_id_error(ValueError("only replay-protected (EIP-155) transactions allowed"))
+    assert client._chain_id_check is None
@@ -0,0 +1,116 @@
+"""
+Tests for local IPFS CID computation.
+"""
+import threading
+from unittest.mock import MagicMock
+
+import base58
+import pytest
+
+from intentlayer_sdk.cid import canonical_payload_bytes, compute_cid, compute_payload_cid
+from intentlayer_sdk.exceptions import PinningError
+from tests.test_helpers import create_test_client
+
+
+@pytest.mark.parametrize("data, cid", [
+    (b"", "QmbFMke1KXqnYyBBWxB74N4c5SBnJMVAiMNRcGu6x1AwQH"),
+    (b"hello world", "Qmf412jQZiuVUtdgnB36FXFX7xg5V6KEbSJ4dpQuhkLyfD"),
+    (b"hello world\n", "QmT78zSuBmuS4z925WZfrqQ1qHaJ56DQaTfyMUF7F8ff5o"),
+])
+def test_matches_ipfs_add(data, cid):
+    """Single-block files get the same CIDv0 as `ipfs add`"""
+    assert compute_cid(data) == cid
+
+
+def test_multi_chunk_layout():
+    """Chunking produces a DAG root that depends on the chunk layout"""
+    data = bytes(range(256)) * 8
+
+    single = compute_cid(data)
+    chunked = compute_cid(data, chunk_size=256)
+    deep = compute_cid(data, chunk_size=256, max_links=2)
+
+    assert len({single, chunked, deep}) == 3
+    assert all(c.startswith("Qm") for c in (single, chunked, deep))
+    assert compute_cid(data, chunk_size=256) == chunked
+
+
+def test_payload_cid_uses_canonical_bytes():
+    """Key order does not change a payload's CID"""
+    a = {"b": 1, "a": [1, 2]}
+    b = {"a": [1, 2], "b": 1}
+
+    assert canonical_payload_bytes(a) == b'{"a":[1,2],"b":1}'
+    assert compute_payload_cid(a) == compute_payload_cid(b)
+
+
+@pytest.fixture
+def client():
+    """Client computing CIDs locally with a mocked chain"""
+    c = create_test_client(local_cid=True)
+    c.did_registry_contract = None
+    c.w3 = MagicMock()
+    c.w3.eth.get_transaction_count.return_value = 0
+    c.recorder_contract = MagicMock()
+    fn = c.recorder_contract.functions.recordIntent.return_value
+    fn.estimate_gas.return_value = 100000
+    fn.build_transaction.side_effect = lambda params: {
+        **params, "to": "0x" + "00" * 20, "data": "0x", "chainId": 1
+    }
+    return c
+
+
+def test_send_overlaps_pinning(client, test_payload):
+    """The transaction is broadcast before the upload completes"""
+    events = []
+    sent = threading.Event()
+
+    def pin(payload):
+        events.append("pin started")
+        sent.wait(5)
+        events.append("pin finished")
+        return compute_payload_cid(payload)
+
+    def send(raw):
+        events.append("sent")
+        sent.set()
+        return b"\x01" * 32
+
+    client.pin_to_ipfs = pin
+    client.w3.eth.send_raw_transaction.side_effect = send
+
+    with pytest.warns(UserWarning, match="Truncating"):
+        client.send_intent("0x" + "11" * 32, test_payload, wait_for_receipt=False)
+
+    assert events.index("sent") < events.index("pin finished")
+    cid_arg = client.recorder_contract.functions.recordIntent.call_args.args[1]
+    assert cid_arg == base58.b58decode(compute_payload_cid(test_payload))[:32]
+
+
+def test_cid_mismatch_raises(client, test_payload):
+    """A pinner CID that differs from the local one is reported"""
+    client.pin_to_ipfs = MagicMock(return_value="QmSomethingElse")
+    client.w3.eth.send_raw_transaction.return_value = b"\x02" * 32
+
+    with pytest.warns(UserWarning), pytest.raises(PinningError, match="0x" + "02" * 32):
+        client.send_intent("0x" + "11" * 32, test_payload, wait_for_receipt=False)
+
+
+def test_cid_mismatch_settles_transaction(client, test_payload):
+    """The broadcast transaction is still awaited and its nonce confirmed"""
+    client.pin_to_ipfs = MagicMock(side_effect=ConnectionError("pinner down"))
+    client.w3.eth.send_raw_transaction.return_value = b"\x03" * 32
+    client._wait_for_receipt = MagicMock(return_value={"status": 1, "blockNumber": 5})
+
+    with pytest.warns(UserWarning), pytest.raises(PinningError) as exc:
+        client.send_intent("0x" + "11" * 32, test_payload)
+
+    assert exc.value.tx_hash == "0x" + "03" * 32
+    assert exc.value.receipt["blockNumber"] == 5
+    assert client.nonce_manager.in_flight == ()
+
+
+def test_pin_body_is_canonical(client):
+    """The pinner receives the bytes the CID was computed from"""
+    kwargs = client._pin_request_kwargs({"b": 1, "a": 2})
+    assert kwargs["data"] == b'{"a":2,"b":1}'
@@ -0,0 +1,130 @@
+"""
+Tests for DID resolution caching.
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+from intentlayer_sdk.did_cache import DIDCache
+from intentlayer_sdk.exceptions import TransactionError
+from tests.test_helpers import TEST_CONTRACT, create_test_client
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+OWNER = "0x1234567890123456789012345678901234567890"
+
+
+@pytest.fixture
+def client():
+    """Client with a mocked DID registry"""
+    c = create_test_client()
+    c.did_registry_contract = MagicMock()
+    c.did_registry_contract.functions.resolve.return_value.call.return_value = (OWNER, True)
+    return c
+
+
+def _resolve_calls(client):
+    return client.did_registry_contract.functions.resolve.return_value.call.call_count
+
+
+def test_cache_expires_by_ttl(monkeypatch):
+    """Active and inactive results expire after their own TTLs"""
+    now = [0.0]
+    monkeypatch.setattr("intentlayer_sdk.did_cache.time.monotonic", lambda: now[0])
+    cache = DIDCache(ttl=100, negative_ttl=10)
+    cache.put("did:a", OWNER, True)
+    cache.put("did:b", ZERO_ADDRESS, False)
+
+    now[0] = 11
+    assert cache.get("did:a") == (OWNER, True)
+    assert cache.get("did:b") is None
+
+    now[0] = 101
+    assert cache.get("did:a") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_cache_evicts_least_recently_used():
+    """The cache stays within maxsize"""
+    cache = DIDCache(maxsize=2)
+    cache.put("did:a", OWNER, True)
+    cache.put("did:b", OWNER, True)
+    cache.get("did:a")
+    cache.put("did:c", OWNER, True)
+
+    assert cache.get("did:b") is None
+    assert cache.get("did:a") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_resolve_did_hits_skip_rpc(client):
+    """Repeated resolutions of an active DID make one eth_call"""
+    for _ in range(10):
+        assert client.resolve_did("did:key:zabc") == (OWNER, True)
+
+    assert _resolve_calls(client) == 1
+    assert client.did_cache.stats()["hits"] == 9
+
+
+def test_resolve_did_caches_not_found(client):
+    """Unregistered DIDs are cached as (ZERO_ADDRESS, False)"""
+    client.did_registry_contract.functions.resolve.return_value.call.side_effect = ValueError(
+        "execution reverted"
+    )
+
+    assert client.resolve_did("did:key:zmissing") == (ZERO_ADDRESS, False)
+    assert client.resolve_did("did:key:zmissing") == (ZERO_ADDRESS, False)
+    assert _resolve_calls(client) == 1
+
+
+def test_resolve_did_errors_not_cached(client):
+    """RPC failures are raised and not cached"""
+    call = client.did_registry_contract.functions.resolve.return_value.call
+    call.side_effect = ConnectionError("down")
+    with pytest.raises(TransactionError):
+        client.resolve_did("did:key:zabc")
+
+    call.side_effect = None
+    assert client.resolve_did("did:key:zabc") == (OWNER, True)
+    assert call.call_count == 2
+
+
+def test_resolve_did_bypass_and_invalidate(client):
+    """use_cache=False and invalidate_did force a fresh lookup"""
+    client.resolve_did("did:key:zabc")
+    client.resolve_did("did:key:zabc", use_cache=False)
+    assert _resolve_calls(client) == 2
+
+    client.invalidate_did("did:key:zabc")
+    client.resolve_did("did:key:zabc")
+    assert _resolve_calls(client) == 3
+
+
+def test_register_did_invalidates_cache(client):
+    """A successful registration drops the cached resolution"""
+    call = client.did_registry_contract.functions.resolve.return_value.call
+    call.return_value = (ZERO_ADDRESS, False)
+    client.resolve_did("did:key:znew")
+    client.w3 = MagicMock()
+    client.w3.eth.get_transaction_count.return_value = 0
+    client.w3.eth.send_raw_transaction.return_value = b"\x01" * 32
+    client.did_registry_contract.functions.register.return_value.build_transaction.side_effect = (
+        lambda params: {**params, "to": TEST_CONTRACT, "data": "0x", "chainId": 1}
+    )
+
+    client.register_did("did:key:znew", force=True, wait_for_receipt=False)
+
+    call.return_value = (OWNER, True)
+    assert client.resolve_did("did:key:znew") == (OWNER, True)
+
+
+def test_did_cache_can_be_disabled():
+    """did_cache=False resolves on every call"""
+    c = create_test_client(did_cache=False)
+    c.did_registry_contract = MagicMock()
+    c.did_registry_contract.functions.resolve.return_value.call.return_value = (OWNER, True)
+
+    c.resolve_did("did:key:zabc")
+    c.resolve_did("did:key:zabc")
+
+    assert c.did_cache is None
+    assert _resolve_calls(c) == 2
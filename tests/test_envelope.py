@@ -135,4 +135,403 @@ class TestCreateEnvelope:
             metadata=metadata
         )
         
-        assert env.metadata == metadata
\ No newline at end of file
+        assert env.metadata == metadata
+
+class TestEnvelopeEncodings:
+    """Test the memoized canonical bytes and hash."""
+
+    @staticmethod
+    def _legacy_hash(env):
+        import json
+        from web3 import Web3
+        canonical = json.dumps(env.model_dump(exclude={"sig_ed25519"}), separators=(',', ':'), sort_keys=True)
+        return bytes(Web3.keccak(canonical.encode('utf-8')))
+
+    @pytest.mark.parametrize("metadata", [None, {"user_id": "tëst", "score": 0.5, "tags": ["a", 1]}])
+    def test_hash_matches_legacy_serialization(self, metadata):
+        """Test hash() is unchanged from the json.dumps + Web3.keccak implementation."""
+        env = create_envelope(
+            prompt="Test prompt",
+            model_id="gpt-4",
+            tool_id="test_tool",
+            did="did:key:test123",
+            private_key=Ed25519PrivateKey.generate(),
+            stake_wei=1000000000000000,
+            metadata=metadata
+        )
+
+        assert env.hash() == self._legacy_hash(env)
+
+    def test_signing_bytes_are_signed(self):
+        """Test signing_bytes() is what sig_ed25519 covers."""
+        from base64 import urlsafe_b64decode
+        private_key = Ed25519PrivateKey.generate()
+        env = create_envelope(
+            prompt="Test prompt",
+            model_id="gpt-4",
+            tool_id="test_tool",
+            did="did:key:test123",
+            private_key=private_key,
+            stake_wei=1000000000000000,
+        )
+        signature = urlsafe_b64decode(env.sig_ed25519 + "==")
+        rebuilt = CallEnvelope(**env.model_dump())
+
+        assert rebuilt.signing_bytes() == env.signing_bytes()
+        private_key.public_key().verify(signature, rebuilt.signing_bytes())
+
+    def test_hash_memoized_and_reset_on_assignment(self, monkeypatch):
+        """Test hash() is computed once and recomputed after a field changes."""
+        import intentlayer_sdk.envelope as envelope_module
+        env = create_envelope(
+            prompt="Test prompt",
+            model_id="gpt-4",
+            tool_id="test_tool",
+            did="did:key:test123",
+            private_key=Ed25519PrivateKey.generate(),
+            stake_wei=1000000000000000,
+        )
+        calls = []
+        real_keccak = envelope_module.keccak256
+        monkeypatch.setattr(envelope_module, "keccak256", lambda data: calls.append(data) or real_keccak(data))
+
+        first = env.hash()
+        assert env.hash() is first
+        assert len(calls) == 1
+
+        env.stake_wei = "2000000000000000"
+        assert env.hash() != first
+        assert env.hash() == self._legacy_hash(env)
+        assert env.model_copy(update={"stake_wei": "1"}).hash() != env.hash()
+
+    def test_metadata_mutation_changes_encodings(self):
+        """Test hash() and signing_bytes() follow metadata mutated in place."""
+        env = create_envelope(
+            prompt="Test prompt",
+            model_id="gpt-4",
+            tool_id="test_tool",
+            did="did:key:test123",
+            private_key=Ed25519PrivateKey.generate(),
+            stake_wei=1000000000000000,
+            metadata={"amount": 1},
+        )
+        first_hash, first_signed = env.hash(), env.signing_bytes()
+
+        env.metadata["amount"] = 5
+
+        assert env.hash() != first_hash
+        assert env.hash() == self._legacy_hash(env)
+        assert env.signing_bytes() != first_signed
+
+    def test_equality_ignores_memoized_encodings(self):
+        """Test envelopes compare equal whether or not their hash was computed."""
+        kwargs = dict(
+            did="did:key:123",
+            model_id="gpt-4",
+            prompt_sha256="e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855",
+            tool_id="test",
+            timestamp_ms=1234567890,
+            stake_wei="1000000000000000",
+            sig_ed25519="abc123"
+        )
+        env, other = CallEnvelope(**kwargs), CallEnvelope(**kwargs)
+        env.hash()
+
+        assert env == other
+        assert env != CallEnvelope(**{**kwargs, "sig_ed25519": "def456"})
+
+
+class TestCreateEnvelopes:
+    """Test the bulk envelope builder."""
+
+    PARAMS = dict(model_id="gpt-4", tool_id="test_tool", did="did:key:test123", stake_wei=1000000000000000)
+
+    @pytest.mark.parametrize("metadata", [None, {"user_id": "tëst", "score": 0.5}])
+    def test_matches_create_envelope(self, metadata):
+        """Test every envelope equals the one create_envelope builds."""
+        from intentlayer_sdk.envelope import create_envelopes
+        private_key = Ed25519PrivateKey.generate()
+        prompts = ["first prompt", b"second prompt", "third prompt ünicode"]
+
+        batch = create_envelopes(prompts, private_key=private_key, timestamp_ms=1234567890, metadata=metadata, **self.PARAMS)
+
+        assert len(batch) == 3
+        for prompt, env in zip(prompts, batch):
+            expected = create_envelope(
+                prompt, private_key=private_key, timestamp_ms=1234567890, metadata=metadata, **self.PARAMS
+            )
+            assert env == expected
+            assert env.hash() == expected.hash()
+            assert env.signing_bytes() == expected.signing_bytes()
+            assert env.model_fields_set == expected.model_fields_set
+
+    def test_indexing(self):
+        """Test negative indexes, slices and out-of-range access."""
+        from intentlayer_sdk.envelope import create_envelopes
+        batch = create_envelopes(["a", "b", "c"], private_key=Ed25519PrivateKey.generate(), **self.PARAMS)
+
+        assert batch[-1] == batch[2]
+        assert [env.prompt_sha256 for env in batch[1:]] == [batch.prompt_sha256(1), batch.prompt_sha256(2)]
+        assert batch[0].sig_ed25519 == batch.sig_ed25519(0)
+        with pytest.raises(IndexError):
+            batch[3]
+
+    def test_metadata_isolated_from_caller(self):
+        """Test the batch keeps its own copy of metadata and hands out copies."""
+        from intentlayer_sdk.envelope import create_envelopes
+        metadata = {"limits": {"amount": 1}}
+        batch = create_envelopes(["a", "b"], private_key=Ed25519PrivateKey.generate(), metadata=metadata, **self.PARAMS)
+
+        metadata["limits"]["amount"] = 999
+        batch[0].metadata["limits"]["amount"] = 5
+
+        assert batch[0].metadata == {"limits": {"amount": 1}}
+        assert batch[0].signing_bytes() == batch.signing_bytes(0)
+
+    @pytest.mark.parametrize("prompts", ["abc", b"abc"])
+    def test_single_prompt_rejected(self, prompts):
+        """Test a bare prompt isn't split into one envelope per character."""
+        from intentlayer_sdk.envelope import create_envelopes
+
+        with pytest.raises(TypeError, match="collection of prompts"):
+            create_envelopes(prompts, private_key=Ed25519PrivateKey.generate(), **self.PARAMS)
+
+    def test_parallel_hashing_and_signing(self, monkeypatch):
+        """Test the worker-thread path produces the sequential result."""
+        import intentlayer_sdk.envelope as envelope_module
+        monkeypatch.setattr(envelope_module, "_PARALLEL_HASH_BYTES", 1)
+        monkeypatch.setattr(envelope_module, "_SIGN_CHUNK", 4)
+        private_key = Ed25519PrivateKey.generate()
+        prompts = [f"prompt {n}" * 50 for n in range(10)]
+
+        parallel = envelope_module.create_envelopes(prompts, private_key=private_key, timestamp_ms=1, max_workers=3, **self.PARAMS)
+        sequential = envelope_module.create_envelopes(prompts, private_key=private_key, timestamp_ms=1, max_workers=1, **self.PARAMS)
+
+        assert list(parallel) == list(sequential)
+
+    def test_signs_with_non_exportable_key(self):
+        """Test keys without raw private bytes sign through the key object."""
+        from unittest.mock import MagicMock
+        from base64 import urlsafe_b64decode
+        from intentlayer_sdk.envelope import create_envelopes
+        real_key = Ed25519PrivateKey.generate()
+        hardware_key = MagicMock()
+        hardware_key.private_bytes_raw.side_effect = TypeError("not exportable")
+        hardware_key.sign.side_effect = real_key.sign
+
+        env = create_envelopes(["prompt"], private_key=hardware_key, **self.PARAMS)[0]
+
+        real_key.public_key().verify(urlsafe_b64decode(env.sig_ed25519 + "=="), env.signing_bytes())
+        assert hardware_key.sign.call_count == 1
+
+    @pytest.mark.parametrize("prompts,overrides,error", [
+        (["ok", ""], {}, ValueError),
+        (["ok"], {"did": "key:test123"}, ValueError),
+        (["ok"], {"model_id": ""}, ValueError),
+        (["ok"], {"metadata": ["not", "a", "dict"]}, TypeError),
+        (["ok"], {"timestamp_ms": "1234567890"}, TypeError),
+    ])
+    def test_validation(self, prompts, overrides, error):
+        """Test parameters are validated once, before any signing."""
+        from intentlayer_sdk.envelope import create_envelopes
+        params = {**self.PARAMS, **overrides}
+
+        with pytest.raises(error):
+            create_envelopes(prompts, private_key=Ed25519PrivateKey.generate(), **params)
+
+
+class TestPromptHashing:
+    """Test incremental prompt hashing."""
+
+    PROMPT = "Summarize the attached report. ünïcode ✓ " * 1000
+
+    def _expected(self):
+        import hashlib
+        return hashlib.sha256(self.PROMPT.encode("utf-8")).hexdigest()
+
+    def test_prompt_sources(self, tmp_path):
+        """Test every supported prompt source hashes like the encoded string."""
+        import io
+        from intentlayer_sdk.envelope import prompt_sha256
+        encoded = self.PROMPT.encode("utf-8")
+        path = tmp_path / "prompt.txt"
+        path.write_bytes(encoded)
+
+        sources = [
+            self.PROMPT,
+            encoded,
+            bytearray(encoded),
+            memoryview(encoded),
+            path,
+            io.BytesIO(encoded),
+            io.StringIO(self.PROMPT),
+            iter([self.PROMPT[:100], encoded[len(self.PROMPT[:100].encode("utf-8")):]]),
+        ]
+        for source in sources:
+            assert prompt_sha256(source) == self._expected(), type(source).__name__
+
+    def test_long_string_hashed_in_chunks(self, monkeypatch):
+        """Test strings longer than a chunk produce the same hash."""
+        import intentlayer_sdk.envelope as envelope_module
+        monkeypatch.setattr(envelope_module, "_HASH_CHUNK", 7)
+
+        assert envelope_module.prompt_sha256(self.PROMPT) == self._expected()
+
+    def test_large_prompt_is_not_copied(self):
+        """Test peak memory while hashing stays far below the prompt size."""
+        import tracemalloc
+        from intentlayer_sdk.envelope import prompt_sha256
+        prompt = "x" * (32 * 1024 * 1024)
+
+        tracemalloc.start()
+        try:
+            prompt_sha256(prompt)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert peak < 4 * 1024 * 1024
+
+    def test_create_envelope_from_file(self, tmp_path):
+        """Test create_envelope accepts a path and a file object."""
+        path = tmp_path / "prompt.txt"
+        path.write_text(self.PROMPT, encoding="utf-8")
+        private_key = Ed25519PrivateKey.generate()
+        params = dict(model_id="gpt-4", tool_id="test_tool", did="did:key:test123", private_key=private_key, stake_wei=1)
+
+        from_path = create_envelope(path, **params)
+        with open(path, "rb") as f:
+            from_file = create_envelope(f, **params)
+
+        assert from_path.prompt_sha256 == from_file.prompt_sha256 == self._expected()
+
+    @pytest.mark.parametrize("prompt", [iter([]), iter(["", b""])])
+    def test_empty_stream_rejected(self, prompt):
+        """Test a stream yielding no bytes is an empty prompt."""
+        with pytest.raises(ValueError, match="Prompt cannot be empty"):
+            create_envelope(
+                prompt, model_id="gpt-4", tool_id="test_tool", did="did:key:test123",
+                private_key=Ed25519PrivateKey.generate(), stake_wei=1
+            )
+
+    def test_empty_file_rejected(self, tmp_path):
+        """Test empty files are empty prompts, in bulk too."""
+        from intentlayer_sdk.envelope import create_envelopes
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+
+        with pytest.raises(ValueError, match="Prompt 1 cannot be empty"):
+            create_envelopes(
+                ["ok", path], model_id="gpt-4", tool_id="test_tool", did="did:key:test123",
+                private_key=Ed25519PrivateKey.generate(), stake_wei=1
+            )
+
+    def test_unsupported_chunk_type(self):
+        """Test chunks that are neither text nor bytes are rejected."""
+        from intentlayer_sdk.envelope import prompt_sha256
+
+        with pytest.raises(TypeError, match="str or bytes-like"):
+            prompt_sha256([b"ok", 42])
+
+
+class TestVerifyEnvelope:
+    """Test envelope signature verification."""
+
+    @staticmethod
+    def _did(private_key, multibase=True):
+        from intentlayer_sdk.identity.crypto import derive_did_from_pubkey
+        from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+        did = derive_did_from_pubkey(private_key.public_key().public_bytes(Encoding.Raw, PublicFormat.Raw))
+        # derive_did_from_pubkey omits the multibase prefix of standard did:key identifiers
+        return did.replace("did:key:", "did:key:z") if multibase else did
+
+    def _envelope(self, private_key, multibase=True, **kwargs):
+        return create_envelope(
+            "test prompt", model_id="gpt-4", tool_id="test_tool", did=self._did(private_key, multibase),
+            private_key=private_key, stake_wei=1000, **kwargs
+        )
+
+    @pytest.mark.parametrize("multibase", [True, False])
+    @pytest.mark.parametrize("metadata", [None, {"user_id": "tëst", "score": 0.5}])
+    def test_valid_signature(self, multibase, metadata):
+        """Test envelopes verify, as models and as parsed JSON."""
+        from intentlayer_sdk.envelope import verify_envelope
+        env = self._envelope(Ed25519PrivateKey.generate(), multibase, metadata=metadata)
+
+        assert verify_envelope(env)
+        assert verify_envelope(CallEnvelope.model_validate_json(env.model_dump_json()))
+        assert verify_envelope(env.model_dump())
+        assert verify_envelope(env.model_dump(exclude_none=True))
+
+    def test_tampered_envelope(self):
+        """Test changed fields, foreign keys and malformed input fail verification."""
+        from intentlayer_sdk.envelope import verify_envelope
+        private_key = Ed25519PrivateKey.generate()
+        env = self._envelope(private_key)
+        other = self._envelope(Ed25519PrivateKey.generate())
+
+        assert not verify_envelope(env.model_copy(update={"stake_wei": "1001"}))
+        assert not verify_envelope(env.model_copy(update={"metadata": {"extra": 1}}))
+        assert not verify_envelope(env.model_copy(update={"did": other.did}))
+        assert not verify_envelope(env.model_copy(update={"sig_ed25519": other.sig_ed25519}))
+        assert not verify_envelope(env.model_copy(update={"sig_ed25519": env.sig_ed25519[:-4]}))
+        assert not verify_envelope(env.model_copy(update={"sig_ed25519": "!" + env.sig_ed25519[1:]}))
+        assert not verify_envelope(env.model_copy(update={"did": "did:web:example.com"}))
+        assert not verify_envelope(env.model_copy(update={"did": "did:key:z0OIl"}))
+        assert not verify_envelope({"did": env.did})
+
+    def test_metadata_mutated_in_place(self):
+        """Test verification follows metadata changed after signing."""
+        from intentlayer_sdk.envelope import create_envelopes, verify_envelope, verify_envelopes
+        private_key = Ed25519PrivateKey.generate()
+        env = self._envelope(private_key, metadata={"amount": 1})
+        env.signing_bytes()
+        batch = create_envelopes(
+            ["a", "b"], model_id="gpt-4", tool_id="test_tool", did=self._did(private_key),
+            private_key=private_key, stake_wei=1000, metadata={"amount": 1}
+        )
+
+        env.metadata["amount"] = 999
+        batch.metadata["amount"] = 999
+
+        assert not verify_envelope(env)
+        assert not verify_envelope(env.model_dump())
+        assert verify_envelopes(batch) == [False, False]
+
+    def test_did_keys_cached(self):
+        """Test the public key of a DID is decoded once."""
+        from intentlayer_sdk.envelope import _did_key_public_key, verify_envelope
+        env = self._envelope(Ed25519PrivateKey.generate())
+        _did_key_public_key.cache_clear()
+
+        assert verify_envelope(env) and verify_envelope(env)
+        assert _did_key_public_key.cache_info().misses == 1
+        assert _did_key_public_key.cache_info().hits == 1
+
+    @pytest.mark.parametrize("max_workers", [1, 3])
+    def test_verify_envelopes(self, max_workers, monkeypatch):
+        """Test bulk verification of batches and envelope lists, serially and on threads."""
+        import intentlayer_sdk.envelope as envelope_module
+        from intentlayer_sdk.envelope import create_envelopes, verify_envelopes
+        monkeypatch.setattr(envelope_module, "_VERIFY_CHUNK", 2)
+        private_key = Ed25519PrivateKey.generate()
+        batch = create_envelopes(
+            [f"prompt {i}" for i in range(7)], model_id="gpt-4", tool_id="test_tool",
+            did=self._did(private_key), private_key=private_key, stake_wei=1000
+        )
+        envelopes = list(batch)
+        envelopes[3] = envelopes[3].model_copy(update={"prompt_sha256": "0" * 64})
+        envelopes[5] = envelopes[5].model_dump()
+
+        assert verify_envelopes(batch, max_workers=max_workers) == [True] * 7
+        assert verify_envelopes(envelopes, max_workers=max_workers) == [True, True, True, False, True, True, True]
+
+    def test_verify_envelopes_non_key_did(self):
+        """Test batches signed for a DID without an embedded key don't verify."""
+        from intentlayer_sdk.envelope import create_envelopes, verify_envelopes
+        batch = create_envelopes(
+            ["a", "b"], model_id="gpt-4", tool_id="test_tool", did="did:web:example.com",
+            private_key=Ed25519PrivateKey.generate(), stake_wei=1
+        )
+
+        assert verify_envelopes(batch) == [False, False]
@@ -0,0 +1,154 @@
+"""
+Tests for transaction fee pricing.
+"""
+from unittest.mock import MagicMock, PropertyMock
+
+import pytest
+from web3.exceptions import MethodUnavailable
+
+from intentlayer_sdk.fees import CachedFeeOracle, FeeOracle, get_fee_oracle
+from tests.test_helpers import create_test_client
+
+
+def _w3(gas_price=10**9, history=None):
+    w3 = MagicMock()
+    type(w3.eth).gas_price = PropertyMock(return_value=gas_price)
+    if isinstance(history, Exception):
+        w3.eth.fee_history.side_effect = history
+    else:
+        w3.eth.fee_history.return_value = history
+    return w3
+
+
+def test_legacy_quote_cached_for_ttl(monkeypatch):
+    """eth_gasPrice is read at most once per TTL"""
+    now = [0.0]
+    monkeypatch.setattr("intentlayer_sdk.fees.time.monotonic", lambda: now[0])
+    oracle = CachedFeeOracle(ttl=10)
+    w3 = _w3()
+
+    assert oracle.fees(w3) == {"gasPrice": 10**9}
+    now[0] = 5.0
+    oracle.fees(w3)
+    assert oracle.refreshes == 1
+
+    type(w3.eth).gas_price = PropertyMock(return_value=3 * 10**9)
+    now[0] = 11.0
+    assert oracle.fees(w3) == {"gasPrice": 3 * 10**9}
+    assert oracle.refreshes == 2
+
+
+def test_invalidate_forces_refresh():
+    """invalidate() drops the cached quote"""
+    oracle = CachedFeeOracle(ttl=60)
+    w3 = _w3()
+    oracle.fees(w3)
+    oracle.invalidate()
+    oracle.fees(w3)
+    assert oracle.refreshes == 2
+
+
+def test_eip1559_quote_from_fee_history():
+    """Type-2 fees use the median percentile tip and base fee headroom"""
+    history = {
+        "baseFeePerGas": [100, 110, 120],
+        "reward": [[2], [5], [3]],
+    }
+    oracle = CachedFeeOracle(eip1559=True, history_blocks=2, reward_percentile=40)
+
+    fees = oracle.fees(_w3(history=history))
+
+    assert fees == {"maxPriorityFeePerGas": 3, "maxFeePerGas": 2 * 120 + 3}
+
+
+def test_eip1559_min_priority_fee():
+    """The priority fee never drops below the configured floor"""
+    history = {"baseFeePerGas": [100, 100], "reward": [[0]]}
+    oracle = CachedFeeOracle(eip1559=True, min_priority_fee=7)
+
+    assert oracle.fees(_w3(history=history))["maxPriorityFeePerGas"] == 7
+
+
+def test_eip1559_falls_back_to_legacy():
+    """Chains without eth_feeHistory are priced with eth_gasPrice"""
+    oracle = CachedFeeOracle(eip1559=True, ttl=0)
+    w3 = _w3(history=ValueError("method not found"))
+
+    assert oracle.fees(w3) == {"gasPrice": 10**9}
+    assert oracle.fees(w3) == {"gasPrice": 10**9}
+    assert w3.eth.fee_history.call_count == 1
+
+
+@pytest.mark.parametrize("history", [MethodUnavailable("eth_feeHistory"), {"oldestBlock": 1, "reward": []}])
+def test_eip1559_unsupported_latches_legacy(history):
+    """A -32601 answer or a history without base fees disables EIP-1559 pricing"""
+    oracle = CachedFeeOracle(eip1559=True, ttl=0)
+    w3 = _w3(history=history)
+
+    oracle.fees(w3)
+    assert oracle.fees(w3) == {"gasPrice": 10**9}
+    assert w3.eth.fee_history.call_count == 1
+
+
+def test_transient_fee_history_error_keeps_eip1559():
+    """A timeout prices one quote with eth_gasPrice and retries fee history on the next refresh"""
+    oracle = CachedFeeOracle(eip1559=True, ttl=0)
+    w3 = _w3()
+    w3.eth.fee_history.side_effect = [
+        TimeoutError("read timed out"),
+        {"baseFeePerGas": [100, 100], "reward": [[4]]},
+    ]
+
+    assert oracle.fees(w3) == {"gasPrice": 10**9}
+    assert oracle.fees(w3) == {"maxPriorityFeePerGas": 4, "maxFeePerGas": 204}
+
+
+def test_oracle_shared_per_endpoint():
+    """Clients on the same RPC endpoint share one oracle per pricing mode"""
+    a = create_test_client(rpc_url="https://rpc-a.example.com")
+    b = create_test_client(rpc_url="https://rpc-a.example.com")
+    c = create_test_client(rpc_url="https://rpc-a.example.com", eip1559=True)
+
+    assert a.fee_oracle is b.fee_oracle
+    assert a.fee_oracle is not c.fee_oracle
+    assert c.fee_oracle.eip1559
+    assert get_fee_oracle("https://rpc-a.example.com") is a.fee_oracle
+
+
+def test_fee_oracle_is_abstract():
+    """Oracles must implement fees()"""
+    with pytest.raises(TypeError):
+        FeeOracle()
+
+
+def test_client_prices_with_oracle(test_payload):
+    """send_intent uses the oracle's fees, or the explicit override"""
+    class FixedOracle(FeeOracle):
+        def fees(self, w3):
+            return {"maxFeePerGas": 50, "maxPriorityFeePerGas": 2}
+
+    client = create_test_client(fee_oracle=FixedOracle())
+    client.did_registry_contract = None
+    client.w3 = MagicMock()
+    client.w3.eth.get_transaction_count.return_value = 0
+    client.w3.eth.send_raw_transaction.side_effect = lambda raw: b"\x01" * 32
+    client.recorder_contract = MagicMock()
+    fn = client.recorder_contract.functions.recordIntent.return_value
+    fn.estimate_gas.return_value = 100000
+    fn.build_transaction.side_effect = lambda params: {
+        **params, "to": "0x" + "00" * 20, "data": "0x", "chainId": 1
+    }
+    client.pin_to_ipfs = MagicMock(return_value="0x" + "ab" * 32)
+
+    client.send_intent("0x" + "11" * 32, test_payload, wait_for_receipt=False)
+    client.send_intent("0x" + "22" * 32, test_payload, wait_for_receipt=False, gas_price_override=9)
+
+    first, second = (c.args[0] for c in fn.build_transaction.call_args_list)
+    assert first["maxFeePerGas"] == 50 and "gasPrice" not in first
+    assert second["gasPrice"] == 9 and "maxFeePerGas" not in second
+
+
+def test_rejects_negative_ttl():
+    """A negative TTL is a configuration error"""
+    with pytest.raises(ValueError, match="ttl"):
+        CachedFeeOracle(ttl=-1)
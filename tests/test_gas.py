@@ -0,0 +1,153 @@
+"""
+Tests for the gas estimate cache.
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+from intentlayer_sdk.exceptions import TransactionError
+from intentlayer_sdk.gas import GasModel, is_out_of_gas_error
+from tests.test_helpers import TEST_CONTRACT, create_test_client
+
+
+def _hash(i):
+    return "0x" + f"{i:064x}"
+
+
+def test_cache_hit_skips_estimate():
+    """Repeated estimates for the same key run eth_estimateGas once"""
+    model = GasModel()
+    estimate = MagicMock(return_value=100000)
+    key = GasModel.key_for(TEST_CONTRACT, "recordIntent", b"\x00" * 32, b"\x01" * 34)
+
+    assert [model.estimate(key, estimate) for _ in range(5)] == [110000] * 5
+    assert estimate.call_count == 1
+    assert model.stats()["hits"] == 4
+    assert model.hit_rate == pytest.approx(0.8)
+
+
+def test_key_uses_length_classes():
+    """Arguments of the same ABI word length share a key"""
+    a = GasModel.key_for(TEST_CONTRACT, "register", "did:key:z" + "a" * 20)
+    b = GasModel.key_for(TEST_CONTRACT.lower(), "register", "did:key:z" + "b" * 20)
+    c = GasModel.key_for(TEST_CONTRACT, "register", "did:key:z" + "c" * 40)
+
+    assert a == b
+    assert a != c
+
+
+def test_entries_expire_by_ttl_and_uses(monkeypatch):
+    """Estimates are refreshed after ttl seconds or max_uses hits"""
+    now = [0.0]
+    monkeypatch.setattr("intentlayer_sdk.gas.time.monotonic", lambda: now[0])
+    model = GasModel(ttl=10, max_uses=2)
+    estimate = MagicMock(return_value=1000)
+
+    for _ in range(3):
+        model.estimate("k", estimate)
+    assert estimate.call_count == 1
+
+    model.estimate("k", estimate)       # third hit exceeds max_uses
+    assert estimate.call_count == 2
+
+    now[0] = 11.0
+    model.estimate("k", estimate)
+    assert estimate.call_count == 3
+
+
+def test_failed_estimate_is_not_cached():
+    """Errors from the estimate function propagate and leave the cache empty"""
+    model = GasModel()
+    with pytest.raises(ValueError):
+        model.estimate("k", MagicMock(side_effect=ValueError("reverted")))
+    assert model.stats()["size"] == 0
+
+
+def test_out_of_gas_receipt_invalidates():
+    """A failed receipt that used its whole gas limit drops the estimate"""
+    model = GasModel()
+    gas = model.estimate("k", lambda: 1000)
+    model.watch(b"\x01", "k", gas)
+    model.watch(b"\x02", "k", gas)
+
+    model.observe_receipt(b"\x01", {"status": 1, "gasUsed": 900})
+    assert model.stats()["size"] == 1
+
+    model.observe_receipt(b"\x02", {"status": 0, "gasUsed": gas})
+    assert model.stats()["size"] == 0
+    assert model.invalidations == 1
+
+
+@pytest.mark.parametrize("message, expected", [
+    ("out of gas", True),
+    ("intrinsic gas too low", True),
+    ("gas required exceeds allowance (21000)", True),
+    ("nonce too low", False),
+])
+def test_is_out_of_gas_error(message, expected):
+    """Out-of-gas errors are recognised by message"""
+    assert is_out_of_gas_error(ValueError(message)) is expected
+
+
+@pytest.fixture
+def client():
+    """Client with a gas model and mocked chain"""
+    c = create_test_client(gas_model=True)
+    c.did_registry_contract = None
+    c.w3 = MagicMock()
+    c.w3.eth.get_transaction_count.return_value = 0
+    c.w3.eth.send_raw_transaction.side_effect = lambda raw: b"\x01" * 32
+    c.w3.eth.wait_for_transaction_receipt.side_effect = lambda tx_hash, **kw: {
+        "transactionHash": tx_hash, "status": 1, "gasUsed": 50000
+    }
+    c.recorder_contract = MagicMock()
+    fn = c.recorder_contract.functions.recordIntent.return_value
+    fn.estimate_gas.return_value = 100000
+    fn.build_transaction.side_effect = lambda params: {
+        **params, "to": "0x" + "00" * 20, "data": "0x", "chainId": 1
+    }
+    c.pin_to_ipfs = MagicMock(return_value="0x" + "ab" * 32)
+    return c
+
+
+def test_client_disabled_by_default():
+    """Gas caching is opt-in"""
+    assert create_test_client().gas_model is None
+    model = GasModel()
+    assert create_test_client(gas_model=model).gas_model is model
+
+
+def test_client_reuses_cached_estimate(client, test_payload):
+    """Sends with the same call shape estimate gas once"""
+    for i in range(5):
+        client.send_intent(_hash(i), test_payload)
+
+    fn = client.recorder_contract.functions.recordIntent.return_value
+    assert fn.estimate_gas.call_count == 1
+    assert all(c.args[0]["gas"] == 110000 for c in fn.build_transaction.call_args_list)
+
+
+def test_client_invalidates_on_out_of_gas_send(client, test_payload):
+    """A send rejected for too little gas forces a fresh estimate"""
+    client.send_intent(_hash(1), test_payload)
+    client.w3.eth.send_raw_transaction.side_effect = ValueError("intrinsic gas too low")
+
+    with pytest.raises(TransactionError):
+        client.send_intent(_hash(2), test_payload)
+
+    client.w3.eth.send_raw_transaction.side_effect = lambda raw: b"\x01" * 32
+    client.send_intent(_hash(3), test_payload)
+    fn = client.recorder_contract.functions.recordIntent.return_value
+    assert fn.estimate_gas.call_count == 2
+
+
+def test_client_invalidates_on_out_of_gas_receipt(client, test_payload):
+    """A reverted receipt that used all its gas forces a fresh estimate"""
+    client.w3.eth.wait_for_transaction_receipt.side_effect = lambda tx_hash, **kw: {
+        "transactionHash": tx_hash, "status": 0, "gasUsed": 110000
+    }
+    client.send_intent(_hash(1), test_payload)
+    client.send_intent(_hash(2), test_payload)
+
+    fn = client.recorder_contract.functions.recordIntent.return_value
+    assert fn.estimate_gas.call_count == 2
@@ -0,0 +1,64 @@
+"""
+Cold-start guards: importing the SDK must not load heavy dependencies.
+"""
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ("web3", "eth_account", "pydantic", "cryptography", "grpc", "aiohttp")
+
+# Generous budget for the package's own cumulative import time (microseconds);
+# the lazy package imports in a few tens of milliseconds, web3 alone takes ~1s
+IMPORT_BUDGET_US = 300_000
+
+
+def _importtime(statement):
+    """Run a statement under -X importtime and return {module: cumulative microseconds}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, timeout=60, check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def _top_level(modules):
+    return {name.split(".")[0] for name in modules}
+
+
+@pytest.mark.parametrize("statement", [
+    "import intentlayer_sdk",
+    "from intentlayer_sdk import NetworkConfig, IntentLayerError, __version__",
+    "import intentlayer_sdk.gateway",
+    "import intent_cli.__main__",
+])
+def test_import_does_not_load_heavy_dependencies(statement):
+    """Light entry points leave web3, pydantic, grpc and friends unloaded"""
+    loaded = _top_level(_importtime(statement)) & set(HEAVY_MODULES)
+    assert not loaded, f"{statement!r} imported {sorted(loaded)}"
+
+
+def test_package_import_time_budget():
+    """import intentlayer_sdk stays within the cold-start budget"""
+    modules = _importtime("import intentlayer_sdk")
+    assert modules["intentlayer_sdk"] < IMPORT_BUDGET_US
+
+
+def test_lazy_attributes_resolve():
+    """Lazily exported names still resolve to the real objects"""
+    import intentlayer_sdk
+    from intentlayer_sdk.client import IntentClient
+    from intentlayer_sdk.config import NetworkConfig
+
+    assert intentlayer_sdk.IntentClient is IntentClient
+    assert intentlayer_sdk.NETWORKS == NetworkConfig.load_networks()
+    assert set(intentlayer_sdk.__all__) <= set(dir(intentlayer_sdk))
+    with pytest.raises(AttributeError):
+        intentlayer_sdk.DoesNotExist
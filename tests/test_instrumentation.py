@@ -0,0 +1,199 @@
+"""
+Tests for per-stage instrumentation hooks.
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+from intentlayer_sdk.gateway.client import GatewayClient, TxReceipt
+from intentlayer_sdk.instrumentation import (
+    Instrumentation, InstrumentationListener, OpenTelemetryListener, stage
+)
+from tests.test_helpers import create_test_client
+
+
+class Recorder(InstrumentationListener):
+    """Collects every event it is sent"""
+
+    def __init__(self):
+        self.started = []
+        self.ended = []
+
+    def on_stage_start(self, event):
+        self.started.append(event)
+
+    def on_stage_end(self, event):
+        self.ended.append(event)
+
+    def stages(self):
+        return [(e.stage, e.attempt, e.error) for e in self.ended]
+
+
+def _mock_client_chain(client):
+    """Wire a test client to mocked contract and eth calls"""
+    client.w3 = MagicMock()
+    client.w3.eth.get_transaction_count.return_value = 4
+    client.w3.eth.gas_price = 10**9
+    client.w3.eth.send_raw_transaction.return_value = b"\x12" * 32
+    client.w3.eth.wait_for_transaction_receipt.return_value = {"status": 1}
+    client.recorder_contract = MagicMock()
+    client.recorder_contract.functions.recordIntent.return_value.estimate_gas.return_value = 100000
+    client.recorder_contract.functions.recordIntent.return_value.build_transaction.side_effect = (
+        lambda params: {**params, "to": "0x" + "00" * 20, "data": "0x", "chainId": 1}
+    )
+    client.did_registry_contract = None
+    client.pin_to_ipfs = MagicMock(return_value="0x" + "ab" * 32)
+    return client
+
+
+def test_send_intent_reports_each_stage(test_payload):
+    """Listeners see every stage of send_intent, then the call as a whole"""
+    recorder = Recorder()
+    client = _mock_client_chain(create_test_client(instrumentation=Instrumentation([recorder])))
+
+    result = client.send_intent("0x" + "11" * 32, test_payload)
+
+    assert [stage for stage, _, _ in recorder.stages()] == [
+        "chain_id", "gateway", "validate", "pin", "gas", "fees", "nonce", "sign", "send", "receipt", None
+    ]
+    assert [e.stage for e in recorder.started][-1] == "receipt"
+    assert recorder.started[0].stage is None
+    assert len({e.call_id for e in recorder.ended}) == 1
+    assert all(e.operation == "send_intent" and e.duration >= 0 for e in recorder.ended)
+    assert "timings" not in result
+
+
+def test_retries_increment_attempt_and_report_errors(test_payload):
+    """A resent transaction is a second attempt; the failed one carries its error class"""
+    recorder = Recorder()
+    client = _mock_client_chain(create_test_client(instrumentation=Instrumentation([recorder])))
+    client.w3.eth.send_raw_transaction.side_effect = [
+        ValueError({"code": -32000, "message": "nonce too low"}),
+        b"\x12" * 32,
+    ]
+
+    client.send_intent("0x" + "11" * 32, test_payload, wait_for_receipt=False)
+
+    sends = [(attempt, error) for stage, attempt, error in recorder.stages() if stage == "send"]
+    assert sends == [(1, "ValueError"), (2, None)]
+    assert ("nonce", 2, None) in recorder.stages()
+
+
+def test_failed_call_reports_error(test_payload):
+    """The call-level end event names the exception the caller receives"""
+    recorder = Recorder()
+    client = _mock_client_chain(create_test_client(instrumentation=Instrumentation([recorder])))
+    client.pin_to_ipfs.side_effect = RuntimeError("pinner down")
+
+    with pytest.raises(Exception) as exc:
+        client.send_intent("0x" + "11" * 32, test_payload)
+
+    assert ("pin", 1, "RuntimeError") in recorder.stages()
+    assert recorder.ended[-1].stage is None
+    assert recorder.ended[-1].error == type(exc.value).__name__
+
+
+def test_collect_timings_attaches_breakdown(test_payload):
+    """collect_timings works without listeners and sums stages per name"""
+    client = _mock_client_chain(create_test_client(collect_timings=True))
+
+    result = client.send_intent("0x" + "11" * 32, test_payload)
+
+    timings = result["timings"]
+    assert {"pin", "sign", "send", "receipt", "total"} <= set(timings)
+    assert timings["total"] >= sum(v for k, v in timings.items() if k != "total")
+
+
+def test_disabled_instrumentation_is_a_no_op(test_payload):
+    """Without a listener or an active call, stages share one no-op context"""
+    hub = Instrumentation()
+    client = _mock_client_chain(create_test_client(instrumentation=hub))
+
+    assert stage("pin") is stage("send")
+    assert hub.call("send_intent") is stage("pin")
+    assert "timings" not in client.send_intent("0x" + "11" * 32, test_payload)
+
+
+def test_listener_errors_are_swallowed(test_payload):
+    """A broken listener does not break the instrumented call"""
+    broken = MagicMock(spec=InstrumentationListener)
+    broken.on_stage_start.side_effect = RuntimeError("listener bug")
+    recorder = Recorder()
+    hub = Instrumentation([broken])
+    hub.add_listener(recorder)
+    client = _mock_client_chain(create_test_client(instrumentation=hub))
+
+    client.send_intent("0x" + "11" * 32, test_payload)
+    hub.remove_listener(recorder)
+    client.send_intent("0x" + "11" * 32, test_payload)
+
+    assert recorder.stages()[-1] == (None, 1, None)
+    assert len({e.call_id for e in recorder.ended}) == 1
+    assert broken.on_stage_end.called
+
+
+def test_register_did_reports_stages():
+    """register_did reports the DID lookup, gas, signing and receipt stages"""
+    recorder = Recorder()
+    client = create_test_client(instrumentation=Instrumentation([recorder]), collect_timings=True)
+    client.w3 = MagicMock()
+    client.w3.eth.get_transaction_count.return_value = 4
+    client.w3.eth.gas_price = 10**9
+    client.w3.eth.send_raw_transaction.return_value = b"\x12" * 32
+    client.w3.eth.wait_for_transaction_receipt.return_value = {"status": 1}
+    client.resolve_did = MagicMock(return_value=("0x" + "00" * 20, False))
+    client.did_registry_contract = MagicMock()
+    client.did_registry_contract.functions.register.return_value.estimate_gas.return_value = 50000
+    client.did_registry_contract.functions.register.return_value.build_transaction.side_effect = (
+        lambda params: {**params, "to": "0x" + "00" * 20, "data": "0x", "chainId": 1}
+    )
+
+    result = client.register_did("did:key:z6Mk", force=True)
+
+    assert [s for s, _, _ in recorder.stages()] == [
+        "chain_id", "did_lookup", "gas", "fees", "nonce", "sign", "send", "receipt", None
+    ]
+    assert recorder.ended[-1].operation == "register_did"
+    assert "did_lookup" in result["timings"]
+
+
+def test_gateway_register_did_reports_attempts():
+    """Each gateway attempt is an rpc stage, with backoff stages between them"""
+    recorder = Recorder()
+    client = object.__new__(GatewayClient)
+    client.api_key = client.bearer_token = None
+    client.timeout = 5
+    client.instrumentation = Instrumentation([recorder])
+    client.stub = MagicMock()
+    client.stub.RegisterDid.side_effect = [
+        ConnectionError("gateway unavailable"),
+        TxReceipt(hash="0xabc", success=True),
+    ]
+
+    receipt = client.register_did("did:key:z6Mk", pub_key=b"\x01" * 32)
+
+    assert receipt.success
+    assert recorder.stages() == [
+        ("rpc", 1, "ConnectionError"), ("backoff", 1, None), ("rpc", 2, None), (None, 1, None)
+    ]
+    assert recorder.ended[-1].operation == "gateway.register_did"
+
+
+def test_opentelemetry_listener_creates_nested_spans(test_payload):
+    """The OpenTelemetry adapter records a parent span with a child per stage"""
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    listener = OpenTelemetryListener(provider.get_tracer("test"))
+    client = _mock_client_chain(create_test_client(instrumentation=Instrumentation([listener])))
+
+    client.send_intent("0x" + "11" * 32, test_payload)
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    parent = spans["intentlayer.send_intent"]
+    assert spans["intentlayer.send_intent.sign"].parent.span_id == parent.context.span_id
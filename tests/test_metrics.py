@@ -0,0 +1,141 @@
+"""
+Tests for the in-process metrics registry.
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+from intentlayer_sdk.exceptions import PinningError
+from intentlayer_sdk.gateway.client import GatewayClient, TxReceipt
+from intentlayer_sdk.gateway.exceptions import QuotaExceededError, RegisterError
+from intentlayer_sdk.identity.registration import IdentityManager
+from intentlayer_sdk.metrics import MetricsRegistry, get_metrics_registry
+from tests.test_helpers import TEST_PINNER_URL, create_test_client
+
+
+def test_render_prometheus_text():
+    """Counters and cumulative histogram buckets render in the text format"""
+    registry = MetricsRegistry()
+    requests_total = registry.counter("app_requests_total", "Requests served", ("method",))
+    latency = registry.histogram("app_latency_seconds", "Latency", buckets=(0.1, 1))
+    requests_total.inc(method="GET")
+    requests_total.inc(2, method='P"OST')
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(3)
+
+    text = registry.render()
+
+    assert (
+        "# HELP app_latency_seconds Latency\n"
+        "# TYPE app_latency_seconds histogram\n"
+        'app_latency_seconds_bucket{le="0.1"} 1\n'
+        'app_latency_seconds_bucket{le="1"} 2\n'
+        'app_latency_seconds_bucket{le="+Inf"} 3\n'
+        "app_latency_seconds_sum 3.55\n"
+        "app_latency_seconds_count 3\n"
+        "# HELP app_requests_total Requests served\n"
+        "# TYPE app_requests_total counter\n"
+        'app_requests_total{method="GET"} 1\n'
+        'app_requests_total{method="P\\"OST"} 2\n'
+    ) in text
+    assert "# TYPE intentlayer_intents_sent_total counter" in text
+
+
+def test_metric_definitions_are_checked():
+    """Labels must match, counters only go up and names keep one definition"""
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs_total", "Jobs", ("queue",))
+
+    assert registry.counter("jobs_total", "Jobs", ("queue",)) is counter
+    with pytest.raises(ValueError):
+        counter.inc(kind="x")
+    with pytest.raises(ValueError):
+        counter.inc(-1, queue="a")
+    with pytest.raises(ValueError):
+        registry.histogram("jobs_total", "Jobs", labelnames=("queue",))
+
+
+def test_send_intent_updates_metrics(test_payload):
+    """A confirmed intent counts as sent and records its receipt wait and gas used"""
+    registry = MetricsRegistry()
+    client = create_test_client(metrics=registry)
+    client.w3 = MagicMock()
+    client.w3.eth.get_transaction_count.return_value = 4
+    client.w3.eth.gas_price = 10**9
+    client.w3.eth.send_raw_transaction.return_value = b"\x12" * 32
+    client.w3.eth.wait_for_transaction_receipt.return_value = {"status": 1, "gasUsed": 60_000}
+    client.recorder_contract = MagicMock()
+    client.recorder_contract.functions.recordIntent.return_value.estimate_gas.return_value = 100000
+    client.recorder_contract.functions.recordIntent.return_value.build_transaction.side_effect = (
+        lambda params: {**params, "to": "0x" + "00" * 20, "data": "0x", "chainId": 1}
+    )
+    client.did_registry_contract = None
+    client.pin_to_ipfs = MagicMock(return_value="0x" + "ab" * 32)
+
+    client.send_intent("0x" + "11" * 32, test_payload)
+    client.pin_to_ipfs.side_effect = PinningError("pinner down")
+    with pytest.raises(PinningError):
+        client.send_intent("0x" + "11" * 32, test_payload)
+
+    assert registry.intents_sent.value() == 1
+    assert registry.intent_failures.value(error="PinningError") == 1
+    assert registry.receipt_wait.count() == 1
+    assert registry.gas_used.sum() == 60_000
+    assert get_metrics_registry().intents_sent.value() == 0
+
+
+def test_pin_retries_and_cache_hits(real_pin_to_ipfs, requests_mock):
+    """Pin retries, results and cache hits go to the process-wide registry by default"""
+    requests_mock.post(f"{TEST_PINNER_URL}/pin", [
+        {"status_code": 503},
+        {"json": {"cid": "QmTest"}, "headers": {"Content-Type": "application/json"}},
+    ])
+    client = create_test_client()
+
+    assert client.pin_to_ipfs({"a": 1}) == "QmTest"
+    assert client.pin_to_ipfs({"a": 1}) == "QmTest"
+
+    registry = get_metrics_registry()
+    assert registry.pin_retries.value() == 1
+    assert registry.pins.value(result="success") == 1
+    assert registry.cache_requests.value(cache="pin", result="miss") == 1
+    assert registry.cache_requests.value(cache="pin", result="hit") == 1
+
+
+def test_gateway_retries_and_quota():
+    """Gateway retries are counted by status and quota rejections counted once"""
+    registry = MetricsRegistry()
+    client = object.__new__(GatewayClient)
+    client.api_key = client.bearer_token = None
+    client.timeout = 5
+    client._metrics = registry
+    client.stub = MagicMock()
+    client.stub.RegisterDid.side_effect = [
+        ConnectionError("gateway unavailable"),
+        TxReceipt(success=False, error="quota", error_code=RegisterError.DID_QUOTA_EXCEEDED),
+    ]
+
+    with pytest.raises(QuotaExceededError):
+        client.register_did("did:key:z6Mk", pub_key=b"\x01" * 32)
+
+    assert registry.gateway_retries.value(code="ConnectionError") == 1
+    assert registry.quota_exceeded.value() == 1
+
+
+def test_identity_registration_outcomes():
+    """ensure_registered outcomes are counted by result"""
+    identity = MagicMock()
+    identity.did = "did:key:test123"
+    gateway_client = MagicMock()
+    gateway_client.register_did.side_effect = [QuotaExceededError("quota"), MagicMock()]
+    manager = IdentityManager(identity=identity, gateway_client=gateway_client)
+
+    with pytest.raises(QuotaExceededError):
+        manager.ensure_registered()
+    assert manager.ensure_registered() is True
+    assert manager.ensure_registered() is False
+
+    registrations = get_metrics_registry().identity_registrations
+    assert registrations.value(result="quota_exceeded") == 1
+    assert registrations.value(result="registered") == 1
@@ -0,0 +1,126 @@
+"""
+Tests for Multicall3-based bulk DID resolution.
+"""
+import threading
+
+import pytest
+from eth_abi import decode, encode
+from web3 import Web3
+from web3.providers import JSONBaseProvider
+
+from intentlayer_sdk.exceptions import TransactionError
+from intentlayer_sdk.multicall import MULTICALL3_ADDRESS, chunk_calls
+from tests.test_helpers import create_test_client
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+RESOLVE_SELECTOR = bytes.fromhex("461a4478")
+AGGREGATE3_SELECTOR = Web3.keccak(text="aggregate3((address,bool,bytes)[])")[:4]
+
+
+def _owner(did):
+    return Web3.to_checksum_address(Web3.keccak(text=did)[:20])
+
+
+class MulticallChain(JSONBaseProvider):
+    """Provider emulating Multicall3 in front of a DID registry"""
+
+    def __init__(self, registered):
+        super().__init__()
+        self.registered = registered      # did -> active, missing DIDs revert
+        self.malformed = set()
+        self.eth_calls = 0
+        self.fail = False
+        self.lock = threading.Lock()
+
+    def _resolve(self, calldata):
+        assert calldata[:4] == RESOLVE_SELECTOR
+        (did,) = decode(["string"], calldata[4:])
+        if did in self.malformed:
+            return True, b"\x01"
+        if did not in self.registered:
+            return False, b""
+        return True, encode(["address", "bool"], [_owner(did), self.registered[did]])
+
+    def make_request(self, method, params):
+        if method != "eth_call":
+            return {"jsonrpc": "2.0", "id": 1, "result": "0x1"}
+        with self.lock:
+            self.eth_calls += 1
+        if self.fail:
+            return {"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": "boom"}}
+        tx = params[0]
+        assert tx["to"].lower() == MULTICALL3_ADDRESS.lower()
+        data = bytes.fromhex(tx["data"][2:])
+        assert data[:4] == AGGREGATE3_SELECTOR
+        (calls,) = decode(["(address,bool,bytes)[]"], data[4:])
+        results = [self._resolve(calldata) for _, _, calldata in calls]
+        out = encode(["(bool,bytes)[]"], [results])
+        return {"jsonrpc": "2.0", "id": 1, "result": "0x" + out.hex()}
+
+
+@pytest.fixture
+def chain():
+    return MulticallChain({f"did:key:z{i}": i % 3 != 0 for i in range(500)})
+
+
+@pytest.fixture
+def client(chain):
+    c = create_test_client()
+    c.w3 = Web3(chain)
+    c.did_registry_contract = c.w3.eth.contract(
+        address=c.did_registry_address, abi=c.DID_REGISTRY_ABI
+    )
+    return c
+
+
+def test_resolve_dids_matches_single_semantics(client, chain):
+    """Active, inactive, unregistered and malformed DIDs all decode"""
+    chain.malformed.add("did:key:z5")
+    dids = ["did:key:z1", "did:key:z3", "did:key:zmissing", "did:key:z5"]
+
+    result = client.resolve_dids(dids)
+
+    assert list(result) == dids
+    assert result["did:key:z1"] == (_owner("did:key:z1"), True)
+    assert result["did:key:z3"] == (_owner("did:key:z3"), False)
+    assert result["did:key:zmissing"] == (ZERO_ADDRESS, False)
+    assert result["did:key:z5"] == (ZERO_ADDRESS, False)
+    assert chain.eth_calls == 1
+
+
+def test_resolve_dids_chunks_by_calldata(client, chain):
+    """Large inputs are split into several multicall requests"""
+    dids = [f"did:key:z{i}" for i in range(500)]
+
+    result = client.resolve_dids(dids, max_calldata_bytes=8_000, use_cache=False)
+
+    assert len(result) == 500
+    assert all(result[d] == (_owner(d), chain.registered[d]) for d in dids)
+    assert 1 < chain.eth_calls < 500
+
+
+def test_resolve_dids_uses_cache(client, chain):
+    """Cached DIDs are not queried again and results fill the cache"""
+    client.resolve_dids(["did:key:z1", "did:key:z2"])
+    client.resolve_dids(["did:key:z1", "did:key:z2"])
+    assert chain.eth_calls == 1
+
+    assert client.resolve_did("did:key:z1") == (_owner("did:key:z1"), True)
+    assert chain.eth_calls == 1
+
+
+def test_resolve_dids_request_failure(client, chain):
+    """A failed multicall request raises TransactionError"""
+    chain.fail = True
+    with pytest.raises(TransactionError, match="Failed to resolve DIDs"):
+        client.resolve_dids(["did:key:z1"])
+
+
+def test_chunk_calls_respects_limit():
+    """Each chunk stays within the size limit and no call is dropped"""
+    calls = [("0x" + "11" * 20, True, b"\x00" * 100)] * 50
+    chunks = chunk_calls(calls, 1000)
+
+    assert sum(len(c) for c in chunks) == 50
+    assert all(len(c) == 3 for c in chunks[:-1])
+    assert chunk_calls(calls[:1], 10) == [calls[:1]]
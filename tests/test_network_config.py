@@ -112,7 +112,36 @@ class TestNetworkConfig:
         
         # Reset cache for other tests
         NetworkConfig._networks_cache = None
-    
+
+    def test_get_rpc_endpoints(self):
+        """Test weighted RPC endpoint lists, with rpc kept as the primary."""
+        NetworkConfig._networks_cache = {
+            "single": MOCK_NETWORKS["test-network"],
+            "pooled": {
+                **MOCK_NETWORKS["test-network"],
+                "rpcs": [
+                    "https://b.example.com",
+                    {"url": "https://test.example.com", "weight": 2},
+                    {"url": "https://c.example.com"},
+                ],
+            },
+        }
+
+        assert NetworkConfig.get_rpc_endpoints("single") == [("https://test.example.com", 1.0)]
+        assert NetworkConfig.get_rpc_endpoints("pooled") == [
+            ("https://test.example.com", 2.0),
+            ("https://b.example.com", 1.0),
+            ("https://c.example.com", 1.0),
+        ]
+        assert NetworkConfig.get_rpc_url("pooled") == "https://test.example.com"
+
+        # An override replaces the whole list
+        with patch.dict(os.environ, {"POOLED_RPC_URL": "https://env.example.com"}):
+            assert NetworkConfig.get_rpc_endpoints("pooled") == [("https://env.example.com", 1.0)]
+
+        # Reset cache for other tests
+        NetworkConfig._networks_cache = None
+
     def test_get_chain_id(self):
         """Test getting chain ID from network config."""
         # Set the cache directly for testing
@@ -0,0 +1,245 @@
+"""
+Tests for the process-wide nonce manager.
+"""
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from intentlayer_sdk.exceptions import TransactionError
+from intentlayer_sdk.nonce import (
+    NonceManager, get_nonce_manager, is_already_known, is_ambiguous_send_error, is_nonce_error
+)
+from tests.test_helpers import create_test_client, TEST_PRIV_KEY
+
+
+def test_allocate_seeds_from_chain_once():
+    """The chain is queried only for the first allocation"""
+    manager = NonceManager("0xabc")
+    fetch = MagicMock(return_value=7)
+
+    assert [manager.allocate(fetch) for _ in range(3)] == [7, 8, 9]
+    assert fetch.call_count == 1
+
+
+def test_allocate_is_thread_safe():
+    """Concurrent allocations never hand out the same nonce twice"""
+    manager = NonceManager("0xabc")
+    results = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(200):
+            n = manager.allocate(lambda: 0)
+            with lock:
+                results.append(n)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sorted(results) == list(range(1600))
+
+
+def test_released_nonce_is_reused_first():
+    """A nonce that was never broadcast fills the gap before the counter advances"""
+    manager = NonceManager("0xabc")
+    a = manager.allocate(lambda: 0)
+    b = manager.allocate(lambda: 0)
+    manager.release(a)
+
+    assert manager.allocate(lambda: 0) == a
+    assert manager.allocate(lambda: 0) == b + 1
+
+
+def test_resync_after_nonce_too_low():
+    """Resync jumps the counter forward when the chain is ahead"""
+    manager = NonceManager("0xabc")
+    manager.allocate(lambda: 3)
+    manager.resync(lambda: 10)
+
+    assert manager.allocate(lambda: 0) == 10
+
+
+def test_resync_fills_gaps_from_dropped_transactions():
+    """Nonces between the chain count and the counter are refilled if dropped"""
+    manager = NonceManager("0xabc", gap_timeout=0)
+    for _ in range(4):
+        manager.mark_sent(manager.allocate(lambda: 5))   # 5, 6, 7, 8
+
+    # Chain only saw 5 and 6; 7 was dropped, 8 is stuck behind it
+    manager.resync(lambda: 7)
+
+    assert manager.allocate(lambda: 0) == 7
+    assert manager.allocate(lambda: 0) == 8
+    assert manager.allocate(lambda: 0) == 9
+
+
+def test_resync_keeps_recent_in_flight_nonces():
+    """Recently sent transactions are not treated as gaps"""
+    manager = NonceManager("0xabc", gap_timeout=3600)
+    for _ in range(3):
+        manager.mark_sent(manager.allocate(lambda: 0))
+
+    manager.resync(lambda: 1)
+
+    assert manager.in_flight == (1, 2)
+    assert manager.allocate(lambda: 0) == 3
+
+
+def test_in_flight_entries_are_pruned(monkeypatch):
+    """Fire-and-forget sends age out after gap_timeout; a confirmation clears lower nonces"""
+    now = [0.0]
+    monkeypatch.setattr("intentlayer_sdk.nonce.time.monotonic", lambda: now[0])
+    manager = NonceManager("0xabc", gap_timeout=60)
+    for _ in range(5):
+        manager.mark_sent(manager.allocate(lambda: 0))   # 0-4
+
+    now[0] = 30.0
+    manager.mark_sent(manager.allocate(lambda: 0))       # 5
+    assert manager.in_flight == (0, 1, 2, 3, 4, 5)
+
+    now[0] = 61.0
+    manager.mark_sent(manager.allocate(lambda: 0))       # 6
+    assert manager.in_flight == (5, 6)
+
+    manager.mark_sent(manager.allocate(lambda: 0))       # 7
+    manager.mark_confirmed(6)
+    assert manager.in_flight == (7,)
+
+
+def test_reserved_nonces_are_skipped():
+    """Nonces reserved before or after seeding are never allocated"""
+    seeded_later = NonceManager("0xabc")
+    seeded_later.reserve([5, 7])
+    assert seeded_later.allocate(lambda: 5) == 8
+    assert seeded_later.in_flight == (5, 7)
+
+    seeded = NonceManager("0xabc")
+    seeded.allocate(lambda: 3)
+    seeded.reserve([9])
+    assert seeded.allocate(lambda: 0) == 10
+
+
+def test_is_nonce_error():
+    """Node error messages for nonce rejections are recognised"""
+    assert is_nonce_error(ValueError({"code": -32000, "message": "nonce too low"}))
+    assert is_nonce_error(Exception("Nonce too high. Expected nonce to be 3"))
+    assert not is_nonce_error(Exception("insufficient funds for gas"))
+    assert not is_nonce_error(ValueError({"code": -32000, "message": "already known"}))
+
+
+def test_send_error_classification():
+    """Already-known and transport failures are told apart from rejections"""
+    import requests
+
+    assert is_already_known(ValueError({"code": -32000, "message": "already known"}))
+    assert is_already_known(Exception("known transaction: 0xabc"))
+    assert not is_already_known(Exception("nonce too low"))
+    assert is_ambiguous_send_error(requests.exceptions.ReadTimeout("read timed out"))
+    assert is_ambiguous_send_error(ConnectionError("connection reset"))
+    assert not is_ambiguous_send_error(ValueError("insufficient funds for gas"))
+
+
+def test_managers_shared_per_signer_and_chain():
+    """Clients with the same signer and chain share one manager"""
+    a = create_test_client(expected_chain_id=1)
+    b = create_test_client(expected_chain_id=1)
+    c = create_test_client(expected_chain_id=300)
+
+    assert a.nonce_manager is b.nonce_manager
+    assert a.nonce_manager is not c.nonce_manager
+    assert get_nonce_manager(a.address, 1) is a.nonce_manager
+
+
+def _mock_client_chain(client, pending=4):
+    """Wire a test client to mocked contract and eth calls"""
+    client.w3 = MagicMock()
+    client.w3.eth.get_transaction_count.return_value = pending
+    client.w3.eth.send_raw_transaction.return_value = b"\x12" * 32
+    client.recorder_contract = MagicMock()
+    client.recorder_contract.functions.recordIntent.return_value.estimate_gas.return_value = 100000
+    client.recorder_contract.functions.recordIntent.return_value.build_transaction.side_effect = (
+        lambda params: {**params, "to": "0x" + "00" * 20, "data": "0x", "chainId": 1}
+    )
+    client.did_registry_contract = None
+    client.pin_to_ipfs = MagicMock(return_value="0x" + "ab" * 32)
+    return client
+
+
+def test_send_intent_uses_local_counter(test_payload):
+    """Consecutive intents get consecutive nonces with one chain lookup"""
+    client = _mock_client_chain(create_test_client())
+
+    for _ in range(3):
+        client.send_intent("0x" + "11" * 32, test_payload, wait_for_receipt=False)
+
+    built = client.recorder_contract.functions.recordIntent.return_value.build_transaction
+    assert [c.args[0]["nonce"] for c in built.call_args_list] == [4, 5, 6]
+    assert client.w3.eth.get_transaction_count.call_count == 1
+
+
+def test_send_intent_resyncs_on_nonce_error(test_payload):
+    """A nonce-too-low rejection resyncs and resends with the chain's nonce"""
+    client = _mock_client_chain(create_test_client(), pending=4)
+    client.w3.eth.get_transaction_count.side_effect = [4, 9]
+    client.w3.eth.send_raw_transaction.side_effect = [
+        ValueError({"code": -32000, "message": "nonce too low"}),
+        b"\x12" * 32,
+    ]
+
+    client.send_intent("0x" + "11" * 32, test_payload, wait_for_receipt=False)
+
+    built = client.recorder_contract.functions.recordIntent.return_value.build_transaction
+    assert [c.args[0]["nonce"] for c in built.call_args_list] == [4, 9]
+    assert client.nonce_manager.in_flight == (9,)
+
+
+def test_send_failure_releases_nonce(test_payload):
+    """A nonce whose transaction the node rejected is reused by the next send"""
+    client = _mock_client_chain(create_test_client())
+    client.w3.eth.send_raw_transaction.side_effect = [
+        ValueError({"code": -32000, "message": "insufficient funds for gas"}),
+        b"\x12" * 32,
+    ]
+
+    with pytest.raises(Exception, match="insufficient funds"):
+        client.send_intent("0x" + "11" * 32, test_payload, wait_for_receipt=False)
+    client.send_intent("0x" + "11" * 32, test_payload, wait_for_receipt=False)
+
+    built = client.recorder_contract.functions.recordIntent.return_value.build_transaction
+    assert [c.args[0]["nonce"] for c in built.call_args_list] == [4, 4]
+
+
+def test_ambiguous_send_failure_keeps_nonce(test_payload):
+    """A nonce whose transaction may have reached the node is not handed out again"""
+    client = _mock_client_chain(create_test_client())
+    client.w3.eth.send_raw_transaction.side_effect = [
+        ConnectionError("connection reset"),
+        b"\x12" * 32,
+    ]
+
+    with pytest.raises(TransactionError, match="Failed to send transaction"):
+        client.send_intent("0x" + "11" * 32, test_payload, wait_for_receipt=False)
+    client.send_intent("0x" + "11" * 32, test_payload, wait_for_receipt=False)
+
+    built = client.recorder_contract.functions.recordIntent.return_value.build_transaction
+    assert [c.args[0]["nonce"] for c in built.call_args_list] == [4, 5]
+    assert client.w3.eth.get_transaction_count.call_count == 2
+
+
+def test_already_known_counts_as_sent(test_payload):
+    """A transaction the node already has is not re-signed with a new nonce"""
+    from web3 import Web3
+
+    client = _mock_client_chain(create_test_client())
+    client.w3.eth.send_raw_transaction.side_effect = ValueError({"code": -32000, "message": "already known"})
+
+    result = client.send_intent("0x" + "11" * 32, test_payload, wait_for_receipt=False)
+
+    sent = client.w3.eth.send_raw_transaction
+    assert sent.call_count == 1
+    assert result["transactionHash"] == "0x" + Web3.keccak(sent.call_args.args[0]).hex()
+    assert client.nonce_manager.in_flight == (4,)
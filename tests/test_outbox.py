@@ -0,0 +1,308 @@
+"""
+Tests for the durable intent outbox.
+"""
+from unittest.mock import MagicMock
+
+import pytest
+from web3.exceptions import TransactionNotFound
+
+from intentlayer_sdk.cid import compute_payload_cid
+from intentlayer_sdk.exceptions import EnvelopeError, PinningError
+from intentlayer_sdk.outbox import IntentOutbox, STAGE_CONFIRMED, STAGE_FAILED, STAGE_SIGNED
+from tests.test_helpers import TEST_STAKE_WEI
+
+ENVELOPE_HASH = "0x" + "ab" * 32
+RAW_TX = b"\xf8\x01signed"
+
+
+def _client(receipt=None):
+    """Mock client whose chain mines every transaction with the given receipt."""
+    client = MagicMock()
+    client.assert_chain_id = MagicMock()
+    client._prepare_intent.return_value = (bytes.fromhex("ab" * 32), TEST_STAKE_WEI)
+    client.pin_to_ipfs.side_effect = compute_payload_cid
+    client._sign_intent.return_value = (RAW_TX, 7)
+    client.w3.eth.get_transaction_receipt.return_value = receipt or {
+        "status": 1, "blockNumber": 10, "gasUsed": 21000
+    }
+    return client
+
+
+def _drain(outbox, rounds=5):
+    for _ in range(rounds):
+        outbox.process_once()
+
+
+def test_entry_moves_through_all_stages(tmp_path, test_payload):
+    """process_once advances an entry one stage at a time until confirmed"""
+    client = _client()
+    outbox = IntentOutbox(client, str(tmp_path / "outbox.db"), autostart=False)
+    entry_id = outbox.submit(ENVELOPE_HASH, test_payload)
+
+    stages = []
+    for _ in range(4):
+        outbox.process_once()
+        stages.append(outbox.get(entry_id).stage)
+
+    assert stages == ["pinned", "signed", "sent", "confirmed"]
+    entry = outbox.get(entry_id)
+    assert entry.cid == compute_payload_cid(test_payload)
+    assert entry.nonce == 7
+    assert entry.receipt["blockNumber"] == 10
+    client.w3.eth.send_raw_transaction.assert_called_once_with(RAW_TX)
+    client.nonce_manager.mark_sent.assert_called_once_with(7)
+    client.nonce_manager.mark_confirmed.assert_called_once_with(7)
+    outbox.close()
+
+
+def test_submit_is_idempotent(tmp_path, test_payload):
+    """Submitting the same envelope hash twice returns the same entry"""
+    outbox = IntentOutbox(_client(), str(tmp_path / "outbox.db"), autostart=False)
+
+    first = outbox.submit(ENVELOPE_HASH, test_payload)
+    second = outbox.submit(bytes.fromhex("ab" * 32), test_payload)
+
+    assert first == second
+    assert outbox.counts() == {"pending": 1}
+    assert outbox.get("AB" * 32).id == first
+    outbox.close()
+
+
+def test_restart_resumes_without_repinning_or_resigning(tmp_path, test_payload):
+    """A new outbox on the same journal re-broadcasts the stored signed transaction"""
+    path = str(tmp_path / "outbox.db")
+    client = _client()
+    outbox = IntentOutbox(client, path, autostart=False)
+    entry_id = outbox.submit(ENVELOPE_HASH, test_payload)
+    outbox.process_once()
+    outbox.process_once()
+    assert outbox.get(entry_id).stage == STAGE_SIGNED
+    outbox.close()  # simulated crash before broadcast
+
+    restarted_client = _client()
+    restarted = IntentOutbox(restarted_client, path, autostart=False)
+    _drain(restarted)
+
+    assert restarted.get(entry_id).stage == STAGE_CONFIRMED
+    restarted_client.pin_to_ipfs.assert_not_called()
+    restarted_client._sign_intent.assert_not_called()
+    restarted_client.w3.eth.send_raw_transaction.assert_called_once_with(RAW_TX)
+    restarted.close()
+
+
+def test_already_known_counts_as_sent(tmp_path, test_payload):
+    """A node that already has the transaction does not fail the entry"""
+    client = _client()
+    client.w3.eth.send_raw_transaction.side_effect = ValueError("already known")
+    outbox = IntentOutbox(client, str(tmp_path / "outbox.db"), autostart=False)
+    entry_id = outbox.submit(ENVELOPE_HASH, test_payload)
+
+    _drain(outbox)
+
+    assert outbox.get(entry_id).stage == STAGE_CONFIRMED
+
+
+def test_taken_nonce_is_resigned(tmp_path, test_payload):
+    """nonce too low without a receipt re-signs the intent with a fresh nonce"""
+    client = _client()
+    client.w3.eth.send_raw_transaction.side_effect = [ValueError("nonce too low"), b"\x01"]
+    client.w3.eth.get_transaction_receipt.side_effect = [
+        TransactionNotFound("missing"), {"status": 1, "blockNumber": 11, "gasUsed": 1}
+    ]
+    client._sign_intent.side_effect = [(RAW_TX, 7), (RAW_TX + b"2", 8)]
+    outbox = IntentOutbox(client, str(tmp_path / "outbox.db"), autostart=False)
+    entry_id = outbox.submit(ENVELOPE_HASH, test_payload)
+
+    _drain(outbox, rounds=6)
+
+    entry = outbox.get(entry_id)
+    assert entry.stage == STAGE_CONFIRMED
+    assert entry.nonce == 8
+    assert client._sign_intent.call_count == 2
+    client.nonce_manager.resync.assert_called_once()
+
+
+def test_restart_reserves_journaled_nonces(tmp_path, test_payload):
+    """Nonces of signed but unconfirmed entries are kept from new allocations after a restart"""
+    path = str(tmp_path / "outbox.db")
+    outbox = IntentOutbox(_client(), path, autostart=False)
+    outbox.submit(ENVELOPE_HASH, test_payload)
+    outbox.process_once()
+    outbox.process_once()
+    outbox.close()
+
+    restarted_client = _client()
+    restarted = IntentOutbox(restarted_client, path, autostart=False)
+    restarted.process_once()
+    restarted.process_once()
+
+    restarted_client.nonce_manager.reserve.assert_called_once_with([7])
+    restarted.close()
+
+
+@pytest.mark.parametrize("pending, stage, sign_calls", [(True, STAGE_CONFIRMED, 1), (False, STAGE_CONFIRMED, 2)])
+def test_replacement_underpriced(tmp_path, test_payload, pending, stage, sign_calls):
+    """A held nonce counts as sent if the node has our transaction, otherwise the intent is re-signed"""
+    client = _client()
+    client.w3.eth.send_raw_transaction.side_effect = [ValueError("replacement transaction underpriced"), b"\x01"]
+    if not pending:
+        client.w3.eth.get_transaction.side_effect = TransactionNotFound("missing")
+    client._sign_intent.side_effect = [(RAW_TX, 7), (RAW_TX + b"2", 8)]
+    outbox = IntentOutbox(client, str(tmp_path / "outbox.db"), autostart=False)
+    entry_id = outbox.submit(ENVELOPE_HASH, test_payload)
+
+    _drain(outbox, rounds=6)
+
+    assert outbox.get(entry_id).stage == stage
+    assert client._sign_intent.call_count == sign_calls
+
+
+@pytest.mark.parametrize("pending_nonce, sign_calls, broadcasts", [(7, 1, 2), (8, 2, 2)])
+def test_dropped_transaction_recovers(tmp_path, test_payload, monkeypatch, pending_nonce, sign_calls, broadcasts):
+    """An unmined transaction the node dropped is re-broadcast, or re-signed once its nonce is used"""
+    now = [1000.0]
+    monkeypatch.setattr("intentlayer_sdk.outbox.time.time", lambda: now[0])
+    client = _client()
+    client._fetch_pending_nonce.return_value = pending_nonce
+    client.w3.eth.get_transaction.side_effect = TransactionNotFound("dropped")
+    client.w3.eth.get_transaction_receipt.side_effect = [
+        TransactionNotFound("missing"),
+        TransactionNotFound("missing"),
+        {"status": 1, "blockNumber": 13, "gasUsed": 1},
+    ]
+    client._sign_intent.side_effect = [(RAW_TX, 7), (RAW_TX + b"2", 8)]
+    outbox = IntentOutbox(client, str(tmp_path / "outbox.db"), rebroadcast_interval=30, autostart=False)
+    entry_id = outbox.submit(ENVELOPE_HASH, test_payload)
+
+    _drain(outbox, rounds=4)
+    assert outbox.get(entry_id).stage == "sent"
+    assert outbox.process_once() == 0  # waiting for the receipt
+
+    now[0] += 30
+    for _ in range(4):
+        outbox.process_once()
+        now[0] += 1
+
+    assert outbox.get(entry_id).stage == STAGE_CONFIRMED
+    assert client._sign_intent.call_count == sign_calls
+    assert client.w3.eth.send_raw_transaction.call_count == broadcasts
+
+
+def test_unmined_transaction_fails_after_max_attempts(tmp_path, test_payload, monkeypatch):
+    """A transaction still unmined after max_attempts re-broadcasts fails the entry"""
+    now = [1000.0]
+    monkeypatch.setattr("intentlayer_sdk.outbox.time.time", lambda: now[0])
+    client = _client()
+    client._fetch_pending_nonce.return_value = 8
+    client.w3.eth.get_transaction_receipt.side_effect = TransactionNotFound("missing")
+    client.w3.eth.send_raw_transaction.side_effect = [b"\x01", ValueError("already known"), ValueError("already known")]
+    outbox = IntentOutbox(
+        client, str(tmp_path / "outbox.db"), max_attempts=2, rebroadcast_interval=30, autostart=False
+    )
+    entry_id = outbox.submit(ENVELOPE_HASH, test_payload)
+    _drain(outbox, rounds=3)
+
+    for _ in range(3):
+        now[0] += 30
+        outbox.process_once()
+
+    entry = outbox.get(entry_id)
+    assert entry.stage == STAGE_FAILED
+    assert entry.attempts == 2
+    assert "not mined" in entry.error
+    assert client.w3.eth.send_raw_transaction.call_count == 3
+    client._sign_intent.assert_called_once()
+
+
+def test_web3_value_errors_are_retried(tmp_path, test_payload):
+    """ValueError subclasses raised by web3 are transient, not validation failures"""
+    from web3.exceptions import Web3ValueError
+
+    client = _client()
+    client._sign_intent.side_effect = [Web3ValueError("upstream hiccup"), (RAW_TX, 7)]
+    outbox = IntentOutbox(client, str(tmp_path / "outbox.db"), autostart=False, retry_backoff=0)
+    entry_id = outbox.submit(ENVELOPE_HASH, test_payload)
+
+    _drain(outbox)
+
+    assert outbox.get(entry_id).stage == STAGE_CONFIRMED
+
+
+def test_invalid_envelope_fails_immediately(tmp_path, test_payload):
+    """Validation errors are permanent and are not retried"""
+    client = _client()
+    client._prepare_intent.side_effect = EnvelopeError("bad envelope")
+    outbox = IntentOutbox(client, str(tmp_path / "outbox.db"), autostart=False)
+    entry_id = outbox.submit(ENVELOPE_HASH, test_payload)
+
+    outbox.process_once()
+
+    entry = outbox.get(entry_id)
+    assert entry.stage == STAGE_FAILED
+    assert "bad envelope" in entry.error
+    client.pin_to_ipfs.assert_not_called()
+
+
+def test_transient_errors_retry_with_backoff(tmp_path, test_payload, monkeypatch):
+    """Pinning failures are retried after a delay, up to max_attempts"""
+    now = [1000.0]
+    monkeypatch.setattr("intentlayer_sdk.outbox.time.time", lambda: now[0])
+    client = _client()
+    client.pin_to_ipfs.side_effect = PinningError("pinner down")
+    outbox = IntentOutbox(
+        client, str(tmp_path / "outbox.db"), max_attempts=3, retry_backoff=1.0, autostart=False
+    )
+    entry_id = outbox.submit(ENVELOPE_HASH, test_payload)
+
+    outbox.process_once()
+    assert outbox.get(entry_id).attempts == 1
+    assert outbox.process_once() == 0  # backing off
+
+    now[0] += 1.0
+    outbox.process_once()
+    now[0] += 2.0
+    outbox.process_once()
+
+    entry = outbox.get(entry_id)
+    assert entry.stage == STAGE_FAILED
+    assert entry.attempts == 3
+    assert client.pin_to_ipfs.call_count == 3
+
+
+def test_reverted_transaction_fails(tmp_path, test_payload):
+    """A mined transaction with status 0 fails the entry and keeps its receipt"""
+    client = _client(receipt={"status": 0, "blockNumber": 12, "gasUsed": 50000})
+    outbox = IntentOutbox(client, str(tmp_path / "outbox.db"), autostart=False)
+    entry_id = outbox.submit(ENVELOPE_HASH, test_payload)
+
+    _drain(outbox)
+
+    entry = outbox.get(entry_id)
+    assert entry.stage == STAGE_FAILED
+    assert entry.receipt["status"] == 0
+    assert entry.error == "Transaction reverted"
+
+
+def test_background_workers_confirm_many(tmp_path, test_payload):
+    """Started workers drive submitted entries to completion"""
+    client = _client()
+    outbox = IntentOutbox(client, str(tmp_path / "outbox.db"), workers=4, poll_interval=0.01)
+    try:
+        ids = [outbox.submit("0x" + f"{i:064x}", test_payload) for i in range(20)]
+        results = [outbox.wait(entry_id, timeout=10) for entry_id in ids]
+    finally:
+        outbox.close()
+
+    assert all(entry.stage == STAGE_CONFIRMED for entry in results)
+    assert client.w3.eth.send_raw_transaction.call_count == 20
+
+
+def test_wait_times_out(tmp_path, test_payload):
+    """wait raises TimeoutError while the entry is still in progress"""
+    outbox = IntentOutbox(_client(), str(tmp_path / "outbox.db"), poll_interval=0.01, autostart=False)
+    entry_id = outbox.submit(ENVELOPE_HASH, test_payload)
+
+    with pytest.raises(TimeoutError):
+        outbox.wait(entry_id, timeout=0.05)
+    with pytest.raises(KeyError):
+        outbox.wait(999, timeout=0.05)
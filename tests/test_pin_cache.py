@@ -0,0 +1,86 @@
+"""
+Tests for the content-addressed pin cache.
+"""
+import pytest
+
+from intentlayer_sdk.pin_cache import PinCache
+from tests.test_helpers import create_test_client
+
+PIN_URL = "https://pin.example.com/pin"
+
+
+def test_repeated_payload_skips_post(requests_mock, real_pin_to_ipfs):
+    """Identical payloads are uploaded once"""
+    requests_mock.post(PIN_URL, json={"cid": "QmCached"})
+    client = create_test_client()
+
+    cids = [client.pin_to_ipfs({"b": 2, "a": 1}), client.pin_to_ipfs({"a": 1, "b": 2})]
+
+    assert cids == ["QmCached", "QmCached"]
+    assert requests_mock.call_count == 1
+    assert client.pin_cache.stats()["hits"] == 1
+
+
+def test_cache_can_be_disabled(requests_mock, real_pin_to_ipfs):
+    """pin_cache=False posts every payload"""
+    requests_mock.post(PIN_URL, json={"cid": "QmFresh"})
+    client = create_test_client(pin_cache=False)
+
+    client.pin_to_ipfs({"a": 1})
+    client.pin_to_ipfs({"a": 1})
+
+    assert requests_mock.call_count == 2
+
+
+def test_failed_pins_not_cached(requests_mock, real_pin_to_ipfs):
+    """Only successful pins are remembered"""
+    requests_mock.post(PIN_URL, [
+        {"json": {"error": "bad"}, "status_code": 400},
+        {"json": {"cid": "QmOk"}},
+    ])
+    client = create_test_client()
+
+    with pytest.raises(Exception):
+        client.pin_to_ipfs({"a": 1})
+    assert client.pin_to_ipfs({"a": 1}) == "QmOk"
+
+
+def test_entries_revalidate_after_ttl(monkeypatch):
+    """Entries older than the TTL are treated as misses"""
+    now = [1000.0]
+    monkeypatch.setattr("intentlayer_sdk.pin_cache.time.time", lambda: now[0])
+    cache = PinCache(ttl=60)
+    key = cache.key_for({"a": 1})
+    cache.put(key, "QmA")
+
+    now[0] += 59
+    assert cache.get(key) == "QmA"
+    now[0] += 2
+    assert cache.get(key) is None
+
+
+def test_lru_eviction():
+    """The in-memory cache stays within maxsize"""
+    cache = PinCache(maxsize=2)
+    for i in range(3):
+        cache.put(str(i), f"Qm{i}")
+
+    assert cache.get("0") is None
+    assert cache.get("2") == "Qm2"
+    assert cache.stats()["size"] == 2
+
+
+def test_persists_to_disk(tmp_path):
+    """Entries survive a new cache instance on the same file"""
+    path = str(tmp_path / "pins.sqlite")
+    first = PinCache(path=path)
+    key = first.key_for({"a": 1})
+    first.put(key, "QmDisk")
+    first.close()
+
+    second = PinCache(path=path)
+    assert second.get(key) == "QmDisk"
+    second.invalidate(key)
+    second.close()
+
+    assert PinCache(path=path).get(key) is None
@@ -0,0 +1,105 @@
+"""
+Tests for concurrent pinning and pin request encoding.
+"""
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+
+from intentlayer_sdk.exceptions import PinningError
+from tests.test_helpers import create_test_client
+
+
+@pytest.fixture
+def pinner():
+    """Local keep-alive pinner recording client connections"""
+    state = {"ports": set(), "active": 0, "peak": 0, "lock": threading.Lock()}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            with state["lock"]:
+                state["ports"].add(self.client_address[1])
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            body = json.dumps({"cid": f"Qm{payload['n']}"}).encode()
+            with state["lock"]:
+                state["active"] -= 1
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state["url"] = f"http://127.0.0.1:{server.server_address[1]}"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def test_pin_many_returns_cids_in_order(pinner):
+    """Results follow input order and connections are reused"""
+    client = create_test_client(pinner_url=pinner["url"], pin_concurrency=4)
+
+    cids = client.pin_many([{"n": i} for i in range(40)])
+
+    assert cids == [f"Qm{i}" for i in range(40)]
+    assert pinner["peak"] <= 4
+    assert len(pinner["ports"]) <= 4
+
+
+def test_pin_many_errors():
+    """The first failure raises unless return_exceptions is set"""
+    client = create_test_client()
+
+    def pin(payload):
+        if payload["n"] == 2:
+            raise PinningError("boom")
+        return f"Qm{payload['n']}"
+
+    client.pin_to_ipfs = MagicMock(side_effect=pin)
+    payloads = [{"n": i} for i in range(4)]
+
+    with pytest.raises(PinningError, match="boom"):
+        client.pin_many(payloads)
+
+    results = client.pin_many(payloads, max_in_flight=2, return_exceptions=True)
+    assert results[:2] == ["Qm0", "Qm1"] and results[3] == "Qm3"
+    assert isinstance(results[2], PinningError)
+    assert client.pin_many([]) == []
+
+
+def test_pool_size_configures_adapters():
+    """The HTTP adapters keep pin_pool_size connections per host"""
+    client = create_test_client(pin_pool_size=64)
+    adapter = client.session.get_adapter("https://pin.example.com/pin")
+    assert adapter._pool_maxsize == 64
+
+    with pytest.raises(ValueError, match="pin_pool_size"):
+        create_test_client(pin_pool_size=0)
+
+
+def test_large_payloads_are_gzipped():
+    """Bodies above the threshold are compressed, small ones sent as JSON"""
+    client = create_test_client(pin_gzip_threshold=1024)
+    small = {"data": "x"}
+    large = {"data": "x" * 4096}
+
+    assert client._pin_request_kwargs(small) == {"json": small}
+    kwargs = client._pin_request_kwargs(large)
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(kwargs["data"])) == large
+    assert len(kwargs["data"]) < 1024
+
+    assert create_test_client()._pin_request_kwargs(large) == {"json": large}
@@ -0,0 +1,260 @@
+"""
+Tests for the shared block-driven receipt tracker.
+"""
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from web3 import Web3
+from web3.exceptions import TimeExhausted
+from web3.providers import JSONBaseProvider
+
+from intentlayer_sdk.receipts import ReceiptTracker, get_receipt_tracker
+from tests.test_helpers import create_test_client
+
+
+class FakeChain(JSONBaseProvider):
+    """In-memory JSON-RPC provider with a controllable head and mined transactions"""
+
+    def __init__(self, batching=True):
+        super().__init__()
+        self.head = 10
+        self.mined = {}          # tx hash -> block number
+        self.calls = []          # (kind, method) per request
+        self.batching = batching
+
+    def _receipt(self, tx_hash):
+        block = self.mined.get(tx_hash)
+        if block is None or block > self.head:
+            return None
+        return {
+            "transactionHash": tx_hash,
+            "blockNumber": hex(block),
+            "blockHash": "0x" + "00" * 32,
+            "transactionIndex": "0x0",
+            "status": "0x1",
+            "gasUsed": "0x5208",
+            "cumulativeGasUsed": "0x5208",
+            "effectiveGasPrice": "0x1",
+            "logs": [],
+            "logsBloom": "0x" + "00" * 256,
+            "from": "0x" + "11" * 20,
+            "to": "0x" + "22" * 20,
+            "contractAddress": None,
+            "type": "0x0",
+        }
+
+    def make_request(self, method, params):
+        self.calls.append(("single", method))
+        if method == "eth_blockNumber":
+            return {"jsonrpc": "2.0", "id": 1, "result": hex(self.head)}
+        if method == "eth_getTransactionReceipt":
+            return {"jsonrpc": "2.0", "id": 1, "result": self._receipt(params[0])}
+        return {"jsonrpc": "2.0", "id": 1, "result": None}
+
+    def make_batch_request(self, requests):
+        if not self.batching:
+            raise NotImplementedError("batching disabled")
+        self.calls.append(("batch", len(requests)))
+        return [
+            {"jsonrpc": "2.0", "id": i, "result": self._receipt(params[0])}
+            for i, (method, params) in enumerate(requests)
+        ]
+
+
+def _h(i):
+    return "0x" + f"{i:064x}"
+
+
+@pytest.fixture
+def chain():
+    return FakeChain()
+
+
+@pytest.fixture
+def tracker(chain):
+    t = ReceiptTracker(Web3(chain), autostart=False)
+    yield t
+    t.stop()
+
+
+def test_resolves_many_receipts_with_batched_calls(chain, tracker):
+    """Receipts for hundreds of transactions are fetched in a few batches"""
+    futures = [tracker.track(_h(i)) for i in range(250)]
+    for i in range(250):
+        chain.mined[_h(i)] = 11
+    chain.head = 11
+
+    tracker.poll_once()
+
+    assert all(f.done() for f in futures)
+    assert futures[0].result()["blockNumber"] == 11
+    batches = [c for c in chain.calls if c[0] == "batch"]
+    assert [n for _, n in batches] == [100, 100, 50]
+    assert not any(c == ("single", "eth_getTransactionReceipt") for c in chain.calls)
+
+
+def test_no_receipt_requests_without_new_blocks(chain, tracker):
+    """Pending transactions are only re-checked when the head advances"""
+    tracker.track(_h(1))
+    tracker.poll_once()          # first check of a fresh transaction
+    requests_after_first = tracker.receipt_requests
+
+    for _ in range(5):
+        tracker.poll_once()
+
+    assert tracker.receipt_requests == requests_after_first
+    assert tracker.block_polls == 6
+
+
+def test_waits_for_confirmations(chain, tracker):
+    """A receipt resolves only after the requested number of blocks"""
+    future = tracker.track(_h(1), confirmations=3)
+    chain.mined[_h(1)] = 11
+    chain.head = 11
+    tracker.poll_once()
+    assert not future.done()
+
+    chain.head = 12
+    tracker.poll_once()
+    assert not future.done()
+
+    chain.head = 13
+    tracker.poll_once()
+    assert future.result()["blockNumber"] == 11
+
+
+def test_reorged_receipt_is_dropped(chain, tracker):
+    """A receipt that disappears before enough confirmations is not resolved"""
+    future = tracker.track(_h(1), confirmations=2)
+    chain.mined[_h(1)] = 11
+    chain.head = 11
+    tracker.poll_once()
+
+    del chain.mined[_h(1)]
+    chain.head = 12
+    tracker.poll_once()
+    assert not future.done()
+
+    chain.mined[_h(1)] = 12
+    chain.head = 13
+    tracker.poll_once()
+    assert future.result()["blockNumber"] == 12
+
+
+def test_falls_back_to_single_requests(chain):
+    """Providers without batch support still work"""
+    chain.batching = False
+    tracker = ReceiptTracker(Web3(chain), autostart=False)
+    future = tracker.track(bytes.fromhex(_h(7)[2:]))
+    chain.mined[_h(7)] = 10
+
+    tracker.poll_once()
+
+    assert future.result()["status"] == 1
+
+
+def test_poll_interval_follows_block_time(chain, tracker, monkeypatch):
+    """The polling interval adapts to the observed block time"""
+    now = [100.0]
+    monkeypatch.setattr("intentlayer_sdk.receipts.time.monotonic", lambda: now[0])
+    tracker.block_time = 12.0
+    tracker.track(_h(1))
+
+    for _ in range(30):
+        chain.head += 1
+        now[0] += 1.0
+        tracker.poll_once()
+
+    assert 0.9 < tracker.block_time < 1.2
+    assert tracker.poll_interval == pytest.approx(tracker.block_time / 2)
+
+
+def test_background_thread_resolves_waiters(chain):
+    """wait() blocks until the background loop sees the receipt"""
+    tracker = ReceiptTracker(Web3(chain), min_poll_interval=0.01, block_time=0.02)
+    chain.mined[_h(3)] = 12
+
+    def mine():
+        chain.head = 12
+
+    threading.Timer(0.05, mine).start()
+    try:
+        receipt = tracker.wait(_h(3), timeout=5)
+    finally:
+        tracker.stop()
+
+    assert receipt["blockNumber"] == 12
+
+
+def test_wait_times_out(chain):
+    """wait() raises TimeExhausted like web3's receipt polling"""
+    tracker = ReceiptTracker(Web3(chain), min_poll_interval=0.01, block_time=0.02)
+    try:
+        with pytest.raises(TimeExhausted):
+            tracker.wait(_h(99), timeout=0.1)
+    finally:
+        tracker.stop()
+    assert tracker.pending_count == 0
+
+
+def test_timeout_leaves_other_waiters(chain, tracker):
+    """One waiter giving up does not cancel others waiting on the same transaction"""
+    patient = tracker.track(_h(5))
+    impatient = tracker.track(_h(5))
+
+    tracker.untrack(_h(5), impatient)
+
+    assert impatient.cancelled()
+    assert not patient.done()
+    assert tracker.pending_count == 1
+
+    chain.mined[_h(5)] = 11
+    chain.head = 11
+    tracker.poll_once()
+    assert patient.result()["blockNumber"] == 11
+    assert tracker.pending_count == 0
+
+
+def test_waiters_resolve_at_their_own_confirmations(chain, tracker):
+    """Waiters on one transaction resolve as soon as their own depth is reached"""
+    one = tracker.track(_h(6), confirmations=1)
+    three = tracker.track(_h(6), confirmations=3)
+    chain.mined[_h(6)] = 11
+    chain.head = 11
+    tracker.poll_once()
+    assert one.done() and not three.done()
+
+    chain.head = 13
+    tracker.poll_once()
+    assert three.result()["blockNumber"] == 11
+
+
+def test_tracker_shared_per_endpoint():
+    """Clients on the same RPC endpoint share one tracker"""
+    a = create_test_client(rpc_url="https://rpc-a.example.com")
+    b = create_test_client(rpc_url="https://rpc-a.example.com")
+    c = create_test_client(rpc_url="https://rpc-b.example.com")
+
+    assert a.receipt_tracker is b.receipt_tracker
+    assert a.receipt_tracker is not c.receipt_tracker
+    assert get_receipt_tracker(MagicMock(), "https://rpc-a.example.com") is a.receipt_tracker
+
+
+def test_client_waits_through_tracker(test_payload, monkeypatch):
+    """use_receipt_tracker routes receipt waits through the shared tracker"""
+    client = create_test_client(use_receipt_tracker=True, confirmations=2)
+    tracker = MagicMock()
+    tracker.wait.return_value = {"status": 1}
+    monkeypatch.setattr(type(client), "receipt_tracker", property(lambda self: tracker))
+    client.w3 = MagicMock()
+
+    assert client._wait_for_receipt(b"\x01" * 32) == {"status": 1}
+    tracker.wait.assert_called_once_with(b"\x01" * 32, timeout=120, confirmations=2)
+    client.w3.eth.wait_for_transaction_receipt.assert_not_called()
+
+
+def test_client_rejects_invalid_confirmations():
+    """At least one confirmation is required"""
+    with pytest.raises(ValueError, match="confirmations"):
+        create_test_client(confirmations=0)
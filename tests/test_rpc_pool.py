@@ -0,0 +1,253 @@
+"""
+Tests for the multi-endpoint RPC pool.
+"""
+import pytest
+import requests
+from web3.providers import HTTPProvider, JSONBaseProvider
+
+from intentlayer_sdk.rpc_pool import AllEndpointsFailedError, EndpointPoolProvider
+from tests.test_helpers import TEST_RPC_URL, create_test_client
+
+
+class Clock:
+    """Fake monotonic clock advanced by the stand-in endpoints"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class StandInEndpoint(JSONBaseProvider):
+    """Local endpoint with a fixed latency that can be switched off"""
+
+    def __init__(self, name, clock, latency=0.05):
+        super().__init__()
+        self.endpoint_uri = f"https://{name}.example.com"
+        self.clock = clock
+        self.latency = latency
+        self.down = False
+        self.calls = []
+
+    def make_request(self, method, params):
+        self.calls.append(method)
+        self.clock.now += self.latency
+        if self.down:
+            raise requests.ConnectionError(f"{self.endpoint_uri} unreachable")
+        return {"jsonrpc": "2.0", "id": 1, "result": "0x10"}
+
+    def make_batch_request(self, requests_):
+        self.calls.append("batch")
+        self.clock.now += self.latency
+        if self.down:
+            raise requests.ConnectionError(f"{self.endpoint_uri} unreachable")
+        return [{"jsonrpc": "2.0", "id": i, "result": "0x10"} for i, _ in enumerate(requests_)]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr("intentlayer_sdk.rpc_pool.time.monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def no_background_probes(monkeypatch):
+    monkeypatch.setattr(EndpointPoolProvider, "_start_background_probes", lambda self: None)
+
+
+def _warm(pool, rounds=10):
+    # Unmeasured endpoints score 0, so the first reads visit each of them
+    for _ in range(rounds):
+        pool.make_request("eth_blockNumber", [])
+
+
+def test_reads_go_to_fastest_endpoint(clock):
+    """After warm-up reads are routed to the lowest latency endpoint"""
+    slow = StandInEndpoint("slow", clock, latency=0.3)
+    fast = StandInEndpoint("fast", clock, latency=0.02)
+    pool = EndpointPoolProvider([slow, fast])
+    _warm(pool)
+    slow.calls.clear()
+    fast.calls.clear()
+
+    for _ in range(20):
+        pool.make_request("eth_call", [])
+
+    assert len(fast.calls) == 20
+    assert slow.calls == []
+
+
+def test_weights_scale_scores(clock):
+    """A heavier weight outranks a somewhat faster endpoint"""
+    heavy = StandInEndpoint("heavy", clock, latency=0.06)
+    light = StandInEndpoint("light", clock, latency=0.05)
+    pool = EndpointPoolProvider([(light, 1.0), (heavy, 3.0)])
+    _warm(pool)
+    heavy.calls.clear()
+
+    pool.make_request("eth_call", [])
+
+    assert heavy.calls == ["eth_call"]
+
+
+def test_transactions_prefer_primary(clock):
+    """Sends go to the primary even when a fallback is faster"""
+    primary = StandInEndpoint("primary", clock, latency=0.3)
+    fallback = StandInEndpoint("fallback", clock, latency=0.01)
+    pool = EndpointPoolProvider([primary, fallback])
+    _warm(pool)
+    primary.calls.clear()
+
+    pool.make_request("eth_sendRawTransaction", ["0x00"])
+
+    assert primary.calls == ["eth_sendRawTransaction"]
+
+
+def test_failover_and_ejection(clock, no_background_probes):
+    """A failing endpoint is skipped and ejected after repeated failures"""
+    primary = StandInEndpoint("primary", clock)
+    fallback = StandInEndpoint("fallback", clock)
+    pool = EndpointPoolProvider([primary, fallback], eject_after=2)
+    primary.down = True
+
+    for _ in range(3):
+        assert pool.make_request("eth_sendRawTransaction", ["0x00"])["result"] == "0x10"
+
+    # Two failed attempts eject the primary; the third send goes straight to the fallback
+    assert primary.calls == ["eth_sendRawTransaction"] * 2
+    assert pool.stats()[0]["healthy"] is False
+    assert pool.stats()[0]["errors"] == 2
+
+
+def test_switches_count_endpoint_changes(clock, no_background_probes):
+    """Failing over to another endpoint is counted as a switch, routine routing is not"""
+    primary = StandInEndpoint("primary", clock, latency=0.3)
+    fallback = StandInEndpoint("fallback", clock, latency=0.01)
+    pool = EndpointPoolProvider([primary, fallback])
+    _warm(pool)
+
+    # Reads go to the fast fallback and sends to the primary without counting
+    for _ in range(5):
+        pool.make_request("eth_chainId", [])
+        pool.make_request("eth_call", [])
+        pool.make_request("eth_sendRawTransaction", ["0x00"])
+    assert pool.switches == 0
+
+    primary.down = True
+    pool.make_request("eth_sendRawTransaction", ["0x00"])
+    assert pool.switches == 1
+
+
+def test_chain_id_goes_to_write_endpoint(clock):
+    """eth_chainId is answered by the endpoint transactions are sent to"""
+    primary = StandInEndpoint("primary", clock, latency=0.3)
+    fallback = StandInEndpoint("fallback", clock, latency=0.01)
+    pool = EndpointPoolProvider([primary, fallback])
+    _warm(pool)
+    primary.calls.clear()
+
+    pool.make_request("eth_chainId", [])
+
+    assert primary.calls == ["eth_chainId"]
+
+
+def test_ejected_endpoint_is_reprobed(clock, no_background_probes):
+    """Ejected endpoints return once a probe succeeds, with doubling backoff"""
+    primary = StandInEndpoint("primary", clock)
+    fallback = StandInEndpoint("fallback", clock)
+    pool = EndpointPoolProvider([primary, fallback], eject_after=1, probe_interval=10)
+    primary.down = True
+    pool.make_request("eth_call", [])
+    assert pool.probe() == {}  # not due yet
+
+    clock.now += 10
+    assert pool.probe() == {primary.endpoint_uri: False}
+    clock.now += 10
+    assert pool.probe() == {}  # backoff doubled to 20s
+
+    primary.down = False
+    clock.now += 10
+    assert pool.probe() == {primary.endpoint_uri: True}
+    assert all(stat["healthy"] for stat in pool.stats())
+    # The failover and the reinstatement
+    assert pool.switches == 2
+
+
+def test_all_endpoints_failing_raises(clock):
+    """When every endpoint fails the caller gets one error naming them all"""
+    a = StandInEndpoint("a", clock)
+    b = StandInEndpoint("b", clock)
+    a.down = b.down = True
+    pool = EndpointPoolProvider([a, b])
+
+    with pytest.raises(AllEndpointsFailedError) as exc:
+        pool.make_request("eth_call", [])
+    assert "a.example.com" in str(exc.value) and "b.example.com" in str(exc.value)
+
+
+def test_rpc_errors_are_not_endpoint_failures(clock):
+    """JSON-RPC errors pass through, except rate limiting which fails over"""
+    class Erroring(StandInEndpoint):
+        code = -32000
+
+        def make_request(self, method, params):
+            self.calls.append(method)
+            return {"jsonrpc": "2.0", "id": 1, "error": {"code": self.code, "message": "nope"}}
+
+    primary = Erroring("primary", clock)
+    fallback = StandInEndpoint("fallback", clock)
+    pool = EndpointPoolProvider([primary, fallback])
+
+    assert pool.make_request("eth_sendRawTransaction", ["0x00"])["error"]["code"] == -32000
+    assert fallback.calls == []
+
+    primary.code = -32005
+    assert pool.make_request("eth_sendRawTransaction", ["0x00"])["result"] == "0x10"
+    assert fallback.calls == ["eth_sendRawTransaction"]
+
+
+def test_batches_fail_over(clock):
+    """Batch requests are routed and failed over like single requests"""
+    a = StandInEndpoint("a", clock)
+    b = StandInEndpoint("b", clock)
+    a.down = True
+    pool = EndpointPoolProvider([a, b])
+
+    responses = pool.make_batch_request([("eth_blockNumber", []), ("eth_chainId", [])])
+
+    assert len(responses) == 2
+    assert b.calls == ["batch"]
+
+
+def test_http_endpoints_fail_over(monkeypatch):
+    """URL endpoints use HTTP providers and fail over on connection errors"""
+    def make_request(provider, method, params):
+        if "rpc-a" in provider.endpoint_uri:
+            raise requests.ConnectionError("refused")
+        return {"jsonrpc": "2.0", "id": 1, "result": "0x2a"}
+
+    monkeypatch.setattr(HTTPProvider, "make_request", make_request)
+    pool = EndpointPoolProvider(
+        ["https://rpc-a.example.com", ("https://rpc-b.example.com", 2.0)], request_timeout=3
+    )
+
+    assert pool.make_request("eth_blockNumber", [])["result"] == "0x2a"
+    assert pool.endpoints == ["https://rpc-a.example.com", "https://rpc-b.example.com"]
+    assert [s["errors"] for s in pool.stats()] == [1, 0]
+
+
+def test_client_pools_fallback_endpoints():
+    """rpc_endpoints puts the client behind a pool with rpc_url as primary"""
+    client = create_test_client(
+        rpc_endpoints=[(TEST_RPC_URL, 2.0), "https://rpc-backup.example.com"]
+    )
+
+    provider = client.w3.provider
+    assert isinstance(provider, EndpointPoolProvider)
+    assert provider.endpoints == [TEST_RPC_URL, "https://rpc-backup.example.com"]
+    assert provider.stats()[0]["weight"] == 2.0
+
+    with pytest.raises(ValueError, match="rpc_endpoints must use https"):
+        create_test_client(rpc_endpoints=["http://rpc.example.com"])
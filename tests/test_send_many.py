@@ -0,0 +1,166 @@
+"""
+Tests for pipelined batch sending (IntentClient.send_many).
+"""
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from intentlayer_sdk.exceptions import EnvelopeError, PinningError, TransactionError
+from intentlayer_sdk.pipeline import IntentPipeline, IntentResult
+from tests.test_helpers import create_test_client
+
+
+def _hash(i):
+    return "0x" + f"{i:064x}"
+
+
+@pytest.fixture
+def client():
+    """Client with mocked chain and pinner"""
+    c = create_test_client()
+    c.did_registry_contract = None
+    c.w3 = MagicMock()
+    c.w3.eth.get_transaction_count.return_value = 0
+    c.w3.eth.send_raw_transaction.side_effect = lambda raw: b"\x01" * 32
+    c.w3.eth.wait_for_transaction_receipt.side_effect = lambda tx_hash, **kw: {
+        "transactionHash": tx_hash, "status": 1
+    }
+    c.recorder_contract = MagicMock()
+    fn = c.recorder_contract.functions.recordIntent.return_value
+    fn.estimate_gas.return_value = 100000
+    fn.build_transaction.side_effect = lambda params: {
+        **params, "to": "0x" + "00" * 20, "data": "0x", "chainId": 1
+    }
+    c.pin_to_ipfs = MagicMock(return_value="0x" + "ab" * 32)
+    return c
+
+
+def test_send_many_returns_results_in_order(client, test_payload):
+    """Ordered mode yields one result per item in input order"""
+    items = [(_hash(i), test_payload) for i in range(20)]
+
+    results = list(client.send_many(items, pin_concurrency=4, send_concurrency=2))
+
+    assert [r.index for r in results] == list(range(20))
+    assert [r.envelope_hash for r in results] == [h for h, _ in items]
+    assert all(r.ok and r.receipt["status"] == 1 for r in results)
+
+
+def test_send_many_allocates_distinct_nonces(client, test_payload):
+    """Concurrent sends from one signer use distinct nonces"""
+    items = [(_hash(i), test_payload) for i in range(30)]
+
+    list(client.send_many(items, send_concurrency=8))
+
+    built = client.recorder_contract.functions.recordIntent.return_value.build_transaction
+    nonces = sorted(c.args[0]["nonce"] for c in built.call_args_list)
+    assert nonces == list(range(30))
+
+
+def test_send_many_pins_concurrently(client, test_payload):
+    """Several pins are in flight at the same time"""
+    barrier = threading.Barrier(4, timeout=5)
+
+    def pin(payload):
+        barrier.wait()
+        return "0x" + "ab" * 32
+
+    client.pin_to_ipfs = MagicMock(side_effect=pin)
+    items = [(_hash(i), test_payload) for i in range(8)]
+
+    results = list(client.send_many(items, pin_concurrency=4))
+
+    assert all(r.ok for r in results)
+
+
+def test_send_many_reports_per_item_errors(client, test_payload):
+    """A failing item is reported without stopping the others"""
+    def pin(payload):
+        if payload.get("fail"):
+            raise PinningError("pinner down")
+        return "0x" + "ab" * 32
+
+    client.pin_to_ipfs = MagicMock(side_effect=pin)
+    bad = dict(test_payload, fail=True)
+    items = [(_hash(0), test_payload), (_hash(1), bad), ("not-hex", test_payload), (_hash(3), test_payload)]
+
+    results = list(client.send_many(items))
+
+    assert [r.ok for r in results] == [True, False, False, True]
+    assert isinstance(results[1].error, PinningError)
+    assert isinstance(results[2].error, EnvelopeError)
+
+
+def test_send_many_unordered_yields_as_completed(client, test_payload):
+    """Unordered mode does not hold back results behind a slow item"""
+    release = threading.Event()
+
+    def pin(payload):
+        if payload.get("slow"):
+            release.wait(5)
+        return "0x" + "ab" * 32
+
+    client.pin_to_ipfs = MagicMock(side_effect=pin)
+    items = [(_hash(0), dict(test_payload, slow=True))] + [(_hash(i), test_payload) for i in range(1, 5)]
+
+    seen = []
+    for result in client.send_many(items, ordered=False):
+        seen.append(result.index)
+        if len(seen) == 4:
+            release.set()
+
+    assert seen[-1] == 0
+    assert sorted(seen) == list(range(5))
+
+
+def test_send_many_ordered_bounds_buffered_results(client, test_payload):
+    """A stalled first item stops admission once max_pending results wait behind it"""
+    pulled = []
+    pulled_while_stalled = []
+    receipts = client.w3.eth.wait_for_transaction_receipt
+
+    def pin(payload):
+        if payload.get("slow"):
+            # Stall until the items behind this one have finished
+            deadline = time.monotonic() + 5
+            while receipts.call_count < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.1)
+            pulled_while_stalled.append(len(pulled))
+        return "0x" + "ab" * 32
+
+    def items():
+        for i in range(10):
+            pulled.append(i)
+            yield _hash(i), dict(test_payload, slow=i == 0)
+
+    client.pin_to_ipfs = MagicMock(side_effect=pin)
+
+    results = list(client.send_many(items(), max_pending=4))
+
+    assert pulled_while_stalled == [4]
+    assert [r.index for r in results] == list(range(10))
+
+
+def test_send_many_wraps_unexpected_errors(client, test_payload):
+    """Unexpected errors are mapped to TransactionError like send_intent"""
+    client.recorder_contract.functions.recordIntent.return_value.build_transaction.side_effect = KeyError("boom")
+
+    (result,) = list(client.send_many([(_hash(0), test_payload)]))
+
+    assert isinstance(result.error, TransactionError)
+    assert "Transaction failed" in str(result.error)
+
+
+def test_pipeline_validates_concurrency(client):
+    """Stage concurrency must be positive"""
+    with pytest.raises(ValueError, match="pin_concurrency"):
+        IntentPipeline(client, pin_concurrency=0)
+
+
+def test_intent_result_ok():
+    """IntentResult.ok reflects the error field"""
+    assert IntentResult(0, "0x", {}, None).ok
+    assert not IntentResult(0, "0x", None, ValueError("x")).ok
@@ -25,7 +25,7 @@ def test_sha256_hex():
     result_bytes = sha256_hex(b"test")
     assert result_bytes == "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08"
 
-@patch("web3.Web3.keccak")
+@patch("intentlayer_sdk.utils.keccak256")
 def test_create_envelope_hash(mock_keccak):
     """Test envelope hash creation"""
     mock_keccak.return_value = b"test_hash"
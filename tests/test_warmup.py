@@ -0,0 +1,88 @@
+"""
+Tests for network-free client construction and warmup().
+"""
+import threading
+
+import requests
+from eth_abi import encode
+from web3.providers.rpc import HTTPProvider
+
+from tests.test_helpers import TEST_CONTRACT, TEST_PINNER_URL, TEST_STAKE_WEI, create_test_client
+
+
+class FakeRPC:
+    """Records RPC methods and answers the reads warmup issues"""
+
+    def __init__(self):
+        self.methods = []
+        self.lock = threading.Lock()
+
+    def __call__(self, method, params):
+        with self.lock:
+            self.methods.append(method)
+        results = {
+            "eth_chainId": "0x12c",
+            "eth_gasPrice": hex(10**9),
+            "eth_getTransactionCount": "0x5",
+            "eth_call": "0x" + encode(["uint128"], [TEST_STAKE_WEI]).hex(),
+        }
+        return {"jsonrpc": "2.0", "id": 1, "result": results.get(method, "0x0")}
+
+    def install(self, monkeypatch):
+        monkeypatch.setattr(HTTPProvider, "make_request", lambda _, method, params: self(method, params))
+        return self
+
+
+def test_construction_makes_no_rpc_calls(monkeypatch):
+    """Creating a client touches neither the RPC endpoint nor the contracts"""
+    rpc = FakeRPC().install(monkeypatch)
+
+    client = create_test_client(min_stake_wei=None, expected_chain_id=300)
+
+    assert rpc.methods == []
+    assert client._recorder_contract is not None and client._min_stake_wei is None
+    assert client.recorder_contract.address == TEST_CONTRACT
+
+
+def test_contract_bindings_can_be_replaced():
+    """Assigned contract bindings, including None, take precedence"""
+    client = create_test_client()
+
+    client.did_registry_contract = None
+
+    assert client.did_registry_contract is None
+    assert client.recorder_contract is client.recorder_contract
+
+
+def test_warmup_prefetches_reads_and_connections(monkeypatch, requests_mock):
+    """warmup fills the chain ID, min stake, fee and nonce caches and opens the pinner connection"""
+    rpc = FakeRPC().install(monkeypatch)
+    requests_mock.head(TEST_PINNER_URL, status_code=405)
+    client = create_test_client(min_stake_wei=None, expected_chain_id=300)
+
+    results = client.warmup(timeout=5)
+
+    assert results == {
+        "chain_id": None, "pinner": None, "min_stake": None, "fees": None, "nonce": None
+    }
+    assert client._min_stake_wei == TEST_STAKE_WEI
+    assert client.nonce_manager.next_nonce == 5
+    assert requests_mock.call_count == 1
+
+    # The first send's reads are now served from the caches
+    rpc.methods.clear()
+    assert client.min_stake_wei == TEST_STAKE_WEI
+    assert client.fee_oracle.fees(client.w3) == {"gasPrice": 10**9}
+    assert rpc.methods == []
+
+
+def test_warmup_reports_failures(monkeypatch, requests_mock):
+    """Failed warmup tasks are returned, not raised"""
+    FakeRPC().install(monkeypatch)
+    requests_mock.head(TEST_PINNER_URL, exc=requests.ConnectionError("pinner down"))
+    client = create_test_client()
+
+    results = client.warmup(timeout=5)
+
+    assert isinstance(results["pinner"], requests.ConnectionError)
+    assert results["chain_id"] is None